@@ -0,0 +1,41 @@
+import operator
+import time
+
+from safethread.datatype import AbstractSafeBase
+from safethread.process.datatype import ProcessSafeArray, ProcessSafeList
+from safethread.thread.datatype import ThreadSafeList
+
+N_THREAD = 100_000
+N_PROCESS = 200
+
+
+def legacy_iadd(safe_obj: AbstractSafeBase, other):
+    """Previous AbstractSafeBase.__iadd__(): wraps `other` into a new safe object (and lock) first."""
+    other = safe_obj.create(other)
+    with safe_obj._lock, other._lock:
+        safe_obj._data += other._data
+
+
+def current_iadd(safe_obj: AbstractSafeBase, other):
+    safe_obj += other
+
+
+def bench(name: str, factory, n: int):
+    results = []
+    for label, iadd in (("legacy", legacy_iadd), ("current", current_iadd)):
+        safe_obj = factory()
+        begin = time.perf_counter()
+        for _ in range(n):
+            iadd(safe_obj, [1])
+        results.append(f"{label} {n / (time.perf_counter() - begin):10,.0f} ops/s")
+    print(f"{name:16} += [1] | " + " | ".join(results))
+
+
+def main():
+    bench("ThreadSafeList", ThreadSafeList, N_THREAD)
+    bench("ProcessSafeList", ProcessSafeList, N_PROCESS)
+    bench("ProcessSafeArray", ProcessSafeArray, N_PROCESS)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+import time
+
+from safethread.process import BaseProcess, ProcessPool
+
+N_TASKS = 200
+N_MAP = 20_000
+CHUNK_SIZES = (1, 100, 1_000)
+
+
+def task(x: int) -> int:
+    return x * 2
+
+
+def run_task(x: int) -> bool:
+    task(x)
+    return False
+
+
+def bench_base_process():
+    begin = time.perf_counter()
+    for i in range(N_TASKS):
+        process = BaseProcess(run_task, args=[i])
+        process.start()
+        process.join()
+    elapsed = time.perf_counter() - begin
+    print(f"BaseProcess per task     | {N_TASKS/elapsed:12,.0f} tasks/s")
+
+
+def bench_submit():
+    with ProcessPool(4) as pool:
+        begin = time.perf_counter()
+        futures = [pool.submit(task, i) for i in range(N_TASKS)]
+        for future in futures:
+            future.result()
+        elapsed = time.perf_counter() - begin
+    print(f"ProcessPool.submit()     | {N_TASKS/elapsed:12,.0f} tasks/s")
+
+
+def bench_map(chunksize: int):
+    with ProcessPool(4) as pool:
+        begin = time.perf_counter()
+        for _ in pool.imap_unordered(task, range(N_MAP), chunksize=chunksize):
+            pass
+        elapsed = time.perf_counter() - begin
+    print(f"ProcessPool.imap({chunksize:5})  | {N_MAP/elapsed:12,.0f} tasks/s")
+
+
+def main():
+    bench_base_process()
+    bench_submit()
+    for chunksize in CHUNK_SIZES:
+        bench_map(chunksize)
+
+
+if __name__ == "__main__":
+    main()
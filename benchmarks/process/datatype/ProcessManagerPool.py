@@ -0,0 +1,50 @@
+import multiprocessing
+import time
+
+from safethread.process.datatype import ProcessManagerPool, ProcessSafeList
+
+N_OBJECTS = 50
+
+
+def bench_dedicated_managers():
+    """One manager server process per object (previous behaviour)."""
+    begin = time.perf_counter()
+    objs = [multiprocessing.Manager().list() for _ in range(N_OBJECTS)]
+    elapsed = time.perf_counter() - begin
+    n_processes = len(multiprocessing.active_children())
+    return elapsed, n_processes, objs
+
+
+def bench_shared_managers(pool_size: int):
+    """Objects share the managers of ProcessManagerPool."""
+    ProcessManagerPool.set_size(pool_size)
+    begin = time.perf_counter()
+    objs = [ProcessSafeList() for _ in range(N_OBJECTS)]
+    elapsed = time.perf_counter() - begin
+    n_processes = len(multiprocessing.active_children())
+    return elapsed, n_processes, objs
+
+
+def report(name: str, elapsed: float, n_processes: int):
+    print(f"{name:<28} total {elapsed*1000:9.2f} ms | "
+          f"per object {elapsed/N_OBJECTS*1000:7.3f} ms | "
+          f"manager processes {n_processes}")
+
+
+def main():
+    print(f"Creating {N_OBJECTS} shared lists")
+
+    elapsed, n_processes, objs = bench_dedicated_managers()
+    report("multiprocessing.Manager()", elapsed, n_processes)
+    del objs
+    time.sleep(0.5)
+
+    for pool_size in (1, 4):
+        elapsed, n_processes, objs = bench_shared_managers(pool_size)
+        report(f"ProcessManagerPool(size={pool_size})", elapsed, n_processes)
+        del objs
+        ProcessManagerPool.shutdown()
+
+
+if __name__ == "__main__":
+    main()
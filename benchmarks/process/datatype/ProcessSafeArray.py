@@ -0,0 +1,36 @@
+import time
+
+from safethread.process.datatype import ProcessSafeArray, ProcessSafeList
+
+N_OPS = 20_000
+
+
+def bench(name: str, safe_list):
+    begin = time.perf_counter()
+    for i in range(N_OPS):
+        safe_list.append(i)
+    append = time.perf_counter() - begin
+
+    begin = time.perf_counter()
+    for i in range(N_OPS):
+        safe_list[i]
+    getitem = time.perf_counter() - begin
+
+    begin = time.perf_counter()
+    for _ in range(N_OPS):
+        len(safe_list)
+    length = time.perf_counter() - begin
+
+    print(f"{name:<18} append {N_OPS/append:12,.0f} ops/s | "
+          f"getitem {N_OPS/getitem:12,.0f} ops/s | "
+          f"len {N_OPS/length:12,.0f} ops/s")
+
+
+def main():
+    print(f"Running {N_OPS} operations of each kind")
+    bench("ProcessSafeList", ProcessSafeList())
+    bench("ProcessSafeArray", ProcessSafeArray(typecode="q"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+import multiprocessing
+import time
+
+from safethread.process.datatype import ProcessSafeQueue
+
+BATCH_SIZES = (1, 10, 100, 1_000)
+N_ITEMS = 100_000
+
+
+def producer(queue_1: ProcessSafeQueue, batch_size: int):
+    if batch_size == 1:
+        for i in range(N_ITEMS):
+            queue_1.put(i)
+        return
+    for start in range(0, N_ITEMS, batch_size):
+        queue_1.put_many(range(start, start + batch_size))
+
+
+def bench(batch_size: int):
+    queue_1 = ProcessSafeQueue()
+    process = multiprocessing.Process(
+        target=producer, args=(queue_1, batch_size))
+
+    begin = time.perf_counter()
+    process.start()
+    received = 0
+    while received < N_ITEMS:
+        received += len(queue_1.get_many(batch_size))
+    elapsed = time.perf_counter() - begin
+    process.join()
+
+    print(f"batch {batch_size:5} | {N_ITEMS/elapsed:12,.0f} items/s")
+
+
+def main():
+    for batch_size in BATCH_SIZES:
+        bench(batch_size)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+import multiprocessing
+import statistics
+import time
+
+from safethread.process.datatype import ProcessSafeQueue, ProcessSafeRingQueue
+
+RECORD_SIZES = (64, 1_024, 16_384)
+N_ITEMS = 20_000
+N_ROUND_TRIPS = 2_000
+
+
+def create_queues(name: str, record_size: int):
+    """Creates a (request, reply) pair of queues."""
+    if name == "ProcessSafeQueue":
+        return ProcessSafeQueue(), ProcessSafeQueue()
+    return (ProcessSafeRingQueue(256, slot_size=record_size),
+            ProcessSafeRingQueue(256, slot_size=record_size))
+
+
+def producer(output, record_size: int):
+    record = bytes(record_size)
+    for _ in range(N_ITEMS):
+        output.put(record)
+
+
+def echo(input, output):
+    for _ in range(N_ROUND_TRIPS):
+        output.put(input.get())
+
+
+def bench_throughput(name: str, record_size: int) -> float:
+    queue_1, _ = create_queues(name, record_size)
+    process = multiprocessing.Process(
+        target=producer, args=(queue_1, record_size))
+
+    begin = time.perf_counter()
+    process.start()
+    for _ in range(N_ITEMS):
+        queue_1.get()
+    elapsed = time.perf_counter() - begin
+    process.join()
+    return N_ITEMS / elapsed
+
+
+def bench_latency(name: str, record_size: int) -> float:
+    request, reply = create_queues(name, record_size)
+    process = multiprocessing.Process(target=echo, args=(request, reply))
+    process.start()
+
+    record = bytes(record_size)
+    round_trips = []
+    for _ in range(N_ROUND_TRIPS):
+        begin = time.perf_counter()
+        request.put(record)
+        reply.get()
+        round_trips.append(time.perf_counter() - begin)
+    process.join()
+    return statistics.median(round_trips) * 1e6
+
+
+def main():
+    for record_size in RECORD_SIZES:
+        for name in ("ProcessSafeQueue", "ProcessSafeRingQueue"):
+            throughput = bench_throughput(name, record_size)
+            latency = bench_latency(name, record_size)
+            print(f"{name:20} | record {record_size:6} B | {throughput:10,.0f} records/s | "
+                  f"round trip (median) {latency:8.1f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+import time
+
+from safethread.process.datatype import ProcessSafeList, ProcessSafeSet
+
+SIZES = (100, 1_000, 5_000)
+N_LOOKUPS = 2_000
+
+
+def list_backed_add(safe_list: ProcessSafeList, value):
+    """Previous ProcessSafeSet.add(): linear scan of a ListProxy, then append."""
+    if value not in safe_list:
+        safe_list.append(value)
+
+
+def bench(size: int):
+    safe_list = ProcessSafeList(range(size))
+    safe_set = ProcessSafeSet(range(size))
+
+    begin = time.perf_counter()
+    for i in range(N_LOOKUPS):
+        list_backed_add(safe_list, size + i)
+    elapsed_list = time.perf_counter() - begin
+
+    begin = time.perf_counter()
+    for i in range(N_LOOKUPS):
+        safe_set.add(size + i)
+    elapsed_set = time.perf_counter() - begin
+
+    print(f"size {size:6} | list-backed add {N_LOOKUPS/elapsed_list:10,.0f} ops/s | "
+          f"ProcessSafeSet.add {N_LOOKUPS/elapsed_set:10,.0f} ops/s")
+
+
+def main():
+    for size in SIZES:
+        bench(size)
+
+
+if __name__ == "__main__":
+    main()
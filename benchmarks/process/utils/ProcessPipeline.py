@@ -0,0 +1,47 @@
+import os
+import time
+
+from safethread.process.utils import ProcessPipeline, ProcessPipelineStage
+from safethread.thread.utils import ThreadPipeline, ThreadPipelineStage
+
+N_ITEMS = 400
+N_WORKERS = os.cpu_count() or 1
+
+
+def cpu_bound(n: int) -> int:
+    return sum(i * i for i in range(n))
+
+
+def identity(x):
+    return x
+
+
+def bench(name: str, pipeline):
+    pipeline.start()
+    begin = time.perf_counter()
+    for _ in range(N_ITEMS):
+        pipeline.put(20_000)
+    for _ in range(N_ITEMS):
+        pipeline.get()
+    elapsed = time.perf_counter() - begin
+    pipeline.stop()
+    print(f"{name:34} | {N_ITEMS/elapsed:10,.0f} items/s")
+
+
+def main():
+    print(f"CPU-bound callback, {N_WORKERS} workers per stage")
+    bench("ThreadPipelineStage", ThreadPipeline([
+        ThreadPipelineStage(cpu_bound, n_threads=N_WORKERS),
+    ]))
+    bench("ProcessPipelineStage", ProcessPipeline([
+        ProcessPipelineStage(cpu_bound, n_processes=N_WORKERS),
+    ]))
+    bench("thread => process => thread stages", ProcessPipeline([
+        ThreadPipelineStage(identity),
+        ProcessPipelineStage(cpu_bound, n_processes=N_WORKERS),
+        ThreadPipelineStage(identity),
+    ]))
+
+
+if __name__ == "__main__":
+    main()
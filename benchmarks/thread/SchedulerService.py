@@ -0,0 +1,50 @@
+import threading
+import time
+
+from safethread.thread import SchedulerService, SchedulerThread
+
+N_JOBS = 2_000
+TIMEOUT = 0.1
+DURATION = 2.0
+
+
+def bench(name: str, schedule):
+    lock = threading.Lock()
+    counter = [0]
+
+    def callback() -> bool:
+        with lock:
+            counter[0] += 1
+        return True
+
+    threads = threading.active_count()
+    begin = time.perf_counter()
+    jobs = [schedule(callback) for _ in range(N_JOBS)]
+    started = time.perf_counter() - begin
+    time.sleep(DURATION)
+    calls = counter[0]
+    extra_threads = threading.active_count() - threads
+    for job in jobs:
+        job.stop()
+    for job in jobs:
+        job.join()
+    expected = N_JOBS * DURATION / TIMEOUT
+    print(f"{name:16} | start {N_JOBS} jobs: {started*1000:8.1f} ms | threads: {extra_threads:5} | "
+          f"runs: {calls/DURATION:9,.0f}/s ({calls/expected:.0%} of expected)")
+
+
+def schedule_thread(callback):
+    scheduler = SchedulerThread(TIMEOUT, callback)
+    scheduler.start()
+    return scheduler
+
+
+def main():
+    print(f"{N_JOBS} periodic jobs (every {TIMEOUT}s), during {DURATION}s")
+    bench("SchedulerThread", schedule_thread)
+    with SchedulerService(max_workers=4) as service:
+        bench("SchedulerService", lambda callback: service.schedule(TIMEOUT, callback))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+import os
+import threading
+import time
+
+from safethread.thread import SubprocessPool, SubprocessThread
+
+N_COMMANDS = 1_000
+COMMAND = ["true"]
+MAX_CONCURRENT = sorted({1, os.cpu_count() or 1, 4 * (os.cpu_count() or 1)})
+
+
+def bench_thread():
+    """One SubprocessThread per command, all started at once."""
+    threads = threading.active_count()
+    begin = time.perf_counter()
+    subprocesses = [SubprocessThread(COMMAND) for _ in range(N_COMMANDS)]
+    for subprocess in subprocesses:
+        subprocess.start()
+    extra_threads = threading.active_count() - threads
+    for subprocess in subprocesses:
+        subprocess.join()
+    elapsed = time.perf_counter() - begin
+    print(f"SubprocessThread per command | threads: {extra_threads:5} | {N_COMMANDS/elapsed:9,.0f} commands/s")
+
+
+def bench_pool(max_concurrent: int):
+    threads = threading.active_count()
+    with SubprocessPool(max_concurrent=max_concurrent) as pool:
+        begin = time.perf_counter()
+        extra_threads = threading.active_count() - threads
+        failed = sum(result.returncode != 0
+                     for result in pool.run(COMMAND for _ in range(N_COMMANDS)))
+        elapsed = time.perf_counter() - begin
+    print(f"SubprocessPool({max_concurrent:3})          | threads: {extra_threads:5} | "
+          f"{N_COMMANDS/elapsed:9,.0f} commands/s | failed: {failed}")
+
+
+def main():
+    print(f"{N_COMMANDS:,} short-lived commands ({' '.join(COMMAND)})")
+    bench_thread()
+    for max_concurrent in MAX_CONCURRENT:
+        bench_pool(max_concurrent)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+import time
+
+from safethread.thread import BaseThread, ThreadPool
+
+N_TASKS = 20_000
+CHUNK_SIZES = (1, 10, 100)
+
+
+def task(x: int) -> int:
+    return x * 2
+
+
+def run_task(x: int) -> bool:
+    task(x)
+    return False
+
+
+def bench_base_thread():
+    begin = time.perf_counter()
+    for i in range(N_TASKS):
+        thread = BaseThread(run_task, args=[i])
+        thread.start()
+        thread.join()
+    elapsed = time.perf_counter() - begin
+    print(f"BaseThread per task  | {N_TASKS/elapsed:12,.0f} tasks/s")
+
+
+def bench_submit():
+    with ThreadPool(max_workers=4) as pool:
+        begin = time.perf_counter()
+        futures = [pool.submit(task, i) for i in range(N_TASKS)]
+        for future in futures:
+            future.result()
+        elapsed = time.perf_counter() - begin
+    print(f"ThreadPool.submit()  | {N_TASKS/elapsed:12,.0f} tasks/s")
+
+
+def bench_map(chunksize: int):
+    with ThreadPool(max_workers=4) as pool:
+        begin = time.perf_counter()
+        for _ in pool.map(task, range(N_TASKS), chunksize=chunksize):
+            pass
+        elapsed = time.perf_counter() - begin
+    print(f"ThreadPool.map({chunksize:3})  | {N_TASKS/elapsed:12,.0f} tasks/s")
+
+
+def main():
+    bench_base_thread()
+    bench_submit()
+    for chunksize in CHUNK_SIZES:
+        bench_map(chunksize)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+import sys
+import threading
+import time
+
+from safethread.thread.datatype import ThreadRLock, ThreadRWLock, ThreadSafeList
+
+THREADS = (1, 2, 4, 8)
+SIZE = 10_000
+DURATION = 1.0
+
+
+def bench(n_readers: int, lock) -> tuple[float, float]:
+    """Runs `n_readers` reader threads (count()) and one writer thread (append/pop) for DURATION seconds."""
+    safe_list = ThreadSafeList(range(SIZE), lock=lock)
+    stop = threading.Event()
+    reads = [0] * n_readers
+    writes = [0]
+
+    def reader(i: int):
+        while not stop.is_set():
+            safe_list.count(SIZE // 2)
+            reads[i] += 1
+
+    def writer():
+        while not stop.is_set():
+            safe_list.append(-1)
+            safe_list.pop()
+            writes[0] += 1
+            time.sleep(0.001)
+
+    threads = [threading.Thread(target=reader, args=(i,))
+               for i in range(n_readers)]
+    threads.append(threading.Thread(target=writer))
+    for thread in threads:
+        thread.start()
+    time.sleep(DURATION)
+    stop.set()
+    for thread in threads:
+        thread.join()
+    return sum(reads) / DURATION, writes[0] / DURATION
+
+
+def main():
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"GIL enabled: {gil} (readers only run in parallel on free-threaded builds)")
+    for n_readers in THREADS:
+        results = []
+        for name, factory in (("ThreadRLock", ThreadRLock),
+                              ("ThreadRWLock", ThreadRWLock),
+                              ("ThreadRWLock(no writer pref.)", lambda: ThreadRWLock(writer_preference=False))):
+            reads, writes = bench(n_readers, factory())
+            results.append(
+                f"{name} {reads:9,.0f} reads/s {writes:6,.0f} writes/s")
+        print(f"{n_readers:2} readers | " + " | ".join(results))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+import threading
+import time
+
+from safethread.thread.datatype import ThreadSafeQueue
+
+BATCH_SIZES = (1, 10, 100, 1_000)
+N_ITEMS = 200_000
+
+
+def bench(batch_size: int):
+    queue_1 = ThreadSafeQueue()
+
+    def consumer():
+        received = 0
+        while received < N_ITEMS:
+            received += len(queue_1.get_many(batch_size))
+
+    thread = threading.Thread(target=consumer)
+    begin = time.perf_counter()
+    thread.start()
+    if batch_size == 1:
+        for i in range(N_ITEMS):
+            queue_1.put(i)
+    else:
+        for start in range(0, N_ITEMS, batch_size):
+            queue_1.put_many(range(start, start + batch_size))
+    thread.join()
+    elapsed = time.perf_counter() - begin
+
+    print(f"batch {batch_size:5} | {N_ITEMS/elapsed:12,.0f} items/s")
+
+
+def main():
+    for batch_size in BATCH_SIZES:
+        bench(batch_size)
+
+
+if __name__ == "__main__":
+    main()
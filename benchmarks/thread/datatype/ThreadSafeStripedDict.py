@@ -0,0 +1,46 @@
+import sys
+import threading
+import time
+
+from safethread.thread.datatype import ThreadSafeDict, ThreadSafeStripedDict
+
+THREADS = (1, 4, 16, 64)
+OPS = 200_000
+KEYS = 10_000
+
+
+def bench(safe_dict, n_threads: int) -> float:
+    """Splits OPS get/set operations (on unrelated keys) among `n_threads` threads. Returns ops/s."""
+    ops = OPS // n_threads
+    barrier = threading.Barrier(n_threads + 1)
+
+    def worker(n: int):
+        barrier.wait()
+        for i in range(ops):
+            key = (n * ops + i) % KEYS
+            safe_dict[key] = safe_dict.get(key, 0) + 1
+
+    threads = [threading.Thread(target=worker, args=(n,))
+               for n in range(n_threads)]
+    for thread in threads:
+        thread.start()
+    barrier.wait()
+    begin = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    return 2 * ops * n_threads / (time.perf_counter() - begin)
+
+
+def main():
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"GIL enabled: {gil}")
+    for n_threads in THREADS:
+        results = [f"ThreadSafeDict {bench(ThreadSafeDict(), n_threads):10,.0f} ops/s"]
+        for stripes in (4, 16, 64):
+            ops = bench(ThreadSafeStripedDict(stripes=stripes), n_threads)
+            results.append(f"striped({stripes:2}) {ops:10,.0f} ops/s")
+        print(f"{n_threads:2} threads | " + " | ".join(results))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+import time
+
+from safethread.thread.utils import ThreadPipeline, ThreadPipelineStage
+
+N_ITEMS = 100_000
+ROUNDS = 5
+
+
+def identity(x):
+    return x
+
+
+def bench(collect_stats: bool) -> float:
+    pipeline = ThreadPipeline([
+        ThreadPipelineStage(identity, collect_stats=collect_stats),
+        ThreadPipelineStage(identity, collect_stats=collect_stats),
+    ])
+    pipeline.start()
+    begin = time.perf_counter()
+    for item in range(N_ITEMS):
+        pipeline.put(item)
+    for _ in range(N_ITEMS):
+        pipeline.get()
+    elapsed = time.perf_counter() - begin
+    pipeline.stop_join()
+    return N_ITEMS / elapsed
+
+
+def main():
+    print(f"2-stage pipeline, trivial callback, {N_ITEMS:,} items (best of {ROUNDS})")
+    results = {}
+    for collect_stats in (False, True):
+        results[collect_stats] = max(bench(collect_stats) for _ in range(ROUNDS))
+        print(f"collect_stats={str(collect_stats):5} | {results[collect_stats]:10,.0f} items/s")
+    overhead = 1 - results[True] / results[False]
+    print(f"statistics overhead: {overhead:.1%}")
+
+
+if __name__ == "__main__":
+    main()
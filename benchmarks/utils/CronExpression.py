@@ -0,0 +1,38 @@
+import time
+
+from datetime import datetime
+
+from safethread.utils import CronExpression
+
+N_FIRES = 1_000
+EXPRESSIONS = (
+    "* * * * *",
+    "*/15 9-17 * * mon-fri",
+    "0 3 1 * *",
+    "30 4 * * sun",
+    "0 0 29 2 *",
+)
+
+
+def bench(expression: str):
+    begin = time.perf_counter()
+    cron = CronExpression(expression)
+    compiled = time.perf_counter() - begin
+
+    fire = datetime(2025, 1, 1)
+    begin = time.perf_counter()
+    for _ in range(N_FIRES):
+        fire = cron.next_fire(fire)
+    elapsed = time.perf_counter() - begin
+    print(f"{expression:24} | compile: {compiled*1e6:7.1f} us | next_fire: {elapsed/N_FIRES*1e6:8.2f} us "
+          f"({N_FIRES/elapsed:10,.0f}/s) | last fire: {fire:%Y-%m-%d %H:%M}")
+
+
+def main():
+    print(f"CronExpression.next_fire() - {N_FIRES:,} consecutive fire times per expression")
+    for expression in EXPRESSIONS:
+        bench(expression)
+
+
+if __name__ == "__main__":
+    main()
@@ -27,3 +27,14 @@ class AbstractLock(AbstractContext, Protocol):
         :raises NotImplementedError: if method is not overloaded
         """
         ...
+
+    def get_shared_lock(self) -> "AbstractLock":
+        """
+        Gets the lock used for shared (read-only) access.
+
+        Locks that do not distinguish readers from writers (the default) return themselves.
+
+        :return: The shared side of this lock.
+        :rtype: AbstractLock
+        """
+        return self
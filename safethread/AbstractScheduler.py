@@ -1,8 +1,13 @@
+import math
+import random
 import time
 
+from datetime import datetime
 from typing import Callable, Iterable
 
 from safethread.AbstractParallel import AbstractParallel
+from safethread.BaseEvent import BaseEvent
+from safethread.utils.CronExpression import CronExpression
 
 
 def _dummy_callback(*args) -> bool:
@@ -10,26 +15,207 @@ def _dummy_callback(*args) -> bool:
     return False
 
 
-def _run_scheduler(timeout: float, callback: Callable[..., bool], args: tuple) -> bool:
+class _ScheduleState:
     """
-    The main run loop of the scheduler. This will repeatedly execute the callback at 
-    the given interval (timeout) and stop after the first execution if repeat is False.
+    The next run of a scheduler (monotonic clock), computed from its timeout (or cron expression),
+    mode, misfire policy, jitter and backoff. The next due time is computed once, after each run.
 
-    If callback() returns False, stop scheduler process.
+    In FIXED_RATE mode, runs are aligned on a grid (`anchor + index * timeout`), so callback durations do not accumulate drift.
+    """
+
+    def __init__(self, timeout: float | str, mode: str, misfire: str, jitter: float = 0.0,
+                 backoff: float = 0.0, backoff_max: float | None = None, max_retries: int | None = None):
+        """
+        :raises ValueError: If an argument is invalid (see ``AbstractScheduler``).
+        """
+        super().__init__()
+
+        self.cron: CronExpression | None = None
+        if isinstance(timeout, str):
+            self.cron = CronExpression(timeout)
+            timeout = 0.0
+        if timeout < 0:
+            raise ValueError("'timeout' must be a non-negative number")
+        if mode not in AbstractScheduler.MODES:
+            raise ValueError(
+                f"Invalid mode '{mode}' (must be one of {AbstractScheduler.MODES})")
+        if misfire not in AbstractScheduler.MISFIRE_POLICIES:
+            raise ValueError(
+                f"Invalid misfire policy '{misfire}' (must be one of {AbstractScheduler.MISFIRE_POLICIES})")
+        if jitter < 0 or backoff < 0 or (backoff_max is not None and backoff_max < 0):
+            raise ValueError("'jitter', 'backoff' and 'backoff_max' must be non-negative numbers")
+        if max_retries is not None and max_retries < 0:
+            raise ValueError("'max_retries' must be a non-negative number")
+
+        self.timeout = timeout
+        self.mode = mode
+        self.misfire = misfire
+        self.jitter = jitter
+        self.backoff = backoff
+        self.backoff_max = backoff_max
+        self.max_retries = max_retries
+
+        self.anchor = 0.0
+        self.index = 0
+        self.due = 0.0
+        self.fire: datetime | None = None
+        self.failures = 0
+        # created by start() (in the thread / process), so forked processes do not share the random sequence
+        self.rng: random.Random | None = None
+
+    def __jitter(self) -> float:
+        """Returns a random delay between 0 and `jitter`."""
+        if not self.jitter or self.rng is None:
+            return 0.0
+        return self.rng.uniform(0.0, self.jitter)
+
+    def __next_cron(self, end: float, first: bool = False) -> float:
+        """Computes the next due time of a cron schedule (wall clock converted to the monotonic clock)."""
+        now = datetime.now()
+        fire = self.cron.next_fire(now if first else self.fire)  # type: ignore
+        if fire <= now and self.misfire != AbstractScheduler.MISFIRE_CATCH_UP:
+            if self.misfire == AbstractScheduler.MISFIRE_COALESCE:
+                # run once now, then go back to the schedule
+                self.fire = now
+                return end
+            fire = self.cron.next_fire(now)  # type: ignore
+        self.fire = fire
+        return end + (fire - now).total_seconds()
+
+    def start(self, now: float) -> float:
+        """
+        Schedules the first run (`timeout` seconds after `now`, or the next fire time of the cron expression).
+
+        :return: The due time of the first run.
+        :rtype: float
+        """
+        self.rng = random.Random()
+        self.anchor = now
+        self.index = 1
+        self.failures = 0
+        if self.cron is not None:
+            self.due = self.__next_cron(now, first=True)
+        else:
+            self.due = now + self.timeout
+        self.due += self.__jitter()
+        return self.due
+
+    def fail(self) -> bool:
+        """
+        Records a failed run (callback returned False, or raised an exception).
+
+        :return: True if the run must be retried (backoff enabled, and `max_retries` not reached), False otherwise.
+        :rtype: bool
+        """
+        if self.backoff <= 0:
+            return False
+        self.failures += 1
+        return self.max_retries is None or self.failures <= self.max_retries
+
+    def advance(self, end: float, failed: bool = False) -> float:
+        """
+        Schedules the next run, after a run that ended at `end`.
+
+        :param end: The end time of the run (monotonic clock).
+        :type end: float
+
+        :param failed: If True, the run failed, and the next run is a retry (exponential backoff). Defaults to False.
+        :type failed: bool, optional
+
+        :return: The due time of the next run.
+        :rtype: float
+        """
+        if failed:
+            delay = self.backoff * 2 ** min(self.failures - 1, 64)
+            if self.backoff_max is not None:
+                delay = min(delay, self.backoff_max)
+            self.due = end + delay + self.__jitter()
+            return self.due
+        self.failures = 0
+        if self.cron is not None:
+            self.due = self.__next_cron(end)
+        elif self.mode == AbstractScheduler.FIXED_DELAY or self.timeout <= 0:
+            self.due = end + self.timeout
+        else:
+            self.due = self.__next_slot(end)
+        self.due += self.__jitter()
+        return self.due
+
+    def __next_slot(self, end: float) -> float:
+        """Computes the next due time of the FIXED_RATE grid (applying the misfire policy)."""
+        self.index += 1
+        due = self.anchor + self.index * self.timeout
+        if due > end or self.misfire == AbstractScheduler.MISFIRE_CATCH_UP:
+            return due
+        # missed runs: find the next slot of the grid
+        index = math.floor((end - self.anchor) / self.timeout) + 1
+        if self.anchor + index * self.timeout <= end:
+            index += 1
+        if self.misfire == AbstractScheduler.MISFIRE_SKIP:
+            self.index = index
+            return self.anchor + index * self.timeout
+        # MISFIRE_COALESCE: run once now, then go back to the grid
+        self.index = index - 1
+        return end
+
+
+def _run_scheduler(callback: Callable[..., bool], args: tuple, stop: BaseEvent, state: _ScheduleState) -> bool:
+    """
+    The main run loop of the scheduler. This will repeatedly wait for the next due time
+    (on the stop event, so stop() interrupts the wait), and execute the callback.
+
+    A failed run (callback returns False, or raises an exception) is retried with an exponential backoff
+    (if enabled). Otherwise, the scheduler stops.
 
     This method runs in a separate process and should not be called directly.
     """
-    # Wait for timeout before running the callback
-    time.sleep(timeout)
-    return callback(*args)
+    if state.index == 0:
+        state.start(time.monotonic())
+    while True:
+        delay = state.due - time.monotonic()
+        # Wait for the due time before running the callback
+        if delay > 0 and stop.wait(delay):
+            return False
+        error: Exception | None = None
+        try:
+            result = callback(*args)
+        except Exception as e:
+            result, error = False, e
+        failed = isinstance(result, bool) and result == False
+        if not failed:
+            state.advance(time.monotonic())
+            return result
+        if not state.fail():
+            if error is not None:
+                raise error
+            return False
+        state.advance(time.monotonic(), failed=True)
 
 
 class AbstractScheduler(AbstractParallel):
     """
     An AbstractParallel scheduler that runs a given callback at regular intervals with an optional repeat option.
 
-    :param timeout: Time interval in seconds between each callback execution.
-    :type timeout: float
+    Timing modes:
+    - **FIXED_DELAY**: the callback runs `timeout` seconds after the end of the previous run (default).
+    - **FIXED_RATE**: the callback runs every `timeout` seconds (from the start), whatever the callback duration.
+
+    In FIXED_RATE mode, when a run ends after the next due time (misfire), the `misfire` policy applies:
+    - **MISFIRE_SKIP**: the missed runs are skipped, and the scheduler waits for the next due time.
+    - **MISFIRE_CATCH_UP**: the missed runs are executed immediately, one after another.
+    - **MISFIRE_COALESCE**: the missed runs are executed once, immediately (default).
+
+    With a cron expression as `timeout` (e.g., "*/5 * * * *"), the callback runs at the fire times of the
+    expression (local time), and the `misfire` policy applies when a fire time is missed.
+
+    A random `jitter` spreads the runs of schedulers started together (e.g., replicas of a service).
+    With `backoff`, a failed run (callback returns False, or raises an exception) is retried after `backoff`
+    seconds, doubled after each consecutive failure (up to `backoff_max`), instead of stopping the scheduler.
+
+    Waits are done on the stop event, so `stop()` interrupts them immediately (a running callback is not interrupted).
+
+    :param timeout: Time interval in seconds between each callback execution, or a cron expression.
+    :type timeout: float | str
 
     :param callback: The function (or callable) to execute at each timeout.
     :type callback: Callable
@@ -43,12 +229,35 @@ class AbstractScheduler(AbstractParallel):
     <img src="../../../img/thread/Scheduler.svg" alt="" width="100%">
     """
 
-    def __init__(self, timeout: float, callback: Callable[..., bool], args: Iterable | None = None, repeat: bool = True):
+    FIXED_DELAY = "fixed_delay"
+    """Timing mode: wait `timeout` seconds after the end of each run"""
+
+    FIXED_RATE = "fixed_rate"
+    """Timing mode: run every `timeout` seconds, whatever the callback duration"""
+
+    MODES = (FIXED_DELAY, FIXED_RATE)
+    """Available timing modes"""
+
+    MISFIRE_SKIP = "skip"
+    """Misfire policy: skip the missed runs"""
+
+    MISFIRE_CATCH_UP = "catch_up"
+    """Misfire policy: execute all the missed runs immediately"""
+
+    MISFIRE_COALESCE = "coalesce"
+    """Misfire policy: execute the missed runs once, immediately"""
+
+    MISFIRE_POLICIES = (MISFIRE_SKIP, MISFIRE_CATCH_UP, MISFIRE_COALESCE)
+    """Available misfire policies"""
+
+    def __init__(self, timeout: float | str, callback: Callable[..., bool], args: Iterable | None = None, repeat: bool = True,
+                 mode: str = FIXED_DELAY, misfire: str = MISFIRE_COALESCE, jitter: float = 0.0,
+                 backoff: float = 0.0, backoff_max: float | None = None, max_retries: int | None = None):
         """
         Initializes the scheduler with the given parameters.
 
-        :param timeout: Time interval in seconds between each callback execution.
-        :type timeout: float
+        :param timeout: Time interval in seconds between each callback execution, or a cron expression (see ``utils.CronExpression``).
+        :type timeout: float | str
 
         :param callback: The global function to execute at each timeout. NEEDS TO BE GLOBAL FUNCTION.
         :type callback: Callable[..., bool]
@@ -59,12 +268,36 @@ class AbstractScheduler(AbstractParallel):
         :param repeat: Whether the callback should be repeated indefinitely or just once. Defaults to True.
         :type repeat: bool, optional
 
+        :param mode: The timing mode (one of `MODES`). Defaults to FIXED_DELAY.
+        :type mode: str, optional
+
+        :param misfire: The misfire policy of the FIXED_RATE mode and cron expressions (one of `MISFIRE_POLICIES`). Defaults to MISFIRE_COALESCE.
+        :type misfire: str, optional
+
+        :param jitter: Maximum random delay (in seconds) added to each due time, including the first one. Defaults to 0.0.
+        :type jitter: float, optional
+
+        :param backoff: Delay (in seconds) before retrying a failed run, doubled after each consecutive failure.
+                        Defaults to 0.0 (no retry: a failed run stops the scheduler).
+        :type backoff: float, optional
+
+        :param backoff_max: Maximum retry delay (in seconds). Defaults to None (no limit).
+        :type backoff_max: float, optional
+
+        :param max_retries: Maximum number of consecutive retries, before the scheduler stops. Defaults to None (no limit).
+        :type max_retries: int, optional
+
         :raises TypeError: If 'callback' is not callable.
+        :raises ValueError: If 'timeout' is negative (or an invalid cron expression), 'mode' / 'misfire' is invalid,
+                            or 'jitter', 'backoff', 'backoff_max', 'max_retries' is negative.
         """
         # exception handling
         exception: Exception | None = None
 
-        self.__timeout: float = timeout
+        self.__timeout: float | str = timeout
+        self.__mode = mode
+        self.__misfire = misfire
+        self.__jitter = jitter
 
         self.__args = tuple(args or [])
         self.__callback: Callable[..., bool] = _dummy_callback
@@ -72,13 +305,23 @@ class AbstractScheduler(AbstractParallel):
             self.__callback = callback
         else:
             exception = TypeError("'callback' is not callable")
+        state = None
+        try:
+            state = _ScheduleState(timeout, mode, misfire, jitter=jitter, backoff=backoff,
+                                   backoff_max=backoff_max, max_retries=max_retries)
+        except ValueError as e:
+            exception = exception or e
+
+        # the scheduler loop waits on the stop event of the thread / process (see _create_terminate_event())
+        self.__stop = super()._create_terminate_event()
 
         super().__init__(
             callback=_run_scheduler,
             args=[
-                self.__timeout,
                 self.__callback,
                 self.__args,
+                self.__stop,
+                state,
             ],
             repeat=repeat,
         )
@@ -87,9 +330,30 @@ class AbstractScheduler(AbstractParallel):
         if exception:
             raise exception
 
+    def _create_terminate_event(self) -> BaseEvent:
+        """
+        Returns the stop event of the scheduler (shared with the scheduler loop, so stop() interrupts its waits).
+
+        :return: The stop event.
+        :rtype: BaseEvent
+        """
+        return self.__stop
+
     def get_args(self) -> tuple:
         return self.__args
 
-    def get_timeout(self) -> float:
-        """Returns scheduler timeout."""
+    def get_jitter(self) -> float:
+        """Returns the maximum random delay added to each due time."""
+        return self.__jitter
+
+    def get_misfire(self) -> str:
+        """Returns the misfire policy of the scheduler."""
+        return self.__misfire
+
+    def get_mode(self) -> str:
+        """Returns the timing mode of the scheduler."""
+        return self.__mode
+
+    def get_timeout(self) -> float | str:
+        """Returns scheduler timeout (or cron expression)."""
         return self.__timeout
@@ -1,5 +1,6 @@
 
 import logging
+import operator
 from typing import Any, Callable, Self
 
 from safethread.AbstractLock import AbstractLock
@@ -28,7 +29,7 @@ class AbstractSafeBase:
         :return: Integer representation of the object.
         :rtype: int
         """
-        with self._lock:
+        with self._read_lock:
             return self._data.__index__()
 
     def __ceil__(self):
@@ -38,7 +39,7 @@ class AbstractSafeBase:
         :return: The smallest integer greater than or equal to the object.
         :rtype: int
         """
-        with self._lock:
+        with self._read_lock:
             return self._data.__ceil__()
 
     def __floor__(self):
@@ -48,7 +49,7 @@ class AbstractSafeBase:
         :return: The largest integer less than or equal to the object.
         :rtype: int
         """
-        with self._lock:
+        with self._read_lock:
             return self._data.__floor__()
 
     def __trunc__(self):
@@ -58,7 +59,7 @@ class AbstractSafeBase:
         :return: The truncated integer value.
         :rtype: int
         """
-        with self._lock:
+        with self._read_lock:
             return self._data.__trunc__()
 
     def __round__(self, n=0):
@@ -69,7 +70,7 @@ class AbstractSafeBase:
         :return: The rounded value of the object.
         :rtype: float
         """
-        with self._lock:
+        with self._read_lock:
             return self._data.__round__(n)
 
     def __divmod__(self, other):
@@ -81,9 +82,7 @@ class AbstractSafeBase:
         :return: A tuple containing the quotient and remainder.
         :rtype: tuple
         """
-        other = self.create(other)
-        with self._lock, other._lock:
-            return divmod(self._data, other._data)
+        return self._binary_op(divmod, other)
 
     def __iadd__(self, other):
         """
@@ -92,10 +91,8 @@ class AbstractSafeBase:
         :param other: Another `SafeBaseObj` to add.
         :return: The modified `SafeBaseObj`.
         """
-        other = self.create(other)
-        with self._lock, other._lock:
-            self._data += other._data
-            return self
+        self._binary_op(operator.iadd, other, write=True)
+        return self
 
     def __add__(self, other):
         """
@@ -104,9 +101,7 @@ class AbstractSafeBase:
         :param other: Another `SafeBaseObj` to add.
         :return: A new `SafeBaseObj` containing the sum of the two objects.
         """
-        other = self.create(other)
-        with self._lock, other._lock:
-            return self.create(self._data + other._data)
+        return self.create(self._binary_op(operator.add, other))
 
     def __sub__(self, other):
         """
@@ -117,9 +112,7 @@ class AbstractSafeBase:
         :return: A new instance representing the result of the subtraction.
         :rtype: SafeBaseObj
         """
-        other = self.create(other)
-        with self._lock, other._lock:
-            return self.create(self._data - other._data)
+        return self.create(self._binary_op(operator.sub, other))
 
     def __mul__(self, other):
         """
@@ -130,9 +123,7 @@ class AbstractSafeBase:
         :return: A new instance representing the result of the multiplication.
         :rtype: SafeBaseObj
         """
-        other = self.create(other)
-        with self._lock, other._lock:
-            return self.create(self._data * other._data)
+        return self.create(self._binary_op(operator.mul, other))
 
     def __truediv__(self, other):
         """
@@ -143,9 +134,7 @@ class AbstractSafeBase:
         :return: A new instance representing the result of the division.
         :rtype: SafeBaseObj
         """
-        other = self.create(other)
-        with self._lock, other._lock:
-            return self.create(self._data / other._data)
+        return self.create(self._binary_op(operator.truediv, other))
 
     def __floordiv__(self, other):
         """
@@ -156,9 +145,7 @@ class AbstractSafeBase:
         :return: A new instance representing the result of the floor division.
         :rtype: SafeBaseObj
         """
-        other = self.create(other)
-        with self._lock, other._lock:
-            return self.create(self._data // other._data)
+        return self.create(self._binary_op(operator.floordiv, other))
 
     def __mod__(self, other):
         """
@@ -169,9 +156,7 @@ class AbstractSafeBase:
         :return: A new instance representing the remainder of the division.
         :rtype: SafeBaseObj
         """
-        other = self.create(other)
-        with self._lock, other._lock:
-            return self.create(self._data % other._data)
+        return self.create(self._binary_op(operator.mod, other))
 
     def __pow__(self, other):
         """
@@ -182,9 +167,7 @@ class AbstractSafeBase:
         :return: A new instance representing the result of exponentiation.
         :rtype: SafeBaseObj
         """
-        other = self.create(other)
-        with self._lock, other._lock:
-            return self.create(self._data ** other._data)
+        return self.create(self._binary_op(operator.pow, other))
 
     def __lshift__(self, other):
         """
@@ -195,9 +178,7 @@ class AbstractSafeBase:
         :return: A new instance representing the left-shifted value.
         :rtype: SafeBaseObj
         """
-        other = self.create(other)
-        with self._lock, other._lock:
-            return self.create(self._data << other._data)
+        return self.create(self._binary_op(operator.lshift, other))
 
     def __rshift__(self, other):
         """
@@ -208,9 +189,7 @@ class AbstractSafeBase:
         :return: A new instance representing the right-shifted value.
         :rtype: SafeBaseObj
         """
-        other = self.create(other)
-        with self._lock, other._lock:
-            return self.create(self._data >> other._data)
+        return self.create(self._binary_op(operator.rshift, other))
 
     def __and__(self, other):
         """
@@ -221,9 +200,7 @@ class AbstractSafeBase:
         :return: A new instance representing the result of the AND operation.
         :rtype: SafeBaseObj
         """
-        other = self.create(other)
-        with self._lock, other._lock:
-            return self.create(self._data & other._data)
+        return self.create(self._binary_op(operator.and_, other))
 
     def __or__(self, other):
         """
@@ -234,9 +211,7 @@ class AbstractSafeBase:
         :return: A new instance representing the result of the OR operation.
         :rtype: SafeBaseObj
         """
-        other = self.create(other)
-        with self._lock, other._lock:
-            return self.create(self._data | other._data)
+        return self.create(self._binary_op(operator.or_, other))
 
     def __xor__(self, other):
         """
@@ -247,9 +222,7 @@ class AbstractSafeBase:
         :return: A new instance representing the result of the XOR operation.
         :rtype: SafeBaseObj
         """
-        other = self.create(other)
-        with self._lock, other._lock:
-            return self.create(self._data ^ other._data)
+        return self.create(self._binary_op(operator.xor, other))
 
     def __radd__(self, other):
         """
@@ -260,8 +233,7 @@ class AbstractSafeBase:
         :return: A new instance representing the result of the addition.
         :rtype: SafeBaseObj
         """
-        other = self.create(other)
-        return other.__add__(self)
+        return self.create(self._binary_op(operator.add, other, reflected=True))
 
     def __rsub__(self, other):
         """
@@ -272,8 +244,7 @@ class AbstractSafeBase:
         :return: A new instance representing the result of the subtraction.
         :rtype: SafeBaseObj
         """
-        other = self.create(other)
-        return other.__sub__(self)
+        return self.create(self._binary_op(operator.sub, other, reflected=True))
 
     def __rmul__(self, other):
         """
@@ -284,8 +255,7 @@ class AbstractSafeBase:
         :return: A new instance representing the result of the multiplication.
         :rtype: SafeBaseObj
         """
-        other = self.create(other)
-        return other.__mul__(self)
+        return self.create(self._binary_op(operator.mul, other, reflected=True))
 
     def __rtruediv__(self, other):
         """
@@ -296,8 +266,7 @@ class AbstractSafeBase:
         :return: A new instance representing the result of the division.
         :rtype: SafeBaseObj
         """
-        other = self.create(other)
-        return other.__truediv__(self)
+        return self.create(self._binary_op(operator.truediv, other, reflected=True))
 
     def __rfloordiv__(self, other):
         """
@@ -308,8 +277,7 @@ class AbstractSafeBase:
         :return: A new instance representing the result of the floor division.
         :rtype: SafeBaseObj
         """
-        other = self.create(other)
-        return other.__floordiv__(self)
+        return self.create(self._binary_op(operator.floordiv, other, reflected=True))
 
     def __rmod__(self, other):
         """
@@ -320,8 +288,7 @@ class AbstractSafeBase:
         :return: A new instance representing the remainder.
         :rtype: SafeBaseObj
         """
-        other = self.create(other)
-        return other.__mod__(self)
+        return self.create(self._binary_op(operator.mod, other, reflected=True))
 
     def __rpow__(self, other):
         """
@@ -332,8 +299,7 @@ class AbstractSafeBase:
         :return: A new instance representing the result of exponentiation.
         :rtype: SafeBaseObj
         """
-        other = self.create(other)
-        return other.__pow__(self)
+        return self.create(self._binary_op(operator.pow, other, reflected=True))
 
     def __rlshift__(self, other):
         """
@@ -344,8 +310,7 @@ class AbstractSafeBase:
         :return: A new instance representing the left-shifted value.
         :rtype: SafeBaseObj
         """
-        other = self.create(other)
-        return other.__lshift__(self)
+        return self.create(self._binary_op(operator.lshift, other, reflected=True))
 
     def __rrshift__(self, other):
         """
@@ -356,8 +321,7 @@ class AbstractSafeBase:
         :return: A new instance representing the right-shifted value.
         :rtype: SafeBaseObj
         """
-        other = self.create(other)
-        return other.__rshift__(self)
+        return self.create(self._binary_op(operator.rshift, other, reflected=True))
 
     def __rand__(self, other):
         """
@@ -368,8 +332,7 @@ class AbstractSafeBase:
         :return: A new instance representing the result of the AND operation.
         :rtype: SafeBaseObj
         """
-        other = self.create(other)
-        return other.__and__(self)
+        return self.create(self._binary_op(operator.and_, other, reflected=True))
 
     def __ror__(self, other):
         """
@@ -380,8 +343,7 @@ class AbstractSafeBase:
         :return: A new instance representing the result of the OR operation.
         :rtype: SafeBaseObj
         """
-        other = self.create(other)
-        return other.__or__(self)
+        return self.create(self._binary_op(operator.or_, other, reflected=True))
 
     def __rxor__(self, other):
         """
@@ -392,8 +354,7 @@ class AbstractSafeBase:
         :return: A new instance representing the result of the XOR operation.
         :rtype: SafeBaseObj
         """
-        other = self.create(other)
-        return other.__xor__(self)
+        return self.create(self._binary_op(operator.xor, other, reflected=True))
 
     def __abs__(self):
         """
@@ -404,7 +365,7 @@ class AbstractSafeBase:
         :return: A new instance representing the absolute value.
         :rtype: SafeBaseObj
         """
-        with self._lock:
+        with self._read_lock:
             return self.create(abs(self._data))
 
     def __neg__(self):
@@ -416,7 +377,7 @@ class AbstractSafeBase:
         :return: A new instance representing the negated value.
         :rtype: SafeBaseObj
         """
-        with self._lock:
+        with self._read_lock:
             return self.create(-self._data)
 
     def __pos__(self):
@@ -428,7 +389,7 @@ class AbstractSafeBase:
         :return: A new instance representing the positive value.
         :rtype: SafeBaseObj
         """
-        with self._lock:
+        with self._read_lock:
             return self.create(+self._data)
 
     def __invert__(self):
@@ -440,7 +401,7 @@ class AbstractSafeBase:
         :return: A new instance representing the bitwise-inverted value.
         :rtype: SafeBaseObj
         """
-        with self._lock:
+        with self._read_lock:
             return self.create(~self._data)
 
     def __ne__(self, other) -> bool:
@@ -461,9 +422,7 @@ class AbstractSafeBase:
         :param other: Another `SafeBaseObj` to compare.
         :return: `True` if equal, otherwise `False`.
         """
-        other = self.create(other)
-        with self._lock, other._lock:
-            return self._data == other._data
+        return self._binary_op(operator.eq, other)
 
     def __lt__(self, other):
         """
@@ -474,9 +433,7 @@ class AbstractSafeBase:
         :return: `True` if the object is less than the other object, otherwise `False`.
         :rtype: bool
         """
-        other = self.create(other)
-        with self._lock, other._lock:
-            return self._data < other._data
+        return self._binary_op(operator.lt, other)
 
     def __le__(self, other):
         """
@@ -498,9 +455,7 @@ class AbstractSafeBase:
         :return: `True` if the object is greater than the other object, otherwise `False`.
         :rtype: bool
         """
-        other = self.create(other)
-        with self._lock, other._lock:
-            return self._data > other._data
+        return self._binary_op(operator.gt, other)
 
     def __ge__(self, other):
         """
@@ -520,7 +475,7 @@ class AbstractSafeBase:
         :param index: The index of the item to retrieve.
         :return: The item at the given index.
         """
-        with self._lock:
+        with self._read_lock:
             return self._data[index]
 
     def __setitem__(self, index, value):
@@ -553,7 +508,7 @@ class AbstractSafeBase:
         :return: `True` if the value exists in the object, otherwise `False`.
         :rtype: bool
         """
-        with self._lock:
+        with self._read_lock:
             return value in self._data
 
     def __sizeof__(self):
@@ -563,7 +518,7 @@ class AbstractSafeBase:
         :return: The size of the object in bytes.
         :rtype: int
         """
-        with self._lock:
+        with self._read_lock:
             return self._data.__sizeof__() + self._lock.__sizeof__()
 
     def __len__(self):
@@ -572,7 +527,7 @@ class AbstractSafeBase:
 
         :return: The length of the internal data.
         """
-        with self._lock:
+        with self._read_lock:
             return len(self._data)
 
     def __iter__(self):
@@ -582,7 +537,7 @@ class AbstractSafeBase:
         :return: An iterator for the object's data.
         :rtype: iterator
         """
-        with self._lock:
+        with self._read_lock:
             return iter(self._data)
 
     def __hash__(self):
@@ -592,7 +547,7 @@ class AbstractSafeBase:
         :return: The hash value of the object's data.
         :rtype: int
         """
-        with self._lock:
+        with self._read_lock:
             return hash(self._data)
 
     def __repr__(self):
@@ -601,7 +556,7 @@ class AbstractSafeBase:
 
         :return: A string representation of the object.
         """
-        with self._lock:
+        with self._read_lock:
             return repr(self._data)
 
     def __str__(self):
@@ -610,7 +565,7 @@ class AbstractSafeBase:
 
         :return: A string representation of the object.
         """
-        with self._lock:
+        with self._read_lock:
             return str(self._data)
 
     def __bool__(self):
@@ -619,7 +574,7 @@ class AbstractSafeBase:
 
         :return: `True` if the object is truthy, otherwise `False`.
         """
-        with self._lock:
+        with self._read_lock:
             return bool(self._data)
 
     def __int__(self):
@@ -629,7 +584,7 @@ class AbstractSafeBase:
         :return: The integer representation of the object's data.
         :rtype: int
         """
-        with self._lock:
+        with self._read_lock:
             return int(self._data)
 
     def __float__(self):
@@ -639,7 +594,7 @@ class AbstractSafeBase:
         :return: The float representation of the object's data.
         :rtype: float
         """
-        with self._lock:
+        with self._read_lock:
             return float(self._data)
 
     def __init__(self, data: Any):
@@ -659,6 +614,52 @@ class AbstractSafeBase:
             self._lock = data._lock
         else:
             self._lock = self._create_lock()
+        # read-only methods use the shared side of the lock (if any)
+        self._read_lock = self._lock.get_shared_lock()
+
+    def _binary_op(self, op: Callable[[Any, Any], Any], other: Any, reflected: bool = False, write: bool = False) -> Any:
+        """
+        Apply a binary operation to the internal data and `other`, safely.
+
+        Plain values are used as they are (no new safe object is created). If `other` is a safe object,
+        the locks of both objects are acquired in a stable order (by lock identity), which prevents
+        deadlocks between threads running `a op b` and `b op a` concurrently.
+
+        :param op: The binary operation (e.g., ``operator.add``).
+        :type op: Callable[[Any, Any], Any]
+        :param other: The other operand (a safe object or a plain value).
+        :type other: Any
+        :param reflected: If True, computes `op(other, data)` instead of `op(data, other)`. Defaults to False.
+        :type reflected: bool, optional
+        :param write: If True, stores the result as the new internal data (in-place operations),
+                      holding the exclusive lock of this object. Defaults to False.
+        :type write: bool, optional
+
+        :return: The result of the operation.
+        :rtype: Any
+        """
+        lock = self._lock if write else self._read_lock
+        if not isinstance(other, AbstractSafeBase):
+            with lock:
+                return self.__apply(op, other, reflected, write)
+        if other._lock is self._lock:
+            with lock:
+                return self.__apply(op, other._data, reflected, write)
+        if id(self._lock) < id(other._lock):
+            first, second = lock, other._read_lock
+        else:
+            first, second = other._read_lock, lock
+        with first, second:
+            return self.__apply(op, other._data, reflected, write)
+
+    def __apply(self, op: Callable[[Any, Any], Any], value: Any, reflected: bool, write: bool) -> Any:
+        """
+        Apply a binary operation to the internal data and a value (the caller must hold the locks).
+        """
+        result = op(value, self._data) if reflected else op(self._data, value)
+        if write:
+            self._data = result
+        return result
 
     def _create_data(self, data: Any | None) -> Any:
         """
@@ -726,5 +727,5 @@ class AbstractSafeBase:
 
         :raises AttributeError: if self._data.copy() does not exist
         """
-        with self._lock:
+        with self._read_lock:
             return self._data.copy()
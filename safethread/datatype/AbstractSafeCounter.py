@@ -0,0 +1,286 @@
+
+import math
+
+from typing import Any, Callable
+
+from .AbstractSafeBase import AbstractSafeBase
+
+
+class AbstractSafeCounter(AbstractSafeBase):
+    """
+    A base class for atomic counters / accumulators.
+
+    Subclasses store the value of the counter and implement `get()`, `set()`, `add()`,
+    `get_and_add()` and `compare_and_set()`. This class maps the numeric operators
+    (e.g., `int(counter)`, `counter == 1`, `counter += 1`) to those methods.
+
+    In sharded mode, every thread / process adds to its own shard (no contention among writers),
+    and `get()` aggregates the shards. In this mode, `get_and_add()` and `compare_and_set()`
+    are not available, because there is no single value to compare with.
+    """
+
+    def __abs__(self):
+        """
+        Return the absolute value of the counter.
+
+        :return: A new counter with the absolute value.
+        :rtype: AbstractSafeCounter
+        """
+        return self.create(abs(self.get()))
+
+    def __bool__(self):
+        """
+        Check if the counter value is non-zero.
+
+        :return: `True` if the value is non-zero, otherwise `False`.
+        :rtype: bool
+        """
+        return bool(self.get())
+
+    def __ceil__(self):
+        """
+        Return the ceiling of the counter value.
+
+        :return: The smallest integer greater than or equal to the value.
+        :rtype: int
+        """
+        return math.ceil(self.get())
+
+    def __float__(self):
+        """
+        Convert the counter value to a float.
+
+        :return: The value as a float.
+        :rtype: float
+        """
+        return float(self.get())
+
+    def __floor__(self):
+        """
+        Return the floor of the counter value.
+
+        :return: The largest integer less than or equal to the value.
+        :rtype: int
+        """
+        return math.floor(self.get())
+
+    def __hash__(self):
+        """
+        Return the hash of the current counter value.
+
+        :return: The hash of the value.
+        :rtype: int
+        """
+        return hash(self.get())
+
+    def __iadd__(self, other):
+        """
+        Add a value to the counter (same as `add()`).
+
+        :param other: The value to add.
+        :return: This counter.
+        """
+        if isinstance(other, AbstractSafeBase):
+            other = other.copy_obj()
+        self.add(other)
+        return self
+
+    def __index__(self):
+        """
+        Convert the counter value to an index (e.g., for slicing or `bin()`).
+
+        :return: The value as an integer.
+        :rtype: int
+        """
+        return self.get().__index__()
+
+    def __int__(self):
+        """
+        Convert the counter value to an integer.
+
+        :return: The value as an integer.
+        :rtype: int
+        """
+        return int(self.get())
+
+    def __invert__(self):
+        """
+        Return the bitwise inversion of the counter value.
+
+        :return: A new counter with the inverted value.
+        :rtype: AbstractSafeCounter
+        """
+        return self.create(~self.get())
+
+    def __isub__(self, other):
+        """
+        Subtract a value from the counter (same as `add(-other)`).
+
+        :param other: The value to subtract.
+        :return: This counter.
+        """
+        if isinstance(other, AbstractSafeBase):
+            other = other.copy_obj()
+        self.add(-other)
+        return self
+
+    def __neg__(self):
+        """
+        Return the negated counter value.
+
+        :return: A new counter with the negated value.
+        :rtype: AbstractSafeCounter
+        """
+        return self.create(-self.get())
+
+    def __pos__(self):
+        """
+        Return the counter value with unary plus.
+
+        :return: A new counter with the value.
+        :rtype: AbstractSafeCounter
+        """
+        return self.create(+self.get())
+
+    def __repr__(self):
+        """
+        Return the representation of the counter value.
+
+        :return: The representation of the value.
+        :rtype: str
+        """
+        return repr(self.get())
+
+    def __round__(self, n=0):
+        """
+        Round the counter value.
+
+        :param n: The number of decimals. Defaults to 0.
+        :type n: int, optional
+
+        :return: The rounded value.
+        :rtype: int or float
+        """
+        return round(self.get(), n)
+
+    def __str__(self):
+        """
+        Return the counter value as a string.
+
+        :return: The value as a string.
+        :rtype: str
+        """
+        return str(self.get())
+
+    def __trunc__(self):
+        """
+        Truncate the counter value towards zero.
+
+        :return: The truncated value.
+        :rtype: int
+        """
+        return math.trunc(self.get())
+
+    def _binary_op(self, op: Callable[[Any, Any], Any], other: Any, reflected: bool = False, write: bool = False) -> Any:
+        """
+        Apply a binary operator to the counter value (see ``AbstractSafeBase._binary_op()``).
+
+        The operands are plain values (the counter value and `other`), and in-place operators
+        set the result under the write lock.
+        """
+        if isinstance(other, AbstractSafeBase):
+            other = other.copy_obj()
+        if not write:
+            value = self.get()
+            return op(other, value) if reflected else op(value, other)
+        # read-modify-write: no update between get() and set() (the lock is reentrant)
+        with self._lock:
+            value = self.get()
+            result = op(other, value) if reflected else op(value, other)
+            self.set(result)
+        return result
+
+    def add(self, delta=1):
+        """
+        Atomically add a value to the counter.
+
+        :param delta: The value to add. Defaults to 1.
+        :type delta: int or float, optional
+
+        :raises NotImplementedError: If the method is not overridden by a subclass.
+        """
+        raise NotImplementedError("Method NOT overloaded")
+
+    def compare_and_set(self, expected, value) -> bool:
+        """
+        Atomically set the counter to `value`, if its current value is `expected`.
+
+        :param expected: The expected current value.
+        :type expected: int or float
+        :param value: The new value.
+        :type value: int or float
+
+        :raises NotImplementedError: If the method is not overridden by a subclass, or in sharded mode.
+
+        :return: True if the counter was updated, False otherwise.
+        :rtype: bool
+        """
+        raise NotImplementedError("Method NOT overloaded")
+
+    def copy_obj(self):
+        """
+        Return the current value of the counter.
+
+        :return: The current value.
+        :rtype: int or float
+        """
+        return self.get()
+
+    def get(self):
+        """
+        Return the current value of the counter (in sharded mode, the sum of all shards).
+
+        :raises NotImplementedError: If the method is not overridden by a subclass.
+
+        :return: The current value.
+        :rtype: int or float
+        """
+        raise NotImplementedError("Method NOT overloaded")
+
+    def get_and_add(self, delta=1):
+        """
+        Atomically add a value to the counter, returning the previous value.
+
+        :param delta: The value to add. Defaults to 1.
+        :type delta: int or float, optional
+
+        :raises NotImplementedError: If the method is not overridden by a subclass, or in sharded mode.
+
+        :return: The value before the addition.
+        :rtype: int or float
+        """
+        raise NotImplementedError("Method NOT overloaded")
+
+    def is_sharded(self) -> bool:
+        """
+        Checks if the counter is in sharded mode.
+
+        :raises NotImplementedError: If the method is not overridden by a subclass.
+
+        :return: True if sharded, False otherwise.
+        :rtype: bool
+        """
+        raise NotImplementedError("Method NOT overloaded")
+
+    def set(self, value):
+        """
+        Set the value of the counter.
+
+        In sharded mode, additions made concurrently with `set()` are kept.
+
+        :param value: The new value.
+        :type value: int or float
+
+        :raises NotImplementedError: If the method is not overridden by a subclass.
+        """
+        raise NotImplementedError("Method NOT overloaded")
@@ -39,7 +39,7 @@ class AbstractSafeDict(AbstractSafeBase):
         :return: The value associated with the key, or the default value.
         :rtype: Any
         """
-        with self._lock:
+        with self._read_lock:
             return self._data.get(key, default)
 
     def items(self):
@@ -49,7 +49,7 @@ class AbstractSafeDict(AbstractSafeBase):
         :return: A view object displaying the dictionary's items.
         :rtype: dict_items
         """
-        with self._lock:
+        with self._read_lock:
             return self._data.items()
 
     def keys(self):
@@ -59,7 +59,7 @@ class AbstractSafeDict(AbstractSafeBase):
         :return: A view object displaying the dictionary's keys.
         :rtype: dict_keys
         """
-        with self._lock:
+        with self._read_lock:
             return self._data.keys()
 
     def pop(self, key, default=None):
@@ -135,5 +135,5 @@ class AbstractSafeDict(AbstractSafeBase):
         :return: A view object displaying the dictionary's values.
         :rtype: dict_values
         """
-        with self._lock:
+        with self._read_lock:
             return self._data.values()
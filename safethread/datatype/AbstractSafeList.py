@@ -43,7 +43,7 @@ class AbstractSafeList(AbstractSafeBase):
         :return: The number of occurrences of the item in the list.
         :rtype: int
         """
-        with self._lock:
+        with self._read_lock:
             return self._data.count(value)
 
     def extend(self, values):
@@ -56,6 +56,19 @@ class AbstractSafeList(AbstractSafeBase):
         with self._lock:
             self._data.extend(values)
 
+    def get_many(self, indices: Iterable[int]) -> list:
+        """
+        Returns the items at the given indices safely (atomically).
+
+        :param indices: The indices of the items to return.
+        :type indices: Iterable[int]
+        :return: The items, in the same order as `indices`.
+        :rtype: list
+        :raises IndexError: If any index is out of range.
+        """
+        with self._read_lock:
+            return [self._data[i] for i in indices]
+
     def index(self, value, start=0, end=None):
         """
         Returns the index of the first matching item safely.
@@ -70,7 +83,7 @@ class AbstractSafeList(AbstractSafeBase):
         :rtype: int
         :raises ValueError: If the item is not found in the list.
         """
-        with self._lock:
+        with self._read_lock:
             return self._data.index(value, start, end if end is not None else len(self._data))
 
     def insert(self, index, value):
@@ -98,6 +111,24 @@ class AbstractSafeList(AbstractSafeBase):
         with self._lock:
             return self._data.pop(index)
 
+    def pop_many(self, n: int) -> list:
+        """
+        Removes and returns the last `n` items from the list safely (atomically).
+
+        If the list has less than `n` items, all items are removed.
+
+        :param n: The maximum number of items to remove.
+        :type n: int
+        :return: The removed items, in list order.
+        :rtype: list
+        """
+        with self._lock:
+            if n <= 0:
+                return []
+            items = self._data[-n:]
+            del self._data[-n:]
+            return items
+
     def remove(self, value):
         """
         Removes an item from the list safely.
@@ -116,6 +147,16 @@ class AbstractSafeList(AbstractSafeBase):
         with self._lock:
             self._data.reverse()
 
+    def snapshot(self) -> list:
+        """
+        Returns a consistent copy of the list safely.
+
+        :return: A copy of the list.
+        :rtype: list
+        """
+        with self._read_lock:
+            return self._data[:]
+
     def sort(self, **kwargs):
         """
         Sorts the list safely.
@@ -5,7 +5,7 @@ import queue
 import multiprocessing
 import multiprocessing.queues
 
-from typing import Any, Iterable, Self
+from typing import Any, Iterable
 
 from .AbstractSafeBase import AbstractSafeBase
 
@@ -18,23 +18,13 @@ class AbstractSafeQueue(AbstractSafeBase):
 
     def __iter__(self):
         """
-        Returns an iterator over the queue's items. Since multiprocessing.Queue is not directly iterable,
-        we dequeue items until empty (not thread-safe for concurrent access).
+        Returns an iterator over a snapshot of the queue's items (see `snapshot()`).
 
-        :return: Generator yielding queue items.
-        """
-        # Temporarily store all items in a list
-        with self._lock:
-            temp_items = []
-            while not self._data.empty():
-                temp_items.append(self._data.get())
-
-            # Re-enqueue the items back into the queue
-            for item in temp_items:
-                self._data.put(item)
+        The queue is not modified.
 
-            # Yield items from the temporary list
-            yield from temp_items
+        :return: Iterator over the queue items.
+        """
+        return iter(self.snapshot())
 
     def __init__(self, data: queue.Queue | multiprocessing.queues.Queue | int | Iterable | None = None):
         """
@@ -68,17 +58,13 @@ class AbstractSafeQueue(AbstractSafeBase):
             for item in data:
                 instance.put(item)
 
-    def copy_obj(self) -> Self:
-        with self._lock:
-            # Temporarily store all items in a list
-            temp_items = []
-            while not self._data.empty():
-                temp_items.append(self._data.get())
+    def copy_obj(self):
+        """
+        Return a copy of the internal queue (same type), holding the items of `snapshot()`.
 
-            # Re-enqueue the items back into the queue
-            for item in temp_items:
-                self._data.put(item)
-            return self._create_data(temp_items)
+        :raises NotImplementedError: Method NOT overloaded.
+        """
+        raise NotImplementedError("Method NOT overloaded")
 
     def empty(self) -> bool:
         """
@@ -136,6 +122,66 @@ class AbstractSafeQueue(AbstractSafeBase):
         """
         return self._data.get(block=block, timeout=timeout)
 
+    def get_many(self, max_items: int, block: bool = True, timeout: float | None = None) -> list:
+        """
+        Retrieve up to `max_items` items from the queue, in a single operation.
+
+        It waits (like `get()`) for the first item, then returns the items immediately available (at most `max_items`).
+
+        :param max_items: The maximum number of items to retrieve.
+        :type max_items: int
+
+        :param block: If True, block until an item is available. If False, raise the Empty exception if no item is immediately available. Default is True.
+        :type block: bool, optional
+
+        :param timeout: The maximum time to wait for the first item. If None, wait indefinitely. Default is None.
+        :type timeout: float, optional
+
+        :return: The items retrieved from the queue (empty list if `max_items` <= 0).
+        :rtype: list
+
+        :raises queue.Empty: If no item is available and block is False or the timeout expires.
+        """
+        if max_items <= 0:
+            return []
+        items = [self.get(block=block, timeout=timeout)]
+        while len(items) < max_items:
+            try:
+                items.append(self.get_nowait())
+            except queue.Empty:
+                break
+        return items
+
+    def put_many(self, items: Iterable, block: bool = True, timeout: float | None = None):
+        """
+        Put multiple items into the queue, in a single operation.
+
+        :param items: The items to be put into the queue.
+        :type items: Iterable
+
+        :param block: If True, blocks until a free slot is available. If False, raises the Full exception if no free slot is immediately available.
+        :type block: bool, optional
+
+        :param timeout: The maximum time to wait for a free slot. If None, waits indefinitely.
+        :type timeout: float or None, optional
+
+        :raises queue.Full: If no free slot is available and block is False or the timeout expires.
+        """
+        for item in items:
+            self.put(item, block=block, timeout=timeout)
+
+    def peek(self) -> Any:
+        """
+        Return the next item of the queue, without removing it.
+
+        :return: The item at the front of the queue.
+        :rtype: Any
+
+        :raises queue.Empty: If the queue is empty.
+        :raises NotImplementedError: Method NOT overloaded.
+        """
+        raise NotImplementedError("Method NOT overloaded")
+
     def put(self, item: Any, block: bool = True, timeout: float | None = None):
         """
         Put an item into the queue.
@@ -159,6 +205,19 @@ class AbstractSafeQueue(AbstractSafeBase):
         """
         return self._data.qsize()
 
+    def snapshot(self) -> list:
+        """
+        Return a list of the items in the queue (front first), without removing them.
+
+        Producers and consumers are only blocked while the items are copied.
+
+        :return: The items of the queue.
+        :rtype: list
+
+        :raises NotImplementedError: Method NOT overloaded.
+        """
+        raise NotImplementedError("Method NOT overloaded")
+
     def clear(self):
         """
         Clears the queue
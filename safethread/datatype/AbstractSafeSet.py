@@ -43,7 +43,7 @@ class AbstractSafeSet(AbstractSafeBase):
         :return: A new set with the difference.
         :rtype: set
         """
-        with self._lock:  # Ensure  safety
+        with self._read_lock:  # Ensure  safety
             return self._data.difference(*others)
 
     def difference_update(self, *others):
@@ -75,7 +75,7 @@ class AbstractSafeSet(AbstractSafeBase):
         :return: A new set with the intersection.
         :rtype: set
         """
-        with self._lock:  # Ensure  safety
+        with self._read_lock:  # Ensure  safety
             return self._data.intersection(*others)
 
     def intersection_update(self, *others):
@@ -97,7 +97,7 @@ class AbstractSafeSet(AbstractSafeBase):
         :return: `True` if the sets are disjoint, otherwise `False`.
         :rtype: bool
         """
-        with self._lock:  # Ensure  safety
+        with self._read_lock:  # Ensure  safety
             return self._data.isdisjoint(other)
 
     def issubset(self, other):
@@ -109,7 +109,7 @@ class AbstractSafeSet(AbstractSafeBase):
         :return: `True` if the set is a subset, otherwise `False`.
         :rtype: bool
         """
-        with self._lock:  # Ensure  safety
+        with self._read_lock:  # Ensure  safety
             return self._data.issubset(other)
 
     def issuperset(self, other):
@@ -121,7 +121,7 @@ class AbstractSafeSet(AbstractSafeBase):
         :return: `True` if the set is a superset, otherwise `False`.
         :rtype: bool
         """
-        with self._lock:  # Ensure  safety
+        with self._read_lock:  # Ensure  safety
             return self._data.issuperset(other)
 
     def pop(self):
@@ -155,7 +155,7 @@ class AbstractSafeSet(AbstractSafeBase):
         :return: A new set with the symmetric difference.
         :rtype: set
         """
-        with self._lock:  # Ensure  safety
+        with self._read_lock:  # Ensure  safety
             return self._data.symmetric_difference(other)
 
     def symmetric_difference_update(self, other):
@@ -177,7 +177,7 @@ class AbstractSafeSet(AbstractSafeBase):
         :return: A new set with the union.
         :rtype: set
         """
-        with self._lock:  # Ensure  safety
+        with self._read_lock:  # Ensure  safety
             return self._data.union(*others)
 
     def update(self, *others):
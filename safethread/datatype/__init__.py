@@ -5,6 +5,7 @@ This module provides data structures that are simultaneously thread-safe and mul
 
 ### **Classes:**
 - **AbstractSafeBase**: A base class for creating thread-safe or multiprocess-safe data structures.
+- **AbstractSafeCounter**: A base atomic counter / accumulator to create thread-safe or multiprocess-safe implementations.
 - **AbstractSafeDict**: A base dictionary-like data structure to create thread-safe or multiprocess-safe implementations.
 - **AbstractSafeList**: A base list-like data structure to create thread-safe or multiprocess-safe implementations.
 - **AbstractSafeQueue**: A base queue-like data structure to create thread-safe or multiprocess-safe implementations.
@@ -12,6 +13,7 @@ This module provides data structures that are simultaneously thread-safe and mul
 """
 
 from safethread.datatype.AbstractSafeBase import AbstractSafeBase
+from safethread.datatype.AbstractSafeCounter import AbstractSafeCounter
 from safethread.datatype.AbstractSafeDict import AbstractSafeDict
 from safethread.datatype.AbstractSafeList import AbstractSafeList
 from safethread.datatype.AbstractSafeQueue import AbstractSafeQueue
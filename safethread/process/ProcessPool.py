@@ -0,0 +1,606 @@
+
+import collections
+import concurrent.futures
+import itertools
+import multiprocessing
+import multiprocessing.connection
+import os
+import pickle
+import queue
+import threading
+import time
+
+from multiprocessing.connection import Connection
+from typing import Any, Callable, Iterable, Iterator
+
+from safethread.process.BaseProcess import BaseProcess
+from safethread.process.ProcessEvent import ProcessEvent
+
+from safethread.thread.BaseThread import BaseThread
+
+
+_CHECK_INTERVAL = 0.1
+"""Seconds between two checks of the worker processes (crash detection)"""
+
+_MAX_SENT = 2
+"""Maximum number of tasks sent to a worker: its running task, and the next one (so it does not wait for the pool)"""
+
+
+class _Close:
+    """Sentinel put into the queue of a feeder thread, to close the pipe of its worker (and stop the thread)"""
+    pass
+
+
+def _feed(conn: Connection, messages: queue.SimpleQueue) -> bool:
+    """
+    Method to be executed in the feeder threads. It sends the messages (tasks, stop sentinel) of its worker through the pipe.
+
+    Sending blocks until the worker reads the message, so it is not done by the collector thread: a worker
+    blocked on sending a large result would never read a large task.
+
+    :return: True to keep the feeder thread running, False otherwise
+    :rtype: bool
+    """
+    message = messages.get()
+    if isinstance(message, _Close):
+        conn.close()
+        return False
+    try:
+        conn.send(message)
+    except OSError:
+        # the worker has exited: the collector replaces it
+        pass
+    return True
+
+
+def _run_worker(conn: Connection, cancel: ProcessEvent, maxtasksperchild: int | None) -> bool:
+    """
+    The main loop of a worker process. It receives tasks from the pool through its own pipe (`conn`), and sends their
+    results back, until it receives the stop sentinel (None) or it has run `maxtasksperchild` tasks.
+    Once `cancel` is set, the tasks received are not run (the exception sent back is None).
+
+    This method runs in a separate process and should not be called directly.
+    """
+    done = 0
+    while maxtasksperchild is None or done < maxtasksperchild:
+        try:
+            task = conn.recv()
+        except EOFError:
+            # the pool has been closed
+            break
+        if task is None:
+            break
+        task_id, payload = task
+        if cancel.is_set():
+            conn.send((task_id, True, None))
+            done += 1
+            continue
+        try:
+            callback, chunk, kwargs = pickle.loads(payload)
+            result = (task_id, False, [callback(*args, **kwargs) for args in chunk])
+        except BaseException as e:
+            result = (task_id, True, e)
+        try:
+            conn.send(result)
+        except Exception as e:
+            # result (or exception) is not picklable
+            conn.send((task_id, True, RuntimeError(repr(e))))
+        done += 1
+    return False
+
+
+class ProcessPool:
+    """
+    A pool of persistent worker processes (``BaseProcess``), that run submitted tasks and return their results as futures.
+
+    Tasks and results are exchanged through a pipe per worker (tasks are sent by a feeder thread per worker), so callbacks, arguments and results
+    must be pickable. Callbacks NEED TO BE GLOBAL FUNCTIONS (like ``BaseProcess`` callbacks).
+
+    The pool sends at most two tasks to a worker (the running one, and the next one), so it always knows which
+    task runs in which worker, and a crashed worker can not leave a lock shared with other workers acquired. A worker runs up to `maxtasksperchild` tasks, and it is then replaced by a new process.
+    If a worker crashes (e.g., killed by a signal), the future of its running task raises ``ChildProcessError``,
+    and the worker is replaced by a new process.
+
+    Tasks can be submitted before `start()`; they run once the pool starts.
+
+    **Example:**
+
+    ```python
+    def square(x):
+        return x * x
+
+    with ProcessPool(4) as pool:
+        print(pool.submit(square, 3).result())                   # 9
+        print(sorted(pool.imap_unordered(square, range(4), chunksize=2)))  # [0, 1, 4, 9]
+    ```
+    """
+
+    Future = concurrent.futures.Future
+    """The future returned by `submit()`"""
+
+    CrashedException = ChildProcessError
+    """Raised by the future of a task, if its worker process terminates abruptly"""
+
+    def __init__(self, n_workers: int | None = None, maxtasksperchild: int | None = None):
+        """
+        Initializes the process pool.
+
+        :param n_workers: The number of worker processes. Defaults to None (``os.cpu_count()``).
+        :type n_workers: int, optional
+
+        :param maxtasksperchild: The number of tasks a worker runs before it is replaced by a new process. Defaults to None (no limit).
+        :type maxtasksperchild: int, optional
+
+        :raises ValueError: If `n_workers` or `maxtasksperchild` is less than 1.
+        """
+        super().__init__()
+
+        if n_workers is None:
+            n_workers = os.cpu_count() or 1
+        if n_workers < 1:
+            raise ValueError("At least one worker is needed to run ProcessPool")
+        if maxtasksperchild is not None and maxtasksperchild < 1:
+            raise ValueError("'maxtasksperchild' must be at least 1")
+
+        self.__n_workers = n_workers
+        self.__maxtasksperchild = maxtasksperchild
+
+        self.__lock = threading.RLock()
+        self.__futures: dict[int, tuple[concurrent.futures.Future, bool]] = {}
+        self.__task_ids = itertools.count()
+        # tasks (task_id, payload) not sent to a worker yet
+        self.__pending: collections.deque[tuple[int, bytes]] = collections.deque()
+
+        # per worker slot: process, pipe, tasks sent to it (running first), number of tasks
+        # it can still receive (None for no limit), and whether it was sent the stop sentinel
+        self.__workers: list[BaseProcess] = []
+        self.__conns: list[Connection] = []
+        # per worker slot: messages to send, and the feeder thread sending them
+        self.__feeds: list[queue.SimpleQueue] = []
+        self.__feeders: list[BaseThread] = []
+        self.__sent: list[collections.deque[tuple[int, bytes]]] = [collections.deque() for _ in range(n_workers)]
+        self.__budgets: list[int | None] = [maxtasksperchild] * n_workers
+        self.__stopping: list[bool] = [False] * n_workers
+        self.__collector = BaseThread(self.__collect, repeat=True)
+        self.__next_check = 0.0
+        self.__started = False
+        self.__shutdown = False
+        self.__stopped = False
+        # set by shutdown(cancel_futures=True): workers do not run the tasks they have not started
+        self.__cancel = ProcessEvent()
+
+    def __enter__(self):
+        """Starts the pool (if needed), and returns it."""
+        if not self.has_started():
+            self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Shuts down the pool, waiting for the pending tasks."""
+        self.shutdown(wait=True)
+
+    def __collect(self) -> bool:
+        """
+        Method to be executed in the collector thread. It receives the results of the tasks,
+        and replaces the workers that have exited (crash, or `maxtasksperchild`).
+
+        :return: True to keep the collector running, False otherwise
+        :rtype: bool
+        """
+        with self.__lock:
+            conns = list(self.__conns)
+        ready = multiprocessing.connection.wait(conns, timeout=_CHECK_INTERVAL)
+        for conn in conns:
+            if conn not in ready:
+                continue
+            try:
+                # handle every result already in the pipe (one wait() for several results)
+                while True:
+                    self.__set_result(*conn.recv())
+                    if not conn.poll():
+                        break
+            except (EOFError, OSError):
+                # the worker has exited
+                self.__next_check = 0.0
+        if time.monotonic() < self.__next_check:
+            return True
+        self.__next_check = time.monotonic() + _CHECK_INTERVAL
+        return self.__check_workers()
+
+    def __cancel_pending(self):
+        """Cancels the tasks that have not been sent to a worker."""
+        with self.__lock:
+            entries = [self.__futures.pop(task_id, None)
+                       for task_id, _ in self.__pending]
+            self.__pending.clear()
+        for entry in entries:
+            if entry is not None:
+                entry[0].cancel()
+
+    def __check_workers(self) -> bool:
+        """
+        Replaces the worker processes that have exited, and fails the task of crashed workers.
+
+        :return: False if every worker has retired (the collector can stop), True otherwise
+        :rtype: bool
+        """
+        alive = False
+        for slot, worker in enumerate(self.__workers):
+            if worker.is_alive():
+                alive = True
+                continue
+            with self.__lock:
+                # the worker can not run other tasks
+                self.__budgets[slot] = 0
+                if self.__sent[slot]:
+                    # results sent before the worker exited are still in the pipe
+                    self.__drain_results(slot)
+                sent = list(self.__sent[slot])
+                self.__sent[slot].clear()
+                # the next tasks were not received by the worker: they are sent to another one
+                self.__pending.extendleft(reversed(sent[1:]))
+            if sent:
+                self.__fail_task(sent[0][0])
+            if self.__cancel.is_set():
+                self.__cancel_pending()
+            with self.__lock:
+                if self.__stopping[slot] or self.__stopped:
+                    # retired
+                    continue
+                self.__spawn(slot)
+                self.__dispatch()
+            alive = True
+        if alive:
+            return True
+        # every worker has retired
+        with self.__lock:
+            for feed in self.__feeds:
+                # the feeder closes the pipe
+                feed.put(_Close())
+            futures = list(self.__futures.values())
+            self.__futures.clear()
+        for future, _ in futures:
+            if not future.done():
+                future.set_exception(ChildProcessError(
+                    "ProcessPool stopped before the task has run"))
+        return False
+
+    def __dispatch(self):
+        """
+        Sends the pending tasks to the idle workers (one task at a time), and the stop sentinel
+        to the workers that have nothing left to run after shutdown(). It must be called with the lock held.
+        """
+        if not self.__started:
+            return
+        for slot in range(len(self.__conns)):
+            if self.__stopping[slot]:
+                continue
+            sent = self.__sent[slot]
+            while self.__pending and len(sent) < _MAX_SENT and self.__budgets[slot] != 0:
+                task = self.__pending.popleft()
+                self.__send(slot, task)
+                sent.append(task)
+                budget = self.__budgets[slot]
+                if budget is not None:
+                    self.__budgets[slot] = budget - 1
+            if self.__shutdown and not self.__pending:
+                # a worker without budget stops by itself
+                if self.__budgets[slot] != 0:
+                    self.__send(slot, None)
+                self.__stopping[slot] = True
+
+    def __drain_results(self, slot: int):
+        """Handles the results available in the pipe of a worker. It must be called with the lock held."""
+        conn = self.__conns[slot]
+        try:
+            while conn.poll():
+                self.__set_result(*conn.recv())
+        except (EOFError, OSError):
+            pass
+
+    def __fail_task(self, task_id: int):
+        """Fails the future of a task, whose worker process has crashed."""
+        with self.__lock:
+            entry = self.__futures.pop(task_id, None)
+            self.__release(task_id)
+        if entry is not None and not entry[0].done():
+            entry[0].set_exception(ChildProcessError(
+                f"Worker process terminated abruptly while running task {task_id}"))
+
+    def __release(self, task_id: int):
+        """Removes a finished task from its worker slot, and sends the next tasks. It must be called with the lock held."""
+        for sent in self.__sent:
+            for task in sent:
+                if task[0] == task_id:
+                    sent.remove(task)
+                    self.__dispatch()
+                    return
+
+    def __send(self, slot: int, message: Any):
+        """Sends a message (task or stop sentinel) to the worker of a slot, through its feeder thread."""
+        self.__feeds[slot].put(message)
+
+    def __set_result(self, task_id: int, is_error: bool, value: Any):
+        """Sets the result (or exception) of a future."""
+        with self.__lock:
+            entry = self.__futures.pop(task_id, None)
+            self.__release(task_id)
+        if entry is None:
+            return
+        future, single = entry
+        if future.done():
+            # cancelled (the task was already in a worker)
+            return
+        if is_error and value is None:
+            # not run (stop())
+            future.cancel()
+        elif is_error:
+            future.set_exception(value)
+        else:
+            future.set_result(value[0] if single else value)
+
+    def __spawn(self, slot: int):
+        """Starts a new worker process (with a new pipe) in a slot. It must be called with the lock held."""
+        conn, worker_conn = multiprocessing.Pipe()
+        worker = BaseProcess(_run_worker, args=[
+            worker_conn,
+            self.__cancel,
+            self.__maxtasksperchild,
+        ])
+        feed: queue.SimpleQueue = queue.SimpleQueue()
+        feeder = BaseThread(_feed, args=[conn, feed], repeat=True)
+        if slot < len(self.__workers):
+            # the old feeder closes the old pipe (it may still be sending to it)
+            self.__feeds[slot].put(_Close())
+            self.__workers[slot] = worker
+            self.__conns[slot] = conn
+            self.__feeds[slot] = feed
+            self.__feeders[slot] = feeder
+        else:
+            self.__workers.append(worker)
+            self.__conns.append(conn)
+            self.__feeds.append(feed)
+            self.__feeders.append(feeder)
+        self.__sent[slot].clear()
+        self.__budgets[slot] = self.__maxtasksperchild
+        self.__stopping[slot] = False
+        worker.start()
+        feeder.start()
+        # the worker has its own copy (the pool gets EOF once it exits)
+        worker_conn.close()
+
+    def __submit(self, callback: Callable, chunk: tuple, kwargs: dict, single: bool) -> concurrent.futures.Future:
+        """Adds a task to the pending tasks (sent to the first idle worker)."""
+        if not callable(callback):
+            raise TypeError("'callback' is not callable")
+        if self.__shutdown:
+            raise RuntimeError("Cannot submit tasks after shutdown")
+        # pickled here, so an unpicklable task raises in the caller, and a task that
+        # fails to unpickle in the worker fails its future
+        payload = pickle.dumps((callback, chunk, kwargs))
+        future = concurrent.futures.Future()
+        with self.__lock:
+            if self.__shutdown:
+                raise RuntimeError("Cannot submit tasks after shutdown")
+            task_id = next(self.__task_ids)
+            self.__futures[task_id] = (future, single)
+            self.__pending.append((task_id, payload))
+            self.__dispatch()
+        return future
+
+    def __submit_chunks(self, callback: Callable, iterables: tuple, chunksize: int) -> list[concurrent.futures.Future]:
+        """Submits the calls of `map()` / `imap_unordered()`, in chunks."""
+        if chunksize < 1:
+            raise ValueError("'chunksize' must be at least 1")
+        return [self.__submit(callback, chunk, {}, single=False)
+                for chunk in itertools.batched(zip(*iterables), chunksize)]
+
+    def get_n_workers(self) -> int:
+        """Returns the number of worker processes."""
+        return self.__n_workers
+
+    def get_maxtasksperchild(self) -> int | None:
+        """Returns the number of tasks a worker runs before it is replaced (None for no limit)."""
+        return self.__maxtasksperchild
+
+    def get_pending_count(self) -> int:
+        """Returns the number of submitted tasks that have not finished yet."""
+        with self.__lock:
+            return len(self.__futures)
+
+    def has_started(self) -> bool:
+        """
+        Checks if the pool has started.
+
+        :return: True if the pool has started, otherwise False.
+        :rtype: bool
+        """
+        return self.__started
+
+    def is_alive(self) -> bool:
+        """
+        Checks if the pool is alive.
+
+        :return: True if any worker process (or the collector thread) is still alive, otherwise False.
+        :rtype: bool
+        """
+        return self.__collector.is_alive() or any(worker.is_alive() for worker in list(self.__workers))
+
+    def is_terminated(self) -> bool:
+        """
+        Checks if the pool has terminated.
+
+        :return: True if the pool has started and is not alive, otherwise False.
+        :rtype: bool
+        """
+        return self.has_started() and not self.is_alive()
+
+    def imap_unordered(self, callback: Callable, *iterables: Iterable, chunksize: int = 1) -> Iterator:
+        """
+        Runs `callback(*args)` for every args of `zip(*iterables)` in the pool, yielding the results as soon as they are available.
+
+        All tasks are submitted immediately (`chunksize` calls per task).
+
+        :param callback: The global function to call.
+        :type callback: Callable
+
+        :param iterables: The iterables of arguments.
+        :type iterables: Iterable
+
+        :param chunksize: The number of calls run by each task. Defaults to 1.
+        :type chunksize: int, optional
+
+        :return: An iterator over the results (in completion order).
+        :rtype: Iterator
+
+        :raises ValueError: If `chunksize` is less than 1.
+        :raises RuntimeError: If the pool has been shut down.
+        """
+        futures = self.__submit_chunks(callback, iterables, chunksize)
+
+        def result_iterator():
+            try:
+                for future in concurrent.futures.as_completed(futures):
+                    yield from future.result()
+            finally:
+                for future in futures:
+                    future.cancel()
+        return result_iterator()
+
+    def map(self, callback: Callable, *iterables: Iterable, timeout: float | None = None, chunksize: int = 1) -> Iterator:
+        """
+        Runs `callback(*args)` for every args of `zip(*iterables)` in the pool, like the built-in `map()`.
+
+        All tasks are submitted immediately (`chunksize` calls per task), and results are yielded in order.
+
+        :param callback: The global function to call.
+        :type callback: Callable
+
+        :param iterables: The iterables of arguments.
+        :type iterables: Iterable
+
+        :param timeout: The maximum time (since `map()` was called) to wait for the results. Defaults to None (no limit).
+        :type timeout: float, optional
+
+        :param chunksize: The number of calls run by each task. Defaults to 1.
+        :type chunksize: int, optional
+
+        :return: An iterator over the results.
+        :rtype: Iterator
+
+        :raises TimeoutError: If a result is not available before the timeout expires.
+        :raises ValueError: If `chunksize` is less than 1.
+        :raises RuntimeError: If the pool has been shut down.
+        """
+        endtime = None if timeout is None else time.monotonic() + timeout
+        futures = self.__submit_chunks(callback, iterables, chunksize)
+
+        def result_iterator():
+            try:
+                futures.reverse()
+                while futures:
+                    future = futures.pop()
+                    if endtime is None:
+                        yield from future.result()
+                    else:
+                        yield from future.result(endtime - time.monotonic())
+            finally:
+                for future in futures:
+                    future.cancel()
+        return result_iterator()
+
+    def shutdown(self, wait: bool = True, cancel_futures: bool = False):
+        """
+        Shuts down the pool: new tasks are refused, and workers stop once the pending tasks are done.
+
+        :param wait: If True, wait for the worker processes to finish. Defaults to True.
+        :type wait: bool, optional
+
+        :param cancel_futures: If True, cancel the pending tasks (not running yet). Defaults to False.
+        :type cancel_futures: bool, optional
+        """
+        with self.__lock:
+            self.__shutdown = True
+        if cancel_futures:
+            # including the tasks sent to the workers, and not started
+            self.__cancel.set()
+            self.__cancel_pending()
+        with self.__lock:
+            # stop sentinels are sent to the workers once the pending tasks are done
+            self.__dispatch()
+        if wait and self.__started:
+            self.join()
+
+    def start(self):
+        """
+        Starts the worker processes.
+
+        :raises RuntimeError: If start() is called more than once, or after stop().
+        """
+        with self.__lock:
+            if self.__started:
+                raise RuntimeError("ProcessPool has already been started.")
+            if self.__stopped:
+                raise RuntimeError("Cannot start ProcessPool after stop()")
+            self.__started = True
+            for slot in range(self.__n_workers):
+                self.__spawn(slot)
+            self.__dispatch()
+            self.__collector.start()
+
+    def stop(self):
+        """
+        Stops the pool (immediately): pending tasks are cancelled, and workers stop after their current task (crashed workers are not replaced).
+        """
+        self.__stopped = True
+        self.shutdown(wait=False, cancel_futures=True)
+        if not self.__started:
+            # nothing will run the sentinels
+            with self.__lock:
+                futures = list(self.__futures.values())
+                self.__futures.clear()
+            for future, _ in futures:
+                future.cancel()
+
+    def join(self, timeout: float | None = None):
+        """
+        Joins the worker processes and the collector thread, waiting for them to finish.
+
+        :param timeout: The maximum time to wait for each worker to finish. Defaults to None.
+        :type timeout: float or None, optional
+
+        :raises RuntimeError: If join() is called before start().
+        """
+        if not self.__started:
+            raise RuntimeError(
+                "Cannot join a ProcessPool that has not been started.")
+        self.__collector.join(timeout)
+        for worker in list(self.__workers):
+            worker.join(timeout)
+        for feeder in list(self.__feeders):
+            feeder.join(timeout)
+
+    def stop_join(self, timeout: float | None = None):
+        """
+        Calls stop() and join() to stop the pool and wait for its processes to finish.
+
+        :param timeout: The maximum time to wait for each worker to finish. Defaults to None.
+        :type timeout: float or None, optional
+        """
+        self.stop()
+        self.join(timeout=timeout)
+
+    def submit(self, callback: Callable, /, *args, **kwargs) -> concurrent.futures.Future:
+        """
+        Submits a task (`callback(*args, **kwargs)`) to the pool.
+
+        :param callback: The global function to call.
+        :type callback: Callable
+
+        :return: A future with the result (or exception) of the call.
+        :rtype: concurrent.futures.Future
+
+        :raises TypeError: If the callback is not callable.
+        :raises RuntimeError: If the pool has been shut down.
+        """
+        return self.__submit(callback, (args,), kwargs, single=True)
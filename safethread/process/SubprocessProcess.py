@@ -1,11 +1,13 @@
 
 
-import multiprocessing
+import weakref
 
 from typing import MutableSequence
 
 from safethread.AbstractSubprocess import AbstractSubprocess
 
+from safethread.process.datatype.ProcessManagerPool import ProcessManagerPool
+
 from safethread.process.BaseProcess import BaseProcess
 
 
@@ -17,4 +19,6 @@ class SubprocessProcess(AbstractSubprocess, BaseProcess):
     """
 
     def _create_command_list(self) -> MutableSequence:
-        return multiprocessing.Manager().list()
+        manager = ProcessManagerPool.acquire()
+        weakref.finalize(self, ProcessManagerPool.release, manager)
+        return manager.list()
@@ -9,11 +9,13 @@ This module provides multiprocessed classes, that inherit from BaseProcess. It a
 Classes:
 - **BaseProcess**: An process-safe class that manages processes safely.
 - **ProcessEvent**: An process-safe class that manages processes events safely.
+- **ProcessPool**: A pool of persistent worker processes, that run submitted tasks and return futures (with `maxtasksperchild` and crashed worker replacement).
 - **SchedulerProcess**: A process-safe class that runs a scheduled global Callable function after a pre-defined timeout, either singleshot or periodically.
 - **SubprocessProcess**: A process-safe class that runs a subprocess within a separate process.
 """
 
 from safethread.process.BaseProcess import BaseProcess
 from safethread.process.ProcessEvent import ProcessEvent
+from safethread.process.ProcessPool import ProcessPool
 from safethread.process.SchedulerProcess import SchedulerProcess
 from safethread.process.SubprocessProcess import SubprocessProcess
@@ -0,0 +1,383 @@
+
+import atexit
+import multiprocessing.managers
+import threading
+
+from multiprocessing.managers import ListProxy, SyncManager
+from typing import Any, cast
+
+from safethread.thread.datatype.ThreadSafeDelayQueue import ThreadSafeDelayQueue
+from safethread.thread.datatype.ThreadSafePriorityQueue import ThreadSafePriorityQueue
+
+
+def _make_proxy_type(name: str, exposed: tuple[str, ...]) -> Any:
+    """
+    Creates a proxy type (``multiprocessing.managers.MakeProxyType``, which is not part of the public API)
+    that forwards the `exposed` methods to the referent.
+    """
+    return getattr(multiprocessing.managers, "MakeProxyType")(name, exposed)
+
+
+class BulkList(list):
+    """
+    A ``list`` stored in a ``ProcessManager`` server process, that provides bulk operations.
+
+    Each bulk operation is executed by the server in a single round-trip.
+    """
+
+    def get_many(self, indices: list[int]) -> list:
+        """
+        Returns the items at the given indices.
+
+        :param indices: Indices of the items to return.
+        :type indices: list[int]
+
+        :raises IndexError: If any index is out of range.
+
+        :return: The items, in the same order as `indices`.
+        :rtype: list
+        """
+        return [self[i] for i in indices]
+
+    def pop_many(self, n: int) -> list:
+        """
+        Removes and returns the last `n` items (or all items, if the list has less than `n` items).
+
+        :param n: Maximum number of items to remove.
+        :type n: int
+
+        :return: The removed items, in list order.
+        :rtype: list
+        """
+        if n <= 0:
+            return []
+        items = self[-n:]
+        del self[-n:]
+        return items
+
+    def snapshot(self) -> list:
+        """
+        Returns a copy of the list.
+
+        :return: A copy of the list.
+        :rtype: list
+        """
+        return list(self)
+
+
+class BulkListProxy(ListProxy):
+    """
+    Proxy of a ``BulkList`` stored in a ``ProcessManager`` server process.
+
+    Besides the ``ListProxy`` methods, it provides `clear()` and bulk operations, all single round-trips.
+    """
+
+    _exposed_ = tuple(getattr(ListProxy, "_exposed_")) + (
+        "clear", "get_many", "pop_many", "snapshot",
+    )
+
+    def __iter__(self):
+        """Iterates over a copy of the list (fetched in a single round-trip)."""
+        return iter(cast(list, self._callmethod("snapshot")))
+
+    def clear(self):
+        """Removes all items of the list."""
+        return self._callmethod("clear")
+
+    def get_many(self, indices: list[int]) -> list:
+        """Returns the items at the given indices."""
+        return cast(list, self._callmethod("get_many", (indices,)))
+
+    def pop_many(self, n: int) -> list:
+        """Removes and returns the last `n` items (in list order)."""
+        return cast(list, self._callmethod("pop_many", (n,)))
+
+    def snapshot(self) -> list:
+        """Returns a copy of the list."""
+        return cast(list, self._callmethod("snapshot"))
+
+
+BaseSetProxy = _make_proxy_type("BaseSetProxy", (
+    "__contains__", "__len__",
+    "add", "clear", "copy", "difference", "difference_update", "discard",
+    "intersection", "intersection_update", "isdisjoint", "issubset", "issuperset",
+    "pop", "remove", "symmetric_difference", "symmetric_difference_update",
+    "union", "update",
+))
+
+
+class SetProxy(BaseSetProxy):
+    """
+    Proxy of a ``set`` stored in a ``ProcessManager`` server process.
+
+    Membership tests, insertions and removals are single round-trips (O(1) in the server),
+    and set algebra is computed by the server.
+    """
+
+    def __iter__(self):
+        """Iterates over a copy of the set (fetched in a single round-trip)."""
+        return iter(self._callmethod("copy"))
+
+
+class SharedPriorityQueue(ThreadSafePriorityQueue):
+    """
+    A ``ThreadSafePriorityQueue`` stored in a ``ProcessManager`` server process.
+
+    A proxy only forwards method calls, so the queue properties are also available as getter methods.
+    """
+
+    def get_maxsize(self) -> int:
+        """
+        Gets the queue maximum size.
+
+        :return: Maximum size of the queue (0 if unlimited).
+        :rtype: int
+        """
+        return self.maxsize
+
+    def get_unfinished_tasks(self) -> int:
+        """
+        Gets the number of unfinished tasks.
+
+        :return: Number of items put that have not been marked done by `task_done()`.
+        :rtype: int
+        """
+        return self.unfinished_tasks
+
+    def is_shut_down(self) -> bool:
+        """
+        Checks if the queue has been shut down.
+
+        :return: True if queue has been shut down, False otherwise.
+        :rtype: bool
+        """
+        return self.is_shutdown
+
+
+# ThreadSafeDelayQueue narrows _init_with_data() (see its override)
+class SharedDelayQueue(ThreadSafeDelayQueue, SharedPriorityQueue):  # type: ignore
+    """
+    A ``ThreadSafeDelayQueue`` stored in a ``ProcessManager`` server process (see ``SharedPriorityQueue``).
+    """
+    pass
+
+
+BaseSafeQueueProxy = _make_proxy_type("BaseSafeQueueProxy", (
+    "clear", "copy", "empty", "full", "get", "get_many", "get_nowait",
+    "join", "peek", "put", "put_many", "put_nowait", "qsize", "shutdown", "snapshot", "task_done",
+))
+
+
+class SafeQueueProxy(BaseSafeQueueProxy):
+    """
+    Proxy of a ``SharedPriorityQueue`` (or ``SharedDelayQueue``) stored in a ``ProcessManager`` server process.
+
+    Every method (including the batched `get_many()` / `put_many()`) is a single round-trip,
+    and blocking calls wait in the server process.
+    """
+    _exposed_ = BaseSafeQueueProxy._exposed_ + (
+        "get_maxsize", "get_unfinished_tasks", "is_shut_down",
+    )
+
+    def __iter__(self):
+        """Iterates over a snapshot of the queue (fetched in a single round-trip)."""
+        return iter(self._callmethod("snapshot"))
+
+    @property
+    def is_shutdown(self) -> bool:
+        """True if queue has been shutdown, False otherwise"""
+        return self._callmethod("is_shut_down")
+
+    @property
+    def maxsize(self) -> int:
+        """Get queue maximum size"""
+        return self._callmethod("get_maxsize")
+
+    @property
+    def unfinished_tasks(self) -> int:
+        """Get the number of unfinished tasks"""
+        return self._callmethod("get_unfinished_tasks")
+
+
+class ProcessManager(SyncManager):
+    """
+    A ``multiprocessing.managers.SyncManager`` used by ``ProcessManagerPool``.
+
+    Custom shared types (and their proxies) must be registered in this class,
+    using ``ProcessManager.register()``, before the first manager is started.
+
+    Shared types (besides those of ``SyncManager``):
+    - **bulk_list**: A ``BulkList``, accessed through a ``BulkListProxy``.
+    - **set**: A ``set``, accessed through a ``SetProxy``.
+    - **priority_queue**: A ``SharedPriorityQueue``, accessed through a ``SafeQueueProxy``.
+    - **delay_queue**: A ``SharedDelayQueue``, accessed through a ``SafeQueueProxy``.
+    """
+    pass
+
+
+ProcessManager.register("bulk_list", BulkList, BulkListProxy)
+ProcessManager.register("set", set, SetProxy)
+ProcessManager.register("priority_queue", SharedPriorityQueue, SafeQueueProxy,
+                        method_to_typeid={"copy": "priority_queue"})
+ProcessManager.register("delay_queue", SharedDelayQueue, SafeQueueProxy,
+                        method_to_typeid={"copy": "delay_queue"})
+
+
+class ProcessManagerPool:
+    """
+    A process-wide pool of shared ``ProcessManager`` server processes.
+
+    Instead of starting a new manager server process for every process-safe
+    data structure, ``ProcessManagerPool`` lazily starts at most ``get_size()``
+    managers and shares them between all objects. Each manager keeps a reference
+    count of the objects using it, so new objects are always placed in the least
+    used manager. All managers are shut down at interpreter exit.
+    """
+
+    _lock = threading.RLock()
+    _size: int = 1
+    _managers: list[ProcessManager] = []
+    _refcounts: list[int] = []
+
+    @classmethod
+    def get_size(cls) -> int:
+        """
+        Gets the maximum number of manager processes in the pool.
+
+        :return: Maximum number of manager processes.
+        :rtype: int
+        """
+        with cls._lock:
+            return cls._size
+
+    @classmethod
+    def set_size(cls, size: int):
+        """
+        Sets the maximum number of manager processes in the pool.
+
+        Managers already started are kept running, even if the new size is smaller than the number of started managers.
+
+        :param size: Maximum number of manager processes. Must be >= 1.
+        :type size: int
+
+        :raises ValueError: If `size` is less than 1.
+        """
+        if size < 1:
+            raise ValueError(
+                "ProcessManagerPool size must be at least 1")
+        with cls._lock:
+            cls._size = size
+
+    @classmethod
+    def get_started_count(cls) -> int:
+        """
+        Gets the number of manager processes currently running.
+
+        :return: Number of running manager processes.
+        :rtype: int
+        """
+        with cls._lock:
+            return len(cls._managers)
+
+    @classmethod
+    def get_refcount(cls, manager: ProcessManager) -> int:
+        """
+        Gets the number of objects that currently use a manager.
+
+        :param manager: The manager to check.
+        :type manager: ProcessManager
+
+        :raises ValueError: If the manager does not belong to the pool.
+
+        :return: Number of acquired references of the manager.
+        :rtype: int
+        """
+        with cls._lock:
+            return cls._refcounts[cls.__index(manager)]
+
+    @classmethod
+    def acquire(cls) -> ProcessManager:
+        """
+        Acquires a reference to a shared manager, starting a new one if needed.
+
+        A new manager is only started if every running manager is in use and the pool has not reached its size.
+        Every call to acquire() must be paired with a call to release().
+
+        :return: The least used manager of the pool.
+        :rtype: ProcessManager
+        """
+        with cls._lock:
+            index = -1
+            if cls._refcounts:
+                index = min(range(len(cls._refcounts)),
+                            key=cls._refcounts.__getitem__)
+            if index < 0 or (cls._refcounts[index] > 0 and len(cls._managers) < cls._size):
+                manager = ProcessManager()
+                manager.start()
+                cls._managers.append(manager)
+                cls._refcounts.append(0)
+                index = len(cls._managers) - 1
+            cls._refcounts[index] += 1
+            return cls._managers[index]
+
+    @classmethod
+    def release(cls, manager: ProcessManager):
+        """
+        Releases a reference to a shared manager previously obtained with acquire().
+
+        The manager keeps running (idle) so it can be reused by new objects.
+        Releasing a manager that no longer belongs to the pool (e.g., after shutdown()) does nothing.
+
+        :param manager: The manager to release.
+        :type manager: ProcessManager
+        """
+        with cls._lock:
+            try:
+                index = cls.__index(manager)
+            except ValueError:
+                return
+            if cls._refcounts[index] > 0:
+                cls._refcounts[index] -= 1
+
+    @classmethod
+    def shutdown(cls, force: bool = False):
+        """
+        Shuts down the managers of the pool.
+
+        :param force: If True, shuts down all managers, invalidating objects still using them.
+                      If False, only idle managers (not referenced by any object) are shut down. Defaults to False.
+        :type force: bool, optional
+        """
+        with cls._lock:
+            managers, refcounts = [], []
+            for manager, refcount in zip(cls._managers, cls._refcounts):
+                if refcount > 0 and not force:
+                    managers.append(manager)
+                    refcounts.append(refcount)
+                    continue
+                try:
+                    manager.shutdown()
+                except:
+                    pass
+            cls._managers = managers
+            cls._refcounts = refcounts
+
+    @classmethod
+    def __index(cls, manager: ProcessManager) -> int:
+        """
+        Finds the position of a manager in the pool (by identity).
+
+        :raises ValueError: If the manager does not belong to the pool.
+        """
+        for i, item in enumerate(cls._managers):
+            if item is manager:
+                return i
+        raise ValueError("Manager does not belong to ProcessManagerPool")
+
+
+def _shutdown_at_exit():
+    """Shuts down every manager of the pool when the interpreter exits."""
+    ProcessManagerPool.shutdown(force=True)
+
+
+atexit.register(_shutdown_at_exit)
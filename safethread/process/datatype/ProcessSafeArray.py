@@ -0,0 +1,457 @@
+
+import array
+import os
+import struct
+import weakref
+
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Iterable, Literal, cast
+
+from safethread.AbstractLock import AbstractLock
+from safethread.datatype.AbstractSafeList import AbstractSafeList
+
+from safethread.process.datatype.ProcessRLock import ProcessRLock
+
+
+_Typecode = Literal["b", "B", "h", "H", "i", "I", "l", "L", "q", "Q", "f", "d"]
+"""Format of the typed memoryview of a _SharedArray"""
+
+_TYPECODES = tuple(tc for tc in array.typecodes if tc not in ("u", "w"))
+"""Typecodes supported by ProcessSafeArray (same as ``array.array``, except unicode)"""
+
+_HEADER = struct.Struct("qqq")
+"""Shared header layout: length, capacity, generation"""
+
+
+def _close_segments(mapping: list, retired: list[SharedMemory]):
+    """
+    Releases the views of the current data segment and closes it, along with any previously retired segment.
+
+    Segments that are still exported (e.g., by a memoryview held by the user) are kept in `retired`, to be closed later.
+    """
+    for view in reversed(mapping[1:]):
+        view.release()
+    if mapping[0] is not None:
+        retired.append(mapping[0])
+    mapping[:] = [None]
+    for segment in tuple(retired):
+        try:
+            segment.close()
+            retired.remove(segment)
+        except BufferError:
+            pass
+
+
+def _release_mapping(mapping: list, retired: list[SharedMemory], header: SharedMemory, owner_pid: int | None):
+    """
+    Releases the memory mapping of a _SharedArray, unlinking its shared memory segments if called by the owner process.
+
+    This function is called by weakref.finalize() and should not be called directly.
+    """
+    _close_segments(mapping, retired)
+    if owner_pid == os.getpid():
+        assert header.buf is not None
+        _, _, generation = _HEADER.unpack_from(header.buf)
+        try:
+            segment = SharedMemory(
+                name=_SharedArray.segment_name(header.name, generation), track=False)
+            segment.close()
+            segment.unlink()
+        except FileNotFoundError:
+            pass
+        header.close()
+        header.unlink()
+    else:
+        header.close()
+
+
+class _SharedArray:
+    """
+    A typed, growable array stored in ``multiprocessing.shared_memory`` segments.
+
+    The array is composed of a fixed header segment (length, capacity and generation)
+    and a data segment. When the array grows, a new data segment (next generation) is
+    allocated and every process re-attaches to it on its next access.
+
+    It is NOT synchronized; it must be protected by an external lock (see ProcessSafeArray).
+    """
+
+    @staticmethod
+    def segment_name(header_name: str, generation: int) -> str:
+        """Gets the name of the data segment for a given generation."""
+        return f"{header_name.lstrip('/')}_{generation}"
+
+    def __init__(self, typecode: str, data: Iterable | None = None, name: str | None = None):
+        """
+        Creates a new shared array, or attaches to an existing one.
+
+        :param typecode: The ``array.array`` typecode of the elements.
+        :type typecode: str
+        :param data: Initial elements of the array (ignored when attaching). Defaults to None.
+        :type data: Iterable, optional
+        :param name: Name of the header segment of an existing shared array to attach to. Defaults to None (create).
+        :type name: str, optional
+
+        :raises ValueError: If the typecode is not supported.
+        """
+        super().__init__()
+
+        if typecode not in _TYPECODES:
+            raise ValueError(
+                f"typecode must be one of {_TYPECODES}, not '{typecode}'")
+
+        self.__typecode: _Typecode = cast(_Typecode, typecode)
+        self.__itemsize = array.array(typecode).itemsize
+        self.__generation = -1
+        # [segment, raw view, typed view]
+        self.__mapping: list[Any] = [None]
+        self.__retired: list[SharedMemory] = []
+
+        owner_pid = None
+        if name is None:
+            values = array.array(typecode, data or [])
+            self.__header = SharedMemory(
+                create=True, size=_HEADER.size, track=False)
+            _HEADER.pack_into(self.__header_buf, 0, 0, 0, -1)
+            owner_pid = os.getpid()
+            self.__reallocate(len(values))
+            self.__view[:len(values)] = memoryview(values)
+            self.__set_length(len(values))
+        else:
+            self.__header = SharedMemory(name=name, track=False)
+
+        weakref.finalize(self, _release_mapping, self.__mapping,
+                         self.__retired, self.__header, owner_pid)
+
+    def __reduce__(self):
+        return (self.__class__, (self.__typecode, None, self.__header.name))
+
+    @property
+    def __header_buf(self) -> memoryview:
+        """Byte view of the header segment."""
+        assert self.__header.buf is not None
+        return self.__header.buf
+
+    @property
+    def __view(self) -> memoryview:
+        """Typed view of the current data segment."""
+        return self.__mapping[2]
+
+    @property
+    def __raw(self) -> memoryview:
+        """Byte view of the current data segment."""
+        return self.__mapping[1]
+
+    def __refresh(self) -> int:
+        """Attaches to the current data segment (if it has changed) and returns the array length."""
+        length, capacity, generation = _HEADER.unpack_from(self.__header_buf)
+        if generation != self.__generation:
+            self.__attach(generation, capacity)
+        return length
+
+    def __attach(self, generation: int, capacity: int, segment: SharedMemory | None = None):
+        """Maps the data segment of a given generation, releasing the previous one."""
+        _close_segments(self.__mapping, self.__retired)
+        if segment is None:
+            segment = SharedMemory(name=self.segment_name(
+                self.__header.name, generation), track=False)
+        assert segment.buf is not None
+        raw = segment.buf[:capacity * self.__itemsize]
+        self.__mapping[:] = [segment, raw, raw.cast(self.__typecode)]
+        self.__generation = generation
+
+    def __reallocate(self, capacity: int):
+        """Moves the array into a new data segment, with the given capacity."""
+        length, _, generation = _HEADER.unpack_from(self.__header_buf)
+        segment = SharedMemory(
+            name=self.segment_name(self.__header.name, generation + 1),
+            create=True,
+            size=max(capacity * self.__itemsize, 1),
+            track=False,
+        )
+        assert segment.buf is not None
+        old_segment = None
+        if generation >= 0:
+            self.__refresh()
+            nbytes = length * self.__itemsize
+            segment.buf[:nbytes] = self.__raw[:nbytes]
+            old_segment = self.__mapping[0]
+        _HEADER.pack_into(self.__header_buf, 0,
+                          length, capacity, generation + 1)
+        if old_segment is not None:
+            old_segment.unlink()
+        self.__attach(generation + 1, capacity, segment)
+
+    def __reserve(self, length: int):
+        """Ensures the data segment can store `length` elements (amortized growth)."""
+        _, capacity, _ = _HEADER.unpack_from(self.__header_buf)
+        if length > capacity:
+            self.__reallocate(max(length, 2 * capacity, 8))
+
+    def __set_length(self, length: int):
+        """Stores the array length in the shared header."""
+        _, capacity, generation = _HEADER.unpack_from(self.__header_buf)
+        _HEADER.pack_into(self.__header_buf, 0, length, capacity, generation)
+
+    def __assign(self, values: Iterable):
+        """Replaces the whole array content."""
+        values = array.array(self.__typecode, values)
+        self.__refresh()
+        self.__reserve(len(values))
+        self.__view[:len(values)] = memoryview(values)
+        self.__set_length(len(values))
+
+    def __move(self, dst: int, src: int, count: int):
+        """Moves `count` elements from index `src` to index `dst` (overlapping allowed)."""
+        size = self.__itemsize
+        self.__raw[dst * size:(dst + count) * size] = \
+            self.__raw[src * size:(src + count) * size]
+
+    @staticmethod
+    def __normalize(index: int, length: int) -> int:
+        """Converts a (possibly negative) index into a valid position."""
+        i = index + length if index < 0 else index
+        if not 0 <= i < length:
+            raise IndexError("array index out of range")
+        return i
+
+    def __len__(self) -> int:
+        return self.__refresh()
+
+    def __getitem__(self, index):
+        length = self.__refresh()
+        if isinstance(index, slice):
+            return self.__view[:length][index].tolist()
+        return self.__view[self.__normalize(index, length)]
+
+    def __setitem__(self, index, value):
+        length = self.__refresh()
+        if not isinstance(index, slice):
+            self.__view[self.__normalize(index, length)] = value
+            return
+        values = array.array(self.__typecode, value)
+        start, stop, step = index.indices(length)
+        if step == 1 and max(stop - start, 0) != len(values):
+            items = self.tolist()
+            items[index] = values
+            self.__assign(items)
+        else:
+            self.__view[:length][index] = memoryview(values)
+
+    def __delitem__(self, index):
+        length = self.__refresh()
+        if isinstance(index, slice):
+            items = self.tolist()
+            del items[index]
+            self.__assign(items)
+            return
+        i = self.__normalize(index, length)
+        self.__move(i, i + 1, length - i - 1)
+        self.__set_length(length - 1)
+
+    def __iter__(self):
+        return iter(self.tolist())
+
+    def __contains__(self, value) -> bool:
+        return value in self.tolist()
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, _SharedArray):
+            other = other.tolist()
+        return self.tolist() == list(other)
+
+    def __iadd__(self, values: Iterable):
+        if isinstance(values, _SharedArray):
+            values = values.tolist()
+        self.extend(values)
+        return self
+
+    def __repr__(self) -> str:
+        return repr(self.tolist())
+
+    @property
+    def typecode(self) -> str:
+        """The ``array.array`` typecode of the elements"""
+        return self.__typecode
+
+    @property
+    def itemsize(self) -> int:
+        """Size of each element, in bytes"""
+        return self.__itemsize
+
+    @property
+    def capacity(self) -> int:
+        """Number of elements that fit in the current data segment"""
+        self.__refresh()
+        _, capacity, _ = _HEADER.unpack_from(self.__header_buf)
+        return capacity
+
+    def as_memoryview(self) -> memoryview:
+        """Returns a typed memoryview of the array elements (zero-copy)."""
+        length = self.__refresh()
+        return self.__view[:length]
+
+    def tolist(self) -> list:
+        """Returns a list copy of the array elements."""
+        return self.as_memoryview().tolist()
+
+    def copy(self) -> list:
+        return self.tolist()
+
+    def append(self, value):
+        length = self.__refresh()
+        self.__reserve(length + 1)
+        self.__view[length] = value
+        self.__set_length(length + 1)
+
+    def extend(self, values: Iterable):
+        values = array.array(self.__typecode, values)
+        length = self.__refresh()
+        self.__reserve(length + len(values))
+        self.__view[length:length + len(values)] = memoryview(values)
+        self.__set_length(length + len(values))
+
+    def insert(self, index: int, value):
+        length = self.__refresh()
+        i = min(max(index + length if index < 0 else index, 0), length)
+        self.__reserve(length + 1)
+        self.__move(i + 1, i, length - i)
+        self.__view[i] = value
+        self.__set_length(length + 1)
+
+    def pop(self, index: int = -1):
+        length = self.__refresh()
+        if length == 0:
+            raise IndexError("pop from empty array")
+        i = self.__normalize(index, length)
+        value = self.__view[i]
+        self.__move(i, i + 1, length - i - 1)
+        self.__set_length(length - 1)
+        return value
+
+    def remove(self, value):
+        del self[self.index(value)]
+
+    def index(self, value, start: int = 0, end: int | None = None) -> int:
+        items = self.tolist()
+        return items.index(value, start, end if end is not None else len(items))
+
+    def count(self, value) -> int:
+        return self.tolist().count(value)
+
+    def reverse(self):
+        self.__assign(reversed(self.tolist()))
+
+    def sort(self, **kwargs):
+        self.__assign(sorted(self.tolist(), **kwargs))
+
+    def clear(self):
+        self.__set_length(0)
+
+
+class ProcessSafeArray(AbstractSafeList):
+    """
+    A process-safe typed array, stored in shared memory (``multiprocessing.shared_memory``).
+
+    Unlike ``ProcessSafeList``, elements are not stored in a manager process, so reads and writes
+    do not need an IPC round-trip: every process accesses the shared memory directly. Elements are
+    restricted to a single numeric ``array.array`` typecode (e.g., 'i', 'q', 'f', 'd').
+
+    The array grows by reallocating its shared memory segment, which every process transparently
+    re-attaches to. It can be passed as an argument to ``BaseProcess`` callbacks.
+    """
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, AbstractSafeList):
+            other = other.copy_obj()
+        with self._lock:
+            return self._data == other
+
+    def __lt__(self, other):
+        if isinstance(other, AbstractSafeList):
+            other = other.copy_obj()
+        with self._lock:
+            return self._data.tolist() < list(other)
+
+    def __gt__(self, other):
+        if isinstance(other, AbstractSafeList):
+            other = other.copy_obj()
+        with self._lock:
+            return self._data.tolist() > list(other)
+
+    def __init__(self, data: list | Iterable | None = None, typecode: str = "d"):
+        """
+        Initialize a process-safe shared memory array.
+
+        :param data: Initial data to populate the array. Defaults to None.
+        :type data: list or Iterable, optional
+
+        :param typecode: The ``array.array`` typecode of the elements (e.g., 'i', 'q', 'd'). Defaults to 'd' (float).
+        :type typecode: str, optional
+
+        :raises ValueError: If the typecode is not supported.
+        :raises TypeError: If the data does not match the typecode.
+        """
+        self.__typecode = typecode
+        if isinstance(data, ProcessSafeArray):
+            self.__typecode = data.typecode
+        elif isinstance(data, _SharedArray):
+            self.__typecode = data.typecode
+
+        super().__init__(data)
+        self._data: _SharedArray
+
+    def _create_data(self, data: Any | None) -> Any:
+        if isinstance(data, _SharedArray):
+            return data
+        return _SharedArray(self.__typecode, data)
+
+    def _create_lock(self) -> AbstractLock:
+        return ProcessRLock()
+
+    def as_memoryview(self) -> memoryview:
+        """
+        Returns a typed memoryview of the array elements, directly mapped in shared memory (zero-copy).
+
+        The view is only valid until the array is resized (e.g., by `append()` or `extend()`), and must be
+        released (``view.release()``) before that. The caller should hold the array lock while using it.
+        A NumPy view can be created from it with ``numpy.asarray(view)``.
+
+        **Example:**
+
+        ```python
+        with safe_array.get_lock():
+            with safe_array.as_memoryview() as view:
+                view[0:3] = array.array('d', [1.0, 2.0, 3.0])
+        ```
+
+        :return: A memoryview of the array elements.
+        :rtype: memoryview
+        """
+        with self._lock:
+            return self._data.as_memoryview()
+
+    def copy(self):
+        """
+        Return a process-safe copy of the array (in a new shared memory segment).
+
+        :return: A new instance of `ProcessSafeArray` containing a copy of the data.
+        :rtype: ProcessSafeArray
+        """
+        return self.__class__(self.copy_obj(), self.__typecode)
+
+    @property
+    def capacity(self) -> int:
+        """Get the number of elements that fit in the shared memory segment before it is reallocated"""
+        with self._lock:
+            return self._data.capacity
+
+    @property
+    def itemsize(self) -> int:
+        """Get the size of each element, in bytes"""
+        return self._data.itemsize
+
+    @property
+    def typecode(self) -> str:
+        """Get the ``array.array`` typecode of the elements"""
+        return self.__typecode
@@ -0,0 +1,181 @@
+
+import multiprocessing
+import os
+
+from multiprocessing.sharedctypes import RawArray
+from typing import Any
+
+from safethread.AbstractLock import AbstractLock
+
+from safethread.datatype.AbstractSafeBase import AbstractSafeBase
+from safethread.datatype.AbstractSafeCounter import AbstractSafeCounter
+
+from safethread.process.datatype.ProcessRLock import ProcessRLock
+
+
+_TYPECODES = "bBhHiIlLqQfd"
+
+
+class ProcessSafeCounter(AbstractSafeCounter):
+    """
+    A process-safe atomic counter / accumulator, stored in shared memory (``ctypes``).
+
+    Reads and writes do not need a manager process: every process accesses the shared
+    memory directly, protected by a lightweight lock.
+
+    In sharded mode, the counter has `shards` slots (each one with its own lock), and each process
+    adds to the slot selected by its process id, so processes rarely contend for the same lock.
+    `get()` sums all slots.
+
+    It can be passed as an argument to ``BaseProcess`` callbacks.
+    """
+
+    def __init__(self, value: int | float | AbstractSafeBase = 0, sharded: bool = False, typecode: str = "q", shards: int | None = None):
+        """
+        Initialize a process-safe counter.
+
+        :param value: The initial value. If it is another ProcessSafeCounter, both objects share the same counter. Defaults to 0.
+        :type value: int, float or AbstractSafeBase, optional
+
+        :param sharded: If True, every process adds to its own slot (see class documentation). Defaults to False.
+                        Ignored if `value` is a ProcessSafeCounter.
+        :type sharded: bool, optional
+
+        :param typecode: The ``array.array`` typecode of the value (e.g., 'q' for int64, 'd' for float). Defaults to 'q'.
+                         Ignored if `value` is a ProcessSafeCounter.
+        :type typecode: str, optional
+
+        :param shards: Number of slots in sharded mode. Defaults to None (``os.cpu_count()``).
+        :type shards: int, optional
+
+        :raises ValueError: If `typecode` is invalid, or `shards` is less than 1.
+        """
+        if isinstance(value, ProcessSafeCounter):
+            sharded = value.__sharded
+            typecode = value.__typecode
+            self.__shard_locks = value.__shard_locks
+        else:
+            if typecode not in _TYPECODES:
+                raise ValueError(
+                    f"Invalid typecode '{typecode}' (must be one of '{_TYPECODES}')")
+            if shards is None:
+                shards = os.cpu_count() or 1
+            if shards < 1:
+                raise ValueError(
+                    "ProcessSafeCounter needs at least 1 shard")
+            if isinstance(value, AbstractSafeBase):
+                value = value.copy_obj()
+            self.__shard_locks = tuple(multiprocessing.Lock()
+                                       for _ in range(shards)) if sharded else ()
+        self.__sharded = sharded
+        self.__typecode = typecode
+
+        super().__init__(value)
+        # slot 0 holds the base value, the other slots are shards
+        self._data: Any
+
+    def _create_data(self, data: Any | None) -> Any:
+        data_array = RawArray(self.__typecode, 1 + len(self.__shard_locks))
+        data_array[0] = data or 0
+        return data_array
+
+    def _create_lock(self) -> AbstractLock:
+        return ProcessRLock()
+
+    def add(self, delta=1):
+        """
+        Atomically add a value to the counter.
+
+        In sharded mode, the value is added to the slot of the current process.
+
+        :param delta: The value to add. Defaults to 1.
+        :type delta: int or float, optional
+        """
+        if self.__sharded:
+            slot = os.getpid() % len(self.__shard_locks)
+            with self.__shard_locks[slot]:
+                self._data[slot + 1] += delta
+            return
+        with self._lock:
+            self._data[0] += delta
+
+    def compare_and_set(self, expected, value) -> bool:
+        """
+        Atomically set the counter to `value`, if its current value is `expected`.
+
+        :param expected: The expected current value.
+        :type expected: int or float
+        :param value: The new value.
+        :type value: int or float
+
+        :raises NotImplementedError: In sharded mode.
+
+        :return: True if the counter was updated, False otherwise.
+        :rtype: bool
+        """
+        if self.__sharded:
+            raise NotImplementedError(
+                "compare_and_set() is not available in sharded mode")
+        with self._lock:
+            if self._data[0] != expected:
+                return False
+            self._data[0] = value
+            return True
+
+    def get(self):
+        """
+        Return the current value of the counter (in sharded mode, the sum of all slots).
+
+        :return: The current value.
+        :rtype: int or float
+        """
+        with self._lock:
+            if not self.__sharded:
+                return self._data[0]
+            return sum(self._data)
+
+    def get_and_add(self, delta=1):
+        """
+        Atomically add a value to the counter, returning the previous value.
+
+        :param delta: The value to add. Defaults to 1.
+        :type delta: int or float, optional
+
+        :raises NotImplementedError: In sharded mode.
+
+        :return: The value before the addition.
+        :rtype: int or float
+        """
+        if self.__sharded:
+            raise NotImplementedError(
+                "get_and_add() is not available in sharded mode")
+        with self._lock:
+            previous = self._data[0]
+            self._data[0] = previous + delta
+            return previous
+
+    def is_sharded(self) -> bool:
+        """
+        Checks if the counter is in sharded mode.
+
+        :return: True if sharded, False otherwise.
+        :rtype: bool
+        """
+        return self.__sharded
+
+    def set(self, value):
+        """
+        Set the value of the counter.
+
+        In sharded mode, additions made concurrently with `set()` are kept.
+
+        :param value: The new value.
+        :type value: int or float
+        """
+        with self._lock:
+            self._data[0] = value - sum(self._data[1:])
+
+    @property
+    def typecode(self) -> str:
+        """The ``array.array`` typecode of the value"""
+        return self.__typecode
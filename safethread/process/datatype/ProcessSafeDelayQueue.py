@@ -0,0 +1,75 @@
+
+from typing import Any, Iterable
+
+
+from safethread.process.datatype.ProcessManagerPool import ProcessManager, SafeQueueProxy
+from safethread.process.datatype.ProcessSafePriorityQueue import ProcessSafePriorityQueue
+
+
+class ProcessSafeDelayQueue(ProcessSafePriorityQueue):
+    """
+    A process-safe delay queue, stored in a shared manager process (see ``ProcessManagerPool``):
+    every item is put with a delay, and it can only be retrieved once its due time is reached.
+
+    The heap is kept by a ``ThreadSafeDelayQueue`` in the manager, so due times are measured by
+    the manager clock. `qsize()`, `empty()` and `full()` count every item, due or not,
+    and `peek()` returns the first item to be due, even if it is not due yet.
+
+    It can be passed as an argument to ``BaseProcess`` callbacks.
+    """
+
+    def _create_queue(self, manager: ProcessManager, maxsize: int) -> SafeQueueProxy:
+        return manager.delay_queue(maxsize)  # type: ignore
+
+    def put(self, item: Any, block: bool = True, timeout: float | None = None, delay: float = 0.0):
+        """
+        Put an item into the queue, to be retrieved after `delay` seconds.
+
+        :param item: The item to be put into the queue.
+        :type item: Any
+
+        :param block: If True, blocks until a free slot is available. If False, raises the Full exception if no free slot is immediately available.
+        :type block: bool, optional
+
+        :param timeout: The maximum time to wait for a free slot. If None, waits indefinitely.
+        :type timeout: float or None, optional
+
+        :param delay: Seconds until the item is due. Defaults to 0.0 (due immediately).
+        :type delay: float, optional
+
+        :raises queue.Full: If no free slot is available and block is False or the timeout expires.
+        """
+        self._data.put(item, block, timeout, delay)
+
+    def put_nowait(self, item: Any, delay: float = 0.0):
+        self.put(item, block=False, delay=delay)
+
+    def put_many(self, items: Iterable, block: bool = True, timeout: float | None = None, delay: float = 0.0):
+        """
+        Put multiple items into the queue (all due after `delay` seconds), in a single round-trip.
+
+        :param items: The items to be put into the queue.
+        :type items: Iterable
+
+        :param block: If True, blocks until a free slot is available. If False, raises the Full exception if no free slot is immediately available.
+        :type block: bool, optional
+
+        :param timeout: The maximum time to wait for the free slots. If None, waits indefinitely.
+        :type timeout: float or None, optional
+
+        :param delay: Seconds until the items are due. Defaults to 0.0 (due immediately).
+        :type delay: float, optional
+
+        :raises queue.Full: If no free slot is available and block is False or the timeout expires.
+        :raises queue.ShutDown: If the queue has been shut down.
+        """
+        self._data.put_many(list(items), block, timeout, delay)
+
+    def snapshot(self) -> list:
+        """
+        Return a list of the items in the queue (by due time, due or not), without removing them.
+
+        :return: The items of the queue.
+        :rtype: list
+        """
+        return self._data.snapshot()
@@ -1,20 +1,22 @@
 
-import multiprocessing
+import weakref
 
 from multiprocessing.managers import DictProxy
 from typing import Any, Iterable
 
 from safethread.AbstractLock import AbstractLock
+from safethread.datatype.AbstractSafeBase import AbstractSafeBase
 from safethread.datatype.AbstractSafeDict import AbstractSafeDict
 
+from safethread.process.datatype.ProcessManagerPool import ProcessManagerPool
 from safethread.process.datatype.ProcessRLock import ProcessRLock
 
 
 class ProcessSafeDict(AbstractSafeDict):
     def __eq__(self, other) -> bool:
-        if isinstance(other, ProcessSafeDict):
-            return dict(self._data) == dict(other._data)
-        return self == ProcessSafeDict(other)
+        if isinstance(other, AbstractSafeBase):
+            other = other.copy_obj()
+        return self.copy_obj() == dict(other)
 
     def __init__(self, data: dict | Iterable | None = None):
         """
@@ -29,7 +31,9 @@ class ProcessSafeDict(AbstractSafeDict):
     def _create_data(self, data: Any | None) -> Any:
         if isinstance(data, DictProxy):
             return data
-        return multiprocessing.Manager().dict(data or {})
+        manager = ProcessManagerPool.acquire()
+        weakref.finalize(self, ProcessManagerPool.release, manager)
+        return manager.dict(data or {})
 
     def _create_lock(self) -> AbstractLock:
         return ProcessRLock()
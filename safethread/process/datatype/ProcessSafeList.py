@@ -1,31 +1,79 @@
 
-import multiprocessing
+import weakref
 
 from multiprocessing.managers import ListProxy
 from typing import Any, Iterable
 
 from safethread.AbstractLock import AbstractLock
+from safethread.datatype.AbstractSafeBase import AbstractSafeBase
 from safethread.datatype.AbstractSafeList import AbstractSafeList
 
+from safethread.process.datatype.ProcessManagerPool import BulkListProxy, ProcessManagerPool
 from safethread.process.datatype.ProcessRLock import ProcessRLock
 
 
+def _as_list(other: Any) -> list:
+    """
+    Converts the operand of a comparison into a list, without creating a new process-safe object.
+
+    :param other: A list, a safe data structure, or an iterable.
+    :type other: Any
+
+    :return: The operand as a list.
+    :rtype: list
+    """
+    if isinstance(other, list):
+        return other
+    if isinstance(other, AbstractSafeList):
+        return other.snapshot()
+    if isinstance(other, AbstractSafeBase):
+        return list(other.copy_obj())
+    return list(other)
+
+
 class ProcessSafeList(AbstractSafeList):
+    """
+    A process-safe list, stored in a shared manager process (see ``ProcessManagerPool``).
+
+    Bulk operations (`clear()`, `extend()`, slice assignment / deletion, `get_many()`, `pop_many()`
+    and `snapshot()`) are executed by the manager in a single round-trip.
+    """
 
     def __eq__(self, other) -> bool:
-        if isinstance(other, ProcessSafeList):
-            return list(self._data) == list(other._data)
-        return self == ProcessSafeList(other)
+        """
+        Check if the list is equal to another list (fetched in a single round-trip).
+
+        :param other: A list, a safe data structure, or an iterable.
+        :type other: Any
+
+        :return: `True` if equal, otherwise `False`.
+        :rtype: bool
+        """
+        return self.snapshot() == _as_list(other)
 
     def __lt__(self, other):
-        if isinstance(other, ProcessSafeList):
-            return list(self._data) < list(other._data)
-        return self < ProcessSafeList(other)
+        """
+        Check if the list is less than another list (fetched in a single round-trip).
+
+        :param other: A list, a safe data structure, or an iterable.
+        :type other: Any
+
+        :return: `True` if the list is less than the other list, otherwise `False`.
+        :rtype: bool
+        """
+        return self.snapshot() < _as_list(other)
 
     def __gt__(self, other):
-        if isinstance(other, ProcessSafeList):
-            return list(self._data) > list(other._data)
-        return self > ProcessSafeList(other)
+        """
+        Check if the list is greater than another list (fetched in a single round-trip).
+
+        :param other: A list, a safe data structure, or an iterable.
+        :type other: Any
+
+        :return: `True` if the list is greater than the other list, otherwise `False`.
+        :rtype: bool
+        """
+        return self.snapshot() > _as_list(other)
 
     def __init__(self, data: list | Iterable | None = None):
         """
@@ -40,17 +88,80 @@ class ProcessSafeList(AbstractSafeList):
     def _create_data(self, data: Any | None) -> Any:
         if isinstance(data, ListProxy):
             return data
-        return multiprocessing.Manager().list(data or [])
+        manager = ProcessManagerPool.acquire()
+        weakref.finalize(self, ProcessManagerPool.release, manager)
+        return manager.bulk_list(data or [])  # type: ignore
 
     def _create_lock(self) -> AbstractLock:
         return ProcessRLock()
 
+    def copy_obj(self):
+        """
+        Return a copy of the list (single round-trip).
+
+        :return: A copy of the list.
+        :rtype: list
+        """
+        return self.snapshot()
+
     def clear(self):
         """
-        Clears the list safely.
+        Clears the list safely (single round-trip).
+        """
+        with self._lock:
+            del self._data[:]
+
+    def extend(self, values):
+        """
+        Adds multiple items to the list safely (single round-trip).
+
+        :param values: The items to be added to the list.
+        :type values: list or Iterable
+        """
+        if not isinstance(values, (list, tuple)):
+            values = list(values)
+        with self._lock:
+            self._data.extend(values)
+
+    def get_many(self, indices: Iterable[int]) -> list:
+        """
+        Returns the items at the given indices safely (single round-trip).
+
+        :param indices: The indices of the items to return.
+        :type indices: Iterable[int]
+        :return: The items, in the same order as `indices`.
+        :rtype: list
+        :raises IndexError: If any index is out of range.
+        """
+        if not isinstance(self._data, BulkListProxy):
+            return super().get_many(indices)
+        with self._lock:
+            return self._data.get_many(list(indices))
+
+    def pop_many(self, n: int) -> list:
+        """
+        Removes and returns the last `n` items from the list safely (single round-trip).
+
+        If the list has less than `n` items, all items are removed.
+
+        :param n: The maximum number of items to remove.
+        :type n: int
+        :return: The removed items, in list order.
+        :rtype: list
+        """
+        if not isinstance(self._data, BulkListProxy):
+            return super().pop_many(n)
+        with self._lock:
+            return self._data.pop_many(n)
+
+    def snapshot(self) -> list:
+        """
+        Returns a consistent copy of the list safely (single round-trip).
 
-        **Complexity:** O(N)
+        :return: A copy of the list.
+        :rtype: list
         """
+        if not isinstance(self._data, BulkListProxy):
+            return super().snapshot()
         with self._lock:
-            while len(self._data) > 0:
-                self._data.pop()
+            return self._data.snapshot()
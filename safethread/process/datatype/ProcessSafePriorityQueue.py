@@ -0,0 +1,198 @@
+
+import weakref
+
+from typing import Any, Iterable
+
+
+from safethread.AbstractLock import AbstractLock
+from safethread.datatype.AbstractSafeQueue import AbstractSafeQueue
+
+from safethread.process.datatype.ProcessManagerPool import ProcessManager, ProcessManagerPool, SafeQueueProxy
+from safethread.process.datatype.ProcessRLock import ProcessRLock
+
+
+class ProcessSafePriorityQueue(AbstractSafeQueue):
+    """
+    A process-safe priority queue, stored in a shared manager process (see ``ProcessManagerPool``).
+
+    The lowest item is retrieved first. Items are usually ``(priority, item)`` tuples;
+    if items with the same priority cannot be compared, use ``(priority, sequence, item)`` tuples.
+
+    The heap is kept by a ``ThreadSafePriorityQueue`` in the manager, so items are ordered by the manager,
+    and every method (including `get_many()` / `put_many()`) is a single round-trip.
+    It supports `task_done()` / `join()` and `shutdown()`, like ``ThreadSafeQueue``.
+
+    It can be passed as an argument to ``BaseProcess`` callbacks.
+    """
+
+    def __eq__(self, other) -> bool:
+        """
+        Method NOT implemented.
+
+        :raises NotImplementedError: Always (Method NOT implemented - use `snapshot()` to compare the items)
+        """
+        raise NotImplementedError(
+            f"Cannot compare {self.__class__.__name__}")
+
+    def __init__(self, data: int | Iterable | None = None):
+        """
+        Initialize the process-safe queue.
+
+        :param data: The maximum size of the queue, or its initial items. If it is another queue of the same class,
+                     both objects share the same queue. Defaults to None (unlimited size).
+        :type data: int, Iterable or None
+        """
+        super().__init__(data)
+        self._data: SafeQueueProxy
+
+    def _create_data(self, data: Any | None) -> Any:
+        if isinstance(data, SafeQueueProxy):
+            return data
+        maxsize, items = 0, []
+        if isinstance(data, int):
+            maxsize = data
+        elif isinstance(data, Iterable) and not isinstance(data, str):
+            items = list(data)
+        elif data is not None:
+            raise TypeError(
+                "Queue create failed, provided argument is not int | Iterable")
+
+        manager = ProcessManagerPool.acquire()
+        weakref.finalize(self, ProcessManagerPool.release, manager)
+        instance = self._create_queue(manager, maxsize)
+        if items:
+            instance.put_many(items)
+        return instance
+
+    def _create_lock(self) -> AbstractLock:
+        return ProcessRLock()
+
+    def _create_queue(self, manager: ProcessManager, maxsize: int) -> SafeQueueProxy:
+        """
+        Create the queue in the manager process.
+
+        :param manager: The manager process.
+        :type manager: ProcessManager
+
+        :param maxsize: The maximum size of the queue (0 for unlimited).
+        :type maxsize: int
+
+        :return: A proxy of the new queue.
+        :rtype: SafeQueueProxy
+        """
+        return manager.priority_queue(maxsize)  # type: ignore
+
+    def clear(self):
+        """Clears the queue"""
+        self._data.clear()
+
+    def copy_obj(self) -> SafeQueueProxy:
+        """
+        Return a copy of the queue, created in the same manager process.
+
+        :return: A proxy of the new queue.
+        :rtype: SafeQueueProxy
+        """
+        return self._data.copy()
+
+    def get_many(self, max_items: int, block: bool = True, timeout: float | None = None) -> list:
+        """
+        Retrieve up to `max_items` items from the queue, in a single round-trip.
+
+        It waits (like `get()`) for the first item, then returns the items immediately available (at most `max_items`).
+
+        :param max_items: The maximum number of items to retrieve.
+        :type max_items: int
+
+        :param block: If True, block until an item is available. If False, raise the Empty exception if no item is immediately available. Default is True.
+        :type block: bool, optional
+
+        :param timeout: The maximum time to wait for the first item. If None, wait indefinitely. Default is None.
+        :type timeout: float, optional
+
+        :return: The items retrieved from the queue (empty list if `max_items` <= 0).
+        :rtype: list
+
+        :raises queue.Empty: If no item is available and block is False or the timeout expires.
+        :raises queue.ShutDown: If the queue has been shut down and is empty.
+        """
+        return self._data.get_many(max_items, block, timeout)
+
+    def join(self):
+        """
+        Blocks until all items in the queue have been gotten and processed (see `task_done()`).
+        """
+        self._data.join()
+
+    def peek(self) -> Any:
+        """
+        Return the next item of the queue, without removing it.
+
+        :return: The item at the front of the queue.
+        :rtype: Any
+
+        :raises queue.Empty: If the queue is empty.
+        """
+        return self._data.peek()
+
+    def put_many(self, items: Iterable, block: bool = True, timeout: float | None = None):
+        """
+        Put multiple items into the queue, in a single round-trip.
+
+        :param items: The items to be put into the queue.
+        :type items: Iterable
+
+        :param block: If True, blocks until a free slot is available. If False, raises the Full exception if no free slot is immediately available.
+        :type block: bool, optional
+
+        :param timeout: The maximum time to wait for the free slots. If None, waits indefinitely.
+        :type timeout: float or None, optional
+
+        :raises queue.Full: If no free slot is available and block is False or the timeout expires.
+        :raises queue.ShutDown: If the queue has been shut down.
+        """
+        self._data.put_many(list(items), block, timeout)
+
+    def shutdown(self, immediate: bool = False):
+        """
+        Shut-down the queue, making queue gets and puts raise ShutDown.
+
+        By default, gets will only raise once the queue is empty. Set
+        'immediate' to True to make gets raise immediately instead.
+
+        :param immediate: If True, discard the remaining items. Defaults to False.
+        :type immediate: bool, optional
+        """
+        self._data.shutdown(immediate)
+
+    def snapshot(self) -> list:
+        """
+        Return a list of the items in the queue (lowest first), without removing them.
+
+        :return: The items of the queue.
+        :rtype: list
+        """
+        return self._data.snapshot()
+
+    def task_done(self):
+        """
+        Indicate that a formerly retrieved item has been processed (see `join()`).
+
+        :raises ValueError: If called more times than there were items placed in the queue.
+        """
+        self._data.task_done()
+
+    @property
+    def is_shutdown(self) -> bool:
+        """True if queue has been shutdown, False otherwise"""
+        return self._data.is_shutdown
+
+    @property
+    def maxsize(self) -> int:
+        """Get queue maximum size"""
+        return self._data.maxsize
+
+    @property
+    def unfinished_tasks(self) -> int:
+        """Get the number of unfinished tasks"""
+        return self._data.unfinished_tasks
@@ -1,8 +1,19 @@
-
+import io
 import multiprocessing
 import multiprocessing.queues
+import os
+import pickle
+import queue
+import select
+import struct
+import threading
+import time
+import weakref
 
-from typing import Any, Iterable, Self
+from multiprocessing.connection import Connection
+from multiprocessing.reduction import ForkingPickler
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Callable, Iterable
 
 
 from safethread.AbstractLock import AbstractLock
@@ -11,7 +22,265 @@ from safethread.datatype.AbstractSafeQueue import AbstractSafeQueue
 from safethread.process.datatype.ProcessRLock import ProcessRLock
 
 
+_RING_HEADER = struct.Struct("qq")
+"""Shared ring header layout: head, tail (absolute byte offsets)"""
+
+_RECORD = struct.Struct("II")
+"""Ring record header layout: payload size, state"""
+
+_LIVE, _CONSUMED, _PADDING = 0, 1, 2
+"""Ring record states"""
+
+
+def _align(size: int) -> int:
+    """Rounds a size up to a multiple of the ring record alignment (8 bytes)."""
+    return (size + 7) & ~7
+
+
+_picklers = threading.local()
+"""Pickler (and its buffer) of each thread, reused by `_dumps()`"""
+
+
+def _dumps(obj: Any) -> bytes:
+    """
+    Pickles an object like ``ForkingPickler.dumps()``, reusing a pickler per thread (faster for small objects).
+    """
+    try:
+        buffer, pickler = _picklers.value
+    except AttributeError:
+        buffer = io.BytesIO()
+        pickler = ForkingPickler(buffer, pickle.HIGHEST_PROTOCOL)
+        _picklers.value = (buffer, pickler)
+    try:
+        pickler.dump(obj)
+        return buffer.getvalue()
+    except BaseException:
+        # the pickler state is unknown after an error
+        del _picklers.value
+        raise
+    finally:
+        # do not keep the pickled objects alive (memo) nor the data
+        pickler.clear_memo()
+        buffer.seek(0)
+        buffer.truncate()
+
+
+def _release_ring(segment: SharedMemory, owner_pid: int | None):
+    """
+    Closes the shared memory of a _SharedRing, unlinking it if called by the owner process.
+
+    This function is called by weakref.finalize() and should not be called directly.
+    """
+    segment.close()
+    if owner_pid == os.getpid():
+        segment.unlink()
+
+
+class _SharedRing:
+    """
+    A ring buffer of variable-size byte records, stored in ``multiprocessing.shared_memory``.
+
+    Records are appended at the tail, and may be consumed in any order; the head advances
+    over consumed records, freeing their space.
+
+    It is NOT synchronized; it must be protected by an external lock (see ProcessSafeQueue).
+    """
+
+    def __init__(self, capacity: int, name: str | None = None):
+        """
+        Creates a new shared ring, or attaches to an existing one.
+
+        :param capacity: The capacity of the ring, in bytes.
+        :type capacity: int
+        :param name: Name of the shared memory of an existing ring to attach to. Defaults to None (create).
+        :type name: str, optional
+        """
+        super().__init__()
+
+        self.__capacity = _align(capacity)
+        owner_pid = None
+        if name is None:
+            self.__segment = SharedMemory(
+                create=True, size=_RING_HEADER.size + self.__capacity, track=False)
+            _RING_HEADER.pack_into(self.__buf, 0, 0, 0)
+            owner_pid = os.getpid()
+        else:
+            self.__segment = SharedMemory(name=name, track=False)
+
+        weakref.finalize(self, _release_ring, self.__segment, owner_pid)
+
+    def __reduce__(self):
+        return (self.__class__, (self.__capacity, self.__segment.name))
+
+    @property
+    def __buf(self) -> memoryview:
+        assert self.__segment.buf is not None
+        return self.__segment.buf
+
+    def append(self, payload: bytes | memoryview) -> int | None:
+        """
+        Appends a record to the ring.
+
+        :param payload: The record data.
+        :type payload: bytes or memoryview
+
+        :return: The position of the record, or None if there is not enough free space.
+        :rtype: int or None
+        """
+        buf, capacity = self.__buf, self.__capacity
+        length = len(payload)
+        size = _RECORD.size + _align(length)
+        head, tail = _RING_HEADER.unpack_from(buf)
+        start = tail % capacity
+        # records are contiguous: pad the end of the ring, if needed
+        padding = capacity - start if start + size > capacity else 0
+        if tail + padding + size - head > capacity:
+            return None
+        if padding:
+            _RECORD.pack_into(buf, _RING_HEADER.size + start,
+                              padding - _RECORD.size, _PADDING)
+            tail += padding
+            start = 0
+        offset = _RING_HEADER.size + start + _RECORD.size
+        _RECORD.pack_into(buf, offset - _RECORD.size, length, _LIVE)
+        buf[offset:offset + length] = payload
+        _RING_HEADER.pack_into(buf, 0, head, tail + size)
+        return tail
+
+    def consume(self, position: int) -> bytes:
+        """
+        Consumes a record, freeing its space.
+
+        :param position: The position of the record (returned by `append()`).
+        :type position: int
+
+        :return: The record data.
+        :rtype: bytes
+        """
+        buf, capacity = self.__buf, self.__capacity
+        offset = _RING_HEADER.size + position % capacity
+        length, _ = _RECORD.unpack_from(buf, offset)
+        payload = buf[offset + _RECORD.size:
+                      offset + _RECORD.size + length].tobytes()
+        _RECORD.pack_into(buf, offset, length, _CONSUMED)
+
+        # free the consumed (and padding) records at the head
+        head, tail = _RING_HEADER.unpack_from(buf)
+        while head < tail:
+            length, state = _RECORD.unpack_from(
+                buf, _RING_HEADER.size + head % capacity)
+            if state == _LIVE:
+                break
+            head += _RECORD.size + _align(length)
+        if head == tail:
+            # empty ring: restart from the beginning of the buffer
+            head = tail = 0
+        _RING_HEADER.pack_into(buf, 0, head, tail)
+        return payload
+
+    def read(self, position: int) -> bytes:
+        """
+        Reads a record, without consuming it.
+
+        :param position: The position of the record (returned by `append()`).
+        :type position: int
+
+        :return: The record data.
+        :rtype: bytes
+        """
+        buf = self.__buf
+        offset = _RING_HEADER.size + position % self.__capacity
+        length, _ = _RECORD.unpack_from(buf, offset)
+        return buf[offset + _RECORD.size: offset + _RECORD.size + length].tobytes()
+
+    def records(self) -> list[bytes]:
+        """
+        Gets the data of the records not consumed yet, oldest first.
+
+        :return: The records data.
+        :rtype: list[bytes]
+        """
+        buf, capacity = self.__buf, self.__capacity
+        result = []
+        head, tail = _RING_HEADER.unpack_from(buf)
+        while head < tail:
+            offset = _RING_HEADER.size + head % capacity
+            length, state = _RECORD.unpack_from(buf, offset)
+            if state == _LIVE:
+                result.append(
+                    buf[offset + _RECORD.size: offset + _RECORD.size + length].tobytes())
+            head += _RECORD.size + _align(length)
+        return result
+
+
+class _ManyQueue(multiprocessing.queues.Queue):
+    """A ``multiprocessing.Queue`` that can receive several messages at once (see `get_many()`)"""
+
+    # attributes of multiprocessing.queues.Queue (missing from its type stubs)
+    _closed: bool
+    _rlock: Any
+    _reader: Connection
+    _sem: Any
+    _poll: Callable[..., bool]
+    _recv_bytes: Callable[[], bytes]
+
+    def __init__(self, maxsize: int = 0):
+        super().__init__(maxsize, ctx=multiprocessing.get_context())
+
+    def get_many(self, max_items: int, block: bool = True, timeout: float | None = None) -> list:
+        """
+        Receive up to `max_items` messages, taking the read lock once (like `get()` for the first message).
+
+        :raises queue.Empty: If no message is available and block is False or the timeout expires.
+        """
+        if self._closed:
+            raise ValueError(f"Queue {self!r} is closed")
+        deadline = None if timeout is None else time.monotonic() + timeout
+        if not self._rlock.acquire(block, timeout):
+            raise queue.Empty
+        try:
+            if not block:
+                if not self._poll():
+                    raise queue.Empty
+            elif deadline is not None:
+                if not self._poll(max(deadline - time.monotonic(), 0)):
+                    raise queue.Empty
+            payloads = [self._recv_bytes()]
+            self._sem.release()
+            poller = None
+            if hasattr(select, "poll"):
+                # much cheaper than Connection.poll() (a new selector per call)
+                poller = select.poll()
+                poller.register(self._reader, select.POLLIN)
+            while len(payloads) < max_items and (self._poll() if poller is None else poller.poll(0)):
+                payloads.append(self._recv_bytes())
+                self._sem.release()
+        finally:
+            self._rlock.release()
+        # unpickle the messages after having released the lock
+        return [pickle.loads(payload) for payload in payloads]
+
+
+class _RingRef(int):
+    """A message that refers to an item stored in the shared ring of a ProcessSafeQueue"""
+
+
 class ProcessSafeQueue(AbstractSafeQueue):
+    """
+    A process-safe queue, based on ``multiprocessing.Queue``.
+
+    Items are pickled once into a shared memory ring buffer, and only a small reference is sent through
+    the queue pipe. So, `peek()`, `snapshot()`, iteration and `copy_obj()` read the ring without dequeuing
+    items (and without blocking producers, except during the copy). Items that do not fit in the ring
+    (see `ring_size`) are sent through the pipe, and are not seen by `peek()` / `snapshot()`.
+
+    Every `put()` takes a process lock to write the ring. With `ring_size=0`, items are only sent through
+    the pipe (faster), but the queue can not be inspected: `peek()` / `snapshot()` raise RuntimeError
+    (`drain_snapshot()` still works, dequeuing every item and putting it back).
+    """
+
+    DEFAULT_RING_SIZE = 1 << 20
+    """Default size of the shared ring, in bytes (1 MiB)"""
 
     def __eq__(self, other) -> bool:
         """
@@ -21,9 +290,33 @@ class ProcessSafeQueue(AbstractSafeQueue):
         """
         raise NotImplementedError("Cannot compare multiprocessing.Queue")
 
-    def __init__(self, data: multiprocessing.queues.Queue | int | Iterable | None = None):
+    def __init__(self, data: multiprocessing.queues.Queue | int | Iterable | None = None, ring_size: int = DEFAULT_RING_SIZE):
+        """
+        Initialize the process-safe queue.
+
+        :param data: The initial data to populate the queue with (a queue or an Iterable), or the maximum size.
+                     If it is another ProcessSafeQueue, both objects share the same queue.
+        :type data: multiprocessing.queues.Queue, int, Iterable or None
+
+        :param ring_size: Size of the shared ring that stores the items, in bytes (read by `peek()` / `snapshot()`).
+                          If 0, every item is sent through the pipe, and the queue can not be inspected. Defaults to DEFAULT_RING_SIZE.
+        :type ring_size: int, optional
+
+        :raises ValueError: If `ring_size` is negative.
+        """
+        if ring_size < 0:
+            raise ValueError("ring_size must be non-negative")
         self.__maxsize: int = 0
-        self._data: multiprocessing.queues.Queue
+        if isinstance(data, ProcessSafeQueue):
+            self.__maxsize = data.__maxsize
+            self.__ring_size = data.__ring_size
+            self.__ring = data.__ring
+            self.__ring_lock = data.__ring_lock
+        else:
+            self.__ring_size = ring_size
+            self.__ring = _SharedRing(ring_size) if ring_size else None
+            self.__ring_lock = multiprocessing.Lock()
+        self._data: _ManyQueue
 
         super().__init__(data)
 
@@ -39,7 +332,7 @@ class ProcessSafeQueue(AbstractSafeQueue):
                 "Queue create failed, provided argument is not int | multiprocessing.queues.Queue")
 
         # create queue
-        instance = multiprocessing.Queue(maxsize=self.maxsize)
+        instance = _ManyQueue(maxsize=self.maxsize)
 
         # initialize queue with provided data
         if (isinstance(data, multiprocessing.queues.Queue) or
@@ -47,9 +340,208 @@ class ProcessSafeQueue(AbstractSafeQueue):
             self._init_with_data(instance, data)
         return instance
 
+    def _init_with_data(self, instance: queue.Queue | multiprocessing.queues.Queue, data: queue.Queue | multiprocessing.queues.Queue | Iterable):
+        if isinstance(data, queue.Queue) or isinstance(data, multiprocessing.queues.Queue):
+            items = []
+            while not data.empty():
+                items.append(data.get())
+            data = items
+        for item in data:
+            self.__send(instance, item)
+
+    def __send(self, instance: queue.Queue | multiprocessing.queues.Queue, message: Any, block: bool = True, timeout: float | None = None):
+        """
+        Send a message through the queue, storing it in the shared ring (if it fits).
+        """
+        if self.__ring is None:
+            instance.put(message, block=block, timeout=timeout)
+            return
+        payload = _dumps(message)
+        with self.__ring_lock:
+            position = self.__ring.append(payload)
+        if position is None:
+            # too big for the free space of the ring
+            instance.put(message, block=block, timeout=timeout)
+            return
+        try:
+            instance.put(_RingRef(position), block=block, timeout=timeout)
+        except BaseException:
+            with self.__ring_lock:
+                self.__ring.consume(position)  # type: ignore
+            raise
+
+    def __receive(self, message: Any) -> Any:
+        """
+        Resolve a message received from the queue, consuming its data from the shared ring.
+        """
+        if isinstance(message, _RingRef):
+            with self.__ring_lock:
+                payload = self.__ring.consume(message)  # type: ignore
+            message = pickle.loads(payload)
+        return message
+
     def _create_lock(self) -> AbstractLock:
         return ProcessRLock()
 
+    def copy(self):
+        """
+        Return a new (unbounded) ProcessSafeQueue with the same ring size, holding the items of `snapshot()`.
+
+        :return: A new queue.
+        :rtype: ProcessSafeQueue
+
+        :raises RuntimeError: If the queue has no shared ring (`ring_size=0`).
+        """
+        return type(self)(self.snapshot(), ring_size=self.__ring_size)
+
+    def copy_obj(self) -> multiprocessing.queues.Queue:
+        """
+        Return a new (unbounded) ``multiprocessing.Queue``, holding the items of `snapshot()`.
+
+        :return: A new queue.
+        :rtype: multiprocessing.queues.Queue
+
+        :raises RuntimeError: If the queue has no shared ring (`ring_size=0`).
+        """
+        instance = multiprocessing.Queue()
+        for item in self.snapshot():
+            instance.put(item)
+        return instance
+
+    def drain_snapshot(self) -> list:
+        """
+        Return a list of the items in the queue (front first), by dequeuing every item and putting it back.
+
+        It works without shared ring, but it is O(n) pipe round-trips under the queue lock: consumers are stalled,
+        producers that do not take the lock interleave with the items put back (reordering them), and it blocks
+        if a bounded queue is filled meanwhile. Prefer `snapshot()`.
+
+        :return: The items of the queue.
+        :rtype: list
+        """
+        with self._lock:
+            try:
+                # also counts the messages not flushed to the pipe yet (feeder threads)
+                count = self._data.qsize()
+            except NotImplementedError:
+                count = 0
+            messages = []
+            while True:
+                try:
+                    messages.append(self._data.get(
+                        block=len(messages) < count, timeout=0.1))
+                except queue.Empty:
+                    break
+            for message in messages:
+                self._data.put(message)
+        if self.__ring is None:
+            return messages
+        with self.__ring_lock:
+            return [pickle.loads(self.__ring.read(message)) if isinstance(message, _RingRef) else message
+                    for message in messages]
+
+    def get(self, block: bool = True, timeout: float | None = None) -> Any:
+        return self.__receive(self._data.get(block=block, timeout=timeout))
+
+    def get_nowait(self) -> Any:
+        return self.get(block=False)
+
+    def get_many(self, max_items: int, block: bool = True, timeout: float | None = None) -> list:
+        """
+        Retrieve up to `max_items` items from the queue.
+
+        It waits (like `get()`) for the first item, then returns the items immediately available (at most `max_items`).
+
+        :param max_items: The maximum number of items to retrieve.
+        :type max_items: int
+
+        :param block: If True, block until an item is available. If False, raise the Empty exception if no item is immediately available. Default is True.
+        :type block: bool, optional
+
+        :param timeout: The maximum time to wait for the first item. If None, wait indefinitely. Default is None.
+        :type timeout: float, optional
+
+        :return: The items retrieved from the queue (empty list if `max_items` <= 0).
+        :rtype: list
+
+        :raises queue.Empty: If no item is available and block is False or the timeout expires.
+        """
+        if max_items <= 0:
+            return []
+        messages = self._data.get_many(max_items, block=block, timeout=timeout)
+        return [self.__receive(message) for message in messages]
+
+    def peek(self) -> Any:
+        """
+        Return the next item of the queue, without removing it.
+
+        It reads the shared ring (see `snapshot()`): if the next item did not fit in the ring,
+        the first item stored in the ring is returned.
+
+        :return: The item at the front of the queue.
+        :rtype: Any
+
+        :raises queue.Empty: If the queue is empty.
+        :raises RuntimeError: If the queue has no shared ring (`ring_size=0`).
+        """
+        items = self.snapshot()
+        if not items:
+            raise queue.Empty
+        return items[0]
+
+    def put(self, item: Any, block: bool = True, timeout: float | None = None):
+        self.__send(self._data, item, block=block, timeout=timeout)
+
+    def put_nowait(self, item: Any):
+        self.put(item, block=False)
+
+    def put_many(self, items: Iterable, block: bool = True, timeout: float | None = None):
+        """
+        Put multiple items into the queue, taking the queue lock once (the items of a batch are not
+        interleaved with the items of other `put_many()` calls).
+
+        Every item is a message of its own, so any consumer can get it (the items of a batch are
+        not tied to the process that receives the first one).
+
+        :param items: The items to be put into the queue.
+        :type items: Iterable
+
+        :param block: If True, blocks until a free slot is available. If False, raises the Full exception if no free slot is immediately available.
+        :type block: bool, optional
+
+        :param timeout: The maximum time to wait for a free slot (for each item). If None, waits indefinitely.
+        :type timeout: float or None, optional
+
+        :raises queue.Full: If no free slot is available and block is False or the timeout expires
+                            (the items put before stay in the queue).
+        """
+        with self._lock:
+            for item in items:
+                self.__send(self._data, item, block=block, timeout=timeout)
+
+    def qsize(self) -> int:
+        """Return the approximate size of the queue (not reliable!)."""
+        return self._data.qsize()
+
+    def snapshot(self) -> list:
+        """
+        Return a list of the items in the queue (front first), without removing them.
+
+        The shared ring is copied under its lock, so producers and consumers are only blocked during the copy.
+        It is a best effort: items that did not fit in the ring (sent through the pipe) are not included.
+
+        :return: The items of the queue.
+        :rtype: list
+
+        :raises RuntimeError: If the queue has no shared ring (`ring_size=0`, see `drain_snapshot()`).
+        """
+        if self.__ring is None:
+            raise RuntimeError(
+                "Cannot inspect a ProcessSafeQueue without shared ring (ring_size=0), use drain_snapshot()")
+        with self.__ring_lock:
+            records = self.__ring.records()
+        return [pickle.loads(record) for record in records]
+
     def shutdown(self):
         """
         Shut-down the queue.
@@ -63,7 +555,7 @@ class ProcessSafeQueue(AbstractSafeQueue):
         """Clears the queue"""
         with self._lock:
             while not self._data.empty():
-                self._data.get()
+                self.__receive(self._data.get())
 
     @property
     def maxsize(self) -> int:
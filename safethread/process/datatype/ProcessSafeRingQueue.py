@@ -0,0 +1,540 @@
+import contextlib
+import multiprocessing
+import os
+import queue
+import struct
+import weakref
+
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Generator, Iterable
+
+from safethread.AbstractLock import AbstractLock
+from safethread.datatype.AbstractSafeQueue import AbstractSafeQueue
+
+from safethread.process.datatype.ProcessRLock import ProcessRLock
+
+
+_INDEX = struct.Struct("q")
+"""Layout of the shared head / tail indexes (absolute slot numbers) and of the record length (slot header)"""
+
+_HEAD, _TAIL, _HEADER_SIZE = 0, _INDEX.size, 2 * _INDEX.size
+"""Shared header layout: head index (written by consumers), tail index (written by producers)"""
+
+
+def _release_segment(segment: SharedMemory, owner_pid: int | None):
+    """
+    Closes the shared memory of a _SlotRing, unlinking it if called by the owner process.
+
+    This function is called by weakref.finalize() and should not be called directly.
+    """
+    segment.close()
+    if owner_pid == os.getpid():
+        segment.unlink()
+
+
+def _as_bytes(item: Any) -> memoryview:
+    """Gets a flat byte view of a bytes-like object."""
+    view = memoryview(item)
+    return view if view.format == "B" and view.ndim == 1 else view.cast("B")
+
+
+class _SlotRing:
+    """
+    A bounded FIFO queue of byte records, stored in fixed-size slots of a ``multiprocessing.shared_memory`` segment.
+
+    Producers and consumers are synchronized by two semaphores (free and used slots), and by
+    two locks (one for each side), so producers do not contend with consumers.
+
+    It implements the queue methods used by AbstractSafeQueue (get, put, qsize, empty, full, ...).
+    """
+
+    def __init__(self, capacity: int, slot_size: int, name: str | None = None, sync: tuple | None = None):
+        """
+        Creates a new slot ring, or attaches to an existing one.
+
+        :param capacity: The number of slots.
+        :type capacity: int
+        :param slot_size: The maximum size of a record, in bytes.
+        :type slot_size: int
+        :param name: Name of the shared memory of an existing ring to attach to. Defaults to None (create).
+        :type name: str, optional
+        :param sync: Synchronization primitives of an existing ring (free, used, put lock, get lock). Defaults to None.
+        :type sync: tuple, optional
+        """
+        super().__init__()
+
+        self.__capacity = capacity
+        self.__slot_size = slot_size
+        # slot stride, aligned to 8 bytes
+        self.__stride = _INDEX.size + ((slot_size + 7) & ~7)
+
+        owner_pid = None
+        if name is None:
+            self.__segment = SharedMemory(
+                create=True, size=_HEADER_SIZE + capacity * self.__stride, track=False)
+            self.__buf[:_HEADER_SIZE] = bytes(_HEADER_SIZE)
+            owner_pid = os.getpid()
+            sync = (multiprocessing.Semaphore(capacity), multiprocessing.Semaphore(0),
+                    multiprocessing.Lock(), multiprocessing.Lock())
+        else:
+            self.__segment = SharedMemory(name=name, track=False)
+        assert sync is not None
+        self.__sync = sync
+        self.__free, self.__used, self.__put_lock, self.__get_lock = sync
+
+        weakref.finalize(self, _release_segment, self.__segment, owner_pid)
+
+    def __reduce__(self):
+        return (self.__class__, (self.__capacity, self.__slot_size, self.__segment.name, self.__sync))
+
+    @property
+    def __buf(self) -> memoryview:
+        assert self.__segment.buf is not None
+        return self.__segment.buf
+
+    @property
+    def capacity(self) -> int:
+        """The number of slots"""
+        return self.__capacity
+
+    @property
+    def slot_size(self) -> int:
+        """The maximum size of a record, in bytes"""
+        return self.__slot_size
+
+    def __acquire(self, semaphore, block: bool, timeout: float | None, error: type[Exception]):
+        """Acquires a semaphore, raising `error` if it is not available (non-blocking or timed out)."""
+        if block and timeout is not None and timeout < 0:
+            raise ValueError("'timeout' must be a non-negative number")
+        if not semaphore.acquire(block, timeout if block else None):
+            raise error
+
+    def __acquire_more(self, semaphore, count: int) -> int:
+        """Acquires a semaphore up to `count` times, without blocking. Returns the number of acquisitions."""
+        acquired = 0
+        while acquired < count and semaphore.acquire(False):
+            acquired += 1
+        return acquired
+
+    def __slot(self, index: int) -> int:
+        """Gets the offset of a slot (by absolute index)."""
+        return _HEADER_SIZE + (index % self.__capacity) * self.__stride
+
+    def __check(self, view: memoryview):
+        if view.nbytes > self.__slot_size:
+            raise ValueError(
+                f"Record size ({view.nbytes}) exceeds the slot size ({self.__slot_size})")
+
+    def __write(self, views: list[memoryview]):
+        """Writes records at the tail (the caller must hold a free slot for each one)."""
+        buf = self.__buf
+        with self.__put_lock:
+            tail, = _INDEX.unpack_from(buf, _TAIL)
+            for view in views:
+                offset = self.__slot(tail)
+                _INDEX.pack_into(buf, offset, view.nbytes)
+                buf[offset + _INDEX.size: offset +
+                    _INDEX.size + view.nbytes] = view
+                tail += 1
+            _INDEX.pack_into(buf, _TAIL, tail)
+        for _ in views:
+            self.__used.release()
+
+    def __read(self, count: int) -> list[bytes]:
+        """Reads records from the head (the caller must hold a used slot for each one)."""
+        buf = self.__buf
+        items = []
+        with self.__get_lock:
+            head, = _INDEX.unpack_from(buf, _HEAD)
+            for _ in range(count):
+                offset = self.__slot(head) + _INDEX.size
+                length, = _INDEX.unpack_from(buf, offset - _INDEX.size)
+                items.append(buf[offset: offset + length].tobytes())
+                head += 1
+            _INDEX.pack_into(buf, _HEAD, head)
+        for _ in range(count):
+            self.__free.release()
+        return items
+
+    def put(self, item: Any, block: bool = True, timeout: float | None = None):
+        view = _as_bytes(item)
+        self.__check(view)
+        self.__acquire(self.__free, block, timeout, queue.Full)
+        self.__write([view])
+
+    def put_nowait(self, item: Any):
+        self.put(item, block=False)
+
+    def put_many(self, items: Iterable, block: bool = True, timeout: float | None = None):
+        views = [_as_bytes(item) for item in items]
+        for view in views:
+            self.__check(view)
+        start = 0
+        while start < len(views):
+            self.__acquire(self.__free, block, timeout, queue.Full)
+            count = 1 + self.__acquire_more(self.__free,
+                                            len(views) - start - 1)
+            self.__write(views[start:start + count])
+            start += count
+
+    def get(self, block: bool = True, timeout: float | None = None) -> bytes:
+        self.__acquire(self.__used, block, timeout, queue.Empty)
+        return self.__read(1)[0]
+
+    def get_nowait(self) -> bytes:
+        return self.get(block=False)
+
+    def get_many(self, max_items: int, block: bool = True, timeout: float | None = None) -> list[bytes]:
+        if max_items <= 0:
+            return []
+        self.__acquire(self.__used, block, timeout, queue.Empty)
+        return self.__read(1 + self.__acquire_more(self.__used, max_items - 1))
+
+    @contextlib.contextmanager
+    def put_view(self, size: int, block: bool = True, timeout: float | None = None) -> Generator[memoryview, None, None]:
+        if size < 0 or size > self.__slot_size:
+            raise ValueError(
+                f"Record size ({size}) must be between 0 and the slot size ({self.__slot_size})")
+        self.__acquire(self.__free, block, timeout, queue.Full)
+        buf = self.__buf
+        committed = False
+        try:
+            with self.__put_lock:
+                tail, = _INDEX.unpack_from(buf, _TAIL)
+                offset = self.__slot(tail)
+                _INDEX.pack_into(buf, offset, size)
+                with buf[offset + _INDEX.size: offset + _INDEX.size + size] as view:
+                    yield view
+                _INDEX.pack_into(buf, _TAIL, tail + 1)
+                committed = True
+        finally:
+            (self.__used if committed else self.__free).release()
+
+    @contextlib.contextmanager
+    def get_view(self, block: bool = True, timeout: float | None = None) -> Generator[memoryview, None, None]:
+        self.__acquire(self.__used, block, timeout, queue.Empty)
+        buf = self.__buf
+        committed = False
+        try:
+            with self.__get_lock:
+                head, = _INDEX.unpack_from(buf, _HEAD)
+                offset = self.__slot(head) + _INDEX.size
+                length, = _INDEX.unpack_from(buf, offset - _INDEX.size)
+                with buf[offset: offset + length].toreadonly() as view:
+                    yield view
+                _INDEX.pack_into(buf, _HEAD, head + 1)
+                committed = True
+        finally:
+            (self.__free if committed else self.__used).release()
+
+    def snapshot(self) -> list[bytes]:
+        buf = self.__buf
+        with self.__get_lock:
+            head, = _INDEX.unpack_from(buf, _HEAD)
+            tail, = _INDEX.unpack_from(buf, _TAIL)
+            items = []
+            for index in range(head, tail):
+                offset = self.__slot(index) + _INDEX.size
+                length, = _INDEX.unpack_from(buf, offset - _INDEX.size)
+                items.append(buf[offset: offset + length].tobytes())
+            return items
+
+    def clear(self):
+        with self.__get_lock:
+            count = self.__acquire_more(self.__used, self.__capacity)
+            head, = _INDEX.unpack_from(self.__buf, _HEAD)
+            _INDEX.pack_into(self.__buf, _HEAD, head + count)
+        for _ in range(count):
+            self.__free.release()
+
+    def qsize(self) -> int:
+        head, = _INDEX.unpack_from(self.__buf, _HEAD)
+        tail, = _INDEX.unpack_from(self.__buf, _TAIL)
+        return tail - head
+
+    def empty(self) -> bool:
+        return self.qsize() <= 0
+
+    def full(self) -> bool:
+        return self.qsize() >= self.__capacity
+
+
+class ProcessSafeRingQueue(AbstractSafeQueue):
+    """
+    A process-safe bounded queue of byte records (e.g., sensor frames, binary blobs), stored in
+    ``multiprocessing.shared_memory``.
+
+    Unlike ``ProcessSafeQueue``, there is no feeder thread, no pipe and no pickling: records are
+    copied into fixed-size slots of a shared ring buffer, with head / tail indexes and semaphores.
+    `put_view()` and `get_view()` give direct (zero-copy) access to the slots.
+
+    Items are bytes-like objects (``bytes``, ``bytearray``, ``memoryview``, ``array.array``, ...)
+    of at most `slot_size` bytes; `get()` returns ``bytes``.
+
+    **Example:**
+
+    ```python
+    frames = ProcessSafeRingQueue(256, slot_size=4096)
+
+    # producer process
+    with frames.put_view(4096) as view:
+        camera.read_into(view)
+
+    # consumer process
+    with frames.get_view() as view:
+        process(view)
+    ```
+    """
+
+    DEFAULT_CAPACITY = 1024
+    """Default number of slots"""
+
+    DEFAULT_SLOT_SIZE = 1024
+    """Default size of a slot, in bytes"""
+
+    def __init__(self, data: int | Iterable | None = None, slot_size: int = DEFAULT_SLOT_SIZE):
+        """
+        Initialize the process-safe ring queue.
+
+        :param data: The capacity (number of slots), or the initial records of the queue. Defaults to None (DEFAULT_CAPACITY).
+                     If it is another ProcessSafeRingQueue, both objects share the same queue.
+        :type data: int, Iterable or None
+
+        :param slot_size: The maximum size of a record, in bytes. Defaults to DEFAULT_SLOT_SIZE.
+        :type slot_size: int, optional
+
+        :raises ValueError: If the capacity or `slot_size` are less than 1, or an initial record exceeds `slot_size`.
+        :raises TypeError: If `data` is not an int or an Iterable of bytes-like objects.
+        """
+        if slot_size < 1:
+            raise ValueError("slot_size must be at least 1")
+        self.__slot_size = slot_size
+        super().__init__(data)
+        self._data: _SlotRing
+
+    def __eq__(self, other) -> bool:
+        """
+        Method NOT implemented.
+
+        :raises NotImplementedError: Always (Method NOT implemented - use `snapshot()` to compare the records)
+        """
+        raise NotImplementedError("Cannot compare ProcessSafeRingQueue")
+
+    def _create_data(self, data: Any | None) -> Any:
+        items = []
+        if isinstance(data, _SlotRing):
+            return data
+        if data is None:
+            capacity = self.DEFAULT_CAPACITY
+        elif isinstance(data, int):
+            capacity = data
+        elif isinstance(data, Iterable) and not isinstance(data, str):
+            items = list(data)
+            capacity = max(self.DEFAULT_CAPACITY, len(items))
+        else:
+            raise TypeError(
+                "Queue create failed, provided argument is not int | Iterable")
+        if capacity < 1:
+            raise ValueError("ProcessSafeRingQueue needs at least 1 slot")
+
+        instance = _SlotRing(capacity, self.__slot_size)
+        instance.put_many(items)
+        return instance
+
+    def _create_lock(self) -> AbstractLock:
+        return ProcessRLock()
+
+    def clear(self):
+        """Clears the queue"""
+        self._data.clear()
+
+    def copy(self):
+        """
+        Return a new ProcessSafeRingQueue (same capacity and slot size), holding the records of `snapshot()`.
+
+        :return: A new queue.
+        :rtype: ProcessSafeRingQueue
+        """
+        return self.create(self.copy_obj())
+
+    def copy_obj(self) -> Any:
+        """
+        Return a new internal ring (same capacity and slot size), holding the records of `snapshot()`.
+
+        :return: A new ring.
+        """
+        instance = _SlotRing(self._data.capacity, self._data.slot_size)
+        instance.put_many(self.snapshot())
+        return instance
+
+    def get(self, block: bool = True, timeout: float | None = None) -> bytes:
+        """
+        Remove and return a record from the queue.
+
+        :param block: If True, block until a record is available. If False, raise the Empty exception if no record is immediately available. Default is True.
+        :type block: bool, optional
+
+        :param timeout: The maximum time to wait for a record. If None, wait indefinitely. Default is None.
+        :type timeout: float, optional
+
+        :return: A copy of the record.
+        :rtype: bytes
+
+        :raises queue.Empty: If no record is available and block is False or the timeout expires.
+        """
+        return self._data.get(block=block, timeout=timeout)
+
+    def get_many(self, max_items: int, block: bool = True, timeout: float | None = None) -> list:
+        """
+        Retrieve up to `max_items` records from the queue, acquiring the consumer lock only once.
+
+        It waits (like `get()`) for the first record, then returns the records immediately available (at most `max_items`).
+
+        :param max_items: The maximum number of records to retrieve.
+        :type max_items: int
+
+        :param block: If True, block until a record is available. If False, raise the Empty exception if no record is immediately available. Default is True.
+        :type block: bool, optional
+
+        :param timeout: The maximum time to wait for the first record. If None, wait indefinitely. Default is None.
+        :type timeout: float, optional
+
+        :return: Copies of the records (empty list if `max_items` <= 0).
+        :rtype: list[bytes]
+
+        :raises queue.Empty: If no record is available and block is False or the timeout expires.
+        """
+        return self._data.get_many(max_items, block=block, timeout=timeout)
+
+    def get_view(self, block: bool = True, timeout: float | None = None) -> contextlib.AbstractContextManager[memoryview]:
+        """
+        Remove a record from the queue, giving direct (zero-copy, read-only) access to its slot.
+
+        The record is removed when the context exits normally (if an exception is raised, it stays in the queue).
+        Other consumers wait while the context is open, so it should be short.
+
+        **Example:**
+
+        ```python
+        with queue.get_view(timeout=1) as view:
+            total += sum(view)
+        ```
+
+        :param block: If True, block until a record is available. If False, raise the Empty exception if no record is immediately available. Default is True.
+        :type block: bool, optional
+
+        :param timeout: The maximum time to wait for a record. If None, wait indefinitely. Default is None.
+        :type timeout: float, optional
+
+        :return: A context manager that yields a read-only memoryview of the record (released when the context exits).
+        :rtype: AbstractContextManager[memoryview]
+
+        :raises queue.Empty: If no record is available and block is False or the timeout expires.
+        """
+        return self._data.get_view(block=block, timeout=timeout)
+
+    def peek(self) -> bytes:
+        """
+        Return the next record of the queue, without removing it.
+
+        :return: A copy of the record at the front of the queue.
+        :rtype: bytes
+
+        :raises queue.Empty: If the queue is empty.
+        """
+        items = self._data.snapshot()
+        if not items:
+            raise queue.Empty
+        return items[0]
+
+    def put(self, item: Any, block: bool = True, timeout: float | None = None):
+        """
+        Copy a record into the queue.
+
+        :param item: The record (a bytes-like object of at most `slot_size` bytes).
+        :type item: bytes-like
+
+        :param block: If True, blocks until a free slot is available. If False, raises the Full exception if no free slot is immediately available.
+        :type block: bool, optional
+
+        :param timeout: The maximum time to wait for a free slot. If None, waits indefinitely.
+        :type timeout: float or None, optional
+
+        :raises queue.Full: If no free slot is available and block is False or the timeout expires.
+        :raises ValueError: If the record exceeds `slot_size`.
+        :raises TypeError: If the item is not a bytes-like object.
+        """
+        self._data.put(item, block=block, timeout=timeout)
+
+    def put_many(self, items: Iterable, block: bool = True, timeout: float | None = None):
+        """
+        Copy multiple records into the queue, acquiring the producer lock once per chunk of free slots.
+
+        If the Full exception is raised, the records put before it remain in the queue.
+
+        :param items: The records (bytes-like objects of at most `slot_size` bytes).
+        :type items: Iterable
+
+        :param block: If True, blocks until a free slot is available. If False, raises the Full exception if no free slot is immediately available.
+        :type block: bool, optional
+
+        :param timeout: The maximum time to wait for each free slot. If None, waits indefinitely.
+        :type timeout: float or None, optional
+
+        :raises queue.Full: If no free slot is available and block is False or the timeout expires.
+        :raises ValueError: If a record exceeds `slot_size` (nothing is put).
+        :raises TypeError: If an item is not a bytes-like object.
+        """
+        self._data.put_many(items, block=block, timeout=timeout)
+
+    def put_view(self, size: int, block: bool = True, timeout: float | None = None) -> contextlib.AbstractContextManager[memoryview]:
+        """
+        Add a record of `size` bytes to the queue, giving direct (zero-copy) access to its slot.
+
+        The record is added when the context exits normally (if an exception is raised, it is discarded).
+        Other producers wait while the context is open, so it should be short.
+
+        **Example:**
+
+        ```python
+        with queue.put_view(len(frame)) as view:
+            view[:] = frame
+        ```
+
+        :param size: The size of the record, in bytes.
+        :type size: int
+
+        :param block: If True, blocks until a free slot is available. If False, raises the Full exception if no free slot is immediately available.
+        :type block: bool, optional
+
+        :param timeout: The maximum time to wait for a free slot. If None, waits indefinitely.
+        :type timeout: float or None, optional
+
+        :return: A context manager that yields a writable memoryview of the record (released when the context exits).
+        :rtype: AbstractContextManager[memoryview]
+
+        :raises queue.Full: If no free slot is available and block is False or the timeout expires.
+        :raises ValueError: If `size` is negative or exceeds `slot_size`.
+        """
+        return self._data.put_view(size, block=block, timeout=timeout)
+
+    def snapshot(self) -> list:
+        """
+        Return a list of the records in the queue (front first), without removing them.
+
+        Only consumers wait while the records are copied.
+
+        :return: Copies of the records.
+        :rtype: list[bytes]
+        """
+        return self._data.snapshot()
+
+    @property
+    def maxsize(self) -> int:
+        """Get queue maximum size (number of slots)"""
+        return self._data.capacity
+
+    @property
+    def slot_size(self) -> int:
+        """Get the maximum size of a record, in bytes"""
+        return self._data.slot_size
@@ -1,61 +1,77 @@
 
-import logging
+import weakref
+
 from typing import Any, Iterable
 
 
 from safethread.AbstractLock import AbstractLock
+from safethread.datatype.AbstractSafeBase import AbstractSafeBase
 from safethread.datatype.AbstractSafeSet import AbstractSafeSet
 
-from safethread.process.datatype.ProcessSafeList import ProcessSafeList
+from safethread.process.datatype.ProcessManagerPool import ProcessManagerPool, SetProxy
 from safethread.process.datatype.ProcessRLock import ProcessRLock
 
 
+def _as_set(other: Any) -> set | frozenset:
+    """
+    Converts an argument of a set operation into a (picklable) set, to be sent to the manager process.
+
+    :param other: A set, a safe data structure, or an iterable.
+    :type other: Any
+
+    :return: The argument as a set.
+    :rtype: set | frozenset
+    """
+    if isinstance(other, (set, frozenset)):
+        return other
+    if isinstance(other, AbstractSafeBase):
+        return set(other.copy_obj())
+    return set(other)
+
+
 class ProcessSafeSet(AbstractSafeSet):
+    """
+    A process-safe set, stored in a shared manager process (see ``ProcessManagerPool``).
+
+    Membership tests, `add()`, `discard()` and `remove()` are O(1) single round-trips to the
+    manager, and set algebra (e.g., `union()`, `update()`) is computed by the manager.
+    """
 
     def __eq__(self, other) -> bool:
-        if isinstance(other, ProcessSafeSet):
-            return set(self._data) == set(other._data)
-        return self == ProcessSafeSet(other)
+        other = _as_set(other)
+        with self._lock:
+            return self._data.copy() == other
 
     def __lt__(self, other):
-        if isinstance(other, ProcessSafeSet):
-            return set(self._data) < set(other._data)
-        return self < ProcessSafeSet(other)
+        other = _as_set(other)
+        with self._lock:
+            return self._data.copy() < other
 
     def __gt__(self, other):
-        if isinstance(other, ProcessSafeSet):
-            return set(self._data) > set(other._data)
-        return self > ProcessSafeSet(other)
+        other = _as_set(other)
+        with self._lock:
+            return self._data.copy() > other
 
     def __init__(self, data: set | Iterable | None = None):
+        """
+        Initialize a process-safe set.
+
+        :param data: The initial data to populate the set with.
+        :type data: set, Iterable, or None
+        """
         super().__init__(data)
-        self._data: ProcessSafeList
+        self._data: SetProxy
 
     def _create_data(self, data: Any | None) -> Any:
-        if isinstance(data, ProcessSafeList):
+        if isinstance(data, SetProxy):
             return data
-        return ProcessSafeList(data or [])
+        manager = ProcessManagerPool.acquire()
+        weakref.finalize(self, ProcessManagerPool.release, manager)
+        return manager.set(data or [])  # type: ignore
 
     def _create_lock(self) -> AbstractLock:
         return ProcessRLock()
 
-    def add(self, value):
-        """
-        Adds an element to the set safely.
-
-        :param value: The element to add to the set.
-        :type value: `type of value`
-        """
-        if value not in self._data:
-            self._data.append(value)
-
-    def clear(self):
-        """
-        Removes all elements from the set safely.
-        """
-        with self._lock:  # Ensure  safety
-            self._data.clear()
-
     def difference(self, *others):
         """
         Returns a new set with elements in the set but not in the others safely.
@@ -66,8 +82,7 @@ class ProcessSafeSet(AbstractSafeSet):
         :return: A new set with the difference.
         :rtype: set
         """
-        with self._lock:  # Ensure  safety
-            return set(self._data).difference(*others)
+        return super().difference(*map(_as_set, others))
 
     def difference_update(self, *others):
         """
@@ -76,27 +91,7 @@ class ProcessSafeSet(AbstractSafeSet):
         :param others: Sets to subtract from the current set.
         :type others: set or Iterable
         """
-        with self._lock:  # Ensure  safety
-            # get elements from others sets
-            for other_set in others:
-                for item in other_set:
-                    try:
-                        self._data.remove(item)
-                    except:
-                        pass
-
-    def discard(self, value):
-        """
-        Removes an element from the set if present safely. Does nothing if not present.
-
-        :param value: The element to remove from the set.
-        :type value: `type of value`
-        """
-        try:
-            with self._lock:  # Ensure  safety
-                self._data.remove(value)
-        except:
-            pass
+        super().difference_update(*map(_as_set, others))
 
     def intersection(self, *others):
         """
@@ -108,8 +103,7 @@ class ProcessSafeSet(AbstractSafeSet):
         :return: A new set with the intersection.
         :rtype: set
         """
-        with self._lock:  # Ensure  safety
-            return set(self._data).intersection(*others)
+        return super().intersection(*map(_as_set, others))
 
     def intersection_update(self, *others):
         """
@@ -118,11 +112,7 @@ class ProcessSafeSet(AbstractSafeSet):
         :param others: Sets to intersect with the current set.
         :type others: set or Iterable
         """
-        with self._lock:  # Ensure  safety
-            new_data = set(self._data)
-            new_data.intersection_update(*others)
-            self._data.clear()
-            self._data.extend(new_data)
+        super().intersection_update(*map(_as_set, others))
 
     def isdisjoint(self, other):
         """
@@ -134,8 +124,7 @@ class ProcessSafeSet(AbstractSafeSet):
         :return: `True` if the sets are disjoint, otherwise `False`.
         :rtype: bool
         """
-        with self._lock:  # Ensure  safety
-            return set(self._data).isdisjoint(other)
+        return super().isdisjoint(_as_set(other))
 
     def issubset(self, other):
         """
@@ -147,8 +136,7 @@ class ProcessSafeSet(AbstractSafeSet):
         :return: `True` if the set is a subset, otherwise `False`.
         :rtype: bool
         """
-        with self._lock:  # Ensure  safety
-            return set(self._data).issubset(other)
+        return super().issubset(_as_set(other))
 
     def issuperset(self, other):
         """
@@ -160,38 +148,7 @@ class ProcessSafeSet(AbstractSafeSet):
         :return: `True` if the set is a superset, otherwise `False`.
         :rtype: bool
         """
-        with self._lock:  # Ensure  safety
-            return set(self._data).issuperset(other)
-
-    def pop(self):
-        """
-        Removes and returns an arbitrary element from the set safely.
-
-        :return: An arbitrary element from the set.
-        :rtype: `type of element`
-
-        :raises KeyError: If the set is empty.
-        """
-        with self._lock:  # Ensure  safety
-            try:
-                return self._data.pop()
-            except Exception as e:
-                raise KeyError(f"Failed to pop element: {e}")
-
-    def remove(self, value):
-        """
-        Removes an element from the set safely. Raises KeyError if not present.
-
-        :param value: The element to remove from the set.
-        :type value: `type of value`
-
-        :raises KeyError: If the element is not found in the set.
-        """
-        with self._lock:  # Ensure  safety
-            try:
-                self._data.remove(value)
-            except Exception as e:
-                raise KeyError(f"Failed to remove element: {e}")
+        return super().issuperset(_as_set(other))
 
     def symmetric_difference(self, other):
         """
@@ -203,8 +160,7 @@ class ProcessSafeSet(AbstractSafeSet):
         :return: A new set with the symmetric difference.
         :rtype: set
         """
-        with self._lock:  # Ensure  safety
-            return set(self._data).symmetric_difference(other)
+        return super().symmetric_difference(_as_set(other))
 
     def symmetric_difference_update(self, other):
         """
@@ -213,11 +169,7 @@ class ProcessSafeSet(AbstractSafeSet):
         :param other: The set to compare.
         :type other: set
         """
-        with self._lock:  # Ensure  safety
-            new_data = set(self._data)
-            new_data.symmetric_difference_update(other)
-            self._data.clear()
-            self._data.extend(new_data)
+        super().symmetric_difference_update(_as_set(other))
 
     def union(self, *others):
         """
@@ -229,8 +181,7 @@ class ProcessSafeSet(AbstractSafeSet):
         :return: A new set with the union.
         :rtype: set
         """
-        with self._lock:  # Ensure  safety
-            return set(self._data).union(*others)
+        return super().union(*map(_as_set, others))
 
     def update(self, *others):
         """
@@ -239,7 +190,4 @@ class ProcessSafeSet(AbstractSafeSet):
         :param others: Sets to add to the current set.
         :type others: set or Iterable
         """
-        with self._lock:  # Ensure  safety
-            new_data = self.union(*others)
-            self._data.clear()
-            self._data.extend(new_data)
+        super().update(*map(_as_set, others))
@@ -4,11 +4,18 @@
 This module provides process-safe data structures to be used in multiprocess (parallel) programming scenarios.
 
 ### **Classes:**
+- **ProcessManager**: A ``SyncManager`` subclass used to share process-safe data structures.
+- **ProcessManagerPool**: A process-wide pool of shared manager processes, used by default by process-safe data structures.
 - **ProcessRLock**: A process-safe reentrant lock (RLock) implementation.
+- **ProcessSafeArray**: A process-safe typed array implementation, stored in shared memory (no manager round-trips).
+- **ProcessSafeCounter**: A process-safe atomic counter / accumulator, stored in shared memory, with an optional sharded (per-process) mode.
+- **ProcessSafeDelayQueue**: A process-safe delay queue (items are retrieved once due), stored in a shared manager process.
 - **ProcessSafeDict**: A process-safe dictionary implementation.
 - **ProcessSafeList**: A process-safe list implementation.
 - **ProcessSafeSet**: A process-safe set implementation.
+- **ProcessSafePriorityQueue**: A process-safe priority queue (heap), stored in a shared manager process.
 - **ProcessSafeQueue**: A process-safe queue implementation.
+- **ProcessSafeRingQueue**: A process-safe bounded queue of byte records, stored in a shared memory ring buffer (zero-copy views, no pickling).
 """
 
 # - **AbstractProcessSafeBasicData**: A base class for process-safe basic data structures (e.g., int, float, str, bool).
@@ -16,9 +23,16 @@ This module provides process-safe data structures to be used in multiprocess (pa
 # - **ProcessSafeInt**: A process-safe int implementation.
 # from .ProcessSafeInt import ProcessSafeInt
 
+from safethread.process.datatype.ProcessManagerPool import ProcessManager
+from safethread.process.datatype.ProcessManagerPool import ProcessManagerPool
 from safethread.process.datatype.ProcessRLock import ProcessRLock
+from safethread.process.datatype.ProcessSafeArray import ProcessSafeArray
+from safethread.process.datatype.ProcessSafeCounter import ProcessSafeCounter
+from safethread.process.datatype.ProcessSafeDelayQueue import ProcessSafeDelayQueue
 from safethread.process.datatype.ProcessSafeDict import ProcessSafeDict
 from safethread.process.datatype.ProcessSafeList import ProcessSafeList
 from safethread.process.datatype.ProcessSafeSet import ProcessSafeSet
+from safethread.process.datatype.ProcessSafePriorityQueue import ProcessSafePriorityQueue
 from safethread.process.datatype.ProcessSafeQueue import ProcessSafeQueue
+from safethread.process.datatype.ProcessSafeRingQueue import ProcessSafeRingQueue
 # TODO
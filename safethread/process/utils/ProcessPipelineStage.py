@@ -0,0 +1,307 @@
+
+import queue
+
+from typing import Any, Callable, Self
+
+from safethread.process.BaseProcess import BaseProcess
+from safethread.process.ProcessEvent import ProcessEvent
+from safethread.process.datatype.ProcessSafeQueue import ProcessSafeQueue
+
+from safethread.thread.BaseThread import BaseThread
+from safethread.thread.utils.ThreadPipelineStage import ThreadPipelineStage
+
+
+class _Stop:
+    """Sentinel put into the input queue to wake up (and stop) the stage processes"""
+    pass
+
+
+def _run_stage(callback: Callable[[Any], Any], input_queue: ProcessSafeQueue, output_queue: ProcessSafeQueue,
+               stop: ProcessEvent) -> bool:
+    """
+    Method to be executed in the stage processes. It gets data from the input queue,
+    processes it through the callback function, and puts the result into the output queue.
+    Once `stop` is set, the process ends (data still in the input queue is not processed).
+
+    This method runs in a separate process and should not be called directly.
+
+    :return: True to keep the process running, False otherwise
+    :rtype: bool
+    """
+    input_data = input_queue.get()
+    if isinstance(input_data, _Stop) or stop.is_set():
+        return False
+    output_queue.put(callback(input_data))
+    return True
+
+
+class ProcessPipelineStage:
+    """
+    A pipeline stage that processes data through a callback function, in N separate processes.
+
+    It has the same interface as ``ThreadPipelineStage``, but the callback runs in worker processes
+    (not limited by the GIL), so it fits CPU-bound stages. Input and output data are exchanged through
+    ``ProcessSafeQueue``s, so they must be pickable, and the callback NEEDS TO BE A GLOBAL FUNCTION.
+
+    Process and thread stages can be connected (see `connect_output()` and ``ProcessPipeline``),
+    so I/O stages can stay on threads while CPU-bound stages run on processes.
+
+    The pipeline runs indefinitely until :meth:`stop()` is called.
+
+    :raises TypeError: If the provided callback is not callable.
+    :raises ValueError: If `n_processes` is less than 1.
+    """
+
+    EmptyException = queue.Empty
+    """
+    Raised when one of the following conditions happens:
+    - get(block=False) is called, and there is no input in IN_QUEUE
+    - get(timeout=value) and timeout exceeded (no input received within timeout time frame)
+    """
+
+    FullException = queue.Full
+    """
+    Raised when one of the following conditions happens:
+    - put(block=False) is called and there is no available space in the OUT_QUEUE
+    - put(timeout=value) and timeout exceeded (OUT_QUEUE full and timeout has expired)
+    """
+
+    StoppedException = queue.ShutDown
+    """Raised when put()/get() is called after Pipeline.stop()"""
+
+    @staticmethod
+    def is_instance(obj: Any):
+        """
+        Checks if the object is an instance of ProcessPipelineStage.
+
+        :param obj: The object to check.
+        :type obj: Any
+
+        :raises TypeError: If the object is not an instance of ProcessPipelineStage.
+
+        :return: The ProcessPipelineStage object if it is an instance.
+        :rtype: ProcessPipelineStage
+        """
+        if not isinstance(obj, ProcessPipelineStage):
+            raise TypeError("Object is not a Pipeline Stage.")
+        return obj
+
+    def __init__(self, callback: Callable[[Any], Any], n_processes: int = 1):
+        """
+        Initializes the pipeline stage with a callback function.
+
+        :param callback: The global function to process data through the pipeline stage. Accepts one data argument, and returns an output data.
+        :type callback: Callable[[Any],Any]
+
+        :param n_processes: Number of processes that will read the input queue, and
+                            store result in the output queue. Defaults to 1.
+        :type n_processes: int
+
+        :raises TypeError: If the callback argument is not callable.
+        :raises ValueError: If `n_processes` is less than 1.
+        """
+        super().__init__()
+
+        # not inspected: no shared ring (faster)
+        self.__input_queue = ProcessSafeQueue(ring_size=0)
+        self.__output_queue = ProcessSafeQueue(ring_size=0)
+        self.__next_stage: ThreadPipelineStage | None = None
+        self.__started = False
+        self.__stopped = False
+        self.__stop_event = ProcessEvent()
+        self.__processes: list[BaseProcess] = []
+        self.__forwarder: BaseThread | None = None
+
+        if not callable(callback):
+            raise TypeError("'callback' is not callable")
+        self.__callback = callback
+
+        if n_processes < 1:
+            raise ValueError(
+                "At least one process is needed to run PipelineStage")
+        self.__n_processes = n_processes
+
+    def __forward(self) -> bool:
+        """
+        Method to be executed in the forwarder thread (output connected to a ``ThreadPipelineStage``).
+        It moves the processed data from the output queue into the input of the next stage.
+
+        :return: True to keep the forwarder thread running, False otherwise
+        :rtype: bool
+        """
+        try:
+            output_data = self.__output_queue.get(timeout=0.1)
+        except queue.Empty:
+            return not self.__stopped
+        try:
+            self.__next_stage.put(output_data)  # type: ignore
+        except queue.ShutDown:
+            return False
+        return True
+
+    def _get_input_queue(self) -> Any:
+        """
+        Gets the input queue of the stage (used to connect the output of a previous stage).
+
+        :return: The input queue.
+        :rtype: ProcessSafeQueue
+        """
+        return self.__input_queue
+
+    def has_started(self) -> bool:
+        """
+        Checks if the pipeline stage has started.
+
+        :return: True if the pipeline stage has started, otherwise False.
+        :rtype: bool
+        """
+        return self.__started
+
+    def is_alive(self) -> bool:
+        """
+        Checks if the pipeline stage is alive.
+
+        :return: True if any process of the pipeline stage is still alive, otherwise False.
+        :rtype: bool
+        """
+        for process in self.__processes:
+            if process.is_alive():
+                return True
+        return self.__forwarder is not None and self.__forwarder.is_alive()
+
+    def is_terminated(self) -> bool:
+        """
+        Checks if the pipeline stage has terminated.
+
+        :return: True if the pipeline stage has started and is not alive, otherwise False.
+        :rtype: bool
+        """
+        return self.has_started() and not self.is_alive()
+
+    def put(self, value, block: bool = True, timeout: float | None = None):
+        """
+        Puts data into the input queue for processing.
+
+        :param value: The data to be processed by the pipeline.
+        :type value: Any
+        :param block: If True, block until data can be inserted into the queue. Defaults to True.
+        :type block: bool, optional
+        :param timeout: Timeout for the put operation. Defaults to None.
+        :type timeout: float or None, optional
+
+        :raises FullException: If block is True and the timeout is exceeded, or if block is False and
+                               there is no available space in the input queue.
+        :raises StoppedException: If the pipeline has stopped.
+        """
+        if self.__stopped:
+            raise queue.ShutDown
+        self.__input_queue.put(value, block, timeout)
+
+    def get(self, block: bool = True, timeout: float | None = None):
+        """
+        Retrieves the processed data from the output queue.
+
+        :param block: If True, block until data can be retrieved from the queue. Defaults to True.
+        :type block: bool, optional
+        :param timeout: Timeout for the get operation. Defaults to None.
+        :type timeout: float or None, optional
+
+        :return: The processed data after passing through the callback function.
+        :rtype: Any
+
+        :raises EmptyException: If block is True and the timeout is exceeded, or if block is False and
+                                no output is available in the output queue.
+        :raises StoppedException: If the pipeline has stopped.
+        """
+        if self.__stopped:
+            raise queue.ShutDown
+        return self.__output_queue.get(block, timeout)
+
+    def connect_output(self, other_pipeline: Self | ThreadPipelineStage):
+        """
+        Connects this Pipeline Stage output to the input of another pipeline.
+
+        If the other stage is a ``ThreadPipelineStage``, a thread of this process forwards the output data to it.
+
+        :param other_pipeline: Another pipeline stage.
+        :type other_pipeline: ProcessPipelineStage or ThreadPipelineStage
+
+        :raises RuntimeError: If the pipeline stage has already started.
+        """
+        if self.__started:
+            raise RuntimeError(
+                "Cannot connect the output of a started PipelineStage")
+        if isinstance(other_pipeline, ThreadPipelineStage):
+            self.__next_stage = other_pipeline
+            return
+        self.__next_stage = None
+        self.__output_queue = other_pipeline._get_input_queue()
+
+    def start(self):
+        """
+        Starts the pipeline stage processes.
+
+        :raises RuntimeError: If start() is called more than once on the same object.
+        """
+        if self.__started:
+            raise RuntimeError("PipelineStage has already been started.")
+        for _ in range(self.__n_processes):
+            self.__processes.append(BaseProcess(
+                _run_stage,
+                args=[self.__callback, self.__input_queue,
+                      self.__output_queue, self.__stop_event],
+                repeat=True,
+            ))
+        if self.__next_stage is not None:
+            self.__forwarder = BaseThread(self.__forward, repeat=True)
+        for process in self.__processes:
+            process.start()
+        if self.__forwarder is not None:
+            self.__forwarder.start()
+        self.__started = True
+
+    def stop(self):
+        """
+        Stops the pipeline processes (immediately, after their current data).
+
+        Processes are not killed: each one finishes its current data (putting the result into the
+        output queue), and then ends. Data still in the input queue is not processed.
+        """
+        self.__stopped = True
+        # processes end after their current data
+        self.__stop_event.set()
+        # wake up processes waiting for input
+        for _ in self.__processes:
+            try:
+                self.__input_queue.put(_Stop())
+            except:
+                pass
+
+    def join(self, timeout: float | None = None):
+        """
+        Joins the pipeline stages' processes, waiting for them to finish.
+
+        :param timeout: The maximum time to wait for processes to finish. Defaults to None.
+        :type timeout: float or None, optional
+
+        :raises RuntimeError: If join() is called before start().
+        """
+        if not self.__started:
+            raise RuntimeError(
+                "Cannot join a PipelineStage that has not been started.")
+        for process in self.__processes:
+            process.join(timeout)
+        if self.__forwarder is not None:
+            self.__forwarder.join(timeout)
+
+    def stop_join(self, timeout: float | None = None):
+        """
+        Calls stop() and join() to stop the pipeline stage and wait for its processes to finish.
+
+        :param timeout: The maximum time to wait for processes to finish. Defaults to None.
+        :type timeout: float or None, optional
+
+        :raises RuntimeError: If join() is called before start().
+        """
+        self.stop()
+        self.join(timeout=timeout)
@@ -0,0 +1,229 @@
+import threading
+import time
+
+from typing import Any, Callable, Iterable, Protocol
+
+from safethread.AbstractScheduler import AbstractScheduler, _ScheduleState
+
+
+class _JobService(Protocol):
+    """Interface of the service that runs a ``SchedulerJob`` (implemented by ``SchedulerService``)"""
+
+    def _add(self, job: "SchedulerJob", due: float) -> None:
+        """Schedules a started job, at `due` (monotonic clock)."""
+        raise NotImplementedError("Method not OVERLOADED")
+
+    def _cancel(self, job: "SchedulerJob") -> None:
+        """Cancels the next run of a job."""
+        raise NotImplementedError("Method not OVERLOADED")
+
+
+class SchedulerJob:
+    """
+    A job of a ``SchedulerService``: it runs a given callback at regular intervals with an optional repeat option.
+
+    It has the same interface as ``SchedulerThread`` (`start()`, `stop()`, `join()`, ...), but it does not
+    own a thread: the service dispatcher thread triggers it, and a worker thread of the service runs the callback.
+    Like ``SchedulerThread``, the callback runs `timeout` seconds after `start()`, then according to the timing
+    `mode` and `misfire` policy (or cron expression, with `jitter`), see ``AbstractScheduler``. A callback that returns False
+    (or raises an exception) is retried with exponential `backoff` if enabled, otherwise it ends the job.
+
+    Jobs are created by ``SchedulerService.create_job()`` and ``SchedulerService.schedule()``.
+    """
+
+    def __init__(self, service: _JobService, timeout: float | str, callback: Callable[..., Any],
+                 args: Iterable | None = None, repeat: bool = True, mode: str = AbstractScheduler.FIXED_DELAY,
+                 misfire: str = AbstractScheduler.MISFIRE_COALESCE, jitter: float = 0.0, backoff: float = 0.0,
+                 backoff_max: float | None = None, max_retries: int | None = None):
+        """
+        Initializes the job.
+
+        :param service: The scheduler service that runs the job.
+        :type service: SchedulerService
+
+        :param timeout: Time interval in seconds between each callback execution, or a cron expression.
+        :type timeout: float | str
+
+        :param callback: The function (or callable) to execute at each timeout.
+        :type callback: Callable[..., Any]
+
+        :param args: Optional arguments to pass to the callback. Defaults to None.
+        :type args: Iterable, optional
+
+        :param repeat: Whether the callback should be repeated indefinitely or just once. Defaults to True.
+        :type repeat: bool, optional
+
+        :param mode: The timing mode (one of ``AbstractScheduler.MODES``). Defaults to FIXED_DELAY.
+        :type mode: str, optional
+
+        :param misfire: The misfire policy (one of ``AbstractScheduler.MISFIRE_POLICIES``). Defaults to MISFIRE_COALESCE.
+        :type misfire: str, optional
+
+        :param jitter: Maximum random delay (in seconds) added to each due time. Defaults to 0.0.
+        :type jitter: float, optional
+
+        :param backoff: Delay (in seconds) before retrying a failed run, doubled after each consecutive failure.
+                        Defaults to 0.0 (no retry: a failed run ends the job).
+        :type backoff: float, optional
+
+        :param backoff_max: Maximum retry delay (in seconds). Defaults to None (no limit).
+        :type backoff_max: float, optional
+
+        :param max_retries: Maximum number of consecutive retries, before the job ends. Defaults to None (no limit).
+        :type max_retries: int, optional
+
+        :raises TypeError: If 'callback' is not callable.
+        :raises ValueError: If a timing argument is invalid (see ``AbstractScheduler``).
+        """
+        super().__init__()
+
+        if not callable(callback):
+            raise TypeError("'callback' is not callable")
+        self.__state = _ScheduleState(timeout, mode, misfire, jitter=jitter, backoff=backoff,
+                                      backoff_max=backoff_max, max_retries=max_retries)
+
+        self.__service = service
+        self.__timeout = timeout
+        self.__callback = callback
+        self.__args = tuple(args or [])
+        self.__repeat = repeat
+        self.__mode = mode
+        self.__misfire = misfire
+        self.__failed = False
+
+        self.__started = False
+        self.__stopped = False
+        self.__done = threading.Event()
+
+    def _run(self) -> bool:
+        """
+        Runs the callback (called by a worker thread of the service).
+
+        :return: True if the job must be scheduled again, False otherwise.
+        :rtype: bool
+        """
+        if self.__stopped:
+            return False
+        try:
+            result = self.__callback(*self.__args)
+        except Exception:
+            result = False
+        self.__failed = isinstance(result, bool) and result == False
+        if self.__failed:
+            # retried with backoff (if enabled), even if not repeatable
+            return self.__state.fail() and not self.__stopped
+        return self.__repeat and not self.__stopped
+
+    def _next_due(self) -> float:
+        """
+        Gets the due time (monotonic clock) of the next run of the job (or retry), after a run.
+
+        :return: The due time.
+        :rtype: float
+        """
+        return self.__state.advance(time.monotonic(), failed=self.__failed)
+
+    def _is_stopped(self) -> bool:
+        """Checks if `stop()` has been called (or the job has terminated)."""
+        return self.__stopped
+
+    def _finish(self):
+        """Marks the job as terminated (called by the service)."""
+        self.__stopped = True
+        self.__done.set()
+
+    def get_args(self) -> tuple:
+        """Returns the callback args."""
+        return self.__args
+
+    def get_misfire(self) -> str:
+        """Returns the misfire policy of the job."""
+        return self.__misfire
+
+    def get_mode(self) -> str:
+        """Returns the timing mode of the job."""
+        return self.__mode
+
+    def get_service(self) -> _JobService:
+        """Returns the scheduler service that runs the job."""
+        return self.__service
+
+    def get_timeout(self) -> float | str:
+        """Returns the job timeout (or cron expression)."""
+        return self.__timeout
+
+    def has_started(self) -> bool:
+        """
+        Checks if the job has started.
+
+        :return: True if the job has started, otherwise False.
+        :rtype: bool
+        """
+        return self.__started
+
+    def is_alive(self) -> bool:
+        """
+        Checks if the job is alive (scheduled or running).
+
+        :return: True if the job is alive, otherwise False.
+        :rtype: bool
+        """
+        return self.__started and not self.__done.is_set()
+
+    def is_terminated(self) -> bool:
+        """
+        Checks if the job has terminated.
+
+        :return: True if the job HAS started and is NOT alive, otherwise False.
+        :rtype: bool
+        """
+        return self.has_started() and not self.is_alive()
+
+    def is_repeatable(self) -> bool:
+        """
+        Checks if the job executes the callback repeatedly (until .stop() is called).
+
+        :return: True if the callback is executed repeatedly, False otherwise.
+        :rtype: bool
+        """
+        return self.__repeat
+
+    def start(self):
+        """
+        Starts the job: the callback runs after `timeout` seconds.
+
+        :raises RuntimeError: If start() is called more than once, or the service has been stopped.
+        """
+        if self.__started:
+            raise RuntimeError("Job has already been started.")
+        self.__started = True
+        self.__service._add(self, self.__state.start(time.monotonic()))
+
+    def stop(self):
+        """Stops the job (a running callback is not interrupted)."""
+        self.__stopped = True
+        if self.__started:
+            self.__service._cancel(self)
+
+    def join(self, timeout: float | None = None):
+        """
+        Joins the job, waiting for it to finish.
+
+        :param timeout: The maximum time to wait for the job to finish. Defaults to None.
+        :type timeout: float, optional
+
+        :raises RuntimeError: If join() is called before start().
+        """
+        if not self.__started:
+            raise RuntimeError("Cannot join a job that has not been started.")
+        self.__done.wait(timeout)
+
+    def stop_join(self, timeout: float | None = None):
+        """
+        Calls stop() and join() to stop the job and wait for it to finish.
+
+        :param timeout: The maximum time to wait for the job to finish. Defaults to None.
+        :type timeout: float, optional
+        """
+        self.stop()
+        self.join(timeout=timeout)
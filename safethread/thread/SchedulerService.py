@@ -0,0 +1,293 @@
+import heapq
+import itertools
+import threading
+import time
+
+from typing import Any, Callable, Iterable
+
+from safethread.thread.BaseThread import BaseThread
+from safethread.thread.SchedulerJob import SchedulerJob
+from safethread.thread.ThreadPool import ThreadPool
+
+
+class SchedulerService:
+    """
+    A scheduler that multiplexes many scheduled jobs (``SchedulerJob``) onto a single dispatcher thread.
+
+    Each ``SchedulerThread`` owns an OS thread that sleeps until its timeout. Instead, the service keeps the
+    next run of every job in a heap (O(log n) to add a job, O(1) to cancel it), and a single dispatcher thread
+    waits for the earliest one. Due callbacks are handed to a ``ThreadPool``, so a slow callback does not delay
+    the other jobs.
+
+    Jobs have the same interface as ``SchedulerThread``.
+
+    **Example:**
+
+    ```python
+    with SchedulerService(max_workers=4) as service:
+        job = service.schedule(1.0, check_health, args=[host])   # every second
+        ...
+        job.stop()
+    ```
+    """
+
+    def __init__(self, max_workers: int | None = None):
+        """
+        Initializes the scheduler service.
+
+        :param max_workers: The maximum number of threads running callbacks. Defaults to None (see ``ThreadPool``).
+        :type max_workers: int, optional
+
+        :raises ValueError: If `max_workers` is less than 1.
+        """
+        super().__init__()
+
+        self.__pool = ThreadPool(max_workers=max_workers)
+        self.__dispatcher = BaseThread(self.__dispatch, repeat=True)
+
+        self.__cond = threading.Condition()
+        # heap of (due time, sequence number, job)
+        self.__heap: list[tuple[float, int, SchedulerJob]] = []
+        # sequence number of the valid heap entry of each scheduled job (other entries are cancelled)
+        self.__entries: dict[SchedulerJob, int] = {}
+        self.__jobs: set[SchedulerJob] = set()
+        self.__seq = itertools.count()
+        self.__cancelled = 0
+
+        self.__started = False
+        self.__stopped = False
+
+    def __enter__(self):
+        """Starts the service (if needed), and returns it."""
+        if not self.has_started():
+            self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Stops the service, and waits for its threads."""
+        self.stop_join()
+
+    def __push(self, job: SchedulerJob, due: float):
+        """Schedules the next run of a job, at `due` (monotonic clock). The caller holds the condition."""
+        seq = next(self.__seq)
+        self.__entries[job] = seq
+        heapq.heappush(self.__heap, (due, seq, job))
+        # wake up the dispatcher, if the job is the next one
+        if self.__heap[0][1] == seq:
+            self.__cond.notify()
+
+    def __compact(self):
+        """Removes the cancelled entries from the heap (the caller holds the condition)."""
+        self.__heap = [entry for entry in self.__heap
+                       if self.__entries.get(entry[2]) == entry[1]]
+        heapq.heapify(self.__heap)
+        self.__cancelled = 0
+
+    def __dispatch(self) -> bool:
+        """
+        Method to be executed in the dispatcher thread. It waits for the next due job, and submits it to the pool.
+
+        :return: True to keep the dispatcher running, False otherwise
+        :rtype: bool
+        """
+        with self.__cond:
+            while True:
+                if self.__stopped:
+                    return False
+                if not self.__heap:
+                    self.__cond.wait()
+                    continue
+                due, seq, job = self.__heap[0]
+                if self.__entries.get(job) != seq:
+                    heapq.heappop(self.__heap)
+                    self.__cancelled -= 1
+                    continue
+                delay = due - time.monotonic()
+                if delay > 0:
+                    self.__cond.wait(delay)
+                    continue
+                heapq.heappop(self.__heap)
+                del self.__entries[job]
+                break
+        try:
+            future = self.__pool.submit(self.__run_job, job)
+        except RuntimeError:
+            # pool shut down (service stopped)
+            self.__finish(job)
+            return False
+
+        def on_done(future):
+            # a job cancelled by the pool (stop) never runs, so it never finishes by itself
+            if future.cancelled():
+                self.__finish(job)
+        future.add_done_callback(on_done)
+        return True
+
+    def __run_job(self, job: SchedulerJob):
+        """Runs a job in a pool thread, and schedules its next run."""
+        again = job._run()
+        due = job._next_due()
+        with self.__cond:
+            if again and not job._is_stopped() and not self.__stopped:
+                self.__push(job, due)
+                return
+        self.__finish(job)
+
+    def __finish(self, job: SchedulerJob):
+        """Removes a terminated job from the service."""
+        with self.__cond:
+            self.__jobs.discard(job)
+        job._finish()
+
+    def _add(self, job: SchedulerJob, due: float):
+        """
+        Schedules a started job, at `due` (monotonic clock). Called by ``SchedulerJob.start()``.
+
+        :raises RuntimeError: If the service has been stopped.
+        """
+        with self.__cond:
+            if self.__stopped:
+                raise RuntimeError("Cannot schedule jobs after SchedulerService.stop()")
+            self.__jobs.add(job)
+            self.__push(job, due)
+
+    def _cancel(self, job: SchedulerJob):
+        """Cancels the next run of a job (called by ``SchedulerJob.stop()``)."""
+        with self.__cond:
+            if self.__entries.pop(job, None) is None:
+                # running now (or already finished): it ends after its callback
+                return
+            self.__cancelled += 1
+            if self.__cancelled > 64 and self.__cancelled > len(self.__heap) // 2:
+                self.__compact()
+        self.__finish(job)
+
+    def create_job(self, timeout: float | str, callback: Callable[..., Any], args: Iterable | None = None,
+                   repeat: bool = True, **kwargs) -> SchedulerJob:
+        """
+        Creates a job (not started), with the same arguments as ``SchedulerThread``.
+
+        :param timeout: Time interval in seconds between each callback execution, or a cron expression.
+        :type timeout: float | str
+
+        :param callback: The function (or callable) to execute at each timeout.
+        :type callback: Callable[..., Any]
+
+        :param args: Optional arguments to pass to the callback. Defaults to None.
+        :type args: Iterable, optional
+
+        :param repeat: Whether the callback should be repeated indefinitely or just once. Defaults to True.
+        :type repeat: bool, optional
+
+        :param kwargs: Timing arguments of the job (mode, misfire, jitter, backoff, backoff_max, max_retries), see ``SchedulerJob``.
+
+        :return: The job (call `start()` to schedule it).
+        :rtype: SchedulerJob
+
+        :raises TypeError: If 'callback' is not callable.
+        :raises ValueError: If a timing argument is invalid.
+        """
+        return SchedulerJob(self, timeout, callback, args=args, repeat=repeat, **kwargs)
+
+    def schedule(self, timeout: float | str, callback: Callable[..., Any], args: Iterable | None = None,
+                 repeat: bool = True, **kwargs) -> SchedulerJob:
+        """
+        Creates and starts a job (see `create_job()`).
+
+        :return: The started job.
+        :rtype: SchedulerJob
+
+        :raises TypeError: If 'callback' is not callable.
+        :raises ValueError: If a timing argument is invalid.
+        :raises RuntimeError: If the service has been stopped.
+        """
+        job = self.create_job(timeout, callback, args=args, repeat=repeat, **kwargs)
+        job.start()
+        return job
+
+    def get_job_count(self) -> int:
+        """Returns the number of alive jobs (scheduled or running)."""
+        with self.__cond:
+            return len(self.__jobs)
+
+    def has_started(self) -> bool:
+        """
+        Checks if the service has started.
+
+        :return: True if the service has started, otherwise False.
+        :rtype: bool
+        """
+        return self.__started
+
+    def is_alive(self) -> bool:
+        """
+        Checks if the service is alive.
+
+        :return: True if the dispatcher thread is alive, otherwise False.
+        :rtype: bool
+        """
+        return self.__dispatcher.is_alive()
+
+    def is_terminated(self) -> bool:
+        """
+        Checks if the service has terminated.
+
+        :return: True if the service HAS started and is NOT alive, otherwise False.
+        :rtype: bool
+        """
+        return self.has_started() and not self.is_alive()
+
+    def start(self):
+        """
+        Starts the service (dispatcher and worker threads). Jobs started before run once the service starts.
+
+        :raises RuntimeError: If start() is called more than once.
+        """
+        if self.__started:
+            raise RuntimeError("SchedulerService has already been started.")
+        self.__pool.start()
+        self.__dispatcher.start()
+        self.__started = True
+
+    def stop(self):
+        """
+        Stops the service: every job is stopped (running callbacks are not interrupted).
+        """
+        with self.__cond:
+            self.__stopped = True
+            # scheduled jobs (submitted jobs end when cancelled by the pool, or after their callback)
+            jobs = list(self.__entries)
+            self.__heap.clear()
+            self.__entries.clear()
+            self.__cond.notify_all()
+        self.__dispatcher.stop()
+        self.__pool.stop()
+        for job in jobs:
+            self.__finish(job)
+
+    def join(self, timeout: float | None = None):
+        """
+        Joins the service threads, waiting for them to finish.
+
+        :param timeout: The maximum time to wait for each thread to finish. Defaults to None.
+        :type timeout: float, optional
+
+        :raises RuntimeError: If join() is called before start().
+        """
+        if not self.__started:
+            raise RuntimeError(
+                "Cannot join a SchedulerService that has not been started.")
+        self.__dispatcher.join(timeout)
+        self.__pool.join(timeout)
+
+    def stop_join(self, timeout: float | None = None):
+        """
+        Calls stop() and join() to stop the service and wait for its threads to finish.
+
+        :param timeout: The maximum time to wait for each thread to finish. Defaults to None.
+        :type timeout: float, optional
+
+        :raises RuntimeError: If join() is called before start().
+        """
+        self.stop()
+        self.join(timeout=timeout)
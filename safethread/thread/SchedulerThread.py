@@ -9,8 +9,8 @@ class SchedulerThread(AbstractScheduler, BaseThread):
     """
     A thread scheduler that runs a given callback at regular intervals with an optional repeat option.
 
-    :param timeout: Time interval in seconds between each callback execution.
-    :type timeout: float
+    :param timeout: Time interval in seconds between each callback execution, or a cron expression (e.g., "*/5 * * * *").
+    :type timeout: float | str
 
     :param callback: The function (or callable) to execute at each timeout.
     :type callback: Callable
@@ -21,6 +21,24 @@ class SchedulerThread(AbstractScheduler, BaseThread):
     :param repeat: Whether the callback should be repeated indefinitely or just once. Defaults to True.
     :type repeat: bool, optional
 
+    :param mode: The timing mode (FIXED_DELAY or FIXED_RATE). Defaults to FIXED_DELAY.
+    :type mode: str, optional
+
+    :param misfire: The misfire policy of the FIXED_RATE mode and cron expressions (MISFIRE_SKIP, MISFIRE_CATCH_UP or MISFIRE_COALESCE). Defaults to MISFIRE_COALESCE.
+    :type misfire: str, optional
+
+    :param jitter: Maximum random delay (in seconds) added to each due time. Defaults to 0.0.
+    :type jitter: float, optional
+
+    :param backoff: Delay (in seconds) before retrying a failed run, doubled after each consecutive failure. Defaults to 0.0 (no retry).
+    :type backoff: float, optional
+
+    :param backoff_max: Maximum retry delay (in seconds). Defaults to None (no limit).
+    :type backoff_max: float, optional
+
+    :param max_retries: Maximum number of consecutive retries. Defaults to None (no limit).
+    :type max_retries: int, optional
+
     <img src="../../../img/thread/Scheduler.svg" alt="" width="100%">
     """
     pass
@@ -0,0 +1,329 @@
+import os
+import queue
+import threading
+
+from typing import Any, Callable, Iterable, Iterator
+
+from safethread.AbstractSubprocess import AbstractSubprocess, _dummy_on_finish, _run_subprocess
+from safethread.thread.BaseThread import BaseThread
+from safethread.thread.datatype.ThreadSafeQueue import ThreadSafeQueue
+
+
+class SubprocessPool:
+    """
+    A pool that runs subprocess commands, at most `max_concurrent` at a time.
+
+    Each ``SubprocessThread`` owns a thread, and starting many of them at once forks as many children.
+    Instead, the pool queues the commands, and a fixed set of `max_concurrent` supervisor threads (``BaseThread``)
+    run them one after the other. Results are delivered as ``Finished`` objects (see ``AbstractSubprocess``),
+    either to an `on_finish` callback (called in a supervisor thread), or by the `run()` iterator.
+
+    Commands can be submitted before `start()`; they run once the pool starts.
+
+    **Example:**
+
+    ```python
+    with SubprocessPool(max_concurrent=8) as pool:
+        for result in pool.run(["gzip", "-k", path] for path in paths):
+            print(result.args, result.returncode)
+    ```
+    """
+
+    Finished = AbstractSubprocess.Finished
+    """The result of a command"""
+
+    FullException = queue.Full
+    """
+    Raised when one of the following conditions happens:
+    - submit() is called with `block=False` (or a timeout), and there is no available space in the command queue
+    """
+
+    CANCELLED = 254
+    """Return code of the commands cancelled by `stop()` (never run)"""
+
+    def __init__(self, max_concurrent: int | None = None, on_finish: Callable[[Finished], Any] = _dummy_on_finish,
+                 maxsize: int = 0, timeout: float | None = None, cwd: str | None = None, env: dict | None = None):
+        """
+        Initializes the subprocess pool.
+
+        :param max_concurrent: The maximum number of commands running at the same time (number of supervisor threads).
+                               Defaults to None (``os.cpu_count()``).
+        :type max_concurrent: int, optional
+
+        :param on_finish: Default callback of `submit()`, with one argument `result: SubprocessPool.Finished`. Defaults to `lambda res: None`.
+        :type on_finish: Callable, optional
+
+        :param maxsize: The maximum number of pending commands (`submit()` blocks when the command queue is full). Defaults to 0 (unbounded).
+        :type maxsize: int, optional
+
+        :param timeout: Timeout of each subprocess. Defaults to None (no timeout).
+        :type timeout: float, optional
+
+        :param cwd: Working directory to run the subprocesses. Defaults to None (current directory).
+        :type cwd: str, optional
+
+        :param env: Environment to run the subprocesses. Defaults to current ENV (None).
+        :type env: dict, optional
+
+        :raises ValueError: If `max_concurrent` is less than 1.
+        :raises TypeError: If `on_finish` is not callable.
+        """
+        super().__init__()
+
+        if max_concurrent is None:
+            max_concurrent = os.cpu_count() or 1
+        if max_concurrent < 1:
+            raise ValueError("At least one concurrent command is needed to run SubprocessPool")
+        if not callable(on_finish):
+            raise TypeError("on_finish() is not callable.")
+
+        self.__max_concurrent = max_concurrent
+        self.__on_finish = on_finish
+        self.__timeout = timeout
+        self.__cwd = cwd
+        self.__env = env
+
+        # queue of (command, on_finish)
+        self.__queue = ThreadSafeQueue(maxsize)
+        self.__lock = threading.Lock()
+        self.__running = 0
+
+        self.__supervisors: list[BaseThread] = []
+        self.__started = False
+        self.__shutdown = False
+
+    def __enter__(self):
+        """Starts the pool (if needed), and returns it."""
+        if not self.has_started():
+            self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Shuts down the pool, waiting for the pending commands."""
+        self.shutdown(wait=True)
+
+    def __run_supervisor(self) -> bool:
+        """
+        Method to be executed in the supervisor threads. It waits for a command, and runs it in a subprocess.
+
+        :return: True to keep the supervisor running, False otherwise
+        :rtype: bool
+        """
+        try:
+            command, on_finish = self.__queue.get()
+        except queue.ShutDown:
+            return False
+        with self.__lock:
+            self.__running += 1
+        try:
+            _run_subprocess(command, on_finish, self.__timeout,
+                            self.__cwd, self.__env)
+        except Exception:
+            # on_finish() failed: keep the supervisor running
+            pass
+        finally:
+            with self.__lock:
+                self.__running -= 1
+            self.__queue.task_done()
+        return True
+
+    @staticmethod
+    def __create_command(command: Iterable[str] | str) -> list[str]:
+        """
+        Creates the command list (like ``AbstractSubprocess``).
+
+        :raises TypeError: If `command` is not a string or an iterable of strings.
+        """
+        if isinstance(command, str):
+            return command.split()
+        if isinstance(command, Iterable):
+            return list(command)
+        raise TypeError("Command must be a string or an iterable of strings.")
+
+    def get_max_concurrent(self) -> int:
+        """Returns the maximum number of commands running at the same time."""
+        return self.__max_concurrent
+
+    def get_pending_count(self) -> int:
+        """Returns the approximate number of commands waiting in the command queue."""
+        return self.__queue.qsize()
+
+    def get_running_count(self) -> int:
+        """Returns the number of commands currently running."""
+        return self.__running
+
+    def has_started(self) -> bool:
+        """
+        Checks if the pool has started.
+
+        :return: True if the pool has started, otherwise False.
+        :rtype: bool
+        """
+        return self.__started
+
+    def is_alive(self) -> bool:
+        """
+        Checks if the pool is alive.
+
+        :return: True if any supervisor thread is still alive, otherwise False.
+        :rtype: bool
+        """
+        return any(supervisor.is_alive() for supervisor in self.__supervisors)
+
+    def is_terminated(self) -> bool:
+        """
+        Checks if the pool has terminated.
+
+        :return: True if the pool has been shut down and no supervisor is alive, otherwise False.
+        :rtype: bool
+        """
+        return self.__shutdown and not self.is_alive()
+
+    def run(self, commands: Iterable[Iterable[str] | str]) -> Iterator[Finished]:
+        """
+        Runs a stream of commands in the pool, and yields their results as they finish (completion order).
+
+        Commands are taken from `commands` lazily (at most `2 * max_concurrent` in flight),
+        so a long (or infinite) stream is not loaded into memory.
+
+        :param commands: The commands to run (each one a string, or an iterable of strings).
+        :type commands: Iterable[Iterable[str] | str]
+
+        :return: An iterator over the results.
+        :rtype: Iterator[Finished]
+
+        :raises TypeError: If a command is not a string or an iterable of strings.
+        :raises RuntimeError: If the pool has not been started (its results would never come), or has been shut down.
+        """
+        if not self.__started:
+            raise RuntimeError(
+                "Cannot run commands on a SubprocessPool that has not been started.")
+        results: queue.SimpleQueue = queue.SimpleQueue()
+        window = 2 * self.__max_concurrent
+
+        def result_iterator():
+            pending = 0
+            for command in commands:
+                self.submit(command, on_finish=results.put)
+                pending += 1
+                if pending >= window:
+                    yield results.get()
+                    pending -= 1
+            while pending > 0:
+                yield results.get()
+                pending -= 1
+        return result_iterator()
+
+    def shutdown(self, wait: bool = True):
+        """
+        Shuts down the pool: new commands are refused, and supervisors stop once the pending commands are done.
+
+        :param wait: If True, wait for the supervisor threads to finish. Defaults to True.
+        :type wait: bool, optional
+        """
+        with self.__lock:
+            self.__shutdown = True
+        self.__queue.shutdown()
+        if wait and self.__started:
+            self.join()
+
+    def start(self):
+        """
+        Starts the pool (`max_concurrent` supervisor threads).
+
+        :raises RuntimeError: If start() is called more than once, or after shutdown.
+        """
+        with self.__lock:
+            if self.__started:
+                raise RuntimeError("SubprocessPool has already been started.")
+            if self.__shutdown:
+                raise RuntimeError("Cannot start SubprocessPool after shutdown")
+            self.__started = True
+        for _ in range(self.__max_concurrent):
+            supervisor = BaseThread(self.__run_supervisor, repeat=True)
+            self.__supervisors.append(supervisor)
+            supervisor.start()
+
+    def stop(self):
+        """
+        Stops the pool (immediately): pending commands are cancelled (they finish with return code `CANCELLED`),
+        and supervisors stop after their running command.
+        """
+        with self.__lock:
+            self.__shutdown = True
+        # refuse new commands, then cancel the pending ones
+        self.__queue.shutdown()
+        while True:
+            try:
+                commands = self.__queue.get_many(64, block=False)
+            except (queue.Empty, queue.ShutDown):
+                break
+            for command, on_finish in commands:
+                self.__queue.task_done()
+                try:
+                    on_finish(self.Finished(command, returncode=self.CANCELLED,
+                                            stderr="Cancelled", stdout=""))
+                except Exception:
+                    pass
+        for supervisor in self.__supervisors:
+            supervisor.stop()
+        self.__queue.shutdown(immediate=True)
+
+    def join(self, timeout: float | None = None):
+        """
+        Joins the supervisor threads, waiting for them to finish.
+
+        :param timeout: The maximum time to wait for each supervisor to finish. Defaults to None.
+        :type timeout: float or None, optional
+
+        :raises RuntimeError: If join() is called before start().
+        """
+        if not self.__started:
+            raise RuntimeError(
+                "Cannot join a SubprocessPool that has not been started.")
+        for supervisor in self.__supervisors:
+            supervisor.join(timeout)
+
+    def stop_join(self, timeout: float | None = None):
+        """
+        Calls stop() and join() to stop the pool and wait for its threads to finish.
+
+        :param timeout: The maximum time to wait for each supervisor to finish. Defaults to None.
+        :type timeout: float or None, optional
+        """
+        self.stop()
+        self.join(timeout=timeout)
+
+    def submit(self, command: Iterable[str] | str, on_finish: Callable[[Finished], Any] | None = None,
+               block: bool = True, timeout: float | None = None):
+        """
+        Submits a command to the pool. If the command queue is full, waits for a free slot.
+
+        :param command: The command to run as an iterable or a string.
+        :type command: Iterable[str] | str
+
+        :param on_finish: Callback to execute after the subprocess terminates (in a supervisor thread).
+                          Defaults to None (the `on_finish` of the pool).
+        :type on_finish: Callable, optional
+
+        :param block: If True, waits for a free slot in the command queue. Defaults to True.
+        :type block: bool, optional
+
+        :param timeout: Maximum wait time for a free slot. Defaults to None.
+        :type timeout: float, optional
+
+        :raises TypeError: If `command` is not a string or an iterable of strings, or if `on_finish` is not callable.
+        :raises FullException: If `block=True` and timeout is exceeded, or if `block=False` and the command queue is full.
+        :raises RuntimeError: If the pool has been shut down.
+        """
+        cmd = self.__create_command(command)
+        if on_finish is None:
+            on_finish = self.__on_finish
+        if not callable(on_finish):
+            raise TypeError("on_finish() is not callable.")
+        if self.__shutdown:
+            raise RuntimeError("Cannot submit commands after shutdown")
+        try:
+            self.__queue.put((cmd, on_finish), block=block, timeout=timeout)
+        except queue.ShutDown:
+            raise RuntimeError("Cannot submit commands after shutdown")
@@ -0,0 +1,387 @@
+
+import concurrent.futures
+import itertools
+import os
+import queue
+import threading
+import time
+
+from typing import Callable, Iterable, Iterator
+
+from safethread.thread.BaseThread import BaseThread
+from safethread.thread.datatype.ThreadSafeQueue import ThreadSafeQueue
+
+
+def _run_chunk(callback: Callable, chunk: tuple) -> list:
+    """Runs the callback for every args tuple of a `map()` chunk."""
+    return [callback(*args) for args in chunk]
+
+
+class ThreadPool:
+    """
+    A pool of reusable worker threads (``BaseThread``), that run submitted tasks and return their results as futures.
+
+    Tasks are stored in a work queue (unbounded, or bounded by `maxsize`), and run by up to `max_workers` threads.
+    Workers are created on demand (when a task is submitted and no worker is idle), and a worker that stays
+    idle for `idle_timeout` seconds is stopped, as long as more than `min_workers` workers are running.
+
+    Tasks can be submitted before `start()`; they run once the pool starts.
+
+    **Example:**
+
+    ```python
+    with ThreadPool(max_workers=8) as pool:
+        future = pool.submit(pow, 2, 10)
+        print(future.result())                                # 1024
+        print(list(pool.map(str.upper, ["a", "b"], chunksize=2)))  # ['A', 'B']
+    ```
+    """
+
+    Future = concurrent.futures.Future
+    """The future returned by `submit()`"""
+
+    FullException = queue.Full
+    """
+    Raised when one of the following conditions happens:
+    - submit_nowait() is called, and there is no available space in the work queue
+    """
+
+    def __init__(self, max_workers: int | None = None, min_workers: int = 0, maxsize: int = 0, idle_timeout: float = 5.0):
+        """
+        Initializes the thread pool.
+
+        :param max_workers: The maximum number of worker threads. Defaults to None (``min(32, os.cpu_count() + 4)``).
+        :type max_workers: int, optional
+
+        :param min_workers: The number of worker threads kept running while idle. Defaults to 0.
+        :type min_workers: int, optional
+
+        :param maxsize: The maximum number of pending tasks (`submit()` blocks when the work queue is full). Defaults to 0 (unbounded).
+        :type maxsize: int, optional
+
+        :param idle_timeout: Seconds a worker waits for a task before it is stopped (if above `min_workers`). Defaults to 5.0.
+        :type idle_timeout: float, optional
+
+        :raises ValueError: If `max_workers` is less than 1, `min_workers` is not between 0 and `max_workers`, or `idle_timeout` is not positive.
+        """
+        super().__init__()
+
+        if max_workers is None:
+            max_workers = min(32, (os.cpu_count() or 1) + 4)
+        if max_workers < 1:
+            raise ValueError("At least one worker is needed to run ThreadPool")
+        if not 0 <= min_workers <= max_workers:
+            raise ValueError("'min_workers' must be between 0 and 'max_workers'")
+        if idle_timeout <= 0:
+            raise ValueError("'idle_timeout' must be a positive number")
+
+        self.__max_workers = max_workers
+        self.__min_workers = min_workers
+        self.__idle_timeout = idle_timeout
+
+        self.__queue = ThreadSafeQueue(maxsize)
+        self.__lock = threading.RLock()
+        # one token per idle worker (taken by submit() to avoid spawning a new worker)
+        self.__idle = threading.Semaphore(0)
+
+        self.__workers: list[BaseThread] = []
+        self.__worker_count = 0
+        self.__started = False
+        self.__shutdown = False
+
+    def __enter__(self):
+        """Starts the pool (if needed), and returns it."""
+        if not self.has_started():
+            self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Shuts down the pool, waiting for the pending tasks."""
+        self.shutdown(wait=True)
+
+    def __run_worker(self) -> bool:
+        """
+        Method to be executed in the worker threads. It waits for a task, and runs it.
+
+        :return: True to keep the worker running, False otherwise
+        :rtype: bool
+        """
+        self.__idle.release()
+        while True:
+            try:
+                future, callback, args, kwargs = self.__queue.get(
+                    timeout=self.__idle_timeout)
+                break
+            except queue.Empty:
+                if self.__retire():
+                    return False
+            except queue.ShutDown:
+                with self.__lock:
+                    self.__worker_count -= 1
+                return False
+        # the worker is busy (unless a producer has already taken its token)
+        self.__idle.acquire(blocking=False)
+        if future.set_running_or_notify_cancel():
+            try:
+                result = callback(*args, **kwargs)
+            except BaseException as e:
+                future.set_exception(e)
+            else:
+                future.set_result(result)
+        # do not keep the task (and its result) alive while idle
+        del future, callback, args, kwargs
+        self.__queue.task_done()
+        return True
+
+    def __retire(self) -> bool:
+        """
+        Stops an idle worker, if more than `min_workers` workers are running.
+
+        :return: True if the worker must stop, False otherwise
+        :rtype: bool
+        """
+        with self.__lock:
+            if self.__worker_count <= self.__min_workers:
+                return False
+            # no idle token: a producer is counting on this worker
+            if not self.__idle.acquire(blocking=False):
+                return False
+            self.__worker_count -= 1
+            return True
+
+    def __adjust(self):
+        """Starts a new worker, if no worker is idle (and the pool is not full)."""
+        if self.__idle.acquire(blocking=False):
+            return
+        with self.__lock:
+            if self.__started and not self.__shutdown and self.__worker_count < self.__max_workers:
+                self.__spawn()
+
+    def __spawn(self):
+        """Starts a new worker thread (the caller holds the lock)."""
+        self.__workers = [worker for worker in self.__workers
+                          if worker.is_alive()]
+        worker = BaseThread(self.__run_worker, repeat=True)
+        self.__workers.append(worker)
+        self.__worker_count += 1
+        worker.start()
+
+    def __put(self, future: concurrent.futures.Future, callback: Callable, args: tuple, kwargs: dict, block: bool):
+        """Puts a task into the work queue, and adjusts the number of workers."""
+        if not callable(callback):
+            raise TypeError("'callback' is not callable")
+        if self.__shutdown:
+            raise RuntimeError("Cannot submit tasks after shutdown")
+        try:
+            self.__queue.put((future, callback, args, kwargs), block=block)
+        except queue.ShutDown:
+            raise RuntimeError("Cannot submit tasks after shutdown")
+        self.__adjust()
+
+    def get_max_workers(self) -> int:
+        """Returns the maximum number of worker threads."""
+        return self.__max_workers
+
+    def get_min_workers(self) -> int:
+        """Returns the number of worker threads kept running while idle."""
+        return self.__min_workers
+
+    def get_pending_count(self) -> int:
+        """Returns the approximate number of tasks waiting in the work queue."""
+        return self.__queue.qsize()
+
+    def get_worker_count(self) -> int:
+        """Returns the number of running worker threads."""
+        return self.__worker_count
+
+    def has_started(self) -> bool:
+        """
+        Checks if the pool has started.
+
+        :return: True if the pool has started, otherwise False.
+        :rtype: bool
+        """
+        return self.__started
+
+    def is_alive(self) -> bool:
+        """
+        Checks if the pool is alive.
+
+        :return: True if any worker thread is still alive, otherwise False.
+        :rtype: bool
+        """
+        with self.__lock:
+            workers = list(self.__workers)
+        return any(worker.is_alive() for worker in workers)
+
+    def is_terminated(self) -> bool:
+        """
+        Checks if the pool has terminated.
+
+        :return: True if the pool has been shut down and no worker is alive, otherwise False.
+        :rtype: bool
+        """
+        return self.__shutdown and not self.is_alive()
+
+    def map(self, callback: Callable, *iterables: Iterable, timeout: float | None = None, chunksize: int = 1) -> Iterator:
+        """
+        Runs `callback(*args)` for every args of `zip(*iterables)` in the pool, like the built-in `map()`.
+
+        All tasks are submitted immediately (`chunksize` calls per task), and results are yielded in order.
+
+        :param callback: The function to call.
+        :type callback: Callable
+
+        :param iterables: The iterables of arguments.
+        :type iterables: Iterable
+
+        :param timeout: The maximum time (since `map()` was called) to wait for the results. Defaults to None (no limit).
+        :type timeout: float, optional
+
+        :param chunksize: The number of calls run by each task. Defaults to 1.
+        :type chunksize: int, optional
+
+        :return: An iterator over the results.
+        :rtype: Iterator
+
+        :raises TimeoutError: If a result is not available before the timeout expires.
+        :raises ValueError: If `chunksize` is less than 1.
+        :raises RuntimeError: If the pool has been shut down.
+        """
+        if chunksize < 1:
+            raise ValueError("'chunksize' must be at least 1")
+        endtime = None if timeout is None else time.monotonic() + timeout
+        futures = [self.submit(_run_chunk, callback, chunk)
+                   for chunk in itertools.batched(zip(*iterables), chunksize)]
+
+        def result_iterator():
+            try:
+                futures.reverse()
+                while futures:
+                    future = futures.pop()
+                    if endtime is None:
+                        yield from future.result()
+                    else:
+                        yield from future.result(endtime - time.monotonic())
+            finally:
+                for future in futures:
+                    future.cancel()
+        return result_iterator()
+
+    def shutdown(self, wait: bool = True, cancel_futures: bool = False):
+        """
+        Shuts down the pool: new tasks are refused, and workers stop once the pending tasks are done.
+
+        :param wait: If True, wait for the worker threads to finish. Defaults to True.
+        :type wait: bool, optional
+
+        :param cancel_futures: If True, cancel the pending tasks (not running yet). Defaults to False.
+        :type cancel_futures: bool, optional
+        """
+        with self.__lock:
+            self.__shutdown = True
+        if cancel_futures:
+            while True:
+                try:
+                    tasks = self.__queue.get_many(64, block=False)
+                except (queue.Empty, queue.ShutDown):
+                    break
+                for future, *_ in tasks:
+                    future.cancel()
+                    self.__queue.task_done()
+        self.__queue.shutdown()
+        if wait and self.__started:
+            self.join()
+
+    def start(self):
+        """
+        Starts the pool (`min_workers` workers, plus the workers needed by the tasks submitted before).
+
+        :raises RuntimeError: If start() is called more than once, or after shutdown.
+        """
+        with self.__lock:
+            if self.__started:
+                raise RuntimeError("ThreadPool has already been started.")
+            if self.__shutdown:
+                raise RuntimeError("Cannot start ThreadPool after shutdown")
+            self.__started = True
+            pending = self.__queue.qsize()
+            for _ in range(min(self.__max_workers, max(self.__min_workers, pending))):
+                self.__spawn()
+
+    def stop(self):
+        """
+        Stops the pool (immediately): pending tasks are cancelled, and workers stop after their current task.
+        """
+        self.shutdown(wait=False, cancel_futures=True)
+        with self.__lock:
+            workers = list(self.__workers)
+        # stops workers' main loops
+        for worker in workers:
+            try:
+                worker.stop()
+            except:
+                pass
+        self.__queue.shutdown(immediate=True)
+
+    def join(self, timeout: float | None = None):
+        """
+        Joins the worker threads, waiting for them to finish.
+
+        :param timeout: The maximum time to wait for each worker to finish. Defaults to None.
+        :type timeout: float or None, optional
+
+        :raises RuntimeError: If join() is called before start().
+        """
+        if not self.__started:
+            raise RuntimeError(
+                "Cannot join a ThreadPool that has not been started.")
+        with self.__lock:
+            workers = list(self.__workers)
+        for worker in workers:
+            worker.join(timeout)
+
+    def stop_join(self, timeout: float | None = None):
+        """
+        Calls stop() and join() to stop the pool and wait for its threads to finish.
+
+        :param timeout: The maximum time to wait for each worker to finish. Defaults to None.
+        :type timeout: float or None, optional
+        """
+        self.stop()
+        self.join(timeout=timeout)
+
+    def submit(self, callback: Callable, /, *args, **kwargs) -> concurrent.futures.Future:
+        """
+        Submits a task (`callback(*args, **kwargs)`) to the pool. If the work queue is full, waits for a free slot.
+
+        :param callback: The function to call.
+        :type callback: Callable
+
+        :return: A future with the result (or exception) of the call.
+        :rtype: concurrent.futures.Future
+
+        :raises TypeError: If the callback is not callable.
+        :raises RuntimeError: If the pool has been shut down.
+        """
+        future = concurrent.futures.Future()
+        self.__put(future, callback, args, kwargs, block=True)
+        return future
+
+    def submit_nowait(self, callback: Callable, /, *args, **kwargs) -> concurrent.futures.Future:
+        """
+        Submits a task (`callback(*args, **kwargs)`) to the pool, without waiting for a free slot in the work queue.
+
+        :param callback: The function to call.
+        :type callback: Callable
+
+        :return: A future with the result (or exception) of the call.
+        :rtype: concurrent.futures.Future
+
+        :raises FullException: If the work queue is full.
+        :raises TypeError: If the callback is not callable.
+        :raises RuntimeError: If the pool has been shut down.
+        """
+        future = concurrent.futures.Future()
+        self.__put(future, callback, args, kwargs, block=False)
+        return future
@@ -8,12 +8,20 @@ This module provides threaded classes, that inherit from BaseThread. It also con
 
 Classes:
 - **BaseThread**: A thread-safe class that manages a ``threading.Thread`` instance.
+- **SchedulerJob**: A job of a ``SchedulerService``, with the same interface as ``SchedulerThread`` (but without its own thread).
+- **SchedulerService**: A scheduler that runs many scheduled jobs using a single dispatcher thread (heap of due times) and a ``ThreadPool``.
 - **SchedulerThread**: A thread-safe class that runs a scheduled Callable (function, lambda, etc), after a pre-defined timeout, either singleshot or periodically.
+- **SubprocessPool**: A pool that runs a stream of subprocess commands, at most N at a time, using a fixed set of supervisor threads.
 - **SubprocessThread**: A thread-safe class that runs a subprocess within a separate thread.
 - **ThreadEvent**: A thread-safe class that manages a thread event safely.
+- **ThreadPool**: A pool of reusable worker threads, that run submitted tasks and return futures (bounded / unbounded work queue, dynamic number of workers).
 """
 
 from safethread.thread.BaseThread import BaseThread
+from safethread.thread.SchedulerJob import SchedulerJob
+from safethread.thread.SchedulerService import SchedulerService
 from safethread.thread.SchedulerThread import SchedulerThread
+from safethread.thread.SubprocessPool import SubprocessPool
 from safethread.thread.SubprocessThread import SubprocessThread
 from safethread.thread.ThreadEvent import ThreadEvent
+from safethread.thread.ThreadPool import ThreadPool
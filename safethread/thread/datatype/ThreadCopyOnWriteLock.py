@@ -0,0 +1,231 @@
+
+
+import threading
+import time
+
+from typing import Any, Callable, Self
+
+from safethread.AbstractLock import AbstractLock
+
+
+class ThreadCopyOnWriteLock(AbstractLock):
+    """
+    A re-entrant lock that publishes an immutable snapshot of the data it protects.
+
+    Writers use the lock as usual (`acquire()`, `release()`, 'with' statement), mutating the data in place.
+    When a writer releases the lock (outermost release), a new immutable snapshot of the data is created
+    and published as a new version. Readers get the current snapshot with `get_snapshot()` without locking,
+    and can iterate over it while writers keep working.
+
+    The shared side of the lock (`get_shared_lock()`) locks the data without publishing a new snapshot,
+    for read-only methods that need to access the data itself.
+
+    The counters `get_version()`, `get_copy_time()` and `get_hold_time()` measure the cost of the copies.
+    """
+
+    class SharedLock(AbstractLock):
+        """
+        The shared side of a ThreadCopyOnWriteLock (it does not publish snapshots).
+        """
+
+        def __init__(self, lock: threading.RLock) -> None:
+            """
+            Initializes the shared side of a ThreadCopyOnWriteLock.
+
+            :param lock: The internal lock of the ThreadCopyOnWriteLock.
+            :type lock: threading.RLock
+            """
+            super().__init__()
+            self.__lock = lock
+
+        def __enter__(self) -> Self:  # type: ignore
+            """
+            Acquire the lock.
+
+            :raises RuntimeError: if lock cannot be acquired
+
+            :return: This lock object
+            :rtype: Self
+            """
+            if not self.__lock.acquire():
+                raise RuntimeError("Cannot acquire ThreadCopyOnWriteLock")
+            return self
+
+        def __exit__(self, *args):  # type: ignore
+            """
+            Release the lock.
+            """
+            self.__lock.release()
+
+        def acquire(self, blocking=True, timeout: float = -1) -> bool:
+            """
+            Acquire the lock.
+
+            :return: True if lock acquired successfully, False otherwise.
+            :rtype: bool
+            """
+            return self.__lock.acquire(blocking=blocking, timeout=timeout)
+
+        def release(self):
+            """
+            Release the lock.
+
+            :raises RuntimeError: If the current thread does not hold the lock.
+            """
+            self.__lock.release()
+
+        def get_shared_lock(self) -> AbstractLock:
+            """
+            Gets the shared side of the lock (this object).
+
+            :return: This lock object.
+            :rtype: AbstractLock
+            """
+            return self
+
+    def __init__(self, data: Any, freeze: Callable[[Any], Any]) -> None:
+        """
+        Initializes the ThreadCopyOnWriteLock object, publishing the first snapshot (version 0).
+
+        :param data: The data protected by the lock.
+        :type data: Any
+
+        :param freeze: Callable that returns an immutable copy of the data (e.g., ``tuple``).
+        :type freeze: Callable[[Any], Any]
+        """
+        super().__init__()
+
+        self.__lock = threading.RLock()
+        self.__shared = ThreadCopyOnWriteLock.SharedLock(self.__lock)
+
+        self.__data = data
+        self.__freeze = freeze
+
+        self.__owner: int | None = None
+        self.__depth = 0
+        self.__acquired_at = 0.0
+
+        self.__version = 0
+        self.__copy_time = 0.0
+        self.__hold_time = 0.0
+        self.__snapshot = freeze(data)
+
+    def __enter__(self) -> Self:  # type: ignore
+        """
+        Acquire the lock for writing.
+
+        :raises RuntimeError: if lock cannot be acquired
+
+        :return: This lock object
+        :rtype: Self
+        """
+        if not self.acquire():
+            raise RuntimeError("Cannot acquire ThreadCopyOnWriteLock")
+        return self
+
+    def __exit__(self, *args):  # type: ignore
+        """
+        Release the lock, publishing a new snapshot (outermost release only).
+
+        :param args: Optional exception type, value, and traceback information.
+        """
+        self.release()
+
+    def acquire(self, blocking=True, timeout: float = -1) -> bool:
+        """
+        Acquire the lock for writing.
+
+        - If `blocking` is False and another thread holds the lock, returns False immediately.
+        - If `blocking` is True, waits until the lock is available (or until `timeout`).
+        - If the current thread already holds the lock, the internal counter is incremented.
+
+        :return: True if lock acquired successfully, False otherwise.
+        :rtype: bool
+        """
+        if not self.__lock.acquire(blocking=blocking, timeout=timeout):
+            return False
+        self.__depth += 1
+        if self.__depth == 1:
+            self.__owner = threading.get_ident()
+            self.__acquired_at = time.perf_counter()
+        return True
+
+    def release(self):
+        """
+        Release the lock acquired for writing.
+
+        The outermost release publishes a new snapshot of the data, and increments the version.
+
+        :raises RuntimeError: If the current thread does not hold the lock for writing.
+        """
+        if self.__depth == 0 or self.__owner != threading.get_ident():
+            raise RuntimeError(
+                "Failed to release the lock: current thread is not the ThreadCopyOnWriteLock owner")
+        self.__depth -= 1
+        if self.__depth == 0:
+            self.__owner = None
+            try:
+                begin = time.perf_counter()
+                self.__snapshot = self.__freeze(self.__data)
+                self.__version += 1
+                end = time.perf_counter()
+                self.__copy_time += end - begin
+                self.__hold_time += end - self.__acquired_at
+            finally:
+                self.__lock.release()
+            return
+        self.__lock.release()
+
+    def get_shared_lock(self) -> AbstractLock:
+        """
+        Gets the shared side of this lock (locks the data without publishing a new snapshot).
+
+        :return: The shared side of the lock.
+        :rtype: AbstractLock
+        """
+        return self.__shared
+
+    def is_owned(self) -> bool:
+        """
+        Checks if the current thread holds the lock for writing (its writes are not published yet).
+
+        :return: True if the current thread is the writer, False otherwise.
+        :rtype: bool
+        """
+        return self.__owner == threading.get_ident()
+
+    def get_snapshot(self) -> Any:
+        """
+        Gets the current (immutable) snapshot of the data, without locking.
+
+        :return: The last published snapshot.
+        :rtype: Any
+        """
+        return self.__snapshot
+
+    def get_version(self) -> int:
+        """
+        Gets the version of the current snapshot (the number of snapshots published by writers).
+
+        :return: The snapshot version.
+        :rtype: int
+        """
+        return self.__version
+
+    def get_copy_time(self) -> float:
+        """
+        Gets the total time spent copying the data into snapshots.
+
+        :return: Total copy time, in seconds.
+        :rtype: float
+        """
+        return self.__copy_time
+
+    def get_hold_time(self) -> float:
+        """
+        Gets the total time the lock was held by writers (including the time spent copying the data).
+
+        :return: Total hold time, in seconds.
+        :rtype: float
+        """
+        return self.__hold_time
@@ -0,0 +1,298 @@
+
+
+import threading
+
+from typing import Self
+
+from safethread.AbstractLock import AbstractLock
+
+
+class ThreadRWLock(AbstractLock):
+    """
+    A reader-writer lock for thread synchronization.
+
+    This lock has two modes:
+    - **Exclusive** (writer) mode: only one thread can hold the lock. It is the mode used by
+      `acquire()`, `release()` and the 'with' statement, so this class can replace any other AbstractLock.
+    - **Shared** (reader) mode: many threads can hold the lock simultaneously, as long as no
+      thread holds it in exclusive mode. It is accessed through `get_shared_lock()`.
+
+    Safe data structures (e.g., ``ThreadSafeDict``) that use a ThreadRWLock run their read-only
+    methods in shared mode and their mutators in exclusive mode.
+
+    **Example:**
+
+    ```python
+    lock = ThreadRWLock()
+    with lock.get_shared_lock():
+        ...  # read
+    with lock:
+        ...  # write
+    ```
+    """
+
+    class SharedLock(AbstractLock):
+        """
+        The shared (reader) side of a ThreadRWLock, as an AbstractLock.
+        """
+
+        def __init__(self, rwlock: "ThreadRWLock") -> None:
+            """
+            Initializes the shared side of a ThreadRWLock.
+
+            :param rwlock: The reader-writer lock.
+            :type rwlock: ThreadRWLock
+            """
+            super().__init__()
+            self.__rwlock = rwlock
+
+        def __enter__(self) -> Self:  # type: ignore
+            """
+            Acquire the lock in shared mode.
+
+            :raises RuntimeError: if lock cannot be acquired
+
+            :return: This lock object
+            :rtype: Self
+            """
+            if not self.__rwlock.acquire_shared():
+                raise RuntimeError("Cannot acquire ThreadRWLock (shared)")
+            return self
+
+        def __exit__(self, *args):  # type: ignore
+            """
+            Release the lock acquired in shared mode.
+            """
+            self.__rwlock.release_shared()
+
+        def acquire(self, blocking=True, timeout: float = -1) -> bool:
+            """
+            Acquire the lock in shared mode.
+
+            :return: True if lock acquired successfully, False otherwise.
+            :rtype: bool
+            """
+            return self.__rwlock.acquire_shared(blocking=blocking, timeout=timeout)
+
+        def release(self):
+            """
+            Release the lock acquired in shared mode.
+
+            :raises RuntimeError: If the current thread does not hold the lock in shared mode.
+            """
+            self.__rwlock.release_shared()
+
+        def get_shared_lock(self) -> AbstractLock:
+            """
+            Gets the shared side of the lock (this object).
+
+            :return: This lock object.
+            :rtype: AbstractLock
+            """
+            return self
+
+    def __init__(self, writer_preference: bool = True, reentrant: bool = True) -> None:
+        """
+        Initializes the ThreadRWLock object.
+
+        :param writer_preference: If True, new readers wait while a writer is waiting for the lock
+                                  (avoids writer starvation). If False, readers are always admitted while
+                                  the lock is held in shared mode (maximum read throughput). Defaults to True.
+        :type writer_preference: bool, optional
+
+        :param reentrant: If True, a thread can acquire the lock again in the mode it already holds
+                          (and in shared mode while it holds the exclusive mode). If False, re-acquiring the
+                          lock raises RuntimeError, and each thread only records whether it holds the shared mode (less overhead). Defaults to True.
+        :type reentrant: bool, optional
+        """
+        super().__init__()
+
+        self.__cond = threading.Condition(threading.Lock())
+        self.__writer_preference = writer_preference
+        self.__reentrant = reentrant
+
+        self.__readers = 0
+        self.__reader_owners: dict[int, int] = {}
+        # non-reentrant mode: whether the current thread holds the shared mode
+        self.__local = threading.local()
+        self.__writer: int | None = None
+        self.__writer_count = 0
+        self.__waiting_writers = 0
+
+        self.__shared = ThreadRWLock.SharedLock(self)
+
+    def __enter__(self) -> Self:  # type: ignore
+        """
+        Acquire the lock in exclusive mode.
+
+        :raises RuntimeError: if lock cannot be acquired
+
+        :return: This lock object
+        :rtype: Self
+        """
+        if not self.acquire():
+            raise RuntimeError("Cannot acquire ThreadRWLock")
+        return self
+
+    def __exit__(self, *args):  # type: ignore
+        """
+        Release the lock acquired in exclusive mode.
+
+        :param args: Optional exception type, value, and traceback information.
+        """
+        self.release()
+
+    @staticmethod
+    def __timeout(blocking: bool, timeout: float) -> float | None:
+        """Converts acquire() arguments into a Condition.wait_for() timeout."""
+        if not blocking:
+            return 0
+        return None if timeout < 0 else timeout
+
+    def __is_reader(self, me: int) -> bool:
+        """Checks if the thread `me` (the current thread) holds the lock in shared mode."""
+        if self.__reentrant:
+            return bool(self.__reader_owners.get(me))
+        return getattr(self.__local, "reading", False)
+
+    def acquire(self, blocking=True, timeout: float = -1) -> bool:
+        """
+        Acquire the lock in exclusive (writer) mode.
+
+        - If `blocking` is False and the lock is held by other threads, returns False immediately.
+        - If `blocking` is True, waits until all readers and writers release the lock (or until `timeout`).
+        - If the current thread already holds the lock in exclusive mode, the internal counter is incremented (reentrant only).
+
+        :raises RuntimeError: If the lock is not reentrant and the current thread already holds it,
+                              or if the current thread holds the lock in shared mode (upgrade is not supported).
+
+        :return: True if lock acquired successfully, False otherwise.
+        :rtype: bool
+        """
+        me = threading.get_ident()
+        with self.__cond:
+            if self.__writer == me:
+                if not self.__reentrant:
+                    raise RuntimeError(
+                        "Cannot re-acquire a non-reentrant ThreadRWLock")
+                self.__writer_count += 1
+                return True
+            if self.__is_reader(me):
+                raise RuntimeError(
+                    "Cannot upgrade ThreadRWLock from shared to exclusive mode")
+
+            self.__waiting_writers += 1
+            try:
+                acquired = self.__cond.wait_for(
+                    lambda: self.__writer is None and self.__readers == 0,
+                    self.__timeout(blocking, timeout),
+                )
+            finally:
+                self.__waiting_writers -= 1
+            if not acquired:
+                # readers held back by this writer may proceed
+                self.__cond.notify_all()
+                return False
+            self.__writer = me
+            self.__writer_count = 1
+            return True
+
+    def release(self):
+        """
+        Release the lock acquired in exclusive mode.
+
+        :raises RuntimeError: If the current thread does not hold the lock in exclusive mode.
+        """
+        with self.__cond:
+            if self.__writer != threading.get_ident():
+                raise RuntimeError(
+                    "Failed to release the lock: current thread is not the ThreadRWLock writer")
+            self.__writer_count -= 1
+            if self.__writer_count == 0:
+                self.__writer = None
+                self.__cond.notify_all()
+
+    def acquire_shared(self, blocking=True, timeout: float = -1) -> bool:
+        """
+        Acquire the lock in shared (reader) mode.
+
+        - If `blocking` is False and the lock is held in exclusive mode by another thread, returns False immediately.
+        - If `blocking` is True, waits until no other thread holds the lock in exclusive mode (or until `timeout`).
+          With writer preference, it also waits for the writers already waiting for the lock.
+
+        :raises RuntimeError: If the lock is not reentrant and the current thread already holds it (in any mode).
+
+        :return: True if lock acquired successfully, False otherwise.
+        :rtype: bool
+        """
+        me = threading.get_ident()
+        with self.__cond:
+            holder = self.__writer == me or self.__is_reader(me)
+            if holder and not self.__reentrant:
+                raise RuntimeError(
+                    "Cannot re-acquire a non-reentrant ThreadRWLock")
+            if not holder:
+                acquired = self.__cond.wait_for(
+                    lambda: self.__writer is None and not (
+                        self.__writer_preference and self.__waiting_writers),
+                    self.__timeout(blocking, timeout),
+                )
+                if not acquired:
+                    return False
+            self.__readers += 1
+            if self.__reentrant:
+                self.__reader_owners[me] = self.__reader_owners.get(me, 0) + 1
+            else:
+                self.__local.reading = True
+            return True
+
+    def release_shared(self):
+        """
+        Release the lock acquired in shared mode.
+
+        :raises RuntimeError: If the current thread does not hold the lock in shared mode.
+        """
+        with self.__cond:
+            if self.__readers == 0:
+                raise RuntimeError(
+                    "Failed to release the lock: ThreadRWLock is not held in shared mode")
+            me = threading.get_ident()
+            if not self.__is_reader(me):
+                raise RuntimeError(
+                    "Failed to release the lock: current thread is not a ThreadRWLock reader")
+            if not self.__reentrant:
+                self.__local.reading = False
+            elif self.__reader_owners[me] == 1:
+                del self.__reader_owners[me]
+            else:
+                self.__reader_owners[me] -= 1
+            self.__readers -= 1
+            if self.__readers == 0:
+                self.__cond.notify_all()
+
+    def get_shared_lock(self) -> AbstractLock:
+        """
+        Gets the shared (reader) side of this lock.
+
+        :return: An AbstractLock that acquires this lock in shared mode.
+        :rtype: AbstractLock
+        """
+        return self.__shared
+
+    def is_writer_preferred(self) -> bool:
+        """
+        Checks if waiting writers take precedence over new readers.
+
+        :return: True if writer preference is enabled, False otherwise.
+        :rtype: bool
+        """
+        return self.__writer_preference
+
+    def is_reentrant(self) -> bool:
+        """
+        Checks if the lock is reentrant.
+
+        :return: True if reentrant, False otherwise.
+        :rtype: bool
+        """
+        return self.__reentrant
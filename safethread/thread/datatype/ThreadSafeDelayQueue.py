@@ -0,0 +1,223 @@
+
+import heapq
+import itertools
+import queue
+import time
+
+from typing import Any, Iterable
+
+from safethread.thread.datatype.ThreadSafePriorityQueue import ThreadSafePriorityQueue
+
+
+_sequence = itertools.count()
+"""Tie-breaker of entries with the same due time (keeps FIFO order, and items are never compared)"""
+
+
+class _DelayHeap(queue.PriorityQueue):
+    """A ``queue.PriorityQueue`` of ``(due time, sequence, item)`` entries, used by ThreadSafeDelayQueue"""
+
+
+class ThreadSafeDelayQueue(ThreadSafePriorityQueue):
+    """
+    A thread-safe delay queue: every item is put with a delay, and it can only be retrieved once its due time is reached.
+
+    Items are kept in a binary heap, ordered by due time (``time.monotonic()``); items with the same due time are
+    retrieved in FIFO order. `get()` waits until the first item is due (or the timeout expires).
+
+    `qsize()`, `empty()` and `full()` count every item, due or not (so `get(block=False)` may raise Empty
+    while `empty()` is False).
+
+    **Example:**
+
+    ```python
+    retries = ThreadSafeDelayQueue()
+    retries.put(request, delay=5.0)
+    retries.get()   # returns `request` after 5 seconds
+    ```
+    """
+
+    def __init__(self, data: queue.Queue | int | None = None):
+        """
+        Initialize the thread-safe delay queue.
+
+        If a `Queue` is provided, its items are copied into the new queue (due immediately).
+        If an integer is provided, it sets the maximum size of the queue.
+        If no argument is provided, the queue is initialized with an unlimited size.
+
+        :param data: The initial data to populate the queue with, or the maximum size.
+        :type data: Queue, int, or None
+        """
+        super().__init__(data)
+        self._data: _DelayHeap
+
+    @staticmethod
+    def __entry(item: Any, delay: float) -> tuple:
+        """Creates the heap entry of an item."""
+        return (time.monotonic() + delay, next(_sequence), item)
+
+    def _create_data(self, data: Any | None) -> Any:
+        if isinstance(data, _DelayHeap):
+            return data
+        return super()._create_data(data)
+
+    def _create_queue(self, maxsize: int) -> queue.Queue:
+        return _DelayHeap(maxsize)
+
+    def _init_with_data(self, instance: queue.Queue, data: queue.Queue | Iterable):  # type: ignore
+        while not data.empty():  # type: ignore
+            instance.put(self.__entry(data.get(), 0))  # type: ignore
+
+    def copy_obj(self) -> queue.Queue:
+        """
+        Return a copy of the internal queue (same maximum size), keeping the due time of every item.
+
+        :return: A new queue.
+        :rtype: queue.Queue
+        """
+        with self._data.mutex:
+            entries = list(self._data.queue)
+        instance = self._create_queue(self._data.maxsize)
+        instance.queue.extend(entries)
+        instance.unfinished_tasks = len(entries)
+        return instance
+
+    def get(self, block: bool = True, timeout: float | None = None) -> Any:
+        """
+        Remove and return the first due item of the queue.
+
+        :param block: If True, block until an item is due. If False, raise the Empty exception if no item is due. Default is True.
+        :type block: bool, optional
+
+        :param timeout: The maximum time to wait for an item. If None, wait indefinitely. Default is None.
+        :type timeout: float, optional
+
+        :return: The item.
+        :rtype: Any
+
+        :raises queue.Empty: If no item is due and block is False or the timeout expires.
+        :raises queue.ShutDown: If the queue has been shut down and is empty.
+        :raises ValueError: If timeout is negative.
+        """
+        return self.get_many(1, block=block, timeout=timeout)[0]
+
+    def get_nowait(self) -> Any:
+        return self.get(block=False)
+
+    def get_many(self, max_items: int, block: bool = True, timeout: float | None = None) -> list:
+        """
+        Retrieve up to `max_items` due items from the queue, acquiring the queue mutex only once.
+
+        It waits (like `get()`) for the first item to be due, then returns the items already due (at most `max_items`).
+
+        :param max_items: The maximum number of items to retrieve.
+        :type max_items: int
+
+        :param block: If True, block until an item is due. If False, raise the Empty exception if no item is due. Default is True.
+        :type block: bool, optional
+
+        :param timeout: The maximum time to wait for the first item. If None, wait indefinitely. Default is None.
+        :type timeout: float, optional
+
+        :return: The items retrieved from the queue, by due time (empty list if `max_items` <= 0).
+        :rtype: list
+
+        :raises queue.Empty: If no item is due and block is False or the timeout expires.
+        :raises queue.ShutDown: If the queue has been shut down and is empty.
+        :raises ValueError: If timeout is negative.
+        """
+        if max_items <= 0:
+            return []
+        if block and timeout is not None and timeout < 0:
+            raise ValueError("'timeout' must be a non-negative number")
+        q = self._data
+        with q.not_empty:
+            endtime = None if timeout is None else time.monotonic() + timeout
+            while True:
+                if q.is_shutdown and not q._qsize():
+                    raise queue.ShutDown
+                now = time.monotonic()
+                if q.queue and q.queue[0][0] <= now:
+                    break
+                if not block:
+                    raise queue.Empty
+                # wake up when the first item is due (or a new item is put)
+                wait = q.queue[0][0] - now if q.queue else None
+                if endtime is not None:
+                    remaining = endtime - now
+                    if remaining <= 0.0:
+                        raise queue.Empty
+                    wait = remaining if wait is None else min(wait, remaining)
+                q.not_empty.wait(wait)
+            items = []
+            while q.queue and len(items) < max_items and q.queue[0][0] <= now:
+                items.append(heapq.heappop(q.queue)[2])
+            q.not_full.notify(len(items))
+            return items
+
+    def peek(self) -> Any:
+        """
+        Return the next item of the queue (the first to be due, even if it is not due yet), without removing it.
+
+        :return: The item with the earliest due time.
+        :rtype: Any
+
+        :raises queue.Empty: If the queue is empty.
+        """
+        with self._data.mutex:
+            if not self._data.queue:
+                raise queue.Empty
+            return self._data.queue[0][2]
+
+    def put(self, item: Any, block: bool = True, timeout: float | None = None, delay: float = 0.0):
+        """
+        Put an item into the queue, to be retrieved after `delay` seconds.
+
+        :param item: The item to be put into the queue.
+        :type item: Any
+
+        :param block: If True, blocks until a free slot is available. If False, raises the Full exception if no free slot is immediately available.
+        :type block: bool, optional
+
+        :param timeout: The maximum time to wait for a free slot. If None, waits indefinitely.
+        :type timeout: float or None, optional
+
+        :param delay: Seconds until the item is due. Defaults to 0.0 (due immediately).
+        :type delay: float, optional
+
+        :raises queue.Full: If no free slot is available and block is False or the timeout expires.
+        """
+        super().put(self.__entry(item, delay), block=block, timeout=timeout)
+
+    def put_nowait(self, item: Any, delay: float = 0.0):
+        self.put(item, block=False, delay=delay)
+
+    def put_many(self, items: Iterable, block: bool = True, timeout: float | None = None, delay: float = 0.0):
+        """
+        Put multiple items into the queue (all due after `delay` seconds), acquiring the queue mutex only once.
+
+        :param items: The items to be put into the queue.
+        :type items: Iterable
+
+        :param block: If True, blocks until a free slot is available. If False, raises the Full exception if no free slot is immediately available.
+        :type block: bool, optional
+
+        :param timeout: The maximum time to wait for the free slots. If None, waits indefinitely.
+        :type timeout: float or None, optional
+
+        :param delay: Seconds until the items are due. Defaults to 0.0 (due immediately).
+        :type delay: float, optional
+
+        :raises queue.Full: If no free slot is available and block is False or the timeout expires.
+        :raises queue.ShutDown: If the queue has been shut down.
+        """
+        super().put_many([self.__entry(item, delay) for item in items],
+                         block=block, timeout=timeout)
+
+    def snapshot(self) -> list:
+        """
+        Return a list of the items in the queue (by due time, due or not), without removing them.
+
+        :return: The items of the queue.
+        :rtype: list
+        """
+        return [entry[2] for entry in super().snapshot()]
@@ -1,32 +1,152 @@
 
+from types import MappingProxyType
 from typing import Any, Iterable
 
 from safethread.AbstractLock import AbstractLock
 
 from safethread.datatype.AbstractSafeDict import AbstractSafeDict
 
+from safethread.thread.datatype.ThreadCopyOnWriteLock import ThreadCopyOnWriteLock
 from safethread.thread.datatype.ThreadRLock import ThreadRLock
 
 
+def _freeze_dict(data: dict) -> MappingProxyType:
+    """Returns an immutable copy of a dictionary."""
+    return MappingProxyType(data.copy())
+
+
 class ThreadSafeDict(AbstractSafeDict):
-    def __init__(self, data: dict | Iterable | None = None):
+    def __init__(self, data: dict | Iterable | None = None, lock: AbstractLock | None = None, copy_on_write: bool = False):
         """
         Initialize a shared dictionary with a Lock for thread safety.
 
         :param data: Initial data to populate the dictionary. Defaults to None.
         :type data: dict or Iterable, optional
+
+        :param lock: Lock that protects the dictionary. Use a ``ThreadRWLock`` to run read-only methods
+                     (e.g., `get()`, `items()`, `in`) concurrently. Defaults to None (a new ``ThreadRLock``).
+        :type lock: AbstractLock, optional
+
+        :param copy_on_write: If True, the dictionary is protected by a ``ThreadCopyOnWriteLock``: every write
+                              publishes an immutable snapshot of the dictionary, and iteration, `items()`, `keys()`,
+                              `values()`, `get()`, `len()`, `in` and `[]` read the latest snapshot without locking.
+                              Defaults to False.
+        :type copy_on_write: bool, optional
+
+        :raises ValueError: If both `lock` and `copy_on_write` are given.
         """
+        if lock is not None and copy_on_write:
+            raise ValueError(
+                "Cannot use a custom lock in copy-on-write mode")
+        self.__lock = lock
+        self.__copy_on_write = copy_on_write
         super().__init__(data)
         self._data: dict
 
+        self.__cow = self._lock if isinstance(
+            self._lock, ThreadCopyOnWriteLock) else None
+
+    def __contains__(self, key):
+        """
+        Check if a key exists in the dictionary safely.
+
+        In copy-on-write mode, it reads the latest snapshot without taking the lock.
+
+        :param key: The key to check for presence in the dictionary.
+        :type key: Any
+        :return: `True` if the key exists in the dictionary, otherwise `False`.
+        :rtype: bool
+        """
+        if self.__cow is not None:
+            return key in self.__view()
+        return super().__contains__(key)
+
+    def __getitem__(self, key):
+        """
+        Retrieve a value safely from the dictionary.
+
+        In copy-on-write mode, it reads the latest snapshot without taking the lock.
+
+        :param key: The key to look up.
+        :type key: Any
+        :return: The value associated with the key.
+        :rtype: Any
+
+        :raises KeyError: If the key is not found.
+        """
+        if self.__cow is not None:
+            return self.__view()[key]
+        return super().__getitem__(key)
+
+    def __iter__(self):
+        """
+        Return a thread-safe iterator over the dictionary keys.
+
+        In copy-on-write mode, it reads the latest snapshot without taking the lock.
+
+        :return: An iterator for the dictionary keys.
+        :rtype: iterator
+        """
+        if self.__cow is not None:
+            return iter(self.__view())
+        return super().__iter__()
+
+    def __len__(self):
+        """
+        Return the number of items in the dictionary safely.
+
+        In copy-on-write mode, it reads the latest snapshot without taking the lock.
+
+        :return: The number of items in the dictionary.
+        :rtype: int
+        """
+        if self.__cow is not None:
+            return len(self.__view())
+        return super().__len__()
+
+    def __view(self) -> Any:
+        """
+        In copy-on-write mode, returns the data to read: the data itself if the current thread holds
+        the write lock (its writes are not published yet), otherwise the latest snapshot.
+        """
+        cow = self.__cow
+        assert cow is not None
+        return self._data if cow.is_owned() else cow.get_snapshot()
+
     def _create_data(self, data: Any | None) -> Any:
         if isinstance(data, dict):
             return data
         return dict(data or {})
 
     def _create_lock(self) -> AbstractLock:
+        if self.__lock is not None:
+            return self.__lock
+        if self.__copy_on_write:
+            return ThreadCopyOnWriteLock(self._data, _freeze_dict)
         return ThreadRLock()
 
+    def copy(self):
+        """
+        Return a thread-safe copy of the dict (in copy-on-write mode, if this dict is).
+
+        :return: A new ThreadSafeDict.
+        :rtype: ThreadSafeDict
+        """
+        return type(self)(self.copy_obj(), copy_on_write=self.is_copy_on_write())
+
+    def copy_obj(self):
+        """
+        Return a copy of the internal dictionary.
+
+        In copy-on-write mode, it reads the latest snapshot without taking the lock.
+
+        :return: A copy of the dictionary.
+        :rtype: dict
+        """
+        if self.__cow is not None:
+            return dict(self.__view())
+        return super().copy_obj()
+
     def fromkeys(self, iterable: Iterable, value: Any | None = None):
         """
         Create a new dictionary with keys from an iterable and values set to a specified value.
@@ -39,5 +159,71 @@ class ThreadSafeDict(AbstractSafeDict):
         :return: A new dictionary with the specified keys and values.
         :rtype: dict
         """
-        with self._lock:
+        with self._read_lock:
             return self._data.fromkeys(iterable, value)
+
+    def get(self, key, default=None):
+        """
+        Safely retrieve a value from the dictionary.
+
+        In copy-on-write mode, it reads the latest snapshot without taking the lock.
+
+        :param key: The key to look up.
+        :type key: Any
+        :param default: The default value if the key is not found. Defaults to None.
+        :type default: Any, optional
+
+        :return: The value associated with the key, or the default value.
+        :rtype: Any
+        """
+        if self.__cow is not None:
+            return self.__view().get(key, default)
+        return super().get(key, default)
+
+    def is_copy_on_write(self) -> bool:
+        """
+        Checks if the dictionary is in copy-on-write mode.
+
+        :return: True if the dictionary is protected by a ThreadCopyOnWriteLock, False otherwise.
+        :rtype: bool
+        """
+        return self.__cow is not None
+
+    def items(self):
+        """
+        Return a set-like view of dictionary items (key-value pairs).
+
+        In copy-on-write mode, it reads the latest snapshot without taking the lock.
+
+        :return: A view object displaying the dictionary's items (of the snapshot, in copy-on-write mode).
+        :rtype: dict_items
+        """
+        if self.__cow is not None:
+            return self.__view().items()
+        return super().items()
+
+    def keys(self):
+        """
+        Return a set-like view of dictionary keys.
+
+        In copy-on-write mode, it reads the latest snapshot without taking the lock.
+
+        :return: A view object displaying the dictionary's keys (of the snapshot, in copy-on-write mode).
+        :rtype: dict_keys
+        """
+        if self.__cow is not None:
+            return self.__view().keys()
+        return super().keys()
+
+    def values(self):
+        """
+        Return a set-like view of dictionary values.
+
+        In copy-on-write mode, it reads the latest snapshot without taking the lock.
+
+        :return: A view object displaying the dictionary's values (of the snapshot, in copy-on-write mode).
+        :rtype: dict_values
+        """
+        if self.__cow is not None:
+            return self.__view().values()
+        return super().values()
@@ -4,19 +4,159 @@ from typing import Any, Iterable
 from safethread.AbstractLock import AbstractLock
 from safethread.datatype.AbstractSafeList import AbstractSafeList
 
+from safethread.thread.datatype.ThreadCopyOnWriteLock import ThreadCopyOnWriteLock
 from safethread.thread.datatype.ThreadRLock import ThreadRLock
 
 
 class ThreadSafeList(AbstractSafeList):
 
-    def __init__(self, data: list | Iterable | None = None):
+    def __init__(self, data: list | Iterable | None = None, lock: AbstractLock | None = None, copy_on_write: bool = False):
+        """
+        Initialize a shared list with a Lock for thread safety.
+
+        :param data: Initial data to populate the list. Defaults to None.
+        :type data: list or Iterable, optional
+
+        :param lock: Lock that protects the list. Use a ``ThreadRWLock`` to run read-only methods
+                     (e.g., `count()`, `index()`, `[]`) concurrently. Defaults to None (a new ``ThreadRLock``).
+        :type lock: AbstractLock, optional
+
+        :param copy_on_write: If True, the list is protected by a ``ThreadCopyOnWriteLock``: every write publishes
+                              an immutable snapshot (tuple) of the list, and iteration, `len()`, `in`, `[]`
+                              and `snapshot()` read the latest snapshot without locking. Defaults to False.
+        :type copy_on_write: bool, optional
+
+        :raises ValueError: If both `lock` and `copy_on_write` are given.
+        """
+        if lock is not None and copy_on_write:
+            raise ValueError(
+                "Cannot use a custom lock in copy-on-write mode")
+        self.__lock = lock
+        self.__copy_on_write = copy_on_write
         super().__init__(data)
         self._data: list
 
+        self.__cow = self._lock if isinstance(
+            self._lock, ThreadCopyOnWriteLock) else None
+
+    def __contains__(self, value):
+        """
+        Check if a value exists in the list safely.
+
+        In copy-on-write mode, it reads the latest snapshot without taking the lock.
+
+        :param value: The value to check for presence in the list.
+        :type value: Any
+        :return: `True` if the value exists in the list, otherwise `False`.
+        :rtype: bool
+        """
+        if self.__cow is not None:
+            return value in self.__view()
+        return super().__contains__(value)
+
+    def __getitem__(self, index):
+        """
+        Retrieve an item (or a slice, as a list) safely from the list.
+
+        In copy-on-write mode, it reads the latest snapshot without taking the lock.
+
+        :param index: The index (or slice) of the item to retrieve.
+        :type index: int or slice
+        :return: The item at the given index, or a list with the items of the slice.
+        :rtype: Any
+        """
+        if self.__cow is not None:
+            result = self.__view()[index]
+            return list(result) if isinstance(index, slice) else result
+        return super().__getitem__(index)
+
+    def __iter__(self):
+        """
+        Return a thread-safe iterator for the list.
+
+        In copy-on-write mode, it reads the latest snapshot without taking the lock.
+
+        :return: An iterator for the list items.
+        :rtype: iterator
+        """
+        if self.__cow is not None:
+            return iter(self.__view())
+        return super().__iter__()
+
+    def __len__(self):
+        """
+        Return the length of the list safely.
+
+        In copy-on-write mode, it reads the latest snapshot without taking the lock.
+
+        :return: The number of items in the list.
+        :rtype: int
+        """
+        if self.__cow is not None:
+            return len(self.__view())
+        return super().__len__()
+
+    def __view(self) -> Any:
+        """
+        In copy-on-write mode, returns the data to read: the data itself if the current thread holds
+        the write lock (its writes are not published yet), otherwise the latest snapshot.
+        """
+        cow = self.__cow
+        assert cow is not None
+        return self._data if cow.is_owned() else cow.get_snapshot()
+
     def _create_data(self, data: Any | None) -> Any:
         if isinstance(data, list):
             return data
         return list(data or [])
 
     def _create_lock(self) -> AbstractLock:
+        if self.__lock is not None:
+            return self.__lock
+        if self.__copy_on_write:
+            return ThreadCopyOnWriteLock(self._data, tuple)
         return ThreadRLock()
+
+    def copy(self):
+        """
+        Return a thread-safe copy of the list (in copy-on-write mode, if this list is).
+
+        :return: A new ThreadSafeList.
+        :rtype: ThreadSafeList
+        """
+        return type(self)(self.copy_obj(), copy_on_write=self.is_copy_on_write())
+
+    def copy_obj(self):
+        """
+        Return a copy of the internal list.
+
+        In copy-on-write mode, it reads the latest snapshot without taking the lock.
+
+        :return: A copy of the list.
+        :rtype: list
+        """
+        if self.__cow is not None:
+            return list(self.__view())
+        return super().copy_obj()
+
+    def is_copy_on_write(self) -> bool:
+        """
+        Checks if the list is in copy-on-write mode.
+
+        :return: True if the list is protected by a ThreadCopyOnWriteLock, False otherwise.
+        :rtype: bool
+        """
+        return self.__cow is not None
+
+    def snapshot(self) -> list:
+        """
+        Returns a consistent copy of the list safely.
+
+        In copy-on-write mode, it reads the latest snapshot without taking the lock.
+
+        :return: A copy of the list.
+        :rtype: list
+        """
+        if self.__cow is not None:
+            return list(self.__view())
+        return super().snapshot()
@@ -0,0 +1,56 @@
+
+import queue
+
+from safethread.thread.datatype.ThreadSafeQueue import ThreadSafeQueue
+
+
+class ThreadSafePriorityQueue(ThreadSafeQueue):
+    """
+    A thread-safe priority queue, based on ``queue.PriorityQueue`` (a binary heap).
+
+    The lowest item is retrieved first. Items are usually ``(priority, item)`` tuples;
+    if items with the same priority cannot be compared, use ``(priority, sequence, item)`` tuples.
+
+    All the ``ThreadSafeQueue`` methods are available (e.g., `get_many()`, `task_done()`, `join()`, `shutdown()`),
+    and items are ordered under the queue mutex.
+
+    **Example:**
+
+    ```python
+    tasks = ThreadSafePriorityQueue()
+    tasks.put((2, "low"))
+    tasks.put((1, "high"))
+    tasks.get()     # (1, "high")
+    ```
+    """
+
+    def __init__(self, data: queue.Queue | ThreadSafeQueue | int | None = None):
+        """
+        Initialize the thread-safe priority queue.
+
+        If a `Queue` is provided, its items are copied into the new queue.
+        If an integer is provided, it sets the maximum size of the queue.
+        If it is another ThreadSafePriorityQueue, both objects share the same queue.
+        If no argument is provided, the queue is initialized with an unlimited size.
+
+        :param data: The initial data to populate the queue with, or the maximum size.
+        :type data: Queue, ThreadSafePriorityQueue, int, or None
+        """
+        super().__init__(data)
+        self._data: queue.PriorityQueue
+
+    def _create_queue(self, maxsize: int) -> queue.Queue:
+        return queue.PriorityQueue(maxsize)
+
+    def snapshot(self) -> list:
+        """
+        Return a list of the items in the queue (lowest first), without removing them.
+
+        The heap is copied under the queue mutex, so producers and consumers are only blocked during the copy.
+
+        :return: The items of the queue, sorted.
+        :rtype: list
+        """
+        with self._data.mutex:
+            heap = list(self._data.queue)
+        return sorted(heap)
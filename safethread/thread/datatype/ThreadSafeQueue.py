@@ -1,5 +1,6 @@
 
 import queue
+import time
 
 from threading import Condition
 from typing import Any, Iterable
@@ -12,16 +13,17 @@ from safethread.datatype.AbstractSafeQueue import AbstractSafeQueue
 
 
 class ThreadSafeQueue(AbstractSafeQueue):
-    def __init__(self, data: queue.Queue | int | None = None):
+    def __init__(self, data: "queue.Queue | ThreadSafeQueue | int | None" = None):
         """
         Initialize the thread-safe queue.
 
         If a `Queue` is provided, its items are copied into the new queue.
         If an integer is provided, it sets the maximum size of the queue.
+        If it is another ThreadSafeQueue, both objects share the same queue.
         If no argument is provided, the queue is initialized with an unlimited size.
 
         :param data: The initial data to populate the queue with, or the maximum size.
-        :type data: Queue, int, or None
+        :type data: Queue, ThreadSafeQueue, int, or None
         """
         super().__init__(data)
         self._data: queue.Queue
@@ -39,7 +41,7 @@ class ThreadSafeQueue(AbstractSafeQueue):
                 "Queue create failed, provided argument is not int | queue.Queue")
 
         # create queue
-        instance = queue.Queue(maxsize)
+        instance = self._create_queue(maxsize)
 
         # copy data
         if (isinstance(data, queue.Queue) or
@@ -50,6 +52,150 @@ class ThreadSafeQueue(AbstractSafeQueue):
     def _create_lock(self) -> AbstractLock:
         return ThreadRLock()
 
+    def _create_queue(self, maxsize: int) -> queue.Queue:
+        """
+        Create the internal queue.
+
+        Subclasses may override this method to use another ``queue.Queue`` subclass (e.g., ``queue.PriorityQueue``).
+
+        :param maxsize: The maximum size of the queue (0 for unlimited).
+        :type maxsize: int
+
+        :return: A new, empty queue.
+        :rtype: queue.Queue
+        """
+        return queue.Queue(maxsize)
+
+    def copy_obj(self) -> queue.Queue:
+        """
+        Return a copy of the internal queue (same maximum size), holding the items of `snapshot()`.
+
+        :return: A new queue.
+        :rtype: queue.Queue
+        """
+        items = self.snapshot()
+        instance = self._create_queue(self._data.maxsize)
+        instance.queue.extend(items)
+        instance.unfinished_tasks = len(items)
+        return instance
+
+    def get_many(self, max_items: int, block: bool = True, timeout: float | None = None) -> list:
+        """
+        Retrieve up to `max_items` items from the queue, acquiring the queue mutex only once.
+
+        It waits (like `get()`) for the first item, then returns the items immediately available (at most `max_items`).
+
+        :param max_items: The maximum number of items to retrieve.
+        :type max_items: int
+
+        :param block: If True, block until an item is available. If False, raise the Empty exception if no item is immediately available. Default is True.
+        :type block: bool, optional
+
+        :param timeout: The maximum time to wait for the first item. If None, wait indefinitely. Default is None.
+        :type timeout: float, optional
+
+        :return: The items retrieved from the queue (empty list if `max_items` <= 0).
+        :rtype: list
+
+        :raises queue.Empty: If no item is available and block is False or the timeout expires.
+        :raises queue.ShutDown: If the queue has been shut down and is empty.
+        :raises ValueError: If timeout is negative.
+        """
+        if max_items <= 0:
+            return []
+        q = self._data
+        with q.not_empty:
+            if q.is_shutdown and not q._qsize():
+                raise queue.ShutDown
+            if not block:
+                if not q._qsize():
+                    raise queue.Empty
+            elif timeout is None:
+                while not q._qsize():
+                    q.not_empty.wait()
+                    if q.is_shutdown and not q._qsize():
+                        raise queue.ShutDown
+            elif timeout < 0:
+                raise ValueError("'timeout' must be a non-negative number")
+            else:
+                endtime = time.monotonic() + timeout
+                while not q._qsize():
+                    remaining = endtime - time.monotonic()
+                    if remaining <= 0.0:
+                        raise queue.Empty
+                    q.not_empty.wait(remaining)
+                    if q.is_shutdown and not q._qsize():
+                        raise queue.ShutDown
+            count = min(max_items, q._qsize())
+            items = [q._get() for _ in range(count)]
+            q.not_full.notify(count)
+            return items
+
+    def peek(self) -> Any:
+        """
+        Return the next item of the queue, without removing it.
+
+        :return: The item at the front of the queue.
+        :rtype: Any
+
+        :raises queue.Empty: If the queue is empty.
+        """
+        with self._data.mutex:
+            if not self._data.queue:
+                raise queue.Empty
+            return self._data.queue[0]
+
+    def put_many(self, items: Iterable, block: bool = True, timeout: float | None = None):
+        """
+        Put multiple items into the queue, acquiring the queue mutex only once.
+
+        In a bounded queue, the items are put as free slots become available (consumers
+        are woken up after each chunk). If the Full exception is raised, the items
+        put before it remain in the queue.
+
+        :param items: The items to be put into the queue.
+        :type items: Iterable
+
+        :param block: If True, blocks until a free slot is available. If False, raises the Full exception if no free slot is immediately available.
+        :type block: bool, optional
+
+        :param timeout: The maximum time to wait for the free slots. If None, waits indefinitely.
+        :type timeout: float or None, optional
+
+        :raises queue.Full: If no free slot is available and block is False or the timeout expires.
+        :raises queue.ShutDown: If the queue has been shut down.
+        :raises ValueError: If timeout is negative.
+        """
+        items = list(items)
+        if block and timeout is not None and timeout < 0:
+            raise ValueError("'timeout' must be a non-negative number")
+        endtime = None if timeout is None else time.monotonic() + timeout
+        q = self._data
+        with q.not_full:
+            start = 0
+            while start < len(items):
+                if q.is_shutdown:
+                    raise queue.ShutDown
+                count = len(items) - start
+                if q.maxsize > 0:
+                    count = min(count, q.maxsize - q._qsize())
+                    if count <= 0:
+                        if not block:
+                            raise queue.Full
+                        if endtime is None:
+                            q.not_full.wait()
+                            continue
+                        remaining = endtime - time.monotonic()
+                        if remaining <= 0.0:
+                            raise queue.Full
+                        q.not_full.wait(remaining)
+                        continue
+                for item in items[start:start + count]:
+                    q._put(item)
+                q.unfinished_tasks += count
+                q.not_empty.notify(count)
+                start += count
+
     def join(self):
         """
         Blocks until all items in the Queue have been gotten and processed.
@@ -90,6 +236,18 @@ class ThreadSafeQueue(AbstractSafeQueue):
         """
         return self._data.task_done()
 
+    def snapshot(self) -> list:
+        """
+        Return a list of the items in the queue (front first), without removing them.
+
+        The underlying deque is copied under the queue mutex, so producers and consumers are only blocked during the copy.
+
+        :return: The items of the queue.
+        :rtype: list
+        """
+        with self._data.mutex:
+            return list(self._data.queue)
+
     def clear(self):
         """Clears the queue"""
         self._data.queue.clear()
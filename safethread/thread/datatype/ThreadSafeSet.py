@@ -8,13 +8,18 @@ from safethread.datatype.AbstractSafeSet import AbstractSafeSet
 
 
 class ThreadSafeSet(AbstractSafeSet):
-    def __init__(self, data: set | Iterable | None = None):
+    def __init__(self, data: set | Iterable | None = None, lock: AbstractLock | None = None):
         """
         Initialize a shared set with a Lock for thread safety.
 
         :param data: The initial data to populate the set with.
         :type data: set, Iterable, or None
+
+        :param lock: Lock that protects the set. Use a ``ThreadRWLock`` to run read-only methods
+                     (e.g., `in`, `union()`, `issubset()`) concurrently. Defaults to None (a new ``ThreadRLock``).
+        :type lock: AbstractLock, optional
         """
+        self.__lock = lock
         super().__init__(data)
         self._data: set
 
@@ -24,4 +29,6 @@ class ThreadSafeSet(AbstractSafeSet):
         return set(data or [])
 
     def _create_lock(self) -> AbstractLock:
+        if self.__lock is not None:
+            return self.__lock
         return ThreadRLock()
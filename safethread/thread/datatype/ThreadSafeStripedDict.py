@@ -0,0 +1,389 @@
+
+import time
+
+from typing import Any, Callable, Iterable, Self
+
+from safethread.AbstractLock import AbstractLock
+
+from safethread.datatype.AbstractSafeBase import AbstractSafeBase
+from safethread.datatype.AbstractSafeDict import AbstractSafeDict
+
+from safethread.thread.datatype.ThreadRLock import ThreadRLock
+
+
+class ThreadSafeStripedDict(AbstractSafeDict):
+    """
+    A thread-safe dictionary, split by key hash into stripes (internal dictionaries), each one protected by its own ``ThreadRLock``.
+
+    Operations on a single key (e.g., `d[key]`, `get()`, `pop()`, `setdefault()`) only lock the stripe of the key,
+    so threads that use unrelated keys do not contend for the same lock.
+    Operations on the whole dictionary (e.g., `len()`, `items()`, `keys()`, `copy()`) lock every stripe,
+    returning a consistent snapshot of the dictionary.
+
+    The lock returned by `get_lock()` locks every stripe.
+    """
+
+    DEFAULT_STRIPES = 16
+    """Default number of stripes"""
+
+    class StripedLock(AbstractLock):
+        """
+        A lock that acquires the locks of all stripes of a ThreadSafeStripedDict, in stripe order.
+        """
+
+        def __init__(self, stripes: int) -> None:
+            """
+            Initializes the lock of every stripe.
+
+            :param stripes: Number of stripes.
+            :type stripes: int
+            """
+            super().__init__()
+            self.__locks = tuple(ThreadRLock() for _ in range(stripes))
+
+        def __enter__(self) -> Self:  # type: ignore
+            """
+            Acquire the locks of all stripes.
+
+            :raises RuntimeError: if lock cannot be acquired
+
+            :return: This lock object
+            :rtype: Self
+            """
+            if not self.acquire():
+                raise RuntimeError("Cannot acquire StripedLock")
+            return self
+
+        def __exit__(self, *args):  # type: ignore
+            """
+            Release the locks of all stripes.
+            """
+            self.release()
+
+        def acquire(self, blocking=True, timeout: float = -1) -> bool:
+            """
+            Acquire the locks of all stripes (in stripe order, to avoid deadlocks).
+
+            If any stripe lock cannot be acquired, the stripe locks already acquired are released.
+
+            :return: True if all locks were acquired successfully, False otherwise.
+            :rtype: bool
+            """
+            deadline = time.monotonic() + timeout if timeout >= 0 else None
+            for i, lock in enumerate(self.__locks):
+                remaining = -1 if deadline is None else max(0,
+                                                            deadline - time.monotonic())
+                if not lock.acquire(blocking=blocking, timeout=remaining if blocking else -1):
+                    for acquired in reversed(self.__locks[:i]):
+                        acquired.release()
+                    return False
+            return True
+
+        def release(self):
+            """
+            Release the locks of all stripes.
+
+            :raises RuntimeError: If the current thread does not hold the locks.
+            """
+            for lock in reversed(self.__locks):
+                lock.release()
+
+        def get_locks(self) -> tuple[ThreadRLock, ...]:
+            """
+            Gets the lock of every stripe.
+
+            :return: The stripe locks, in stripe order.
+            :rtype: tuple[ThreadRLock, ...]
+            """
+            return self.__locks
+
+    def __init__(self, data: dict | Iterable | None = None, stripes: int = DEFAULT_STRIPES):
+        """
+        Initialize a striped dictionary.
+
+        :param data: Initial data to populate the dictionary. If it is another ThreadSafeStripedDict,
+                     both objects share the same data and locks. Defaults to None.
+        :type data: dict or Iterable, optional
+
+        :param stripes: Number of stripes (internal dictionaries and locks). More stripes reduce lock contention
+                        among threads, but make whole-dictionary operations slower. Defaults to DEFAULT_STRIPES.
+                        Ignored if `data` is a ThreadSafeStripedDict.
+        :type stripes: int, optional
+
+        :raises ValueError: If `stripes` is less than 1.
+        """
+        if stripes < 1:
+            raise ValueError("ThreadSafeStripedDict needs at least 1 stripe")
+        if isinstance(data, AbstractSafeBase) and not isinstance(data, ThreadSafeStripedDict):
+            data = data.copy_obj()
+        self.__stripes = stripes
+
+        super().__init__(data)
+        self._data: list[dict]  # type: ignore
+        self._lock: ThreadSafeStripedDict.StripedLock
+        self._locks = self._lock.get_locks()
+
+    def __bool__(self) -> bool:
+        with self._lock:
+            return any(self._data)
+
+    def __contains__(self, key) -> bool:
+        i = hash(key) % len(self._data)
+        with self._locks[i]:
+            return key in self._data[i]
+
+    def __delitem__(self, key):
+        i = hash(key) % len(self._data)
+        with self._locks[i]:
+            del self._data[i][key]
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, AbstractSafeBase):
+            other = other.copy_obj()
+        return self.copy_obj() == other
+
+    def __getitem__(self, key):
+        i = hash(key) % len(self._data)
+        with self._locks[i]:
+            return self._data[i][key]
+
+    def __iter__(self):
+        """
+        Iterates over a snapshot of the keys.
+
+        :return: An iterator of the keys.
+        :rtype: iterator
+        """
+        return iter(self.keys())
+
+    def __len__(self) -> int:
+        with self._lock:
+            return sum(len(stripe) for stripe in self._data)
+
+    def __or__(self, other):
+        if isinstance(other, AbstractSafeBase):
+            other = other.copy_obj()
+        return self.create(self.copy_obj() | other)
+
+    def __repr__(self) -> str:
+        return repr(self.copy_obj())
+
+    def __setitem__(self, key, value):
+        i = hash(key) % len(self._data)
+        with self._locks[i]:
+            self._data[i][key] = value
+
+    def __sizeof__(self) -> int:
+        with self._lock:
+            return sum(stripe.__sizeof__() for stripe in self._data) + self._lock.__sizeof__()
+
+    def __str__(self) -> str:
+        return str(self.copy_obj())
+
+    def _binary_op(self, op: Callable[[Any, Any], Any], other: Any, reflected: bool = False, write: bool = False) -> Any:
+        """
+        Apply a binary operation to a consistent snapshot of the dictionary (a ``dict``) and `other`.
+
+        Operators (e.g., `d == other`, `d | other`, `d += other`) then behave like ``dict`` operators
+        (unsupported ones raise TypeError), instead of acting on the internal list of stripes.
+
+        :param op: The binary operation (e.g., ``operator.or_``).
+        :type op: Callable[[Any, Any], Any]
+        :param other: The other operand (a safe object or a plain value).
+        :type other: Any
+        :param reflected: If True, computes `op(other, snapshot)` instead of `op(snapshot, other)`. Defaults to False.
+        :type reflected: bool, optional
+        :param write: If True, stores the result as the new content of the dictionary (in-place operations),
+                      holding the locks of every stripe. Defaults to False.
+        :type write: bool, optional
+
+        :return: The result of the operation.
+        :rtype: Any
+        """
+        if isinstance(other, AbstractSafeBase):
+            other = other.copy_obj()
+        if not write:
+            value = self.copy_obj()
+            return op(other, value) if reflected else op(value, other)
+        with self._lock:
+            value = self.copy_obj()
+            result = op(other, value) if reflected else op(value, other)
+            for stripe, items in zip(self._data, self._create_data(result)):
+                stripe.clear()
+                stripe.update(items)
+        return result
+
+    def _create_data(self, data: Any | None) -> Any:
+        stripes: list[dict] = [{} for _ in range(self.__stripes)]
+        for key, value in dict(data or {}).items():
+            stripes[hash(key) % self.__stripes][key] = value
+        return stripes
+
+    def _create_lock(self) -> AbstractLock:
+        return ThreadSafeStripedDict.StripedLock(self.__stripes)
+
+    def clear(self):
+        """
+        Safely clear the dictionary.
+        """
+        with self._lock:
+            for stripe in self._data:
+                stripe.clear()
+
+    def copy(self):
+        """
+        Return a copy of the dictionary, with the same number of stripes.
+
+        :return: A new ThreadSafeStripedDict.
+        :rtype: ThreadSafeStripedDict
+        """
+        return type(self)(self.copy_obj(), len(self._data))
+
+    def copy_obj(self) -> dict:
+        """
+        Return a consistent snapshot of the dictionary.
+
+        :return: A dict with the items of all stripes.
+        :rtype: dict
+        """
+        result = {}
+        with self._lock:
+            for stripe in self._data:
+                result.update(stripe)
+        return result
+
+    def fromkeys(self, iterable: Iterable, value: Any | None = None):
+        """
+        Create a new dictionary with keys from an iterable and values set to a specified value.
+
+        :param iterable: Iterable containing the keys for the new dictionary.
+        :type iterable: Iterable
+        :param value: Value assigned to each key. Defaults to None.
+        :type value: Any, optional
+
+        :return: A new dictionary with the specified keys and values.
+        :rtype: dict
+        """
+        return dict.fromkeys(iterable, value)
+
+    def get(self, key, default=None):
+        """
+        Safely retrieve a value from the dictionary, locking only the stripe of the key.
+
+        :param key: The key to look up.
+        :type key: Any
+        :param default: The default value if the key is not found. Defaults to None.
+        :type default: Any, optional
+
+        :return: The value associated with the key, or the default value.
+        :rtype: Any
+        """
+        i = hash(key) % len(self._data)
+        with self._locks[i]:
+            return self._data[i].get(key, default)
+
+    def get_stripes(self) -> int:
+        """
+        Gets the number of stripes.
+
+        :return: Number of stripes.
+        :rtype: int
+        """
+        return len(self._data)
+
+    def items(self):
+        """
+        Return a set-like view of a consistent snapshot of the dictionary items (key-value pairs).
+
+        :return: A view object displaying the dictionary's items.
+        :rtype: dict_items
+        """
+        return self.copy_obj().items()
+
+    def keys(self):
+        """
+        Return a set-like view of a consistent snapshot of the dictionary keys.
+
+        :return: A view object displaying the dictionary's keys.
+        :rtype: dict_keys
+        """
+        return self.copy_obj().keys()
+
+    def pop(self, key, default=None):
+        """
+        Remove the specified key and return the corresponding value, locking only the stripe of the key.
+
+        :param key: The key to remove.
+        :type key: Any
+        :param default: The default value to return if the key is not found. Defaults to None.
+        :type default: Any, optional
+
+        :return: The value associated with the key, or the default value.
+        :rtype: Any
+        """
+        i = hash(key) % len(self._data)
+        with self._locks[i]:
+            return self._data[i].pop(key, default)
+
+    def popitem(self):
+        """
+        Remove and return a key-value pair from the dictionary (the last pair of the last non-empty stripe).
+
+        :raises KeyError: If the dictionary is empty.
+
+        :return: The key-value pair removed from the dictionary.
+        :rtype: tuple
+        """
+        with self._lock:
+            for stripe in reversed(self._data):
+                if stripe:
+                    return stripe.popitem()
+        raise KeyError("popitem(): dictionary is empty")
+
+    def setdefault(self, key, default=None):
+        """
+        Retrieve the value for a given key if it exists; otherwise, insert the key with the provided default value.
+
+        Only the stripe of the key is locked.
+
+        :param key: The key to look up in the dictionary.
+        :type key: Any
+        :param default: The value to set if the key is not found. Defaults to None.
+        :type default: Any, optional
+
+        :return: The value associated with the key if it exists; otherwise, the default value that was set.
+        :rtype: Any
+        """
+        i = hash(key) % len(self._data)
+        with self._locks[i]:
+            return self._data[i].setdefault(key, default)
+
+    def update(self, m: Iterable | None = None, **kwargs):
+        """
+        Update the dictionary with key-value pairs from another dictionary or iterable of key-value pairs.
+
+        The pairs are grouped by stripe, and each stripe is updated while holding only its own lock.
+
+        :param m: A dictionary or an iterable of key-value pairs (e.g., list of tuples) to update the dictionary with.
+        :type m: dict or Iterable, optional
+        :param kwargs: Additional key-value pairs to update the dictionary.
+        :type kwargs: dict
+        """
+        if isinstance(m, AbstractSafeBase):
+            m = m.copy_obj()
+        n = len(self._data)
+        groups: dict[int, dict] = {}
+        for key, value in dict(m or {}, **kwargs).items():
+            groups.setdefault(hash(key) % n, {})[key] = value
+        for i, group in groups.items():
+            with self._locks[i]:
+                self._data[i].update(group)
+
+    def values(self):
+        """
+        Return a view of a consistent snapshot of the dictionary values.
+
+        :return: A view object displaying the dictionary's values.
+        :rtype: dict_values
+        """
+        return self.copy_obj().values()
@@ -6,14 +6,26 @@ This module provides thread-safe data structures to be used in multithreaded (co
 
 ### **Classes:**
 - **ThreadSafeRLock**: A thread-safe reentrant lock (RLock) implementation.
+- **ThreadCopyOnWriteLock**: A reentrant lock that publishes immutable snapshots of the data, for lock-free readers.
+- **ThreadRWLock**: A reader-writer lock, with shared (read) and exclusive (write) modes.
+- **ThreadSafeCounter**: A thread-safe atomic counter / accumulator, with an optional sharded (per-thread) mode.
+- **ThreadSafeDelayQueue**: A thread-safe delay queue (items are retrieved once due).
 - **ThreadSafeDict**: A thread-safe dictionary implementation.
 - **ThreadSafeList**: A thread-safe list implementation.
+- **ThreadSafePriorityQueue**: A thread-safe priority queue (heap).
 - **ThreadSafeQueue**: A thread-safe queue implementation.
 - **ThreadSafeSet**: A thread-safe set implementation.
+- **ThreadSafeStripedDict**: A thread-safe dictionary with one lock per stripe (group of keys), for highly concurrent workloads.
 """
 
+from safethread.thread.datatype.ThreadCopyOnWriteLock import ThreadCopyOnWriteLock
 from safethread.thread.datatype.ThreadRLock import ThreadRLock
+from safethread.thread.datatype.ThreadRWLock import ThreadRWLock
+from safethread.thread.datatype.ThreadSafeCounter import ThreadSafeCounter
+from safethread.thread.datatype.ThreadSafeDelayQueue import ThreadSafeDelayQueue
 from safethread.thread.datatype.ThreadSafeDict import ThreadSafeDict
 from safethread.thread.datatype.ThreadSafeList import ThreadSafeList
+from safethread.thread.datatype.ThreadSafePriorityQueue import ThreadSafePriorityQueue
 from safethread.thread.datatype.ThreadSafeQueue import ThreadSafeQueue
 from safethread.thread.datatype.ThreadSafeSet import ThreadSafeSet
+from safethread.thread.datatype.ThreadSafeStripedDict import ThreadSafeStripedDict
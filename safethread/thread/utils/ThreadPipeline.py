@@ -1,5 +1,5 @@
 
-from typing import Any, Iterable
+from typing import Any, Callable, Iterable
 
 from safethread.thread.utils.ThreadPipelineStage import ThreadPipelineStage
 
@@ -16,18 +16,28 @@ class ThreadPipeline:
     <img src="../../../img/utils/Pipeline.svg" alt="" width="100%">
     """
 
-    def __init__(self, pipeline_stages: Iterable[ThreadPipelineStage]):
+    def __init__(self, pipeline_stages: Iterable[ThreadPipelineStage], policy: str | None = None):
         """
         Initializes a pipeline with the given sequence of pipeline stages.
 
         :param pipeline_stages: A collection of `PipelineStage` instances that make up the pipeline.
         :type pipeline_stages: Iterable[PipelineStage]
+
+        :param policy: The backpressure policy applied to every (bounded) stage, see ``ThreadPipelineStage.POLICIES``.
+                       Defaults to None (each stage keeps its own policy).
+        :type policy: str, optional
+
+        :raises ValueError: If the policy is invalid.
         """
         super().__init__()
 
         self.__started = False
+        self.__exporter: Callable[[dict], Any] | None = None
         self.__stages = tuple(pipeline_stages)
         self.__connect()
+        if policy is not None:
+            for stage in self.__stages:
+                stage.set_policy(policy)
 
     def __connect(self):
         """
@@ -79,6 +89,75 @@ class ThreadPipeline:
                 "Cannot put() input into an empty Pipeline (one that has no PipelineStages)")
         self.__stages[0].put(input, block=block, timeout=timeout)
 
+    def get_depths(self) -> list[int]:
+        """
+        Gets the current number of data in the input queue of each stage.
+
+        :return: The queue depth of each stage (in pipeline order).
+        :rtype: list[int]
+        """
+        return [stage.get_depth() for stage in self.__stages]
+
+    def get_high_watermarks(self) -> list[int]:
+        """
+        Gets the highest number of data the input queue of each stage has held.
+
+        :return: The high-watermark of each stage (in pipeline order).
+        :rtype: list[int]
+        """
+        return [stage.get_high_watermark() for stage in self.__stages]
+
+    def stats(self) -> dict:
+        """
+        Gets a snapshot of the pipeline statistics (see ``ThreadPipelineStage.stats()``):
+
+        - **items_in**: Data taken by the first stage.
+        - **items_out**: Results put by the last stage.
+        - **errors**: Callback errors of all stages.
+        - **bottleneck**: Index of the stage with the highest utilization (None if no stage has processed data).
+        - **stages**: Statistics of each stage (in pipeline order).
+
+        :return: The statistics.
+        :rtype: dict
+        """
+        stages = [stage.stats() for stage in self.__stages]
+        bottleneck = None
+        for i, stage in enumerate(stages):
+            if stage["utilization"] > 0 and (bottleneck is None or stage["utilization"] > stages[bottleneck]["utilization"]):
+                bottleneck = i
+        return {
+            "items_in": stages[0]["items_in"] if stages else 0,
+            "items_out": stages[-1]["items_out"] if stages else 0,
+            "errors": sum(stage["errors"] for stage in stages),
+            "bottleneck": bottleneck,
+            "stages": stages,
+        }
+
+    def set_exporter(self, exporter: Callable[[dict], Any] | None):
+        """
+        Sets the exporter hook, called by `export()` with the `stats()` snapshot.
+
+        :param exporter: The exporter, or None to remove it.
+        :type exporter: Callable[[dict], Any] | None
+
+        :raises TypeError: If the exporter is not callable.
+        """
+        if exporter is not None and not callable(exporter):
+            raise TypeError("'exporter' is not callable")
+        self.__exporter = exporter
+
+    def export(self) -> dict:
+        """
+        Takes a `stats()` snapshot, and passes it to the exporter hook (if any).
+
+        :return: The statistics.
+        :rtype: dict
+        """
+        snapshot = self.stats()
+        if self.__exporter is not None:
+            self.__exporter(snapshot)
+        return snapshot
+
     def has_started(self) -> bool:
         """
         Checks if the pipeline has started.
@@ -0,0 +1,384 @@
+from typing import Any, Callable, Iterable
+
+from safethread.thread.utils.ThreadPipelineStage import ThreadPipelineStage
+
+
+class _Router:
+    """
+    Output "queue" of a stage connected to several stages: it routes the data
+    put by the stage threads into the input queues of the next stages.
+    """
+
+    def __init__(self, queues: list, routing: str, key: Callable[[Any], Any] | None):
+        super().__init__()
+
+        self.__queues = queues
+        self.__broadcast = routing == ThreadPipelineGraph.BROADCAST
+        self.__key = key
+
+    def __partition(self, item: Any) -> int:
+        """Returns the index of the queue of an item (partition routing)."""
+        key = item if self.__key is None else self.__key(item)
+        return hash(key) % len(self.__queues)
+
+    def _get_input_queue(self) -> Any:
+        """Allows the router to be passed to ``ThreadPipelineStage.connect_output()``."""
+        return self
+
+    def put(self, item: Any, block: bool = True, timeout: float | None = None):
+        if self.__broadcast:
+            for q in self.__queues:
+                q.put(item, block, timeout)
+            return
+        self.__queues[self.__partition(item)].put(item, block, timeout)
+
+    def put_many(self, items: Iterable, block: bool = True, timeout: float | None = None):
+        items = list(items)
+        if self.__broadcast:
+            for q in self.__queues:
+                q.put_many(items, block, timeout)
+            return
+        # one put_many() per partition, keeping the relative order of the items
+        partitions: dict[int, list] = {}
+        for item in items:
+            partitions.setdefault(self.__partition(item), []).append(item)
+        for index, partition in partitions.items():
+            self.__queues[index].put_many(partition, block, timeout)
+
+    def shutdown(self, immediate: bool = False):
+        for q in self.__queues:
+            q.shutdown(immediate)
+
+
+class ThreadPipelineGraph:
+    """
+    A processing pipeline whose `ThreadPipelineStage` instances form a directed acyclic graph (DAG).
+
+    Unlike ``ThreadPipeline`` (a linear chain), a stage can feed several stages (fan-out), and
+    several stages can feed the same stage (fan-in: their outputs are merged into its input queue).
+
+    Fan-out routing:
+    - **BROADCAST**: every output data is put into the input of all the next stages.
+    - **PARTITION**: each output data goes to one of the next stages, chosen by `hash(key(data))`.
+      Data with the same key always goes to the same stage, so their order is kept, as long as
+      the stages involved keep the order (one thread, or `ordered=True`).
+
+    Data enters the graph through its sources (stages without upstream), and leaves it through its
+    sinks (stages without downstream).
+
+    **Example:**
+
+    ```python
+    graph = ThreadPipelineGraph()
+    graph.add_stage("parse", ThreadPipelineStage(parse))
+    graph.add_stage("even", ThreadPipelineStage(handle))
+    graph.add_stage("odd", ThreadPipelineStage(handle))
+    graph.add_stage("merge", ThreadPipelineStage(store))
+    graph.connect("parse", ["even", "odd"], routing=ThreadPipelineGraph.PARTITION, key=lambda x: x % 2)
+    graph.connect("even", "merge")
+    graph.connect("odd", "merge")
+
+    graph.start()
+    graph.put(data)            # into "parse"
+    result = graph.get()       # from "merge"
+    ```
+    """
+
+    BROADCAST = "broadcast"
+    """Fan-out routing: put each data into all the next stages"""
+
+    PARTITION = "partition"
+    """Fan-out routing: put each data into one of the next stages, chosen by the hash of its key"""
+
+    ROUTINGS = (BROADCAST, PARTITION)
+    """Available fan-out routings"""
+
+    def __init__(self):
+        """
+        Initializes an empty pipeline graph.
+        """
+        super().__init__()
+
+        self.__started = False
+        self.__stages: dict[str, ThreadPipelineStage] = {}
+        self.__edges: dict[str, list[str]] = {}
+        self.__upstreams: dict[str, list[str]] = {}
+
+    def __check_name(self, name: str) -> ThreadPipelineStage:
+        """
+        Gets a stage by its name.
+
+        :raises ValueError: If there is no stage with that name.
+        """
+        if name not in self.__stages:
+            raise ValueError(f"Unknown pipeline stage '{name}'")
+        return self.__stages[name]
+
+    def __reaches(self, begin: str, end: str) -> bool:
+        """Checks if there is a path from stage `begin` to stage `end`."""
+        pending = [begin]
+        visited = set()
+        while pending:
+            name = pending.pop()
+            if name == end:
+                return True
+            if name in visited:
+                continue
+            visited.add(name)
+            pending.extend(self.__edges[name])
+        return False
+
+    def __single(self, names: list[str], kind: str) -> ThreadPipelineStage:
+        """
+        Gets the stage of a single source / sink.
+
+        :raises RuntimeError: If the graph does not have exactly one source / sink.
+        """
+        if len(names) != 1:
+            raise RuntimeError(
+                f"Pipeline graph has {len(names)} {kind}s, the stage name is required")
+        return self.__stages[names[0]]
+
+    def add_stage(self, name: str, stage: ThreadPipelineStage) -> ThreadPipelineStage:
+        """
+        Adds a pipeline stage to the graph.
+
+        :param name: The name of the stage (unique in the graph).
+        :type name: str
+
+        :param stage: The pipeline stage.
+        :type stage: ThreadPipelineStage
+
+        :return: The pipeline stage.
+        :rtype: ThreadPipelineStage
+
+        :raises TypeError: If `stage` is not a ThreadPipelineStage.
+        :raises ValueError: If a stage with the same name already exists.
+        :raises RuntimeError: If the graph has already started.
+        """
+        if self.__started:
+            raise RuntimeError("Cannot add stages to a started pipeline graph")
+        ThreadPipelineStage.is_instance(stage)
+        if name in self.__stages:
+            raise ValueError(f"Pipeline stage '{name}' already exists")
+        self.__stages[name] = stage
+        self.__edges[name] = []
+        self.__upstreams[name] = []
+        return stage
+
+    def connect(self, source: str, targets: str | Iterable[str], routing: str = BROADCAST,
+                key: Callable[[Any], Any] | None = None):
+        """
+        Connects the output of a stage to the input of one or more stages.
+
+        All the next stages of a stage are connected in a single call (its output can be connected only once).
+
+        :param source: The name of the stage whose output is connected.
+        :type source: str
+
+        :param targets: The name(s) of the next stage(s).
+        :type targets: str | Iterable[str]
+
+        :param routing: The fan-out routing (one of `ROUTINGS`). Defaults to BROADCAST.
+        :type routing: str, optional
+
+        :param key: In PARTITION routing, the function that returns the key of a data. Defaults to None (the data itself).
+        :type key: Callable[[Any], Any], optional
+
+        :raises ValueError: If a stage name is unknown or repeated, the routing is invalid,
+                            or the connection would create a cycle.
+        :raises RuntimeError: If the source output is already connected, or the graph has already started.
+        """
+        if self.__started:
+            raise RuntimeError("Cannot connect stages of a started pipeline graph")
+        if routing not in ThreadPipelineGraph.ROUTINGS:
+            raise ValueError(
+                f"Invalid routing '{routing}' (must be one of {ThreadPipelineGraph.ROUTINGS})")
+        if isinstance(targets, str):
+            targets = [targets]
+        targets = list(targets)
+        stage = self.__check_name(source)
+        next_stages = [self.__check_name(target) for target in targets]
+        if not targets or len(set(targets)) != len(targets):
+            raise ValueError("Targets must be a non-empty list of distinct stages")
+        if self.__edges[source]:
+            raise RuntimeError(f"Output of pipeline stage '{source}' is already connected")
+        for target in targets:
+            if self.__reaches(target, source):
+                raise ValueError(
+                    f"Connecting '{source}' to '{target}' would create a cycle")
+
+        if len(next_stages) == 1:
+            stage.connect_output(next_stages[0])
+        else:
+            stage.connect_output(_Router(  # type: ignore
+                [next_stage._get_input_queue() for next_stage in next_stages], routing, key))
+        self.__edges[source] = targets
+        for target in targets:
+            self.__upstreams[target].append(source)
+
+    def get_stage(self, name: str) -> ThreadPipelineStage:
+        """
+        Gets a pipeline stage by its name.
+
+        :raises ValueError: If there is no stage with that name.
+        """
+        return self.__check_name(name)
+
+    def get_sources(self) -> list[str]:
+        """Returns the names of the stages without upstream (graph inputs)."""
+        return [name for name, upstreams in self.__upstreams.items() if not upstreams]
+
+    def get_sinks(self) -> list[str]:
+        """Returns the names of the stages without downstream (graph outputs)."""
+        return [name for name, edges in self.__edges.items() if not edges]
+
+    def get_topological_order(self) -> list[str]:
+        """
+        Returns the names of the stages in topological order (each stage comes before its next stages).
+
+        :return: The stage names.
+        :rtype: list[str]
+        """
+        in_degree = {name: len(upstreams)
+                     for name, upstreams in self.__upstreams.items()}
+        pending = [name for name, degree in in_degree.items() if degree == 0]
+        order = []
+        while pending:
+            name = pending.pop(0)
+            order.append(name)
+            for target in self.__edges[name]:
+                in_degree[target] -= 1
+                if in_degree[target] == 0:
+                    pending.append(target)
+        return order
+
+    def get_depths(self) -> dict[str, int]:
+        """
+        Gets the current number of data in the input queue of each stage.
+
+        :return: The queue depth of each stage, by name.
+        :rtype: dict[str, int]
+        """
+        return {name: stage.get_depth() for name, stage in self.__stages.items()}
+
+    def get(self, block: bool = True, timeout: float | None = None, stage: str | None = None):
+        """
+        Retrieves processed data from a sink of the graph.
+
+        :param block: If True, waits for data to become available. Defaults to True.
+        :type block: bool, optional
+        :param timeout: Maximum wait time for data retrieval. Defaults to None.
+        :type timeout: float | None, optional
+        :param stage: The name of the sink stage. Defaults to None (the only sink of the graph).
+        :type stage: str, optional
+
+        :return: The processed data.
+        :rtype: Any
+
+        :raises EmptyException: If `block=True` and timeout is exceeded, or if `block=False` and no output is available.
+        :raises ValueError: If the stage name is unknown.
+        :raises RuntimeError: If `stage` is None and the graph does not have exactly one sink.
+        """
+        if stage is None:
+            sink = self.__single(self.get_sinks(), "sink")
+        else:
+            sink = self.__check_name(stage)
+        return sink.get(block=block, timeout=timeout)
+
+    def put(self, input: Any, block: bool = True, timeout: float | None = None, stage: str | None = None):
+        """
+        Sends data into a source of the graph for processing.
+
+        :param input: The data to be processed.
+        :type input: Any
+        :param block: If True, waits until space is available in the input queue. Defaults to True.
+        :type block: bool, optional
+        :param timeout: Maximum wait time for insertion. Defaults to None.
+        :type timeout: float | None, optional
+        :param stage: The name of the source stage. Defaults to None (the only source of the graph).
+        :type stage: str, optional
+
+        :raises FullException: If `block=True` and timeout is exceeded, or if `block=False` and there is no available space in the input queue.
+        :raises StoppedException: If the graph has stopped.
+        :raises ValueError: If the stage name is unknown.
+        :raises RuntimeError: If `stage` is None and the graph does not have exactly one source.
+        """
+        if stage is None:
+            source = self.__single(self.get_sources(), "source")
+        else:
+            source = self.__check_name(stage)
+        source.put(input, block=block, timeout=timeout)
+
+    def has_started(self) -> bool:
+        """
+        Checks if the pipeline graph has started.
+
+        :return: True if the pipeline graph has started, otherwise False.
+        :rtype: bool
+        """
+        return self.__started
+
+    def is_alive(self) -> bool:
+        """
+        Checks if all pipeline stages are alive.
+
+        :return: True if all pipeline stages are alive, otherwise False.
+        :rtype: bool
+        """
+        for stage in self.__stages.values():
+            if not stage.is_alive():
+                return False
+        return True
+
+    def is_terminated(self) -> bool:
+        """
+        Checks if the pipeline graph has terminated.
+
+        :return: True if the pipeline graph HAS started and is NOT alive, otherwise False.
+        :rtype: bool
+        """
+        return self.has_started() and not self.is_alive()
+
+    def start(self):
+        """
+        Starts all pipeline stages (the next stages first).
+
+        :raises RuntimeError: If start() is called more than once, or the graph is empty.
+        """
+        if self.__started:
+            raise RuntimeError("Pipeline graph has already been started.")
+        if not self.__stages:
+            raise RuntimeError("Cannot start an empty pipeline graph")
+        for name in reversed(self.get_topological_order()):
+            self.__stages[name].start()
+        self.__started = True
+
+    def stop(self):
+        """Stops all pipeline stages."""
+        for name in self.get_topological_order():
+            self.__stages[name].stop()
+
+    def join(self, timeout: float | None = None):
+        """
+        Waits for all pipeline stages to complete execution.
+
+        :param timeout: The maximum time to wait for each pipeline stage to finish. Defaults to None.
+        :type timeout: float, optional
+
+        :raises RuntimeError: If join() is called before start().
+        """
+        for stage in self.__stages.values():
+            stage.join(timeout=timeout)
+
+    def stop_join(self, timeout: float | None = None):
+        """
+        Calls stop() and join() to stop the pipeline graph and wait for its stages to finish.
+
+        :param timeout: The maximum time to wait for stages to finish. Defaults to None.
+        :type timeout: float, optional
+
+        :raises RuntimeError: If join() is called before start().
+        """
+        self.stop()
+        self.join(timeout=timeout)
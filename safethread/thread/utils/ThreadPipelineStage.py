@@ -1,9 +1,166 @@
 
+import bisect
 import queue
+import threading
+import time
 
-from typing import Any, Callable, Self
+from typing import Any, Callable, Iterable, Protocol, Self
 
 from safethread.thread.BaseThread import BaseThread
+from safethread.thread.datatype.ThreadSafeQueue import ThreadSafeQueue
+
+
+class _StageInput(Protocol):
+    """Interface of a stage that can be connected to the output of a ``ThreadPipelineStage`` (e.g., ``ProcessPipelineStage``)"""
+
+    def _get_input_queue(self) -> Any:
+        """Gets the input queue of the stage."""
+        raise NotImplementedError("Method not OVERLOADED")
+
+
+class _Histogram:
+    """
+    A latency histogram (in seconds), with exponential buckets (1 us, 2 us, 4 us, ... ~134 s, +inf).
+
+    It is updated by a single worker thread (no lock), and merged into a snapshot by `ThreadPipelineStage.stats()`.
+    """
+
+    BOUNDS = tuple(1e-6 * 2 ** i for i in range(28))
+    """Upper bounds of the buckets (the last bucket has no bound)"""
+
+    def __init__(self):
+        super().__init__()
+
+        self.counts = [0] * (len(_Histogram.BOUNDS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.min = float("inf")
+        self.max = 0.0
+
+    def add(self, value: float):
+        self.counts[bisect.bisect_left(_Histogram.BOUNDS, value)] += 1
+        self.count += 1
+        self.total += value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    @staticmethod
+    def snapshot(histograms: Iterable["_Histogram"]) -> dict:
+        """
+        Merges histograms into a snapshot (percentiles are the upper bound of their bucket).
+
+        :return: A dict with count, mean, min, max, p50, p90, p99 and buckets (list of (upper_bound, count)).
+        :rtype: dict
+        """
+        counts = [0] * (len(_Histogram.BOUNDS) + 1)
+        count, total, min_value, max_value = 0, 0.0, float("inf"), 0.0
+        for histogram in histograms:
+            for i, value in enumerate(histogram.counts):
+                counts[i] += value
+            count += histogram.count
+            total += histogram.total
+            min_value = min(min_value, histogram.min)
+            max_value = max(max_value, histogram.max)
+
+        def percentile(q: float) -> float:
+            if not count:
+                return 0.0
+            cumulative = 0
+            for bound, value in zip(_Histogram.BOUNDS, counts):
+                cumulative += value
+                if cumulative >= q * count:
+                    return min(bound, max_value)
+            return max_value
+
+        return {
+            "count": count,
+            "mean": total / count if count else 0.0,
+            "min": min_value if count else 0.0,
+            "max": max_value,
+            "p50": percentile(0.5),
+            "p90": percentile(0.9),
+            "p99": percentile(0.99),
+            "buckets": [(bound, value) for bound, value
+                        in zip(_Histogram.BOUNDS + (float("inf"),), counts) if value],
+        }
+
+
+class _WorkerStats:
+    """Counters of a pipeline stage thread (updated by that thread only, so without lock)."""
+
+    def __init__(self):
+        super().__init__()
+
+        self.items_in = 0
+        self.items_out = 0
+        self.errors = 0
+        self.busy_time = 0.0
+        self.idle_time = 0.0
+        self.callback_latency = _Histogram()
+        self.queue_wait = _Histogram()
+
+    def snapshot(self) -> dict:
+        return {
+            "items_in": self.items_in,
+            "items_out": self.items_out,
+            "errors": self.errors,
+            "busy_time": self.busy_time,
+            "idle_time": self.idle_time,
+        }
+
+
+class _StageQueue(ThreadSafeQueue):
+    """
+    A ThreadSafeQueue used as input / output of a pipeline stage. When bounded, a full queue
+    applies the backpressure policy of the stage (see ``ThreadPipelineStage``).
+
+    It also tracks its high-watermark (approximate, read without the queue mutex in the blocking policies)
+    and the number of dropped items. If `timed`, items are stored as (put time, item) tuples.
+    """
+
+    def __init__(self, maxsize: int, policy: str, timed: bool = False):
+        super().__init__(maxsize)
+        self.policy = policy
+        self.timed = timed
+        self.high_watermark = 0
+        self.dropped = 0
+
+    def put(self, item: Any, block: bool = True, timeout: float | None = None):
+        if self.timed:
+            item = (time.perf_counter(), item)
+        q = self._data
+        if q.maxsize <= 0 or self.policy in (ThreadPipelineStage.BLOCK, ThreadPipelineStage.RAISE):
+            q.put(item, block, timeout)
+            size = len(q.queue)
+            if size > self.high_watermark:
+                self.high_watermark = size
+            return
+        with q.not_full:
+            if q.is_shutdown:
+                raise queue.ShutDown
+            if q._qsize() >= q.maxsize:
+                self.dropped += 1
+                if self.policy == ThreadPipelineStage.DROP_NEWEST:
+                    return
+                q._get()
+                q.unfinished_tasks -= 1
+            q._put(item)
+            q.unfinished_tasks += 1
+            q.not_empty.notify()
+            self.high_watermark = max(self.high_watermark, q._qsize())
+
+    def put_many(self, items: Iterable, block: bool = True, timeout: float | None = None):
+        if self._data.maxsize <= 0 or self.policy in (ThreadPipelineStage.BLOCK, ThreadPipelineStage.RAISE):
+            if self.timed:
+                now = time.perf_counter()
+                items = [(now, item) for item in items]
+            super().put_many(items, block, timeout)
+            self.high_watermark = max(self.high_watermark, len(self._data.queue))
+            return
+        for item in items:
+            self.put(item)
 
 
 class ThreadPipelineStage:
@@ -16,6 +173,28 @@ class ThreadPipelineStage:
     queue. This can be useful for concurrent processing of tasks in a pipeline
     fashion.
 
+    In ordered mode (`ordered=True`), data gets a sequence number when it leaves the input queue,
+    and results are released from a reorder buffer in sequence, so the output keeps the input order.
+    A thread does not process data more than `reorder_window` positions ahead of the oldest pending data,
+    which bounds the reorder buffer memory.
+
+    In micro-batching mode (`batch_size` > 1), each thread drains up to `batch_size` items
+    (waiting at most `max_latency` seconds after the first one), and calls the callback once
+    with the list of items. The callback returns a list of results (one per item, in the same order),
+    and the results are put into the output queue in that order.
+
+    With a bounded input queue (`maxsize` > 0), the backpressure `policy` defines what happens
+    when data is put into a full queue:
+    - **BLOCK**: wait for a free slot (default).
+    - **DROP_OLDEST**: discard the oldest queued data to make room.
+    - **DROP_NEWEST**: discard the new data.
+    - **RAISE**: `put()` raises FullException immediately (between stages, the previous stage waits for a free slot).
+
+    With `collect_stats=True`, each thread counts its input / output data, callback errors, and
+    busy (callback) / idle (waiting for data) time, and records latency histograms of the callback
+    duration and of the queue wait (from `put()` to the callback call). See `stats()` and `set_exporter()`.
+    When disabled (default), the only cost is a few checks per data.
+
     The pipeline runs indefinitely until :meth:`stop()` is called.
 
     :param callback: The function (or callable) that processes input data and 
@@ -46,6 +225,21 @@ class ThreadPipelineStage:
     StoppedException = queue.ShutDown
     """Raised when put()/get() is called after Pipeline.stop()"""
 
+    BLOCK = "block"
+    """Backpressure policy: wait for a free slot in the full queue"""
+
+    DROP_OLDEST = "drop_oldest"
+    """Backpressure policy: discard the oldest data of the full queue"""
+
+    DROP_NEWEST = "drop_newest"
+    """Backpressure policy: discard the data put into the full queue"""
+
+    RAISE = "raise"
+    """Backpressure policy: raise FullException when data is put into the full queue"""
+
+    POLICIES = (BLOCK, DROP_OLDEST, DROP_NEWEST, RAISE)
+    """Available backpressure policies"""
+
     @staticmethod
     def is_instance(obj: Any):
         """
@@ -63,24 +257,55 @@ class ThreadPipelineStage:
             raise TypeError("Object is not a Pipeline Stage.")
         return obj
 
-    def __init__(self, callback: Callable[[Any], Any], n_threads: int = 1):
+    def __init__(self, callback: Callable[[Any], Any], n_threads: int = 1, batch_size: int = 1, max_latency: float | None = None,
+                 maxsize: int = 0, policy: str = BLOCK, ordered: bool = False, reorder_window: int = 1024,
+                 collect_stats: bool = False):
         """
         Initializes the pipeline stage with a callback function.
 
         :param callback: The function to process data through the pipeline stage. Accepts one data argument, and returns an output data.
+                         In micro-batching mode, accepts a list of data, and returns a list of output data (same length and order).
         :type callback: Callable[[Any],Any]
 
         :param n_threads: Number of threads that will read the input queue, and 
                           store result in the output queue. Defaults to 1.
         :type n_threads: int
 
+        :param batch_size: Maximum number of items passed to each callback call. Defaults to 1 (no batching).
+        :type batch_size: int, optional
+
+        :param max_latency: In micro-batching mode, maximum time (in seconds) to wait for more items after the
+                            first item of a batch. Defaults to None (only the items already queued are batched).
+        :type max_latency: float, optional
+
+        :param maxsize: Maximum number of data in the input (and output) queue. Defaults to 0 (unbounded).
+        :type maxsize: int, optional
+
+        :param policy: The backpressure policy of a full queue (one of `POLICIES`). Defaults to BLOCK.
+        :type policy: str, optional
+
+        :param ordered: If True, output data keeps the input order (even with `n_threads` > 1). Defaults to False (completion order).
+        :type ordered: bool, optional
+
+        :param reorder_window: In ordered mode, maximum number of data a thread can be ahead of the oldest data still
+                               being processed (it bounds the results waiting in the reorder buffer). Defaults to 1024.
+        :type reorder_window: int, optional
+
+        :param collect_stats: If True, collect throughput and latency statistics (see `stats()`). Defaults to False.
+        :type collect_stats: bool, optional
+
         :raises TypeError: If the callback argument is not callable.
-        :raises ValueError: If `n_threads` is less than 1.
+        :raises ValueError: If `n_threads`, `batch_size` or `reorder_window` is less than 1, `max_latency` or `maxsize` is negative, or `policy` is invalid.
         """
         super().__init__()
 
-        self.__input_queue = queue.Queue()
-        self.__output_queue = queue.Queue()
+        if maxsize < 0:
+            raise ValueError("'maxsize' must be a non-negative number")
+        self.__check_policy(policy)
+        self.__policy = policy
+        self.__input_queue = _StageQueue(maxsize, policy, timed=collect_stats)
+        self.__own_output_queue = _StageQueue(maxsize, policy)
+        self.__output_queue: Any = self.__own_output_queue
         self.__started = False
         self.__threads: list[BaseThread] = []
 
@@ -93,32 +318,392 @@ class ThreadPipelineStage:
         if n_threads < 1:
             raise ValueError(
                 "At least one thread is needed to run PipelineStage")
-
+        if batch_size < 1:
+            raise ValueError("'batch_size' must be at least 1")
+        if max_latency is not None and max_latency < 0:
+            raise ValueError("'max_latency' must be a non-negative number")
+
+        self.__batch_size = batch_size
+        self.__max_latency = max_latency
+        self.__batch_lock = threading.Lock()
+        self.__batch_stats = {
+            "batches": 0,
+            "items": 0,
+            "max_batch_size": 0,
+            "callback_time": 0.0,
+        }
+
+        if reorder_window < 1:
+            raise ValueError("'reorder_window' must be at least 1")
+        self.__ordered = ordered
+        self.__reorder_window = reorder_window
+        # sequence numbers are assigned when data leaves the input queue (under __take_lock),
+        # so data dropped by the backpressure policy never leaves a gap
+        self.__take_lock = threading.Lock()
+        self.__reorder = threading.Condition()
+        self.__emit_lock = threading.Lock()
+        self.__reorder_buffer: dict[int, tuple[int, list]] = {}
+        self.__next_in = 0
+        self.__next_out = 0
+        self.__stopped = False
+
+        self.__worker_stats: list[_WorkerStats] = []
+        self.__exporter: Callable[[dict], Any] | None = None
+
+        run = self.__run_batch if batch_size > 1 else self.__run_pipeline
         for i in range(n_threads):
+            stats = None
+            if collect_stats:
+                stats = _WorkerStats()
+                self.__worker_stats.append(stats)
             self.__threads.append(
-                BaseThread(self.__run_pipeline, repeat=True)
+                BaseThread(run, args=[stats], repeat=True)
             )
 
-    def __run_pipeline(self) -> bool:
+    def __run_pipeline(self, stats: _WorkerStats | None) -> bool:
         """
         Method to be executed in the thread. It gets data from the input queue,
         processes it through the callback function, and puts the result into
         the output queue.
 
+        :param stats: The counters of the thread (None if statistics are disabled).
+        :type stats: _WorkerStats | None
+
         :raises PipelineStage.FullException: If the output queue is full (no available slot to store output).
 
         :return: True to keep pipeline thread running, False otherwise
         :rtype: bool
         """
         try:
-            input_data = self.__input_queue.get()
-            output_data = self.__callback(input_data)
-            self.__output_queue.put(output_data)
+            if stats is None and not self.__ordered:
+                input_data = self.__input_queue.get()
+                output_data = self.__callback(input_data)
+                self.__output_queue.put(output_data)
+                return True
+            if stats is not None:
+                begin = time.perf_counter()
+            seq = 0
+            if self.__ordered:
+                with self.__take_lock:
+                    input_data = self.__input_queue.get()
+                    seq = self.__next_in
+                    self.__next_in += 1
+                self.__wait_turn(seq)
+            else:
+                input_data = self.__input_queue.get()
+            if stats is not None:
+                start = time.perf_counter()
+                put_time, input_data = input_data
+                stats.items_in += 1
+                stats.idle_time += start - begin
+                stats.queue_wait.add(start - put_time)
+            try:
+                output_data = self.__callback(input_data)
+            except BaseException:
+                if stats is not None:
+                    stats.errors += 1
+                    self.__add_busy(stats, time.perf_counter() - start)
+                if self.__ordered:
+                    # skip the slot, so later results are not stuck in the reorder buffer
+                    self.__release(seq, [], 1)
+                raise
+            if stats is not None:
+                self.__add_busy(stats, time.perf_counter() - start)
+            if self.__ordered:
+                self.__release(seq, [output_data], 1)
+            else:
+                self.__output_queue.put(output_data)
+            if stats is not None:
+                stats.items_out += 1
+            return True
+        except queue.ShutDown as e:
+            self.stop()
+            return False
+
+    @staticmethod
+    def __add_busy(stats: _WorkerStats, elapsed: float):
+        """Records the duration of a callback call in the thread counters."""
+        stats.busy_time += elapsed
+        stats.callback_latency.add(elapsed)
+
+    def __wait_turn(self, seq: int):
+        """
+        In ordered mode, waits until the data `seq` is inside the reorder window.
+
+        :raises queue.ShutDown: If the pipeline stage is stopped while waiting.
+        """
+        with self.__reorder:
+            while seq - self.__next_out >= self.__reorder_window:
+                if self.__stopped:
+                    raise queue.ShutDown
+                self.__reorder.wait()
+
+    def __release(self, seq: int, output_data: list, count: int):
+        """
+        In ordered mode, stores the results of the `count` data starting at `seq` in the reorder buffer,
+        and puts the results that are next in sequence into the output queue.
+        """
+        with self.__reorder:
+            self.__reorder_buffer[seq] = (count, output_data)
+        # the output queue may block (bounded), so results are put outside of __reorder:
+        # __emit_lock keeps them in sequence, and its holder also puts the results released meanwhile
+        with self.__emit_lock:
+            with self.__reorder:
+                ready = []
+                while self.__next_out in self.__reorder_buffer:
+                    count, output_data = self.__reorder_buffer.pop(
+                        self.__next_out)
+                    ready.extend(output_data)
+                    self.__next_out += count
+                self.__reorder.notify_all()
+            if ready:
+                self.__output_queue.put_many(ready)
+
+    @staticmethod
+    def __check_policy(policy: str):
+        """
+        Checks a backpressure policy.
+
+        :raises ValueError: If the policy is not one of `POLICIES`.
+        """
+        if policy not in ThreadPipelineStage.POLICIES:
+            raise ValueError(
+                f"Invalid backpressure policy '{policy}' (must be one of {ThreadPipelineStage.POLICIES})")
+
+    def __get_batch(self) -> list:
+        """
+        Gets a batch of data from the input queue: it waits for the first item, then
+        gets up to `batch_size` items (waiting at most `max_latency` seconds for them).
+
+        :raises queue.ShutDown: If the input queue has been shut down.
+
+        :return: The batch of input data.
+        :rtype: list
+        """
+        batch = self.__input_queue.get_many(self.__batch_size)
+        if self.__max_latency is None:
+            return batch
+        deadline = time.monotonic() + self.__max_latency
+        while len(batch) < self.__batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.extend(self.__input_queue.get_many(
+                    self.__batch_size - len(batch), timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def __run_batch(self, stats: _WorkerStats | None) -> bool:
+        """
+        Method to be executed in the thread, in micro-batching mode. It gets a batch of data from
+        the input queue, processes it through the callback function, and puts the results into
+        the output queue (in order).
+
+        :param stats: The counters of the thread (None if statistics are disabled).
+        :type stats: _WorkerStats | None
+
+        :raises ValueError: If the callback does not return one result per input data.
+
+        :return: True to keep pipeline thread running, False otherwise
+        :rtype: bool
+        """
+        try:
+            if stats is not None:
+                wait_begin = time.perf_counter()
+            seq = 0
+            if self.__ordered:
+                with self.__take_lock:
+                    batch = self.__get_batch()
+                    seq = self.__next_in
+                    self.__next_in += len(batch)
+                self.__wait_turn(seq)
+            else:
+                batch = self.__get_batch()
+            begin = time.perf_counter()
+            if stats is not None:
+                for put_time, _ in batch:
+                    stats.queue_wait.add(begin - put_time)
+                batch = [input_data for _, input_data in batch]
+                stats.items_in += len(batch)
+                stats.idle_time += begin - wait_begin
+            try:
+                output_data = list(self.__callback(batch))
+                if len(output_data) != len(batch):
+                    raise ValueError(
+                        f"Batch callback returned {len(output_data)} results for {len(batch)} inputs")
+            except BaseException:
+                if stats is not None:
+                    stats.errors += 1
+                    self.__add_busy(stats, time.perf_counter() - begin)
+                if self.__ordered:
+                    # skip the slots, so later results are not stuck in the reorder buffer
+                    self.__release(seq, [], len(batch))
+                raise
+            elapsed = time.perf_counter() - begin
+            if stats is not None:
+                self.__add_busy(stats, elapsed)
+            with self.__batch_lock:
+                batch_stats = self.__batch_stats
+                batch_stats["batches"] += 1
+                batch_stats["items"] += len(batch)
+                batch_stats["max_batch_size"] = max(
+                    batch_stats["max_batch_size"], len(batch))
+                batch_stats["callback_time"] += elapsed
+            if self.__ordered:
+                self.__release(seq, output_data, len(batch))
+            else:
+                self.__output_queue.put_many(output_data)
+            if stats is not None:
+                stats.items_out += len(output_data)
             return True
         except queue.ShutDown as e:
             self.stop()
             return False
 
+    def get_reorder_buffer_size(self) -> int:
+        """Returns the number of results waiting in the reorder buffer (ordered mode)."""
+        with self.__reorder:
+            return sum(len(data) for _, data in self.__reorder_buffer.values())
+
+    def get_batch_size(self) -> int:
+        """Returns the maximum number of items per callback call (1 if micro-batching is disabled)."""
+        return self.__batch_size
+
+    def get_batch_stats(self) -> dict:
+        """
+        Gets the micro-batching metrics of the stage (all zero if `batch_size` is 1).
+
+        Keys:
+        - **batches**: Number of batches processed.
+        - **items**: Number of items processed.
+        - **avg_batch_size**: Average number of items per batch.
+        - **max_batch_size**: Largest batch processed.
+        - **avg_callback_time**: Average duration (seconds) of a callback call.
+
+        :return: The metrics.
+        :rtype: dict
+        """
+        with self.__batch_lock:
+            stats = dict(self.__batch_stats)
+        batches = stats["batches"]
+        return {
+            "batches": batches,
+            "items": stats["items"],
+            "avg_batch_size": stats["items"] / batches if batches else 0.0,
+            "max_batch_size": stats["max_batch_size"],
+            "avg_callback_time": stats["callback_time"] / batches if batches else 0.0,
+        }
+
+    def stats(self) -> dict:
+        """
+        Gets a snapshot of the stage statistics (counters are zero if `collect_stats` is False):
+
+        - **enabled**: True if statistics are collected.
+        - **items_in** / **items_out**: Data taken from the input queue / results put into the output.
+        - **errors**: Callback calls that raised an exception.
+        - **depth**, **high_watermark**, **dropped**: Input queue depth, highest depth, and dropped data.
+        - **busy_time** / **idle_time**: Seconds spent by all threads in the callback / waiting for data.
+        - **utilization**: `busy_time / (busy_time + idle_time)` (0.0 before any data).
+        - **callback_latency**: Histogram of the callback duration (one entry per call).
+        - **queue_wait**: Histogram of the time from `put()` to the callback call (one entry per data).
+        - **threads**: Counters of each thread (items_in, items_out, errors, busy_time, idle_time).
+
+        Histograms are dicts with count, mean, min, max, p50, p90, p99 (seconds),
+        and buckets (list of (upper_bound, count)).
+
+        :return: The statistics.
+        :rtype: dict
+        """
+        threads = [stats.snapshot() for stats in self.__worker_stats]
+        busy_time = sum(thread["busy_time"] for thread in threads)
+        idle_time = sum(thread["idle_time"] for thread in threads)
+        return {
+            "enabled": bool(self.__worker_stats),
+            "items_in": sum(thread["items_in"] for thread in threads),
+            "items_out": sum(thread["items_out"] for thread in threads),
+            "errors": sum(thread["errors"] for thread in threads),
+            "depth": self.get_depth(),
+            "high_watermark": self.get_high_watermark(),
+            "dropped": self.get_dropped_count(),
+            "busy_time": busy_time,
+            "idle_time": idle_time,
+            "utilization": busy_time / (busy_time + idle_time) if busy_time + idle_time else 0.0,
+            "callback_latency": _Histogram.snapshot(stats.callback_latency for stats in self.__worker_stats),
+            "queue_wait": _Histogram.snapshot(stats.queue_wait for stats in self.__worker_stats),
+            "threads": threads,
+        }
+
+    def set_exporter(self, exporter: Callable[[dict], Any] | None):
+        """
+        Sets the exporter hook, called by `export()` with the `stats()` snapshot
+        (e.g., to send it to a metrics backend). Use a ``SchedulerThread`` to export periodically.
+
+        :param exporter: The exporter, or None to remove it.
+        :type exporter: Callable[[dict], Any] | None
+
+        :raises TypeError: If the exporter is not callable.
+        """
+        if exporter is not None and not callable(exporter):
+            raise TypeError("'exporter' is not callable")
+        self.__exporter = exporter
+
+    def export(self) -> dict:
+        """
+        Takes a `stats()` snapshot, and passes it to the exporter hook (if any).
+
+        :return: The statistics.
+        :rtype: dict
+        """
+        snapshot = self.stats()
+        if self.__exporter is not None:
+            self.__exporter(snapshot)
+        return snapshot
+
+    def get_depth(self) -> int:
+        """Returns the current number of data in the input queue."""
+        return self.__input_queue.qsize()
+
+    def get_dropped_count(self) -> int:
+        """Returns the number of data discarded by the input queue (DROP_OLDEST / DROP_NEWEST policies)."""
+        return self.__input_queue.dropped
+
+    def get_high_watermark(self) -> int:
+        """Returns the highest number of data the input queue has held."""
+        return self.__input_queue.high_watermark
+
+    def get_maxsize(self) -> int:
+        """Returns the maximum size of the input queue (0 if unbounded)."""
+        return self.__input_queue.maxsize
+
+    def get_policy(self) -> str:
+        """Returns the backpressure policy of the stage."""
+        return self.__policy
+
+    def set_policy(self, policy: str):
+        """
+        Sets the backpressure policy of the stage (applied to its input and output queues).
+
+        :param policy: The backpressure policy (one of `POLICIES`).
+        :type policy: str
+
+        :raises ValueError: If the policy is invalid.
+        """
+        self.__check_policy(policy)
+        self.__policy = policy
+        self.__input_queue.policy = policy
+        self.__own_output_queue.policy = policy
+
+    def is_ordered(self) -> bool:
+        """
+        Checks if the stage keeps the input order of data (ordered mode).
+
+        :return: True if ordered, False otherwise.
+        :rtype: bool
+        """
+        return self.__ordered
+
     def has_started(self) -> bool:
         """
         Checks if the pipeline stage has started.
@@ -161,9 +746,11 @@ class ThreadPipelineStage:
         :type timeout: float or None, optional
 
         :raises FullException: If block is True and the timeout is exceeded, or if block is False and 
-                               there is no available space in the input queue.
+                               there is no available space in the input queue (or immediately, with the RAISE policy).
         :raises StoppedException: If the pipeline has stopped.
         """
+        if self.__policy == ThreadPipelineStage.RAISE:
+            block = False
         self.__input_queue.put(value, block, timeout)
 
     def get(self, block: bool = True, timeout: float | None = None):
@@ -183,14 +770,25 @@ class ThreadPipelineStage:
         """
         return self.__output_queue.get(block, timeout)
 
-    def connect_output(self, other_pipeline: Self):
+    def _get_input_queue(self) -> Any:
+        """
+        Gets the input queue of the stage (used to connect the output of a previous stage).
+
+        :return: The input queue.
+        :rtype: ThreadSafeQueue
+        """
+        return self.__input_queue
+
+    def connect_output(self, other_pipeline: Self | _StageInput):
         """
         Connects this Pipeline Stage output to the input of another pipeline.
 
+        The other stage can also be a ``ProcessPipelineStage`` (its input queue is process-safe).
+
         :param other_pipeline: Another pipeline stage.
-        :type other_pipeline: Self
+        :type other_pipeline: ThreadPipelineStage or ProcessPipelineStage
         """
-        self.__output_queue = other_pipeline.__input_queue
+        self.__output_queue = other_pipeline._get_input_queue()
 
     def start(self):
         """
@@ -212,7 +810,7 @@ class ThreadPipelineStage:
                 thread.stop()
             except:
                 pass
-        # prevent in/out queues from storing data
+        # prevent in/out queues from storing data (and wake up threads blocked on them)
         try:
             self.__input_queue.shutdown(immediate=True)
         except:
@@ -221,6 +819,10 @@ class ThreadPipelineStage:
             self.__output_queue.shutdown(immediate=True)
         except:
             pass
+        # wake up threads waiting for the reorder window
+        with self.__reorder:
+            self.__stopped = True
+            self.__reorder.notify_all()
 
     def join(self, timeout: float | None = None):
         """
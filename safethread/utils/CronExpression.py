@@ -0,0 +1,160 @@
+import bisect
+import calendar
+
+from datetime import MAXYEAR, date, datetime, timedelta
+
+
+class CronExpression:
+    """
+    A cron expression (5 fields: minute, hour, day of month, month, day of week), compiled once into the
+    sorted values of each field, so computing the next fire time only jumps between matching values.
+
+    Supported syntax (per field): `*`, `a`, `a-b`, `*/n`, `a-b/n`, lists (`a,b-c`), and month / weekday names
+    (`jan`...`dec`, `sun`...`sat`). Day of week is 0-6 (0 or 7 is Sunday). Aliases: `@yearly`, `@annually`,
+    `@monthly`, `@weekly`, `@daily`, `@midnight`, `@hourly`.
+
+    Like cron, if both the day of month and the day of week are restricted, a day matches either of them.
+
+    **Example:**
+
+    ```python
+    cron = CronExpression("*/15 9-17 * * mon-fri")
+    cron.next_fire(datetime(2025, 1, 3, 17, 50))  # datetime(2025, 1, 6, 9, 0)
+    ```
+    """
+
+    ALIASES = {
+        "@yearly": "0 0 1 1 *",
+        "@annually": "0 0 1 1 *",
+        "@monthly": "0 0 1 * *",
+        "@weekly": "0 0 * * 0",
+        "@daily": "0 0 * * *",
+        "@midnight": "0 0 * * *",
+        "@hourly": "0 * * * *",
+    }
+    """Cron expression aliases"""
+
+    __MONTHS = ("jan", "feb", "mar", "apr", "may", "jun",
+                "jul", "aug", "sep", "oct", "nov", "dec")
+    __WEEKDAYS = ("sun", "mon", "tue", "wed", "thu", "fri", "sat")
+
+    @staticmethod
+    def __parse_field(text: str, low: int, high: int, names: tuple[str, ...] = (), offset: int = 0) -> tuple[int, ...]:
+        """
+        Parses a field of a cron expression.
+
+        :raises ValueError: If the field is invalid.
+        """
+        def value(token: str) -> int:
+            token = token.lower()
+            if token in names:
+                return names.index(token) + offset
+            number = int(token)
+            if not low <= number <= high:
+                raise ValueError(f"Value {number} out of range {low}-{high}")
+            return number
+
+        values = set()
+        for part in text.split(","):
+            step = 1
+            if "/" in part:
+                part, step_text = part.split("/", 1)
+                step = int(step_text)
+                if step < 1:
+                    raise ValueError(f"Invalid step '{step_text}'")
+            if part == "*":
+                first, last = low, high
+            elif "-" in part:
+                first_text, last_text = part.split("-", 1)
+                first, last = value(first_text), value(last_text)
+            else:
+                first = last = value(part)
+                if step > 1:
+                    last = high
+            if first > last:
+                raise ValueError(f"Invalid range '{part}'")
+            values.update(range(first, last + 1, step))
+        return tuple(sorted(values))
+
+    def __init__(self, expression: str):
+        """
+        Compiles a cron expression.
+
+        :param expression: The cron expression (e.g., "*/5 * * * *"), or an alias (e.g., "@hourly").
+        :type expression: str
+
+        :raises ValueError: If the expression is invalid, or never matches (e.g., "0 0 30 2 *").
+        """
+        super().__init__()
+
+        self.__expression = expression
+        fields = self.ALIASES.get(expression.strip().lower(), expression).split()
+        if len(fields) != 5:
+            raise ValueError(
+                f"Cron expression '{expression}' must have 5 fields (minute hour day month weekday)")
+        try:
+            self.__minutes = self.__parse_field(fields[0], 0, 59)
+            self.__hours = self.__parse_field(fields[1], 0, 23)
+            self.__days = frozenset(self.__parse_field(fields[2], 1, 31))
+            self.__months = self.__parse_field(
+                fields[3], 1, 12, CronExpression.__MONTHS, 1)
+            # 7 is also Sunday
+            self.__weekdays = frozenset(day % 7 for day in self.__parse_field(
+                fields[4], 0, 7, CronExpression.__WEEKDAYS))
+        except ValueError as e:
+            raise ValueError(f"Invalid cron expression '{expression}': {e}")
+        self.__any_day = fields[2] == "*"
+        self.__any_weekday = fields[4] == "*"
+        # every field is valid, but the days may not exist (e.g., 30 February)
+        self.next_fire(datetime(2000, 1, 1))
+
+    def __str__(self) -> str:
+        return self.__expression
+
+    def __day_matches(self, year: int, month: int, day: int) -> bool:
+        """Checks if a day matches the day of month / day of week fields."""
+        in_days = day in self.__days
+        if self.__any_weekday:
+            return in_days
+        # datetime: Monday is 0, cron: Sunday is 0
+        in_weekdays = (date(year, month, day).weekday() + 1) % 7 in self.__weekdays
+        if self.__any_day:
+            return in_weekdays
+        return in_days or in_weekdays
+
+    def next_fire(self, after: datetime) -> datetime:
+        """
+        Computes the first fire time strictly after a given time.
+
+        :param after: The time to start from.
+        :type after: datetime
+
+        :return: The next fire time (same timezone as `after`, seconds set to 0).
+        :rtype: datetime
+
+        :raises ValueError: If the expression never matches (e.g., "0 0 30 2 *").
+        """
+        start = after.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        # 29 February may be 8 years away
+        for year in range(start.year, min(start.year + 9, MAXYEAR + 1)):
+            first_month = start.month if year == start.year else 1
+            for month in self.__months[bisect.bisect_left(self.__months, first_month):]:
+                same_month = (year, month) == (start.year, start.month)
+                first_day = start.day if same_month else 1
+                for day in range(first_day, calendar.monthrange(year, month)[1] + 1):
+                    if not self.__day_matches(year, month, day):
+                        continue
+                    same_day = same_month and day == start.day
+                    first_hour = start.hour if same_day else 0
+                    for hour in self.__hours[bisect.bisect_left(self.__hours, first_hour):]:
+                        first_minute = start.minute if same_day and hour == start.hour else 0
+                        i = bisect.bisect_left(self.__minutes, first_minute)
+                        if i < len(self.__minutes):
+                            return start.replace(year=year, month=month, day=day,
+                                                 hour=hour, minute=self.__minutes[i])
+        raise ValueError(
+            f"Cron expression '{self.__expression}' never matches")
+
+    def get_expression(self) -> str:
+        """Returns the cron expression."""
+        return self.__expression
@@ -0,0 +1,88 @@
+import gc
+import multiprocessing
+import unittest
+
+from safethread.process.datatype import ProcessManagerPool, ProcessSafeDict, ProcessSafeList
+
+
+def worker(lst: ProcessSafeList, value: int):
+    lst.append(value)
+
+
+class TestProcessManagerPool(unittest.TestCase):
+
+    def setUp(self):
+        ProcessManagerPool.shutdown(force=True)
+        ProcessManagerPool.set_size(1)
+
+    def tearDown(self):
+        ProcessManagerPool.shutdown(force=True)
+        ProcessManagerPool.set_size(1)
+
+    def test_invalid_size(self):
+        with self.assertRaises(ValueError):
+            ProcessManagerPool.set_size(0)
+
+    def test_lazy_start(self):
+        self.assertTrue(ProcessManagerPool.get_started_count() == 0)
+        ProcessSafeList()
+        self.assertTrue(ProcessManagerPool.get_started_count() == 1)
+
+    def test_shared_manager(self):
+        objs: list[ProcessSafeList | ProcessSafeDict] = [ProcessSafeList([i]) for i in range(10)]
+        objs.extend(ProcessSafeDict({i: i}) for i in range(10))
+        self.assertTrue(ProcessManagerPool.get_started_count() == 1)
+        for i in range(10):
+            self.assertTrue(objs[i] == [i])
+            self.assertTrue(objs[i + 10] == {i: i})
+
+    def test_pool_size(self):
+        ProcessManagerPool.set_size(3)
+        objs = [ProcessSafeList() for _ in range(10)]
+        self.assertTrue(ProcessManagerPool.get_size() == 3)
+        self.assertTrue(ProcessManagerPool.get_started_count() == 3)
+
+    def test_refcount(self):
+        manager = ProcessManagerPool.acquire()
+        self.assertTrue(ProcessManagerPool.get_refcount(manager) == 1)
+
+        objs = [ProcessSafeList() for _ in range(3)]
+        self.assertTrue(ProcessManagerPool.get_refcount(manager) == 4)
+
+        del objs
+        gc.collect()
+        self.assertTrue(ProcessManagerPool.get_refcount(manager) == 1)
+
+        ProcessManagerPool.release(manager)
+        self.assertTrue(ProcessManagerPool.get_refcount(manager) == 0)
+
+    def test_shutdown_idle(self):
+        safe_list = ProcessSafeList([1])
+
+        # manager in use is kept alive
+        ProcessManagerPool.shutdown()
+        self.assertTrue(ProcessManagerPool.get_started_count() == 1)
+        self.assertTrue(safe_list == [1])
+
+        del safe_list
+        gc.collect()
+        ProcessManagerPool.shutdown()
+        self.assertTrue(ProcessManagerPool.get_started_count() == 0)
+
+    def test_concurrent_access(self):
+        safe_list = ProcessSafeList()
+        processes = [
+            multiprocessing.Process(target=worker, args=(safe_list, i))
+            for i in range(10)
+        ]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+
+        self.assertTrue(len(safe_list) == 10)
+        self.assertTrue(ProcessManagerPool.get_started_count() == 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
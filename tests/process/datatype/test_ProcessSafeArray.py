@@ -0,0 +1,176 @@
+import array
+import multiprocessing
+import pickle
+import unittest
+
+from safethread.process import BaseProcess
+from safethread.process.datatype import ProcessSafeArray
+
+
+def worker(safe_array: ProcessSafeArray, value: int):
+    safe_array.append(value)
+
+
+def worker_grow(safe_array: ProcessSafeArray, n: int):
+    with safe_array.get_lock():
+        safe_array.extend(range(n))
+
+
+def worker_view(safe_array: ProcessSafeArray):
+    with safe_array.get_lock():
+        with safe_array.as_memoryview() as view:
+            for i in range(len(view)):
+                view[i] *= 2
+    return True
+
+
+class TestProcessSafeArray(unittest.TestCase):
+
+    def test_initialization(self):
+        safe_array = ProcessSafeArray()
+        self.assertTrue(len(safe_array) == 0)
+        self.assertTrue(safe_array.typecode == "d")
+
+        safe_array = ProcessSafeArray([1, 2, 3], typecode="i")
+        self.assertTrue(safe_array == [1, 2, 3])
+        self.assertTrue(safe_array.typecode == "i")
+        self.assertTrue(safe_array.itemsize == array.array("i").itemsize)
+
+        other = ProcessSafeArray(safe_array)
+        self.assertTrue(other.typecode == "i")
+        other.append(4)
+        self.assertTrue(safe_array == [1, 2, 3, 4])
+
+    def test_invalid_initialization(self):
+        with self.assertRaises(ValueError):
+            ProcessSafeArray(typecode="x")
+        with self.assertRaises(TypeError):
+            ProcessSafeArray([1.5], typecode="i")
+
+    def test_basic_operations(self):
+        safe_array = ProcessSafeArray(typecode="q")
+
+        safe_array.append(1)
+        safe_array.extend([2, 3, 4, 5])
+        self.assertTrue(safe_array == [1, 2, 3, 4, 5])
+        self.assertTrue(safe_array[-1] == 5)
+        self.assertTrue(safe_array.count(3) == 1)
+        self.assertTrue(safe_array.index(4) == 3)
+        self.assertIn(2, safe_array)
+
+        safe_array.insert(0, 0)
+        self.assertTrue(safe_array == [0, 1, 2, 3, 4, 5])
+
+        self.assertTrue(safe_array.pop() == 5)
+        self.assertTrue(safe_array.pop(0) == 0)
+        self.assertTrue(safe_array == [1, 2, 3, 4])
+
+        safe_array.remove(2)
+        self.assertTrue(safe_array == [1, 3, 4])
+
+        safe_array.reverse()
+        self.assertTrue(safe_array == [4, 3, 1])
+
+        safe_array.sort()
+        self.assertTrue(safe_array == [1, 3, 4])
+
+        del safe_array[1]
+        self.assertTrue(safe_array == [1, 4])
+
+        safe_array.clear()
+        self.assertTrue(len(safe_array) == 0)
+
+        safe_array += [1, 2]
+        safe_array += ProcessSafeArray([3], typecode="q")
+        self.assertTrue(safe_array == [1, 2, 3])
+
+    def test_slicing(self):
+        safe_array = ProcessSafeArray(range(10), typecode="i")
+        self.assertTrue(safe_array[2:5] == [2, 3, 4])
+        self.assertTrue(safe_array[::3] == [0, 3, 6, 9])
+
+        safe_array[0:3] = [7, 8, 9]
+        self.assertTrue(safe_array[0:4] == [7, 8, 9, 3])
+
+        safe_array[0:3] = [1]
+        self.assertTrue(safe_array[0:3] == [1, 3, 4])
+        self.assertTrue(len(safe_array) == 8)
+
+        del safe_array[0:2]
+        self.assertTrue(safe_array == [4, 5, 6, 7, 8, 9])
+
+    def test_edge_cases(self):
+        safe_array = ProcessSafeArray()
+        with self.assertRaises(IndexError):
+            safe_array.pop()
+        with self.assertRaises(IndexError):
+            safe_array[0]
+        with self.assertRaises(ValueError):
+            safe_array.remove(42)
+
+    def test_growth(self):
+        safe_array = ProcessSafeArray(typecode="i")
+        for i in range(1000):
+            safe_array.append(i)
+        self.assertTrue(len(safe_array) == 1000)
+        self.assertTrue(safe_array.capacity >= 1000)
+        self.assertTrue(safe_array == list(range(1000)))
+
+    def test_copy(self):
+        safe_array = ProcessSafeArray([1, 2], typecode="i")
+        copy = safe_array.copy()
+        copy.append(3)
+        self.assertTrue(copy.typecode == "i")
+        self.assertTrue(safe_array == [1, 2])
+        self.assertTrue(copy == [1, 2, 3])
+
+    def test_pickle(self):
+        safe_array = ProcessSafeArray([1, 2], typecode="i")
+        data = pickle.loads(pickle.dumps(safe_array._data))
+        data.append(3)
+        self.assertTrue(safe_array == [1, 2, 3])
+
+    def test_memoryview(self):
+        safe_array = ProcessSafeArray([1, 2, 3], typecode="i")
+        with safe_array.get_lock():
+            with safe_array.as_memoryview() as view:
+                self.assertTrue(view.format == "i")
+                view[0:2] = array.array("i", [5, 6])
+        self.assertTrue(safe_array == [5, 6, 3])
+
+    def test_concurrent_access(self):
+        safe_array = ProcessSafeArray(typecode="i")
+
+        processes = [
+            multiprocessing.Process(target=worker, args=(safe_array, i))
+            for i in range(10)
+        ]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+
+        self.assertTrue(len(safe_array) == 10)
+        for i in range(10):
+            self.assertIn(i, safe_array)
+
+    def test_concurrent_growth(self):
+        safe_array = ProcessSafeArray([1], typecode="i")
+        process = multiprocessing.Process(
+            target=worker_grow, args=(safe_array, 500))
+        process.start()
+        process.join()
+
+        self.assertTrue(len(safe_array) == 501)
+        self.assertTrue(safe_array[1:] == list(range(500)))
+
+    def test_base_process(self):
+        safe_array = ProcessSafeArray([1, 2, 3], typecode="i")
+        process = BaseProcess(worker_view, args=[safe_array])
+        process.start()
+        process.join()
+        self.assertTrue(safe_array == [2, 4, 6])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,114 @@
+import multiprocessing
+import unittest
+
+from safethread.process import BaseProcess
+from safethread.process.datatype import ProcessSafeCounter
+
+
+def worker(counter: ProcessSafeCounter, n: int):
+    for _ in range(n):
+        counter.add()
+
+
+def process_worker(counter: ProcessSafeCounter, n: int) -> bool:
+    worker(counter, n)
+    return False
+
+
+def worker_cas(counter: ProcessSafeCounter, n: int):
+    for _ in range(n):
+        while True:
+            value = counter.get()
+            if counter.compare_and_set(value, value + 1):
+                break
+
+
+class TestProcessSafeCounter(unittest.TestCase):
+
+    def test_initialization(self):
+        counter = ProcessSafeCounter()
+        self.assertTrue(counter.get() == 0)
+        self.assertTrue(counter.typecode == "q")
+        self.assertFalse(counter.is_sharded())
+
+        counter = ProcessSafeCounter(1.5, typecode="d")
+        self.assertTrue(counter.get() == 1.5)
+
+        other = ProcessSafeCounter(counter)
+        other.add(1)
+        self.assertTrue(other.typecode == "d")
+        self.assertTrue(counter.get() == 2.5)
+
+    def test_invalid_initialization(self):
+        with self.assertRaises(ValueError):
+            ProcessSafeCounter(typecode="x")
+        with self.assertRaises(ValueError):
+            ProcessSafeCounter(sharded=True, shards=0)
+        with self.assertRaises(TypeError):
+            ProcessSafeCounter(1.5)
+
+    def test_operations(self):
+        counter = ProcessSafeCounter()
+        counter.add()
+        counter.add(4)
+        self.assertTrue(counter.get() == 5)
+
+        self.assertTrue(counter.get_and_add(2) == 5)
+        self.assertTrue(counter.get() == 7)
+
+        self.assertFalse(counter.compare_and_set(0, 1))
+        self.assertTrue(counter.compare_and_set(7, 1))
+
+        counter.set(10)
+        counter += 2
+        self.assertTrue(counter == 12)
+        self.assertTrue(int(counter) == 12)
+
+    def test_sharded(self):
+        counter = ProcessSafeCounter(10, sharded=True, shards=4)
+        self.assertTrue(counter.is_sharded())
+        counter.add(5)
+        self.assertTrue(counter.get() == 15)
+        counter.set(1)
+        self.assertTrue(counter.get() == 1)
+
+        with self.assertRaises(NotImplementedError):
+            counter.get_and_add()
+        with self.assertRaises(NotImplementedError):
+            counter.compare_and_set(1, 2)
+
+    def test_concurrent_access(self):
+        for sharded in (False, True):
+            counter = ProcessSafeCounter(sharded=sharded, shards=3)
+            processes = [
+                multiprocessing.Process(target=worker, args=(counter, 500))
+                for _ in range(5)
+            ]
+            for process in processes:
+                process.start()
+            for process in processes:
+                process.join()
+            self.assertTrue(counter.get() == 2500)
+
+    def test_compare_and_set(self):
+        counter = ProcessSafeCounter()
+        processes = [
+            multiprocessing.Process(target=worker_cas, args=(counter, 200))
+            for _ in range(4)
+        ]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+        self.assertTrue(counter.get() == 800)
+
+    def test_base_process(self):
+        counter = ProcessSafeCounter(sharded=True)
+        process = BaseProcess(process_worker, args=[counter, 100])
+        process.start()
+        process.join()
+        self.assertTrue(counter.get() == 100)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,56 @@
+import multiprocessing
+import queue
+import time
+import unittest
+
+from safethread.process.datatype import ProcessSafeDelayQueue
+
+
+def producer(output: ProcessSafeDelayQueue):
+    output.put("late", delay=0.2)
+    output.put("early", delay=0.1)
+
+
+class TestProcessSafeDelayQueue(unittest.TestCase):
+
+    def test_initialization(self):
+        queue_1 = ProcessSafeDelayQueue([1, 2, 3])
+        self.assertTrue(queue_1.get_many(5) == [1, 2, 3])
+
+        queue_2 = ProcessSafeDelayQueue(1)
+        queue_2.put("a", delay=10)
+        self.assertTrue(queue_2.full())
+        self.assertRaises(queue.Full, queue_2.put_nowait, "b")
+
+    def test_delay(self):
+        queue_1 = ProcessSafeDelayQueue()
+        start = time.monotonic()
+        queue_1.put_many(["x", "y"], delay=0.1)
+        queue_1.put_nowait("now")
+
+        self.assertTrue(queue_1.get_nowait() == "now")
+        self.assertRaises(queue.Empty, queue_1.get_nowait)
+        self.assertTrue(queue_1.peek() == "x")
+        self.assertTrue(queue_1.snapshot() == ["x", "y"])
+        self.assertTrue(queue_1.get_many(5) == ["x", "y"])
+        self.assertTrue(time.monotonic() - start >= 0.1)
+
+    def test_shutdown(self):
+        queue_1 = ProcessSafeDelayQueue()
+        queue_1.put(1, delay=10)
+        queue_1.shutdown(immediate=True)
+        self.assertRaises(queue.ShutDown, queue_1.get)
+
+    def test_between_processes(self):
+        queue_1 = ProcessSafeDelayQueue()
+        process = multiprocessing.Process(target=producer, args=(queue_1,))
+        process.start()
+        process.join()
+
+        self.assertTrue(queue_1.qsize() == 2)
+        self.assertTrue(queue_1.get(timeout=5) == "early")
+        self.assertTrue(queue_1.get(timeout=5) == "late")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -4,6 +4,7 @@ import multiprocessing
 
 from multiprocessing.managers import ListProxy
 from typing import Any
+from unittest import mock
 
 from safethread.process.datatype import ProcessSafeList
 
@@ -179,6 +180,73 @@ class TestProcessSafeList(unittest.TestCase):
         with self.assertRaises(ValueError):
             safe_list.index(42)
 
+    def test_bulk_operations(self):
+        """
+        Test bulk list operations.
+        """
+        safe_list = ProcessSafeList(range(10))
+
+        self.assertTrue(safe_list.snapshot() == list(range(10)))
+        self.assertTrue(safe_list.get_many([0, 5, -1]) == [0, 5, 9])
+        self.assertTrue(safe_list.pop_many(3) == [7, 8, 9])
+        self.assertTrue(safe_list.pop_many(0) == [])
+        self.assertTrue(len(safe_list) == 7)
+
+        safe_list[0:2] = ["a", "b", "c"]
+        self.assertTrue(safe_list[0:4] == ["a", "b", "c", 2])
+
+        safe_list.extend(x for x in range(2))
+        self.assertTrue(safe_list.pop_many(100) == ["a", "b", "c", 2, 3, 4, 5, 6, 0, 1])
+        self.assertTrue(len(safe_list) == 0)
+
+        with self.assertRaises(IndexError):
+            safe_list.get_many([0])
+
+    def test_bulk_operations_list_proxy(self):
+        """
+        Test bulk list operations on a (non-bulk) ListProxy.
+        """
+        with multiprocessing.Manager() as manager:
+            safe_list = ProcessSafeList(manager.list(range(10)))
+
+            self.assertTrue(safe_list.snapshot() == list(range(10)))
+            self.assertTrue(safe_list.get_many([0, 5, -1]) == [0, 5, 9])
+            self.assertTrue(safe_list.pop_many(3) == [7, 8, 9])
+            safe_list.clear()
+            self.assertTrue(len(safe_list) == 0)
+
+
+class TestProcessSafeListRoundTrips(unittest.TestCase):
+    """
+    Bulk operations must take a fixed number of round-trips to the manager process.
+    """
+
+    N_ITEMS = 10_000
+
+    def assertRoundTrips(self, safe_list: ProcessSafeList, expected: int, operation, *args):
+        with mock.patch.object(safe_list._data, "_callmethod", wraps=safe_list._data._callmethod) as callmethod:
+            operation(*args)
+        self.assertTrue(callmethod.call_count == expected,
+                        f"{operation.__name__}: {callmethod.call_count} round-trips, expected {expected}")
+
+    def iterate(self, safe_list: ProcessSafeList):
+        for _ in safe_list:
+            pass
+
+    def test_round_trips(self):
+        safe_list = ProcessSafeList()
+        values = list(range(self.N_ITEMS))
+
+        self.assertRoundTrips(safe_list, 1, safe_list.extend, values)
+        self.assertRoundTrips(safe_list, 1, safe_list.__setitem__,
+                              slice(0, self.N_ITEMS), values)
+        self.assertRoundTrips(safe_list, 1, safe_list.get_many, values)
+        self.assertRoundTrips(safe_list, 1, safe_list.snapshot)
+        self.assertRoundTrips(safe_list, 1, self.iterate, safe_list)
+        self.assertRoundTrips(safe_list, 1, safe_list.pop_many, 10)
+        self.assertRoundTrips(safe_list, 1, safe_list.clear)
+        self.assertTrue(len(safe_list) == 0)
+
 
 if __name__ == "__main__":
     unittest.main()
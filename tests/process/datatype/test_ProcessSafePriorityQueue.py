@@ -0,0 +1,73 @@
+import multiprocessing
+import queue
+import unittest
+
+from safethread.process.datatype import ProcessSafePriorityQueue
+
+
+def consumer(input: ProcessSafePriorityQueue, output: ProcessSafePriorityQueue):
+    while True:
+        try:
+            items = input.get_many(10)
+        except queue.ShutDown:
+            break
+        output.put_many(items)
+        for _ in items:
+            input.task_done()
+
+
+class TestProcessSafePriorityQueue(unittest.TestCase):
+
+    def test_initialization(self):
+        queue_1 = ProcessSafePriorityQueue(5)
+        self.assertTrue(queue_1.maxsize == 5)
+        self.assertTrue(queue_1.empty())
+
+        queue_2 = ProcessSafePriorityQueue([3, 1, 2])
+        self.assertTrue(queue_2.snapshot() == [1, 2, 3])
+        self.assertTrue(list(queue_2) == [1, 2, 3])
+
+        queue_3 = ProcessSafePriorityQueue(queue_2)
+        self.assertTrue(queue_3.get() == 1)
+        self.assertTrue(queue_2.qsize() == 2)
+
+    def test_order(self):
+        queue_1 = ProcessSafePriorityQueue()
+        queue_1.put((2, "b"))
+        queue_1.put_many([(3, "c"), (1, "a")])
+        self.assertTrue(queue_1.peek() == (1, "a"))
+        self.assertTrue(queue_1.get() == (1, "a"))
+        self.assertTrue(queue_1.get_many(5) == [(2, "b"), (3, "c")])
+        self.assertRaises(queue.Empty, queue_1.get_nowait)
+        self.assertRaises(queue.Empty, queue_1.get, timeout=0.01)
+
+    def test_copy_and_clear(self):
+        queue_1 = ProcessSafePriorityQueue(10)
+        queue_1.put_many([5, 4, 6])
+        queue_2 = queue_1.copy()
+        self.assertTrue(isinstance(queue_2, ProcessSafePriorityQueue))
+        self.assertTrue(queue_2.maxsize == 10)
+        queue_1.clear()
+        self.assertTrue(queue_1.empty())
+        self.assertTrue(queue_2.get_many(3) == [4, 5, 6])
+
+    def test_between_processes(self):
+        queue_1 = ProcessSafePriorityQueue()
+        results = ProcessSafePriorityQueue()
+        queue_1.put_many(range(100))
+
+        processes = [multiprocessing.Process(target=consumer, args=(queue_1, results)) for _ in range(2)]
+        for process in processes:
+            process.start()
+        queue_1.join()
+        queue_1.shutdown()
+        for process in processes:
+            process.join()
+
+        self.assertTrue(queue_1.is_shutdown)
+        self.assertTrue(queue_1.unfinished_tasks == 0)
+        self.assertTrue(results.snapshot() == list(range(100)))
+
+
+if __name__ == '__main__':
+    unittest.main()
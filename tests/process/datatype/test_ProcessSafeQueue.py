@@ -1,3 +1,4 @@
+import queue
 import time
 import unittest
 import multiprocessing
@@ -15,6 +16,19 @@ def producer(output: ProcessSafeQueue):
         time.sleep(0.1)
 
 
+def batch_producer(output: ProcessSafeQueue):
+    output.put_many(range(100))
+    output.put(100)
+
+
+def taker(input: ProcessSafeQueue, output: ProcessSafeQueue):
+    output.put(input.get_many(1, timeout=5))
+
+
+def peeker(input: ProcessSafeQueue, output: ProcessSafeQueue):
+    output.put((input.peek(), input.snapshot()))
+
+
 def consumer(input: ProcessSafeQueue, output: ProcessSafeQueue):
     while True:
         try:
@@ -130,6 +144,131 @@ class TestProcessSafeQueue(unittest.TestCase):
         self.assertFalse(queue_1.full())
         self.assertTrue(queue_1.empty())
 
+    def test_put_many_and_get_many(self):
+        queue_1 = ProcessSafeQueue()
+        queue_1.put_many([0, 1, 2, 3, 4])
+        queue_1.put(5)
+        queue_1.put_many([])
+        time.sleep(0.05)
+
+        self.assertTrue(queue_1.qsize() == 6)
+        self.assertTrue(queue_1.get_many(2) == [0, 1])
+        self.assertTrue(queue_1.get() == 2)
+        self.assertTrue(list(queue_1) == [3, 4, 5])
+        time.sleep(0.05)
+        self.assertTrue(queue_1.get_many(10) == [3, 4, 5])
+        self.assertTrue(queue_1.get_many(0) == [])
+        self.assertTrue(queue_1.empty())
+
+        with self.assertRaises(queue.Empty):
+            queue_1.get_many(3, block=False)
+        with self.assertRaises(queue.Empty):
+            queue_1.get_many(3, timeout=0.05)
+
+    def test_many_between_processes(self):
+        queue_1 = ProcessSafeQueue()
+        process = multiprocessing.Process(
+            target=batch_producer, args=(queue_1,))
+        process.start()
+
+        results = []
+        while len(results) < 101:
+            results.extend(queue_1.get_many(30, timeout=5))
+        process.join()
+        self.assertTrue(results == list(range(101)))
+
+    def test_many_multiple_consumers(self):
+        queue_1 = ProcessSafeQueue()
+        results = ProcessSafeQueue()
+        queue_1.put_many(range(10))
+        process = multiprocessing.Process(
+            target=taker, args=(queue_1, results))
+        process.start()
+        process.join()
+        # the other items of the batch are still available to other consumers
+        self.assertTrue(results.get(timeout=5) == [0])
+        self.assertTrue(queue_1.get_many(20, timeout=5) == list(range(1, 10)))
+
+    def test_peek_and_snapshot(self):
+        queue_1 = ProcessSafeQueue()
+        with self.assertRaises(queue.Empty):
+            queue_1.peek()
+        self.assertTrue(queue_1.snapshot() == [])
+
+        queue_1.put(1)
+        queue_1.put_many([2, 3])
+        queue_1.put({'a': 4})
+        # items are visible as soon as put() returns
+        self.assertTrue(queue_1.peek() == 1)
+        self.assertTrue(queue_1.snapshot() == [1, 2, 3, {'a': 4}])
+        self.assertTrue(list(queue_1) == [1, 2, 3, {'a': 4}])
+
+        time.sleep(0.05)
+        self.assertTrue(queue_1.get_many(2) == [1, 2])
+        self.assertTrue(queue_1.peek() == 3)
+        self.assertTrue(queue_1.snapshot() == [3, {'a': 4}])
+
+        copy = queue_1.copy()
+        self.assertTrue(isinstance(copy, ProcessSafeQueue))
+        self.assertTrue(copy.snapshot() == [3, {'a': 4}])
+        self.assertTrue(queue_1.get(timeout=1) == 3)
+        self.assertTrue(queue_1.get(timeout=1) == {'a': 4})
+        self.assertTrue(queue_1.snapshot() == [])
+
+    def test_snapshot_between_processes(self):
+        queue_1 = ProcessSafeQueue()
+        results = ProcessSafeQueue()
+        queue_1.put_many(['a', 'b'])
+        process = multiprocessing.Process(
+            target=peeker, args=(queue_1, results))
+        process.start()
+        process.join()
+        self.assertTrue(results.get(timeout=5) == ('a', ['a', 'b']))
+        self.assertTrue(queue_1.get_many(5) == ['a', 'b'])
+
+    def test_ring_reuse_and_overflow(self):
+        queue_1 = ProcessSafeQueue(ring_size=256)
+        # the ring wraps around many times
+        for i in range(100):
+            queue_1.put(i)
+            queue_1.put(str(i))
+            self.assertTrue(queue_1.snapshot() == [i, str(i)])
+            self.assertTrue(queue_1.get(timeout=1) == i)
+            self.assertTrue(queue_1.get(timeout=1) == str(i))
+
+        # items that do not fit in the ring are sent through the pipe (not seen by snapshot())
+        queue_1.put(b'x' * 1000)
+        queue_1.put(1)
+        self.assertTrue(queue_1.snapshot() == [1])
+        self.assertTrue(queue_1.peek() == 1)
+        time.sleep(0.05)
+        self.assertTrue(queue_1.drain_snapshot() == [b'x' * 1000, 1])
+        self.assertTrue(queue_1.get(timeout=1) == b'x' * 1000)
+        self.assertTrue(queue_1.get(timeout=1) == 1)
+
+        # no ring: the queue can only be inspected by dequeuing the items and putting them back
+        queue_2 = ProcessSafeQueue(ring_size=0)
+        queue_2.put(1)
+        queue_2.put_many([2, 3])
+        time.sleep(0.05)
+        with self.assertRaises(RuntimeError):
+            queue_2.peek()
+        with self.assertRaises(RuntimeError):
+            queue_2.snapshot()
+        self.assertTrue(queue_2.drain_snapshot() == [1, 2, 3])
+        # the items are put back by the feeder thread: get them one by one
+        self.assertTrue([queue_2.get(timeout=1) for _ in range(3)] == [1, 2, 3])
+
+        with self.assertRaises(ValueError):
+            ProcessSafeQueue(ring_size=-1)
+
+    def test_full_releases_ring(self):
+        queue_1 = ProcessSafeQueue(1, ring_size=256)
+        queue_1.put(1)
+        with self.assertRaises(queue.Full):
+            queue_1.put(2, block=False)
+        self.assertTrue(queue_1.snapshot() == [1])
+
 
 if __name__ == '__main__':
     unittest.main()
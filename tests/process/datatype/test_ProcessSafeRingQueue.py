@@ -0,0 +1,170 @@
+import array
+import multiprocessing
+import queue
+import unittest
+
+from safethread.process.datatype import ProcessSafeRingQueue
+
+
+def producer(output: ProcessSafeRingQueue, count: int):
+    for i in range(count):
+        with output.put_view(4) as view:
+            view[:] = i.to_bytes(4, "little")
+
+
+def consumer(input: ProcessSafeRingQueue, output: ProcessSafeRingQueue):
+    total = 0
+    while True:
+        try:
+            with input.get_view(timeout=1) as view:
+                total += int.from_bytes(view, "little")
+        except queue.Empty:
+            break
+    output.put(total.to_bytes(8, "little"))
+
+
+class TestProcessSafeRingQueue(unittest.TestCase):
+
+    def test_initialization(self):
+        queue_1 = ProcessSafeRingQueue()
+        self.assertTrue(queue_1.maxsize == ProcessSafeRingQueue.DEFAULT_CAPACITY)
+        self.assertTrue(queue_1.slot_size == ProcessSafeRingQueue.DEFAULT_SLOT_SIZE)
+        self.assertTrue(queue_1.empty())
+
+        queue_2 = ProcessSafeRingQueue(8, slot_size=16)
+        self.assertTrue(queue_2.maxsize == 8)
+        self.assertTrue(queue_2.slot_size == 16)
+
+        queue_3 = ProcessSafeRingQueue([b'a', bytearray(b'bc'), array.array('i', [1])])
+        self.assertTrue(queue_3.snapshot() == [b'a', b'bc', bytes(array.array('i', [1]))])
+
+        # shared queue
+        queue_4 = ProcessSafeRingQueue(queue_3)
+        self.assertTrue(queue_4.get() == b'a')
+        self.assertTrue(queue_3.qsize() == 2)
+
+        with self.assertRaises(ValueError):
+            ProcessSafeRingQueue(0)
+        with self.assertRaises(ValueError):
+            ProcessSafeRingQueue(slot_size=0)
+        with self.assertRaises(TypeError):
+            ProcessSafeRingQueue("abc")
+        with self.assertRaises(TypeError):
+            ProcessSafeRingQueue([1, 2])
+
+    def test_put_and_get(self):
+        queue_1 = ProcessSafeRingQueue(3, slot_size=4)
+        queue_1.put(b'1')
+        queue_1.put_nowait(b'22')
+        queue_1.put_many([b'333'])
+        self.assertTrue(queue_1.full())
+        self.assertTrue(queue_1.qsize() == 3)
+
+        with self.assertRaises(queue.Full):
+            queue_1.put(b'4', block=False)
+        with self.assertRaises(queue.Full):
+            queue_1.put(b'4', timeout=0.05)
+        with self.assertRaises(ValueError):
+            queue_1.put(b'55555')
+
+        self.assertTrue(queue_1.peek() == b'1')
+        self.assertTrue(queue_1.get() == b'1')
+        self.assertTrue(queue_1.get_many(5) == [b'22', b'333'])
+        self.assertTrue(queue_1.empty())
+
+        with self.assertRaises(queue.Empty):
+            queue_1.get_nowait()
+        with self.assertRaises(queue.Empty):
+            queue_1.get(timeout=0.05)
+        with self.assertRaises(queue.Empty):
+            queue_1.peek()
+
+    def test_wrap_around(self):
+        queue_1 = ProcessSafeRingQueue(3, slot_size=8)
+        for i in range(20):
+            queue_1.put_many([bytes([i]), bytes([i]) * 2])
+            self.assertTrue(queue_1.snapshot() == [bytes([i]), bytes([i]) * 2])
+            self.assertTrue(queue_1.get_many(2) == [bytes([i]), bytes([i]) * 2])
+
+    def test_put_many_blocks(self):
+        queue_1 = ProcessSafeRingQueue(2, slot_size=8)
+        with self.assertRaises(queue.Full):
+            queue_1.put_many([b'1', b'2', b'3'], block=False)
+        # records put before the exception remain in the queue
+        self.assertTrue(queue_1.get_many(5) == [b'1', b'2'])
+
+        # nothing is put if a record is too large
+        with self.assertRaises(ValueError):
+            queue_1.put_many([b'1', b'123456789'])
+        self.assertTrue(queue_1.empty())
+
+    def test_views(self):
+        queue_1 = ProcessSafeRingQueue(2, slot_size=8)
+        with queue_1.put_view(3) as view:
+            view[:] = b'abc'
+        self.assertTrue(queue_1.snapshot() == [b'abc'])
+
+        # an exception discards the record
+        with self.assertRaises(RuntimeError):
+            with queue_1.put_view(3) as view:
+                raise RuntimeError()
+        self.assertTrue(queue_1.qsize() == 1)
+
+        # an exception keeps the record in the queue
+        with self.assertRaises(RuntimeError):
+            with queue_1.get_view() as view:
+                raise RuntimeError()
+        self.assertTrue(queue_1.qsize() == 1)
+
+        with queue_1.get_view() as view:
+            self.assertTrue(view.readonly)
+            self.assertTrue(bytes(view) == b'abc')
+        self.assertTrue(queue_1.empty())
+
+        with self.assertRaises(ValueError):
+            with queue_1.put_view(9):
+                pass
+        # slots are released after errors
+        queue_1.put_many([b'1', b'2'])
+        self.assertTrue(queue_1.full())
+
+    def test_copy_and_clear(self):
+        queue_1 = ProcessSafeRingQueue(4, slot_size=8)
+        queue_1.put_many([b'1', b'2'])
+
+        queue_2 = queue_1.copy()
+        self.assertTrue(isinstance(queue_2, ProcessSafeRingQueue))
+        self.assertTrue(queue_2.maxsize == 4)
+        self.assertTrue(queue_2.slot_size == 8)
+        self.assertTrue(list(queue_2) == [b'1', b'2'])
+
+        queue_1.clear()
+        self.assertTrue(queue_1.empty())
+        self.assertTrue(queue_2.qsize() == 2)
+        queue_1.put_many([b'1', b'2', b'3', b'4'])
+        self.assertTrue(queue_1.full())
+
+        self.assertRaises(NotImplementedError, queue_1.__eq__, queue_2)
+
+    def test_between_processes(self):
+        queue_1 = ProcessSafeRingQueue(16, slot_size=4)
+        results = ProcessSafeRingQueue(1, slot_size=8)
+        count = 1000
+
+        processes = [multiprocessing.Process(target=producer, args=(queue_1, count)) for _ in range(2)]
+        processes += [multiprocessing.Process(target=consumer, args=(queue_1, results)) for _ in range(2)]
+        for process in processes:
+            process.start()
+
+        total = 0
+        for _ in range(2):
+            total += int.from_bytes(results.get(timeout=10), "little")
+        for process in processes:
+            process.join()
+
+        self.assertTrue(total == 2 * sum(range(count)))
+        self.assertTrue(queue_1.empty())
+
+
+if __name__ == '__main__':
+    unittest.main()
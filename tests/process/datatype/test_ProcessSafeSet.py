@@ -105,6 +105,30 @@ class TestProcessSafeSet(unittest.TestCase):
         safe_set.update({4, 5})
         self.assertTrue(safe_set == {1, 2, 3, 4, 5})
 
+    def test_set_algebra_with_safe_sets(self):
+        safe_set = ProcessSafeSet({1, 2, 3})
+        other = ProcessSafeSet({3, 4})
+        self.assertTrue(safe_set.union(other) == {1, 2, 3, 4})
+        self.assertTrue(safe_set.intersection(other, [3, 5]) == {3})
+        self.assertTrue(safe_set.issuperset(ProcessSafeSet({1, 2})))
+
+        safe_set.update(other, (x for x in [7, 8]))
+        self.assertTrue(safe_set == {1, 2, 3, 4, 7, 8})
+
+    def test_add_duplicates(self):
+        safe_set = ProcessSafeSet()
+        for _ in range(3):
+            safe_set.add(1)
+        self.assertTrue(len(safe_set) == 1)
+        self.assertTrue(list(safe_set) == [1])
+
+    def test_pop_empty(self):
+        safe_set = ProcessSafeSet()
+        with self.assertRaises(KeyError):
+            safe_set.pop()
+        with self.assertRaises(KeyError):
+            safe_set.remove(1)
+
     def test_thread_safety(self):
         safe_set = ProcessSafeSet({1, 2, 3})
 
@@ -120,6 +144,20 @@ class TestProcessSafeSet(unittest.TestCase):
         for i in range(10, 20):
             self.assertIn(i, safe_set)
 
+    def test_concurrent_duplicates(self):
+        safe_set = ProcessSafeSet()
+
+        processes = [
+            multiprocessing.Process(
+                target=worker, args=(safe_set, 1)
+            ) for _ in range(10)]
+        for p in processes:
+            p.start()
+        for p in processes:
+            p.join()
+
+        self.assertTrue(len(safe_set) == 1)
+
 
 if __name__ == '__main__':
     unittest.main()
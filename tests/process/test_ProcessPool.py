@@ -0,0 +1,127 @@
+import os
+import time
+import unittest
+
+from safethread.process import ProcessPool
+
+
+def square(x):
+    return x * x
+
+
+def add(a, b=0):
+    return a + b
+
+
+def get_pid(_=None):
+    return os.getpid()
+
+
+def crash(_=None):
+    os._exit(1)
+
+
+def echo(data):
+    return data
+
+
+def fail(message):
+    raise ValueError(message)
+
+
+class CrashOnLoad:
+    """Argument that crashes the worker process while the task is received"""
+
+    def __reduce__(self):
+        return (os._exit, (1,))
+
+
+class TestProcessPool(unittest.TestCase):
+
+    def test_invalid_initialization(self):
+        with self.assertRaises(ValueError):
+            ProcessPool(0)
+        with self.assertRaises(ValueError):
+            ProcessPool(2, maxtasksperchild=0)
+
+    def test_submit(self):
+        with ProcessPool(2) as pool:
+            futures = [pool.submit(square, i) for i in range(20)]
+            self.assertTrue([future.result(timeout=10) for future in futures] == [i * i for i in range(20)])
+            self.assertTrue(pool.submit(add, 1, b=2).result(timeout=10) == 3)
+
+            future = pool.submit(fail, "error")
+            self.assertTrue(isinstance(future.exception(timeout=10), ValueError))
+            self.assertRaises(TypeError, pool.submit, None)
+
+        self.assertTrue(pool.is_terminated())
+        self.assertTrue(pool.get_pending_count() == 0)
+        self.assertRaises(RuntimeError, pool.submit, square, 2)
+
+    def test_submit_before_start(self):
+        pool = ProcessPool(1)
+        future = pool.submit(square, 3)
+        self.assertFalse(future.done())
+        pool.start()
+        self.assertTrue(future.result(timeout=10) == 9)
+        self.assertRaises(RuntimeError, pool.start)
+        pool.shutdown()
+
+    def test_map(self):
+        with ProcessPool(2) as pool:
+            self.assertTrue(list(pool.map(square, range(10))) == [i * i for i in range(10)])
+            results = pool.map(add, range(10), range(10), chunksize=3)
+            self.assertTrue(list(results) == [2 * i for i in range(10)])
+
+            results = pool.imap_unordered(square, range(100), chunksize=7)
+            self.assertTrue(sorted(results) == [i * i for i in range(100)])
+            self.assertRaises(ValueError, pool.map, square, range(10), chunksize=0)
+
+    def test_maxtasksperchild(self):
+        with ProcessPool(1, maxtasksperchild=2) as pool:
+            pids = [pool.submit(get_pid).result(timeout=10) for _ in range(6)]
+        self.assertTrue(len(set(pids)) == 3)
+
+    def test_crash(self):
+        with ProcessPool(1) as pool:
+            future = pool.submit(crash)
+            self.assertRaises(ProcessPool.CrashedException, future.result, timeout=10)
+            # crashed worker is replaced
+            self.assertTrue(pool.submit(square, 4).result(timeout=10) == 16)
+
+    def test_crash_during_dispatch(self):
+        with ProcessPool(1) as pool:
+            self.assertTrue(pool.submit(square, 2).result(timeout=10) == 4)
+            future = pool.submit(square, CrashOnLoad())
+            self.assertRaises(ProcessPool.CrashedException, future.result, timeout=10)
+            self.assertTrue(pool.submit(square, 4).result(timeout=10) == 16)
+
+            # the task sent after the crashed one is run by the new worker
+            crashed = pool.submit(crash)
+            future = pool.submit(square, 3)
+            self.assertRaises(ProcessPool.CrashedException, crashed.result, timeout=10)
+            self.assertTrue(future.result(timeout=10) == 9)
+
+    def test_large_data(self):
+        # tasks and results larger than the pipe buffer
+        data = [b"x" * 300_000 for _ in range(6)]
+        with ProcessPool(1) as pool:
+            futures = [pool.submit(echo, item) for item in data]
+            self.assertTrue([future.result(timeout=10) for future in futures] == data)
+
+    def test_stop(self):
+        pool = ProcessPool(1)
+        pool.start()
+        running = pool.submit(time.sleep, 0.5)
+        time.sleep(0.2)
+        pending = [pool.submit(square, i) for i in range(5)]
+        pool.stop()
+        pool.join(timeout=10)
+
+        self.assertTrue(running.result(timeout=1) is None)
+        self.assertTrue(all(future.cancelled() for future in pending))
+        self.assertFalse(pool.is_alive())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -103,7 +103,7 @@ class TestSchedulerProcess(unittest.TestCase):
         end = time.perf_counter()
 
         self.assertTrue(
-            end-begin >= scheduler.get_timeout())  # in secs
+            end-begin >= float(scheduler.get_timeout()))  # in secs
 
         self.assertTrue(scheduler.get_timeout() == 0.1)
         self.assertTrue(scheduler.is_terminated())
@@ -128,6 +128,17 @@ class TestSchedulerProcess(unittest.TestCase):
             self.assertTrue(scheduler_rep_called.value == 2)
             self.assertTrue(scheduler_rep_result.value == 10)
 
+    def test_stop_interrupts_wait(self):
+        """Test that stop() does not wait for the end of the timeout."""
+        scheduler = SchedulerProcess(timeout=10.0, callback=callback, args=[
+            Value("i", 0), Value("i", 0), 1], mode=SchedulerProcess.FIXED_RATE)
+        scheduler.start()
+        time.sleep(0.2)
+        begin = time.perf_counter()
+        scheduler.stop_join()
+        self.assertTrue(time.perf_counter() - begin < 2.0)
+        self.assertTrue(scheduler.is_terminated())
+
 
 if __name__ == '__main__':
     unittest.main()
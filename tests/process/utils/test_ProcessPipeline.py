@@ -0,0 +1,62 @@
+import unittest
+
+from safethread.process.utils import ProcessPipeline, ProcessPipelineStage
+from safethread.thread.utils import ThreadPipelineStage
+
+
+def add_five(x):
+    return x + 5
+
+
+def square(x):
+    return x ** 2
+
+
+class TestProcessPipeline(unittest.TestCase):
+
+    def test_invalid_stage(self):
+        with self.assertRaises(TypeError):
+            ProcessPipeline([ProcessPipelineStage(add_five), object()])  # type: ignore
+
+    def test_empty_pipeline(self):
+        pipeline = ProcessPipeline([])
+        self.assertRaises(RuntimeError, pipeline.put, 1)
+        self.assertRaises(RuntimeError, pipeline.get)
+
+    def test_process_stages(self):
+        pipeline = ProcessPipeline([
+            ProcessPipelineStage(add_five),
+            ProcessPipelineStage(square),
+        ])
+        self.assertFalse(pipeline.has_started())
+        pipeline.start()
+        self.assertTrue(pipeline.is_alive())
+
+        for item in (-10, -15, -20):
+            pipeline.put(item)
+        results = [pipeline.get(timeout=10) for _ in range(3)]
+        self.assertTrue(results == [25, 100, 225])
+
+        pipeline.stop()
+        pipeline.join()
+        self.assertTrue(pipeline.is_terminated())
+
+    def test_mixed_stages(self):
+        pipeline = ProcessPipeline([
+            ThreadPipelineStage(add_five),
+            ProcessPipelineStage(square, n_processes=2),
+            ThreadPipelineStage(add_five),
+        ])
+        pipeline.start()
+        for item in range(20):
+            pipeline.put(item)
+        results = [pipeline.get(timeout=10) for _ in range(20)]
+        self.assertTrue(sorted(results) == [(i + 5) ** 2 + 5 for i in range(20)])
+
+        pipeline.stop()
+        pipeline.join(timeout=10)
+        self.assertTrue(pipeline.is_terminated())
+
+
+if __name__ == '__main__':
+    unittest.main()
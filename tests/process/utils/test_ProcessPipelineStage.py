@@ -0,0 +1,96 @@
+import time
+import unittest
+
+from safethread.process.utils import ProcessPipelineStage
+from safethread.thread.utils import ThreadPipelineStage
+
+
+def double(x):
+    return x * 2
+
+
+def add_five(x):
+    return x + 5
+
+
+def slow_double(x):
+    time.sleep(1)
+    return x * 2
+
+
+class TestProcessPipelineStage(unittest.TestCase):
+
+    def test_invalid_initialization(self):
+        with self.assertRaises(TypeError):
+            ProcessPipelineStage(None)  # type: ignore
+        with self.assertRaises(ValueError):
+            ProcessPipelineStage(double, n_processes=0)
+
+    def test_put_and_get(self):
+        stage = ProcessPipelineStage(double)
+        stage.put(5)
+        self.assertFalse(stage.has_started())
+        self.assertFalse(stage.is_alive())
+
+        stage.start()
+        self.assertTrue(stage.get(timeout=10) == 10)
+        self.assertTrue(stage.has_started())
+        self.assertTrue(stage.is_alive())
+        self.assertRaises(RuntimeError, stage.start)
+
+        stage.stop()
+        stage.join()
+        self.assertTrue(stage.is_terminated())
+        self.assertRaises(ProcessPipelineStage.StoppedException, stage.put, 1)
+        self.assertRaises(ProcessPipelineStage.StoppedException, stage.get)
+
+    def test_concurrent_processing(self):
+        stage = ProcessPipelineStage(double, n_processes=3)
+        stage.start()
+        for i in range(100):
+            stage.put(i)
+        results = [stage.get(timeout=10) for _ in range(100)]
+        self.assertTrue(sorted(results) == [i * 2 for i in range(100)])
+        self.assertRaises(ProcessPipelineStage.EmptyException, stage.get, timeout=0.1)
+        stage.stop_join()
+
+    def test_connect_output(self):
+        first = ThreadPipelineStage(add_five)
+        second = ProcessPipelineStage(double, n_processes=2)
+        third = ThreadPipelineStage(add_five)
+        first.connect_output(second)
+        second.connect_output(third)
+
+        for stage in (first, second, third):
+            stage.start()
+        for i in range(10):
+            first.put(i)
+        results = [third.get(timeout=10) for _ in range(10)]
+        self.assertTrue(sorted(results) == [(i + 5) * 2 + 5 for i in range(10)])
+        self.assertRaises(RuntimeError, second.connect_output, first)
+
+        for stage in (first, second, third):
+            stage.stop()
+        for stage in (first, second, third):
+            stage.join(timeout=10)
+        self.assertTrue(second.is_terminated())
+
+    def test_stop_finishes_current_data(self):
+        stage = ProcessPipelineStage(slow_double)
+        collector = ProcessPipelineStage(add_five)
+        stage.connect_output(collector)
+        stage.start()
+        stage.put(5)
+        time.sleep(0.5)  # processing 5
+
+        stage.stop_join(timeout=10)
+        self.assertTrue(stage.is_terminated())
+
+        # the data being processed when stop() was called is not lost
+        collector.start()
+        self.assertTrue(collector.get(timeout=10) == 15)
+        collector.stop_join(timeout=10)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,216 @@
+import unittest
+import threading
+
+from threading import Thread
+from typing import cast
+
+from safethread.thread.datatype import ThreadCopyOnWriteLock, ThreadSafeDict, ThreadSafeList
+
+
+class TestThreadCopyOnWriteLock(unittest.TestCase):
+
+    def test_snapshot(self):
+        data = [1, 2]
+        lock = ThreadCopyOnWriteLock(data, tuple)
+        self.assertTrue(lock.get_snapshot() == (1, 2))
+        self.assertTrue(lock.get_version() == 0)
+
+        with lock:
+            data.append(3)
+            with lock:
+                data.append(4)
+            # nested release does not publish
+            self.assertTrue(lock.get_snapshot() == (1, 2))
+        self.assertTrue(lock.get_snapshot() == (1, 2, 3, 4))
+        self.assertTrue(lock.get_version() == 1)
+        self.assertTrue(lock.get_hold_time() >= lock.get_copy_time() > 0)
+
+    def test_shared_lock(self):
+        data = [1]
+        lock = ThreadCopyOnWriteLock(data, tuple)
+        with lock.get_shared_lock():
+            pass
+        self.assertTrue(lock.get_version() == 0)
+
+        # the shared side excludes writers
+        with lock.get_shared_lock():
+            result = []
+            thread = Thread(target=lambda: result.append(
+                lock.acquire(timeout=0.05)))
+            thread.start()
+            thread.join()
+            self.assertTrue(result == [False])
+
+    def test_release_not_locked(self):
+        lock = ThreadCopyOnWriteLock([], tuple)
+        with self.assertRaises(RuntimeError):
+            lock.release()
+
+        lock.acquire()
+        thread_errors = []
+
+        def release():
+            try:
+                lock.release()
+            except RuntimeError as e:
+                thread_errors.append(e)
+        thread = Thread(target=release)
+        thread.start()
+        thread.join()
+        self.assertTrue(len(thread_errors) == 1)
+        lock.release()
+
+
+class TestCopyOnWriteDatatypes(unittest.TestCase):
+
+    def test_list(self):
+        safe_list = ThreadSafeList([1, 2, 3], copy_on_write=True)
+        self.assertTrue(safe_list.is_copy_on_write())
+        self.assertFalse(ThreadSafeList().is_copy_on_write())
+
+        lock = cast(ThreadCopyOnWriteLock, safe_list.get_lock())
+        self.assertTrue(isinstance(lock, ThreadCopyOnWriteLock))
+
+        safe_list.append(4)
+        safe_list.extend([5, 6])
+        self.assertTrue(lock.get_version() == 2)
+        self.assertTrue(len(safe_list) == 6)
+        self.assertTrue(safe_list[0] == 1)
+        self.assertTrue(safe_list[1:3] == [2, 3])
+        self.assertTrue(5 in safe_list)
+        self.assertTrue(list(safe_list) == [1, 2, 3, 4, 5, 6])
+        self.assertTrue(safe_list.snapshot() == [1, 2, 3, 4, 5, 6])
+        self.assertTrue(safe_list.count(2) == 1)
+
+        safe_list += [7]
+        self.assertTrue(safe_list == [1, 2, 3, 4, 5, 6, 7])
+
+        # shared objects keep the copy-on-write mode
+        other = ThreadSafeList(safe_list)
+        self.assertTrue(other.is_copy_on_write())
+        other.pop()
+        self.assertTrue(len(safe_list) == 6)
+
+        with self.assertRaises(ValueError):
+            ThreadSafeList(lock=lock, copy_on_write=True)
+
+    def test_dict(self):
+        safe_dict = ThreadSafeDict({'a': 1}, copy_on_write=True)
+        self.assertTrue(safe_dict.is_copy_on_write())
+
+        safe_dict['b'] = 2
+        safe_dict.update(c=3)
+        lock = cast(ThreadCopyOnWriteLock, safe_dict.get_lock())
+        self.assertTrue(isinstance(lock, ThreadCopyOnWriteLock))
+        self.assertTrue(lock.get_version() == 2)
+        self.assertTrue(safe_dict['b'] == 2)
+        self.assertTrue(safe_dict.get('z', 0) == 0)
+        self.assertTrue('c' in safe_dict)
+        self.assertTrue(len(safe_dict) == 3)
+        self.assertTrue(set(safe_dict.items()) ==
+                        {('a', 1), ('b', 2), ('c', 3)})
+        self.assertTrue(set(safe_dict.keys()) == {'a', 'b', 'c'})
+        self.assertTrue(set(safe_dict.values()) == {1, 2, 3})
+        self.assertTrue(safe_dict.copy_obj() == {'a': 1, 'b': 2, 'c': 3})
+        with self.assertRaises(KeyError):
+            safe_dict['z']
+
+    def test_read_own_writes(self):
+        """The writer thread reads its own (not published yet) writes, other threads read the snapshot."""
+        safe_dict = ThreadSafeDict(copy_on_write=True)
+        seen = []
+        with safe_dict.get_lock():
+            safe_dict['a'] = 1
+            self.assertTrue('a' in safe_dict)
+            self.assertTrue(len(safe_dict) == 1)
+            self.assertTrue(safe_dict['a'] == 1)
+            self.assertTrue(safe_dict.get('a') == 1)
+            self.assertTrue(dict(safe_dict.items()) == {'a': 1})
+            self.assertTrue(safe_dict.copy_obj() == {'a': 1})
+            reader = Thread(target=lambda: seen.append(len(safe_dict)))
+            reader.start()
+            reader.join()
+        self.assertTrue(seen == [0])
+        self.assertTrue(safe_dict['a'] == 1)
+
+        safe_list = ThreadSafeList([1, 2, 3], copy_on_write=True)
+
+        def callback():
+            safe_list.append(4)
+            seen.append(len(safe_list))
+            seen.append(safe_list[-1])
+            seen.append(safe_list.snapshot())
+        safe_list.execute(callback)
+        self.assertTrue(seen[1:] == [4, 4, [1, 2, 3, 4]])
+
+    def test_copy(self):
+        safe_list = ThreadSafeList([1, 2], copy_on_write=True)
+        copy = safe_list.copy()
+        self.assertTrue(copy.is_copy_on_write())
+        copy.append(3)
+        self.assertTrue(list(safe_list) == [1, 2] and list(copy) == [1, 2, 3])
+        self.assertFalse(ThreadSafeList([1]).copy().is_copy_on_write())
+
+        safe_dict = ThreadSafeDict({'a': 1}, copy_on_write=True)
+        copy = safe_dict.copy()
+        self.assertTrue(copy.is_copy_on_write())
+        self.assertTrue(copy.copy_obj() == {'a': 1})
+        self.assertFalse(ThreadSafeDict({'a': 1}).copy().is_copy_on_write())
+
+    def test_iteration_while_writing(self):
+        safe_dict = ThreadSafeDict(
+            {i: i for i in range(100)}, copy_on_write=True)
+
+        # writers do not break (nor block) iterations over a snapshot
+        for key in safe_dict:
+            safe_dict[key + 100] = key
+        self.assertTrue(len(safe_dict) == 200)
+
+        items = safe_dict.items()
+        safe_dict.clear()
+        self.assertTrue(len(items) == 200)
+        self.assertTrue(len(safe_dict) == 0)
+
+    def test_readers_do_not_lock(self):
+        safe_list = ThreadSafeList([1, 2], copy_on_write=True)
+        with safe_list.get_lock():
+            safe_list.append(3)
+            result = []
+            thread = Thread(target=lambda: result.append(list(safe_list)))
+            thread.start()
+            thread.join(timeout=5)
+            # readers see the last published version
+            self.assertTrue(result == [[1, 2]])
+        self.assertTrue(list(safe_list) == [1, 2, 3])
+
+    def test_consistency(self):
+        safe_list = ThreadSafeList(copy_on_write=True)
+        errors = []
+        stop = threading.Event()
+
+        def writer():
+            for i in range(200):
+                with safe_list.get_lock():
+                    safe_list.append(i)
+                    safe_list.append(i)
+            stop.set()
+
+        def reader():
+            while not stop.is_set():
+                snapshot = list(safe_list)
+                if len(snapshot) % 2 != 0:
+                    errors.append(len(snapshot))
+
+        threads = [Thread(target=writer)] + \
+            [Thread(target=reader) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertTrue(errors == [])
+        self.assertTrue(len(safe_list) == 400)
+
+
+if __name__ == "__main__":
+    unittest.main()
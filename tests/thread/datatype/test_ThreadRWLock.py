@@ -0,0 +1,234 @@
+import unittest
+import threading
+import time
+
+from threading import Thread
+
+from safethread.thread.datatype import ThreadRWLock, ThreadSafeDict, ThreadSafeList, ThreadSafeSet
+
+
+class TestThreadRWLock(unittest.TestCase):
+
+    def test_with_statement(self):
+        lock = ThreadRWLock()
+        with lock:
+            self.assertTrue(lock.acquire())
+            lock.release()
+        with lock.get_shared_lock():
+            self.assertTrue(lock.acquire_shared())
+            lock.release_shared()
+
+    def test_release_not_locked(self):
+        lock = ThreadRWLock()
+        with self.assertRaises(RuntimeError):
+            lock.release()
+        with self.assertRaises(RuntimeError):
+            lock.release_shared()
+
+    def test_options(self):
+        lock = ThreadRWLock()
+        self.assertTrue(lock.is_writer_preferred())
+        self.assertTrue(lock.is_reentrant())
+
+        lock = ThreadRWLock(writer_preference=False, reentrant=False)
+        self.assertFalse(lock.is_writer_preferred())
+        self.assertFalse(lock.is_reentrant())
+
+    def test_shared_readers(self):
+        lock = ThreadRWLock()
+        barrier = threading.Barrier(3, timeout=5)
+        results = []
+
+        def reader():
+            with lock.get_shared_lock():
+                # all readers hold the lock at the same time
+                barrier.wait()
+                results.append(True)
+
+        threads = [Thread(target=reader) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertTrue(results == [True]*3)
+
+    def test_exclusive_writer(self):
+        lock = ThreadRWLock()
+        lock.acquire_shared()
+
+        result = []
+        thread = Thread(target=lambda: result.append(
+            lock.acquire(timeout=0.05)))
+        thread.start()
+        thread.join()
+        self.assertTrue(result == [False])
+
+        lock.release_shared()
+        self.assertTrue(lock.acquire(blocking=False))
+
+        result.clear()
+        thread = Thread(target=lambda: result.append(
+            lock.acquire_shared(blocking=False)))
+        thread.start()
+        thread.join()
+        self.assertTrue(result == [False])
+        lock.release()
+
+    def test_reentrant(self):
+        lock = ThreadRWLock()
+        with lock:
+            with lock:
+                # downgrade: shared access while holding exclusive access
+                with lock.get_shared_lock():
+                    pass
+        with lock.get_shared_lock():
+            with lock.get_shared_lock():
+                pass
+            # upgrade is not supported
+            with self.assertRaises(RuntimeError):
+                lock.acquire()
+        self.assertTrue(lock.acquire(blocking=False))
+        lock.release()
+
+    def test_not_reentrant(self):
+        lock = ThreadRWLock(reentrant=False)
+        with lock:
+            with self.assertRaises(RuntimeError):
+                lock.acquire()
+            with self.assertRaises(RuntimeError):
+                lock.acquire_shared()
+        with lock.get_shared_lock():
+            with self.assertRaises(RuntimeError):
+                lock.acquire_shared()
+            # upgrade is not supported
+            with self.assertRaises(RuntimeError):
+                lock.acquire(timeout=1)
+        self.assertRaises(RuntimeError, lock.release_shared)
+        self.assertTrue(lock.acquire(blocking=False))
+        lock.release()
+
+    def test_not_reentrant_readers(self):
+        lock = ThreadRWLock(reentrant=False)
+        lock.acquire_shared()
+        # the shared mode is tracked per thread
+        result = []
+        reader = Thread(target=lambda: result.extend(
+            [lock.acquire_shared(timeout=1), lock.release_shared()]))
+        reader.start()
+        reader.join()
+        self.assertTrue(result == [True, None])
+        lock.release_shared()
+        self.assertRaises(RuntimeError, lock.release_shared)
+
+    def test_writer_preference(self):
+        for writer_preference in (True, False):
+            lock = ThreadRWLock(writer_preference=writer_preference)
+            lock.acquire_shared()
+
+            writer = Thread(target=lambda: lock.acquire(timeout=0.2))
+            writer.start()
+            time.sleep(0.05)
+
+            result = []
+            reader = Thread(target=lambda: result.append(
+                lock.acquire_shared(timeout=0.05)))
+            reader.start()
+            reader.join()
+            writer.join()
+            # a waiting writer blocks new readers only with writer preference
+            self.assertTrue(result == [not writer_preference])
+
+    def test_reentrant_reader_with_waiting_writer(self):
+        lock = ThreadRWLock()
+        lock.acquire_shared()
+
+        writer = Thread(target=lambda: lock.acquire(timeout=0.2))
+        writer.start()
+        time.sleep(0.05)
+
+        # the current thread already holds the lock, so it must not wait for the writer
+        self.assertTrue(lock.acquire_shared(timeout=0.05))
+        lock.release_shared()
+        lock.release_shared()
+        writer.join()
+
+    def test_consistency(self):
+        lock = ThreadRWLock()
+        data = [0, 0]
+        errors = []
+
+        def writer():
+            for _ in range(500):
+                with lock:
+                    data[0] += 1
+                    data[1] += 1
+
+        def reader():
+            for _ in range(500):
+                with lock.get_shared_lock():
+                    if data[0] != data[1]:
+                        errors.append(tuple(data))
+
+        threads = [Thread(target=writer) for _ in range(2)]
+        threads += [Thread(target=reader) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertTrue(errors == [])
+        self.assertTrue(data == [1000, 1000])
+
+
+class TestThreadRWLockDatatypes(unittest.TestCase):
+
+    def test_lock_parameter(self):
+        lock = ThreadRWLock()
+        for safe_obj in (ThreadSafeDict({'a': 1}, lock=lock),
+                         ThreadSafeList([1], lock=lock),
+                         ThreadSafeSet({1}, lock=lock)):
+            self.assertTrue(safe_obj.get_lock() is lock)
+
+        self.assertFalse(isinstance(ThreadSafeDict().get_lock(), ThreadRWLock))
+
+    def test_concurrent_reads(self):
+        lock = ThreadRWLock()
+        safe_dict = ThreadSafeDict({'a': 1}, lock=lock)
+
+        with lock.get_shared_lock():
+            # readers are not blocked by other readers
+            result = []
+            thread = Thread(target=lambda: result.append(safe_dict.get('a')))
+            thread.start()
+            thread.join(timeout=5)
+            self.assertTrue(result == [1])
+
+    def test_writes_are_exclusive(self):
+        lock = ThreadRWLock()
+        safe_list = ThreadSafeList([1], lock=lock)
+
+        with lock.get_shared_lock():
+            thread = Thread(target=lambda: safe_list.append(2))
+            thread.start()
+            thread.join(timeout=0.05)
+            # writer waits for the readers
+            self.assertTrue(thread.is_alive())
+            self.assertTrue(len(safe_list) == 1)
+        thread.join()
+        self.assertTrue(safe_list == [1, 2])
+
+    def test_operations(self):
+        safe_set = ThreadSafeSet({1, 2}, lock=ThreadRWLock())
+        safe_set.add(3)
+        self.assertTrue(2 in safe_set)
+        self.assertTrue(safe_set.union({4}) == {1, 2, 3, 4})
+        self.assertTrue(safe_set == {1, 2, 3})
+
+        safe_list = ThreadSafeList([1, 2], lock=ThreadRWLock())
+        safe_list += [3]
+        self.assertTrue(safe_list == [1, 2, 3])
+        self.assertTrue(safe_list.index(2) == 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
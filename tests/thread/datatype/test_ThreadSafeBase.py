@@ -251,6 +251,57 @@ class TestSafeThreadBase(unittest.TestCase):
         self.assertTrue(self.obj._data == initial_value +
                         (n_iterations * n_threads))
 
+    def test_operations_do_not_wrap_values(self):
+        """Test that binary operators use plain values without creating new safe objects."""
+        calls = []
+        create = ThreadSafeBase.create
+
+        def counting_create(cls, *args):
+            calls.append(args)
+            return create(*args)
+
+        ThreadSafeBase.create = classmethod(counting_create)  # type: ignore
+        try:
+            self.obj += 5
+            self.assertTrue(self.obj == 15)
+            self.assertTrue(self.obj < 16)
+            self.assertTrue(self.obj > ThreadSafeBase(14))
+            self.assertTrue(divmod(self.obj, 4) == (3, 3))
+            self.assertTrue(calls == [])
+
+            # results are still wrapped
+            self.assertTrue((self.obj + 1)._data == 16)
+            self.assertTrue(len(calls) == 1)
+        finally:
+            del ThreadSafeBase.create
+
+    def test_same_lock_operations(self):
+        """Test operations between objects that share the same lock."""
+        shared = ThreadSafeBase(self.obj_list)
+        self.obj_list += shared
+        self.assertTrue(self.obj_list._data == [1, 2, 3, 4, 1, 2, 3, 4])
+        self.assertTrue(self.obj_list == shared)
+
+    def test_lock_order(self):
+        """Test that `a op b` and `b op a` running concurrently do not deadlock."""
+        obj1 = ThreadSafeBase(0)
+        obj2 = ThreadSafeBase(0)
+        n_iterations = 2000
+
+        def worker(a, b):
+            for _ in range(n_iterations):
+                a += b
+                _ = a == b
+
+        threads = [
+            threading.Thread(target=worker, args=(obj1, obj2)),
+            threading.Thread(target=worker, args=(obj2, obj1)),
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=30)
+        self.assertFalse(any(thread.is_alive() for thread in threads))
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,107 @@
+import unittest
+import threading
+
+from safethread.thread.datatype import ThreadSafeCounter, ThreadSafeList
+
+
+class TestThreadSafeCounter(unittest.TestCase):
+
+    def test_initialization(self):
+        counter = ThreadSafeCounter()
+        self.assertTrue(counter.get() == 0)
+        self.assertFalse(counter.is_sharded())
+
+        counter = ThreadSafeCounter(5.5)
+        self.assertTrue(counter.get() == 5.5)
+
+        counter = ThreadSafeCounter(ThreadSafeCounter(3))
+        self.assertTrue(counter.get() == 3)
+
+        other = ThreadSafeCounter(counter)
+        other.add()
+        self.assertTrue(counter.get() == 4)
+
+    def test_operations(self):
+        counter = ThreadSafeCounter()
+        counter.add()
+        counter.add(4)
+        self.assertTrue(counter.get() == 5)
+
+        self.assertTrue(counter.get_and_add(2) == 5)
+        self.assertTrue(counter.get() == 7)
+
+        self.assertFalse(counter.compare_and_set(0, 1))
+        self.assertTrue(counter.compare_and_set(7, 1))
+        self.assertTrue(counter.get() == 1)
+
+        counter.set(10)
+        self.assertTrue(counter.get() == 10)
+
+    def test_operators(self):
+        counter = ThreadSafeCounter(10)
+        counter += 5
+        counter -= 3
+        self.assertTrue(counter == 12)
+        self.assertTrue(counter > 11)
+        self.assertTrue(counter < ThreadSafeCounter(13))
+        self.assertTrue(int(counter) == 12)
+        self.assertTrue(float(counter) == 12.0)
+        self.assertTrue(str(counter) == "12")
+        self.assertTrue((counter + 1).get() == 13)
+        self.assertTrue((1 - counter).get() == -11)
+        self.assertTrue((-counter).get() == -12)
+        self.assertTrue(ThreadSafeList([0, 1, 2])[ThreadSafeCounter(1)] == 1)
+
+    def test_sharded(self):
+        counter = ThreadSafeCounter(10, sharded=True)
+        self.assertTrue(counter.is_sharded())
+        counter.add(5)
+        self.assertTrue(counter.get() == 15)
+
+        counter.set(1)
+        self.assertTrue(counter.get() == 1)
+        counter += 1
+        self.assertTrue(counter == 2)
+
+        with self.assertRaises(NotImplementedError):
+            counter.get_and_add()
+        with self.assertRaises(NotImplementedError):
+            counter.compare_and_set(2, 3)
+
+        self.assertTrue(ThreadSafeCounter(counter).is_sharded())
+
+    def test_concurrent_access(self):
+        for sharded in (False, True):
+            counter = ThreadSafeCounter(sharded=sharded)
+
+            def worker():
+                for _ in range(1000):
+                    counter.add()
+
+            threads = [threading.Thread(target=worker) for _ in range(10)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+            self.assertTrue(counter.get() == 10000)
+
+    def test_concurrent_get_and_add(self):
+        counter = ThreadSafeCounter()
+        results = []
+
+        def worker():
+            for _ in range(500):
+                results.append(counter.get_and_add())
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertTrue(sorted(results) == list(range(2000)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+import queue
+import threading
+import time
+import unittest
+
+from safethread.thread.datatype import ThreadSafeDelayQueue
+
+
+class TestThreadSafeDelayQueue(unittest.TestCase):
+
+    def test_initialization(self):
+        original_queue = queue.Queue()
+        for i in range(3):
+            original_queue.put(i)
+        queue_1 = ThreadSafeDelayQueue(original_queue)
+        self.assertTrue(queue_1.get_many(5) == [0, 1, 2])
+
+        queue_2 = ThreadSafeDelayQueue(2)
+        self.assertTrue(queue_2.maxsize == 2)
+        queue_2.put_many(["a", "b"], delay=10)
+        self.assertTrue(queue_2.full())
+        self.assertRaises(queue.Full, queue_2.put_nowait, "c")
+
+    def test_delay(self):
+        queue_1 = ThreadSafeDelayQueue()
+        start = time.monotonic()
+        queue_1.put("late", delay=0.2)
+        queue_1.put("early", delay=0.1)
+        queue_1.put("now")
+
+        self.assertTrue(queue_1.qsize() == 3)
+        self.assertTrue(queue_1.get_nowait() == "now")
+        self.assertRaises(queue.Empty, queue_1.get_nowait)
+        self.assertRaises(queue.Empty, queue_1.get, timeout=0.01)
+        self.assertTrue(queue_1.peek() == "early")
+        self.assertTrue(queue_1.snapshot() == ["early", "late"])
+
+        self.assertTrue(queue_1.get() == "early")
+        self.assertTrue(time.monotonic() - start >= 0.1)
+        self.assertTrue(queue_1.get() == "late")
+        self.assertTrue(time.monotonic() - start >= 0.2)
+
+    def test_fifo_for_same_due_time(self):
+        queue_1 = ThreadSafeDelayQueue()
+        # items are never compared
+        items = [{"id": i} for i in range(5)]
+        queue_1.put_many(items)
+        self.assertTrue(queue_1.get_many(10) == items)
+
+    def test_get_many_only_due_items(self):
+        queue_1 = ThreadSafeDelayQueue()
+        queue_1.put_many([1, 2])
+        queue_1.put(3, delay=10)
+        self.assertTrue(queue_1.get_many(10) == [1, 2])
+        self.assertTrue(queue_1.qsize() == 1)
+
+    def test_wakes_up_for_earlier_item(self):
+        queue_1 = ThreadSafeDelayQueue()
+        queue_1.put("late", delay=10)
+        results = []
+        thread = threading.Thread(target=lambda: results.append(queue_1.get(timeout=5)))
+        thread.start()
+        time.sleep(0.05)
+        queue_1.put("now")
+        thread.join()
+        self.assertTrue(results == ["now"])
+
+    def test_copy(self):
+        queue_1 = ThreadSafeDelayQueue()
+        queue_1.put("a", delay=10)
+        queue_2 = queue_1.copy()
+        self.assertTrue(isinstance(queue_2, ThreadSafeDelayQueue))
+        self.assertTrue(queue_2.snapshot() == ["a"])
+        self.assertRaises(queue.Empty, queue_2.get_nowait)
+
+    def test_join_and_shutdown(self):
+        queue_1 = ThreadSafeDelayQueue()
+        queue_1.put(1, delay=0.05)
+        self.assertTrue(queue_1.get() == 1)
+        queue_1.task_done()
+        queue_1.join()
+
+        queue_1.put(2, delay=10)
+        queue_1.shutdown(immediate=True)
+        self.assertRaises(queue.ShutDown, queue_1.get)
+        self.assertRaises(queue.ShutDown, queue_1.put, 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
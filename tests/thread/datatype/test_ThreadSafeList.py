@@ -80,6 +80,21 @@ class TestSafeThreadList(unittest.TestCase):
         self.assertTrue(self.safe_list.pop(0) == 1)
         self.assertTrue(self.safe_list == [2])
 
+    def test_bulk_operations(self):
+        """Test get_many(), pop_many() and snapshot()."""
+        self.safe_list.extend([1, 2, 3, 4, 5])
+        self.assertTrue(self.safe_list.get_many([0, -1]) == [1, 5])
+        self.assertTrue(self.safe_list.pop_many(2) == [4, 5])
+        self.assertTrue(self.safe_list.pop_many(0) == [])
+
+        snapshot = self.safe_list.snapshot()
+        self.assertTrue(snapshot == [1, 2, 3])
+        snapshot.append(4)
+        self.assertTrue(self.safe_list == [1, 2, 3])
+
+        self.assertTrue(self.safe_list.pop_many(10) == [1, 2, 3])
+        self.assertTrue(self.safe_list == [])
+
     def test_remove(self):
         """Test removing an element."""
         self.safe_list.extend([1, 2, 3])
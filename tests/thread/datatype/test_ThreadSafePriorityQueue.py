@@ -0,0 +1,68 @@
+import queue
+import threading
+import unittest
+
+from safethread.thread.datatype import ThreadSafePriorityQueue
+
+
+class TestThreadSafePriorityQueue(unittest.TestCase):
+
+    def test_initialization(self):
+        queue_1 = ThreadSafePriorityQueue(5)
+        self.assertTrue(queue_1.maxsize == 5)
+        self.assertTrue(queue_1.empty())
+
+        original_queue = queue.Queue()
+        for i in (3, 1, 2):
+            original_queue.put(i)
+        queue_2 = ThreadSafePriorityQueue(original_queue)
+        self.assertTrue(queue_2.snapshot() == [1, 2, 3])
+
+        queue_3 = ThreadSafePriorityQueue(queue_2)
+        self.assertTrue(queue_3.get() == 1)
+        self.assertTrue(queue_2.qsize() == 2)
+
+    def test_order(self):
+        queue_1 = ThreadSafePriorityQueue()
+        queue_1.put_many([(3, "c"), (1, "a"), (2, "b")])
+        self.assertTrue(queue_1.peek() == (1, "a"))
+        self.assertTrue(queue_1.snapshot() == [(1, "a"), (2, "b"), (3, "c")])
+        self.assertTrue(queue_1.get() == (1, "a"))
+        self.assertTrue(queue_1.get_many(5) == [(2, "b"), (3, "c")])
+        self.assertRaises(queue.Empty, queue_1.get_nowait)
+
+    def test_copy(self):
+        queue_1 = ThreadSafePriorityQueue(10)
+        queue_1.put_many([5, 4, 6])
+        queue_2 = queue_1.copy()
+        self.assertTrue(isinstance(queue_2, ThreadSafePriorityQueue))
+        self.assertTrue(queue_2.maxsize == 10)
+        self.assertTrue(queue_2.get_many(3) == [4, 5, 6])
+        self.assertTrue(queue_1.qsize() == 3)
+
+    def test_join_and_shutdown(self):
+        queue_1 = ThreadSafePriorityQueue()
+        results = []
+
+        def consumer():
+            while True:
+                try:
+                    results.append(queue_1.get())
+                except queue.ShutDown:
+                    break
+                queue_1.task_done()
+
+        thread = threading.Thread(target=consumer)
+        thread.start()
+        queue_1.put_many(range(100))
+        queue_1.join()
+        queue_1.shutdown()
+        thread.join()
+
+        self.assertTrue(sorted(results) == list(range(100)))
+        self.assertTrue(queue_1.unfinished_tasks == 0)
+        self.assertRaises(queue.ShutDown, queue_1.put, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
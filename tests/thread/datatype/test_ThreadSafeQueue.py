@@ -1,6 +1,8 @@
 import unittest
 import threading
 
+import queue
+
 from queue import Queue
 
 # Ensure SafeQueueThread is imported from the correct module
@@ -159,6 +161,77 @@ class TestSafeThreadQueue(unittest.TestCase):
 
         self.assertEqual(sorted(results), [0, 1, 2, 3, 4])
 
+    def test_put_many_and_get_many(self):
+        queue_1 = ThreadSafeQueue()
+        queue_1.put_many(range(5))
+        self.assertTrue(queue_1.qsize() == 5)
+        self.assertTrue(queue_1.unfinished_tasks == 5)
+
+        self.assertTrue(queue_1.get_many(3) == [0, 1, 2])
+        self.assertTrue(queue_1.get_many(10) == [3, 4])
+        self.assertTrue(queue_1.get_many(0) == [])
+
+        with self.assertRaises(queue.Empty):
+            queue_1.get_many(3, block=False)
+        with self.assertRaises(queue.Empty):
+            queue_1.get_many(3, timeout=0.05)
+
+    def test_get_many_waits_first_item(self):
+        queue_1 = ThreadSafeQueue()
+        timer = threading.Timer(0.05, queue_1.put_many, args=([1, 2],))
+        timer.start()
+        self.assertTrue(queue_1.get_many(5, timeout=5) == [1, 2])
+        timer.join()
+
+    def test_put_many_bounded(self):
+        queue_1 = ThreadSafeQueue(3)
+        with self.assertRaises(queue.Full):
+            queue_1.put_many(range(5), block=False)
+        # items put before the exception remain in the queue
+        self.assertTrue(queue_1.get_many(5) == [0, 1, 2])
+
+        # a blocking put_many() waits for consumers
+        results = []
+
+        def consumer():
+            while len(results) < 10:
+                results.extend(queue_1.get_many(2, timeout=5))
+        thread = threading.Thread(target=consumer)
+        thread.start()
+        queue_1.put_many(range(10), timeout=5)
+        thread.join()
+        self.assertTrue(results == list(range(10)))
+
+    def test_many_shutdown(self):
+        queue_1 = ThreadSafeQueue()
+        queue_1.put_many([1, 2])
+        queue_1.shutdown()
+        with self.assertRaises(queue.ShutDown):
+            queue_1.put_many([3])
+        self.assertTrue(queue_1.get_many(5) == [1, 2])
+        with self.assertRaises(queue.ShutDown):
+            queue_1.get_many(5)
+
+    def test_peek_and_snapshot(self):
+        queue_1 = ThreadSafeQueue(10)
+        with self.assertRaises(queue.Empty):
+            queue_1.peek()
+        self.assertTrue(queue_1.snapshot() == [])
+
+        queue_1.put_many([1, 2, 3])
+        self.assertTrue(queue_1.peek() == 1)
+        self.assertTrue(queue_1.snapshot() == [1, 2, 3])
+        self.assertTrue(list(queue_1) == [1, 2, 3])
+        # nothing was dequeued
+        self.assertTrue(queue_1.qsize() == 3)
+        self.assertTrue(queue_1.unfinished_tasks == 3)
+
+        copy = queue_1.copy()
+        self.assertTrue(isinstance(copy, ThreadSafeQueue))
+        self.assertTrue(copy.maxsize == 10)
+        self.assertTrue(copy.get_many(5) == [1, 2, 3])
+        self.assertTrue(queue_1.get_many(5) == [1, 2, 3])
+
 
 if __name__ == '__main__':
     unittest.main()
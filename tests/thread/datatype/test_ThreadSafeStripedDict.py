@@ -0,0 +1,167 @@
+import operator
+import unittest
+import threading
+
+from safethread.thread.datatype import ThreadSafeDict, ThreadSafeStripedDict
+
+
+class TestThreadSafeStripedDict(unittest.TestCase):
+
+    def setUp(self):
+        self.safe_dict = ThreadSafeStripedDict({'a': 1, 'b': 2, 'c': 3})
+
+    def test_initialize(self):
+        safe_dict = ThreadSafeStripedDict()
+        self.assertTrue(len(safe_dict) == 0)
+        self.assertFalse(safe_dict)
+        self.assertTrue(safe_dict.get_stripes() ==
+                        ThreadSafeStripedDict.DEFAULT_STRIPES)
+
+        safe_dict = ThreadSafeStripedDict([('a', 1), ('b', 2)], stripes=4)
+        self.assertTrue(safe_dict.get_stripes() == 4)
+        self.assertTrue(safe_dict['a'] == 1)
+        self.assertTrue(safe_dict['b'] == 2)
+
+        safe_dict = ThreadSafeStripedDict(ThreadSafeDict({'x': 1}))
+        self.assertTrue(safe_dict == {'x': 1})
+
+        with self.assertRaises(ValueError):
+            ThreadSafeStripedDict(stripes=0)
+
+    def test_shared(self):
+        other = ThreadSafeStripedDict(self.safe_dict, stripes=2)
+        self.assertTrue(other.get_stripes() ==
+                        self.safe_dict.get_stripes())
+        other['d'] = 4
+        self.assertTrue(self.safe_dict['d'] == 4)
+
+    def test_item_access(self):
+        self.safe_dict['d'] = 4
+        self.assertTrue(self.safe_dict['d'] == 4)
+        self.assertTrue('d' in self.safe_dict)
+        del self.safe_dict['d']
+        self.assertTrue('d' not in self.safe_dict)
+        with self.assertRaises(KeyError):
+            _ = self.safe_dict['z']
+        with self.assertRaises(KeyError):
+            del self.safe_dict['z']
+
+    def test_clear(self):
+        self.safe_dict.clear()
+        self.assertTrue(len(self.safe_dict) == 0)
+
+    def test_copy(self):
+        safe_dict = ThreadSafeStripedDict({'a': 1}, stripes=3)
+        copy = safe_dict.copy()
+        copy['b'] = 2
+        self.assertTrue(copy.get_stripes() == 3)
+        self.assertTrue(safe_dict == {'a': 1})
+        self.assertTrue(copy == {'a': 1, 'b': 2})
+        self.assertTrue(safe_dict.copy_obj() == {'a': 1})
+
+    def test_fromkeys(self):
+        result = self.safe_dict.fromkeys(['x', 'y'], 0)
+        self.assertTrue(result == {'x': 0, 'y': 0})
+        self.assertTrue('x' not in self.safe_dict)
+
+    def test_get(self):
+        self.assertTrue(self.safe_dict.get('a') == 1)
+        self.assertTrue(self.safe_dict.get('z', 99) == 99)
+
+    def test_views(self):
+        self.assertTrue(set(self.safe_dict.items()) ==
+                        {('a', 1), ('b', 2), ('c', 3)})
+        self.assertTrue(set(self.safe_dict.keys()) == {'a', 'b', 'c'})
+        self.assertTrue(set(self.safe_dict.values()) == {1, 2, 3})
+        self.assertTrue(set(self.safe_dict) == {'a', 'b', 'c'})
+
+        # snapshots are not affected by later changes
+        keys = self.safe_dict.keys()
+        for key in self.safe_dict:
+            del self.safe_dict[key]
+        self.assertTrue(len(keys) == 3)
+        self.assertTrue(len(self.safe_dict) == 0)
+
+    def test_pop(self):
+        self.assertTrue(self.safe_dict.pop('b') == 2)
+        self.assertTrue('b' not in self.safe_dict)
+        self.assertTrue(self.safe_dict.pop('z', 100) == 100)
+
+    def test_popitem(self):
+        items = {self.safe_dict.popitem() for _ in range(3)}
+        self.assertTrue(items == {('a', 1), ('b', 2), ('c', 3)})
+        with self.assertRaises(KeyError):
+            self.safe_dict.popitem()
+
+    def test_setdefault(self):
+        self.assertTrue(self.safe_dict.setdefault('a', 10) == 1)
+        self.assertTrue(self.safe_dict.setdefault('z', 5) == 5)
+        self.assertTrue(self.safe_dict['z'] == 5)
+
+    def test_update(self):
+        self.safe_dict.update({'x': 9, 'a': 6})
+        self.safe_dict.update([('y', 8)], w=7)
+        self.safe_dict.update(z=5)
+        self.safe_dict.update(ThreadSafeDict({'v': 4}))
+        self.assertTrue(self.safe_dict == {
+            'a': 6, 'b': 2, 'c': 3, 'v': 4, 'w': 7, 'x': 9, 'y': 8, 'z': 5})
+
+    def test_operators(self):
+        self.assertTrue(self.safe_dict == ThreadSafeDict(
+            {'a': 1, 'b': 2, 'c': 3}))
+        self.assertTrue(self.safe_dict != {'a': 1})
+        result = self.safe_dict | {'d': 4}
+        self.assertTrue(isinstance(result, ThreadSafeStripedDict))
+        self.assertTrue(result == {'a': 1, 'b': 2, 'c': 3, 'd': 4})
+        self.assertTrue(str(self.safe_dict) == str(
+            self.safe_dict.copy_obj()))
+
+    def test_dict_operators(self):
+        # operators act on the dictionary, not on the list of stripes
+        self.assertTrue(({'d': 4} | self.safe_dict) == {'a': 1, 'b': 2, 'c': 3, 'd': 4})
+        self.assertRaises(TypeError, operator.add, self.safe_dict, {'d': 4})
+        self.assertRaises(TypeError, operator.lt, self.safe_dict, {'d': 4})
+        with self.assertRaises(TypeError):
+            self.safe_dict += {'d': 4}
+        self.assertTrue(self.safe_dict == {'a': 1, 'b': 2, 'c': 3})
+        self.assertTrue(self.safe_dict.get_stripes() == ThreadSafeStripedDict.DEFAULT_STRIPES)
+        self.assertTrue(self.safe_dict['a'] == 1)
+
+    def test_lock(self):
+        lock = self.safe_dict.get_lock()
+        self.assertTrue(lock.acquire(blocking=False))
+
+        result = []
+        thread = threading.Thread(
+            target=lambda: result.append(lock.acquire(timeout=0.05)))
+        thread.start()
+        thread.join()
+        self.assertTrue(result == [False])
+
+        # the owner can still use the dictionary
+        self.safe_dict['d'] = 4
+        lock.release()
+        self.assertTrue(len(self.safe_dict) == 4)
+
+    def test_thread_safety(self):
+        safe_dict = ThreadSafeStripedDict(stripes=8)
+
+        def worker(n: int):
+            for i in range(1000):
+                safe_dict[(n, i)] = i
+                safe_dict.setdefault('counter', 0)
+            for i in range(0, 1000, 2):
+                del safe_dict[(n, i)]
+
+        threads = [threading.Thread(target=worker, args=(n,))
+                   for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertTrue(len(safe_dict) == 8 * 500 + 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,150 @@
+import threading
+import time
+import unittest
+
+from safethread import AbstractScheduler
+from safethread.thread import SchedulerService, SchedulerJob
+
+
+class TestSchedulerService(unittest.TestCase):
+
+    def setUp(self):
+        self.service = SchedulerService(max_workers=4)
+
+    def tearDown(self):
+        if self.service.has_started():
+            self.service.stop_join(timeout=5)
+
+    def test_invalid_job(self):
+        """Test that invalid jobs are refused."""
+        with self.assertRaises(TypeError):
+            self.service.create_job(1.0, "not_a_function")  # type: ignore
+        with self.assertRaises(ValueError):
+            self.service.create_job(-1.0, lambda: True)
+
+    def test_single_shot(self):
+        """Test that a non-repeated job runs once, after its timeout."""
+        calls = []
+        self.service.start()
+        begin = time.perf_counter()
+        job = self.service.schedule(0.1, lambda x: calls.append(x + 1),
+                                    args=[1], repeat=False)
+        self.assertTrue(isinstance(job, SchedulerJob))
+        self.assertTrue(job.is_alive())
+        job.join(timeout=5)
+        end = time.perf_counter()
+
+        self.assertTrue(job.is_terminated())
+        self.assertTrue(calls == [2])
+        self.assertTrue(end - begin >= float(job.get_timeout()))
+        self.assertTrue(self.service.get_job_count() == 0)
+
+    def test_repeat(self):
+        """Test that a repeated job runs until its callback returns False (SchedulerThread interface)."""
+        calls = []
+
+        def callback(a, b) -> bool:
+            calls.append(a + b)
+            return len(calls) < 3
+
+        job = self.service.create_job(0.02, callback, args=[2, 3])
+        self.assertFalse(job.has_started())
+        self.assertTrue(job.is_repeatable())
+        job.start()
+        with self.assertRaises(RuntimeError):
+            job.start()
+        # jobs started before the service wait for it
+        time.sleep(0.1)
+        self.assertTrue(calls == [])
+        self.service.start()
+        job.join(timeout=5)
+        self.assertTrue(calls == [5, 5, 5])
+
+    def test_cancel(self):
+        """Test that stopped jobs do not run anymore."""
+        calls = []
+        self.service.start()
+        jobs = [self.service.schedule(0.2, calls.append, args=[i])
+                for i in range(200)]
+        self.assertTrue(self.service.get_job_count() == 200)
+        for job in jobs[:150]:
+            job.stop()
+        self.assertTrue(all(job.is_terminated() for job in jobs[:150]))
+        self.assertTrue(self.service.get_job_count() == 50)
+        time.sleep(0.3)
+        self.assertTrue(len(calls) >= 50)
+        self.assertTrue(all(i >= 150 for i in calls))
+
+    def test_many_jobs(self):
+        """Test that many jobs share the same threads, and a slow callback does not delay other jobs."""
+        counter = {"calls": 0}
+        lock = threading.Lock()
+        release = threading.Event()
+
+        def count():
+            with lock:
+                counter["calls"] += 1
+
+        threads = threading.active_count()
+        self.service.start()
+        slow = self.service.schedule(0.0, release.wait, args=[5], repeat=False)
+        for _ in range(1000):
+            self.service.schedule(0.05, count)
+        time.sleep(0.3)
+        self.assertTrue(counter["calls"] >= 1000)
+        # dispatcher + at most 4 workers
+        self.assertTrue(threading.active_count() - threads <= 5)
+        self.assertTrue(slow.is_alive())
+        release.set()
+        slow.join(timeout=5)
+        self.assertTrue(slow.is_terminated())
+
+    def test_fixed_rate(self):
+        """Test the FIXED_RATE mode of jobs."""
+        calls = []
+
+        def callback() -> bool:
+            calls.append(time.monotonic())
+            time.sleep(0.03)
+            return len(calls) < 5
+
+        self.service.start()
+        job = self.service.schedule(0.05, callback, mode=AbstractScheduler.FIXED_RATE)
+        self.assertTrue(job.get_mode() == AbstractScheduler.FIXED_RATE)
+        job.join(timeout=5)
+        self.assertTrue(abs(calls[-1] - calls[0] - 4 * 0.05) < 0.04)
+
+    def test_backoff(self):
+        """Test that failed runs of a job are retried with an exponential backoff."""
+        calls = []
+
+        def callback() -> bool:
+            calls.append(time.monotonic())
+            return len(calls) >= 3
+
+        self.service.start()
+        job = self.service.schedule(0.01, callback, repeat=False, backoff=0.05, max_retries=5)
+        job.join(timeout=5)
+        self.assertTrue(job.is_terminated())
+        self.assertTrue(len(calls) == 3)
+        self.assertTrue(calls[2] - calls[1] >= 0.1)
+
+        calls.clear()
+        job = self.service.schedule(0.01, lambda: calls.append(1) or False,
+                                    backoff=0.01, max_retries=2)
+        job.join(timeout=5)
+        self.assertTrue(len(calls) == 3)
+
+    def test_stop(self):
+        """Test that stopping the service terminates its jobs."""
+        with self.service:
+            job = self.service.schedule(10.0, lambda: True)
+        self.assertTrue(self.service.is_terminated())
+        job.join(timeout=5)
+        self.assertTrue(job.is_terminated())
+        with self.assertRaises(RuntimeError):
+            self.service.schedule(1.0, lambda: True)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,6 +1,7 @@
 import time
 import unittest
 
+from safethread.AbstractScheduler import AbstractScheduler, _ScheduleState
 from safethread.thread import SchedulerThread, BaseThread
 
 
@@ -72,7 +73,7 @@ class TestSchedulerThread(unittest.TestCase):
         self.assertTrue(self.scheduler_result == 2)
 
         self.assertTrue(
-            end-begin >= self.scheduler.get_timeout())  # in secs
+            end-begin >= float(self.scheduler.get_timeout()))  # in secs
 
     def test_callback_repeat(self):
         """Test that the callback is executed repeatedly if repeat is True."""
@@ -87,6 +88,160 @@ class TestSchedulerThread(unittest.TestCase):
         self.assertTrue(self.scheduler_rep_called == 2)
         self.assertTrue(self.scheduler_rep_result == 10)
 
+    def test_invalid_schedule(self):
+        """Test that invalid timing arguments are refused."""
+        with self.assertRaises(ValueError):
+            SchedulerThread(timeout=-1.0, callback=lambda: True)
+        with self.assertRaises(ValueError):
+            SchedulerThread(timeout=1.0, callback=lambda: True, mode="invalid")
+        with self.assertRaises(ValueError):
+            SchedulerThread(timeout=1.0, callback=lambda: True, misfire="invalid")
+        with self.assertRaises(ValueError):
+            SchedulerThread(timeout="* * *", callback=lambda: True)
+        with self.assertRaises(ValueError):
+            SchedulerThread(timeout=1.0, callback=lambda: True, jitter=-1.0)
+        with self.assertRaises(ValueError):
+            SchedulerThread(timeout=1.0, callback=lambda: True, backoff=-1.0)
+        with self.assertRaises(ValueError):
+            SchedulerThread(timeout=1.0, callback=lambda: True, max_retries=-1)
+
+    def test_stop_interrupts_wait(self):
+        """Test that stop() does not wait for the end of the timeout."""
+        scheduler = SchedulerThread(timeout=10.0, callback=lambda: True)
+        scheduler.start()
+        time.sleep(0.05)
+        begin = time.perf_counter()
+        scheduler.stop_join()
+        self.assertTrue(time.perf_counter() - begin < 1.0)
+        self.assertTrue(scheduler.is_terminated())
+
+    def test_fixed_rate(self):
+        """Test that the FIXED_RATE mode does not accumulate the callback duration."""
+        calls = []
+
+        def callback() -> bool:
+            calls.append(time.monotonic())
+            time.sleep(0.03)
+            return len(calls) < 5
+
+        for mode in (SchedulerThread.FIXED_DELAY, SchedulerThread.FIXED_RATE):
+            calls.clear()
+            scheduler = SchedulerThread(timeout=0.05, callback=callback, mode=mode)
+            self.assertTrue(scheduler.get_mode() == mode)
+            scheduler.start()
+            scheduler.join(timeout=5)
+            elapsed = calls[-1] - calls[0]
+            if mode == SchedulerThread.FIXED_RATE:
+                self.assertTrue(abs(elapsed - 4 * 0.05) < 0.04)
+            else:
+                self.assertTrue(elapsed >= 4 * 0.08)
+
+    def test_misfire(self):
+        """Test the misfire policies of the FIXED_RATE mode."""
+        def runs(misfire: str, end: float) -> float:
+            state = _ScheduleState(1.0, AbstractScheduler.FIXED_RATE, misfire)
+            self.assertTrue(state.start(0.0) == 1.0)
+            # first run ends after the runs due at 2.0 and 3.0
+            return state.advance(end)
+
+        # no misfire: next slot of the grid
+        self.assertTrue(runs(AbstractScheduler.MISFIRE_SKIP, 1.5) == 2.0)
+        self.assertTrue(runs(AbstractScheduler.MISFIRE_SKIP, 3.5) == 4.0)
+        self.assertTrue(runs(AbstractScheduler.MISFIRE_COALESCE, 3.5) == 3.5)
+        self.assertTrue(runs(AbstractScheduler.MISFIRE_CATCH_UP, 3.5) == 2.0)
+
+        state = _ScheduleState(1.0, AbstractScheduler.FIXED_RATE,
+                               AbstractScheduler.MISFIRE_COALESCE)
+        state.start(0.0)
+        self.assertTrue(state.advance(3.5) == 3.5)
+        # after the coalesced run, back to the grid
+        self.assertTrue(state.advance(3.6) == 4.0)
+
+        state = _ScheduleState(1.0, AbstractScheduler.FIXED_RATE,
+                               AbstractScheduler.MISFIRE_CATCH_UP)
+        state.start(0.0)
+        self.assertTrue([state.advance(3.5) for _ in range(3)] == [2.0, 3.0, 4.0])
+
+        state = _ScheduleState(1.0, AbstractScheduler.FIXED_DELAY,
+                               AbstractScheduler.MISFIRE_SKIP)
+        state.start(0.0)
+        self.assertTrue(state.advance(3.5) == 4.5)
+
+    def test_backoff(self):
+        """Test that failed runs are retried with an exponential backoff."""
+        calls = []
+
+        def callback() -> bool:
+            calls.append(time.monotonic())
+            if len(calls) == 1:
+                raise RuntimeError("failure")
+            return len(calls) == 3
+
+        scheduler = SchedulerThread(timeout=0.01, callback=callback, repeat=False, backoff=0.05)
+        scheduler.start()
+        scheduler.join(timeout=5)
+        # run, retry after 0.05s, retry after 0.1s (success)
+        self.assertTrue(len(calls) == 3)
+        self.assertTrue(calls[1] - calls[0] >= 0.05)
+        self.assertTrue(calls[2] - calls[1] >= 0.1)
+
+    def test_max_retries(self):
+        """Test that the scheduler stops after `max_retries` consecutive retries."""
+        calls = []
+
+        def callback() -> bool:
+            calls.append(1)
+            return False
+
+        scheduler = SchedulerThread(timeout=0.01, callback=callback, backoff=0.01,
+                                    backoff_max=0.02, max_retries=3)
+        scheduler.start()
+        scheduler.join(timeout=5)
+        self.assertTrue(scheduler.is_terminated())
+        self.assertTrue(len(calls) == 4)
+
+    def test_backoff_state(self):
+        """Test the backoff delays, and their reset after a successful run."""
+        state = _ScheduleState(1.0, AbstractScheduler.FIXED_DELAY, AbstractScheduler.MISFIRE_SKIP,
+                               backoff=0.5, backoff_max=1.5)
+        state.start(0.0)
+        delays = []
+        for _ in range(4):
+            self.assertTrue(state.fail())
+            delays.append(state.advance(10.0, failed=True) - 10.0)
+        self.assertTrue(delays == [0.5, 1.0, 1.5, 1.5])
+        self.assertTrue(state.advance(20.0) == 21.0)
+        self.assertTrue(state.fail())
+        self.assertTrue(state.advance(30.0, failed=True) == 30.5)
+
+        # no backoff: no retry
+        state = _ScheduleState(1.0, AbstractScheduler.FIXED_DELAY, AbstractScheduler.MISFIRE_SKIP)
+        self.assertTrue(not state.fail())
+
+    def test_jitter(self):
+        """Test that the jitter delays each due time, within its bound."""
+        state = _ScheduleState(1.0, AbstractScheduler.FIXED_DELAY,
+                               AbstractScheduler.MISFIRE_SKIP, jitter=0.2)
+        dues = [state.start(0.0)] + [state.advance(10.0) for _ in range(100)]
+        self.assertTrue(1.0 <= dues[0] <= 1.2)
+        self.assertTrue(all(11.0 <= due <= 11.2 for due in dues[1:]))
+        self.assertTrue(len(set(dues[1:])) > 1)
+
+    def test_cron(self):
+        """Test that a cron expression is accepted as timeout."""
+        scheduler = SchedulerThread(timeout="@hourly", callback=lambda: True)
+        self.assertTrue(scheduler.get_timeout() == "@hourly")
+        state = _ScheduleState("* * * * *", AbstractScheduler.FIXED_DELAY,
+                               AbstractScheduler.MISFIRE_SKIP)
+        # next minute boundary
+        due = state.start(0.0)
+        self.assertTrue(0.0 < due <= 60.0)
+        self.assertTrue(state.fire is not None and state.fire.second == 0)
+        fire = state.fire
+        state.advance(due)
+        assert fire is not None and state.fire is not None
+        self.assertTrue((state.fire - fire).total_seconds() == 60.0)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,96 @@
+import sys
+import threading
+import time
+import unittest
+
+from safethread.thread import SubprocessPool
+
+
+def sleep_command(seconds: float) -> list[str]:
+    return [sys.executable, "-c", f"import time; time.sleep({seconds})"]
+
+
+class TestSubprocessPool(unittest.TestCase):
+
+    def test_invalid_pool(self):
+        with self.assertRaises(ValueError):
+            SubprocessPool(max_concurrent=0)
+        with self.assertRaises(TypeError):
+            SubprocessPool(on_finish=123)  # type: ignore
+        pool = SubprocessPool()
+        with self.assertRaises(TypeError):
+            pool.submit(123)  # type: ignore
+        with self.assertRaises(RuntimeError):
+            pool.join()
+
+    def test_submit(self):
+        results = []
+        done = threading.Event()
+
+        def on_finish(result: SubprocessPool.Finished):
+            results.append(result)
+            done.set()
+
+        with SubprocessPool(max_concurrent=2, on_finish=on_finish) as pool:
+            pool.submit([sys.executable, "-c", "print('Hello, World!')"])
+            self.assertTrue(done.wait(timeout=10))
+        self.assertTrue(pool.is_terminated())
+        self.assertTrue(len(results) == 1)
+        self.assertTrue(results[0].returncode == 0)
+        self.assertTrue(results[0].stdout == "Hello, World!")
+
+    def test_run(self):
+        commands = [[sys.executable, "-c", f"print({i})"] for i in range(10)]
+        commands.append(["non_existing_command"])
+        with SubprocessPool(max_concurrent=3) as pool:
+            results = list(pool.run(iter(commands)))
+        self.assertTrue(len(results) == 11)
+        outputs = sorted(int(result.stdout) for result in results
+                         if result.returncode == 0)
+        self.assertTrue(outputs == list(range(10)))
+        failed = [result for result in results if result.returncode != 0]
+        self.assertTrue(len(failed) == 1)
+        self.assertTrue(failed[0].args == ("non_existing_command",))
+
+    def test_run_before_start(self):
+        pool = SubprocessPool(max_concurrent=1, maxsize=1)
+        self.assertRaises(RuntimeError, pool.run, [[sys.executable, "-c", "pass"]])
+        pool.shutdown()
+
+    def test_max_concurrent(self):
+        """Test that at most `max_concurrent` commands run at the same time."""
+        running = []
+        with SubprocessPool(max_concurrent=2) as pool:
+            sampler = threading.Thread(
+                target=lambda: [running.append(pool.get_running_count()) or time.sleep(0.01)
+                                for _ in range(50)])
+            begin = time.perf_counter()
+            sampler.start()
+            results = list(pool.run(sleep_command(0.3) for _ in range(4)))
+            elapsed = time.perf_counter() - begin
+            sampler.join()
+        self.assertTrue(len(results) == 4)
+        self.assertTrue(max(running) == 2)
+        # 2 batches of 2 commands
+        self.assertTrue(elapsed >= 0.6)
+
+    def test_stop(self):
+        """Test that stop() cancels the pending commands."""
+        results = []
+        pool = SubprocessPool(max_concurrent=1, on_finish=results.append)
+        for _ in range(5):
+            pool.submit(sleep_command(0.2))
+        pool.start()
+        time.sleep(0.1)
+        pool.stop_join(timeout=10)
+        self.assertTrue(pool.is_terminated())
+        self.assertTrue(len(results) == 5)
+        cancelled = [result for result in results
+                     if result.returncode == SubprocessPool.CANCELLED]
+        self.assertTrue(len(cancelled) == 4)
+        with self.assertRaises(RuntimeError):
+            pool.submit(sleep_command(0.1))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,104 @@
+import threading
+import time
+import unittest
+
+from safethread.thread import ThreadPool
+
+
+class TestThreadPool(unittest.TestCase):
+
+    def test_invalid_initialization(self):
+        with self.assertRaises(ValueError):
+            ThreadPool(max_workers=0)
+        with self.assertRaises(ValueError):
+            ThreadPool(max_workers=2, min_workers=3)
+        with self.assertRaises(ValueError):
+            ThreadPool(idle_timeout=0)
+
+    def test_submit(self):
+        with ThreadPool(max_workers=4) as pool:
+            futures = [pool.submit(pow, i, 2) for i in range(20)]
+            self.assertTrue([future.result() for future in futures] == [i * i for i in range(20)])
+
+            future = pool.submit(int, "not a number")
+            self.assertTrue(isinstance(future.exception(), ValueError))
+
+            future = pool.submit(lambda a, b=0: a + b, 1, b=2)
+            self.assertTrue(future.result() == 3)
+
+            self.assertRaises(TypeError, pool.submit, None)
+            self.assertTrue(pool.get_worker_count() <= 4)
+
+        self.assertTrue(pool.is_terminated())
+        self.assertRaises(RuntimeError, pool.submit, pow, 2, 2)
+
+    def test_submit_before_start(self):
+        pool = ThreadPool(max_workers=2)
+        future = pool.submit(pow, 2, 3)
+        self.assertFalse(future.done())
+        self.assertTrue(pool.get_worker_count() == 0)
+
+        pool.start()
+        self.assertTrue(future.result(timeout=5) == 8)
+        self.assertRaises(RuntimeError, pool.start)
+        pool.shutdown()
+
+    def test_map(self):
+        with ThreadPool(max_workers=3) as pool:
+            self.assertTrue(list(pool.map(str, range(10))) == [str(i) for i in range(10)])
+            results = pool.map(pow, range(10), [2] * 10, chunksize=4)
+            self.assertTrue(list(results) == [i * i for i in range(10)])
+            self.assertRaises(ValueError, pool.map, str, range(10), chunksize=0)
+
+            results = pool.map(time.sleep, [1], timeout=0.05)
+            self.assertRaises(TimeoutError, list, results)
+
+    def test_bounded_queue(self):
+        pool = ThreadPool(max_workers=1, maxsize=2)
+        pool.submit_nowait(pow, 2, 1)
+        pool.submit_nowait(pow, 2, 2)
+        self.assertTrue(pool.get_pending_count() == 2)
+        self.assertRaises(ThreadPool.FullException, pool.submit_nowait, pow, 2, 3)
+
+        pool.start()
+        self.assertTrue(pool.submit(pow, 2, 3).result(timeout=5) == 8)
+        pool.shutdown()
+
+    def test_resize(self):
+        pool = ThreadPool(max_workers=4, min_workers=1, idle_timeout=0.1)
+        pool.start()
+        self.assertTrue(pool.get_worker_count() == 1)
+
+        event = threading.Event()
+        futures = [pool.submit(event.wait, 5) for _ in range(6)]
+        self.assertTrue(pool.get_worker_count() == 4)
+        self.assertTrue(pool.get_pending_count() <= 2)
+        event.set()
+        self.assertTrue(all(future.result() for future in futures))
+
+        # idle workers stop, down to min_workers
+        deadline = time.monotonic() + 5
+        while pool.get_worker_count() > 1 and time.monotonic() < deadline:
+            time.sleep(0.05)
+        self.assertTrue(pool.get_worker_count() == 1)
+        self.assertTrue(pool.submit(pow, 3, 2).result(timeout=5) == 9)
+        pool.shutdown()
+
+    def test_stop(self):
+        pool = ThreadPool(max_workers=1)
+        pool.start()
+        event = threading.Event()
+        running = pool.submit(event.wait, 5)
+        pending = [pool.submit(pow, 2, 2) for _ in range(5)]
+
+        pool.stop()
+        event.set()
+        pool.join(timeout=5)
+
+        self.assertTrue(running.result() is True)
+        self.assertTrue(all(future.cancelled() for future in pending))
+        self.assertFalse(pool.is_alive())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,3 +1,5 @@
+import threading
+import time
 import unittest
 
 from safethread.thread.utils import ThreadPipelineStage, ThreadPipeline
@@ -82,5 +84,73 @@ class TestPipeline(unittest.TestCase):
         self.assertTrue(pipeline.is_terminated())
 
 
+    def test_backpressure(self):
+        """Test that a pipeline-wide policy applies to every stage, and stages expose their depth."""
+        with self.assertRaises(ValueError):
+            ThreadPipeline([ThreadPipelineStage(lambda x: x)], policy="invalid")
+
+        release = threading.Event()
+
+        def slow(x):
+            release.wait(5)
+            return x
+
+        first = ThreadPipelineStage(lambda x: x, maxsize=3)
+        second = ThreadPipelineStage(slow, maxsize=3)
+        pipeline = ThreadPipeline([first, second],
+                                  policy=ThreadPipelineStage.DROP_NEWEST)
+        self.assertTrue(first.get_policy() == ThreadPipelineStage.DROP_NEWEST)
+        self.assertTrue(second.get_policy() == ThreadPipelineStage.DROP_NEWEST)
+
+        pipeline.start()
+        for item in range(20):
+            pipeline.put(item)
+        depths = pipeline.get_depths()
+        self.assertTrue(len(depths) == 2)
+        self.assertTrue(all(depth <= 3 for depth in depths))
+        self.assertTrue(all(mark <= 3 for mark in pipeline.get_high_watermarks()))
+
+        release.set()
+        results = []
+        while True:
+            try:
+                results.append(pipeline.get(timeout=0.2))
+            except ThreadPipelineStage.EmptyException:
+                break
+        self.assertTrue(0 < len(results) < 20)
+        self.assertTrue(results == sorted(results))
+        self.assertTrue(first.get_dropped_count() + second.get_dropped_count() > 0)
+        pipeline.stop()
+        pipeline.join()
+
+    def test_stats(self):
+        """Test the pipeline statistics, and the bottleneck detection."""
+        def slow(x):
+            time.sleep(0.01)
+            return x
+
+        pipeline = ThreadPipeline([
+            ThreadPipelineStage(lambda x: x, collect_stats=True),
+            ThreadPipelineStage(slow, collect_stats=True),
+        ])
+        self.assertTrue(pipeline.stats()["bottleneck"] is None)
+        exported = []
+        pipeline.set_exporter(exported.append)
+
+        pipeline.start()
+        for item in range(10):
+            pipeline.put(item)
+        self.assertTrue([pipeline.get(timeout=5) for _ in range(10)] == list(range(10)))
+
+        stats = pipeline.export()
+        self.assertTrue(exported == [stats])
+        self.assertTrue(stats["items_in"] == 10)
+        self.assertTrue(stats["items_out"] == 10)
+        self.assertTrue(stats["errors"] == 0)
+        self.assertTrue(len(stats["stages"]) == 2)
+        self.assertTrue(stats["bottleneck"] == 1)
+        pipeline.stop_join()
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,130 @@
+import unittest
+
+from safethread.thread.utils import ThreadPipelineGraph, ThreadPipelineStage
+
+
+class TestThreadPipelineGraph(unittest.TestCase):
+
+    def test_invalid_graph(self):
+        """Tests the validation of stages and connections."""
+        graph = ThreadPipelineGraph()
+        graph.add_stage("a", ThreadPipelineStage(lambda x: x))
+        graph.add_stage("b", ThreadPipelineStage(lambda x: x))
+        graph.add_stage("c", ThreadPipelineStage(lambda x: x))
+
+        with self.assertRaises(ValueError):
+            graph.add_stage("a", ThreadPipelineStage(lambda x: x))
+        with self.assertRaises(TypeError):
+            graph.add_stage("d", lambda x: x)  # type: ignore
+        with self.assertRaises(ValueError):
+            graph.connect("a", "unknown")
+        with self.assertRaises(ValueError):
+            graph.connect("a", ["b", "c"], routing="invalid")
+        with self.assertRaises(ValueError):
+            graph.connect("a", ["b", "b"])
+
+        graph.connect("a", "b")
+        graph.connect("b", "c")
+        with self.assertRaises(RuntimeError):
+            graph.connect("a", "c")
+        # c => a would close the cycle a => b => c => a
+        with self.assertRaises(ValueError):
+            graph.connect("c", "a")
+        with self.assertRaises(ValueError):
+            graph.connect("c", "c")
+
+        self.assertTrue(graph.get_sources() == ["a"])
+        self.assertTrue(graph.get_sinks() == ["c"])
+        self.assertTrue(graph.get_topological_order() == ["a", "b", "c"])
+
+    def test_broadcast(self):
+        """Tests that broadcast routing sends each data to all the next stages."""
+        graph = ThreadPipelineGraph()
+        graph.add_stage("in", ThreadPipelineStage(lambda x: x))
+        graph.add_stage("double", ThreadPipelineStage(lambda x: x * 2))
+        graph.add_stage("square", ThreadPipelineStage(lambda x: x * x))
+        graph.connect("in", ["double", "square"])
+        graph.start()
+
+        self.assertTrue(graph.has_started())
+        self.assertTrue(graph.is_alive())
+        for item in range(5):
+            graph.put(item)
+        self.assertTrue([graph.get(timeout=5, stage="double") for _ in range(5)]
+                        == [x * 2 for x in range(5)])
+        self.assertTrue([graph.get(timeout=5, stage="square") for _ in range(5)]
+                        == [x * x for x in range(5)])
+        # two sinks: the stage name is required
+        with self.assertRaises(RuntimeError):
+            graph.get(block=False)
+        graph.stop_join()
+        self.assertTrue(graph.is_terminated())
+
+    def test_partition_merge(self):
+        """Tests partitioned fan-out and fan-in, keeping the order of data with the same key."""
+        graph = ThreadPipelineGraph()
+        graph.add_stage("in", ThreadPipelineStage(lambda x: x))
+        for i in range(3):
+            graph.add_stage(f"worker{i}", ThreadPipelineStage(
+                lambda x, i=i: (i, x)))
+        graph.add_stage("merge", ThreadPipelineStage(lambda x: x))
+        graph.connect("in", ["worker0", "worker1", "worker2"],
+                      routing=ThreadPipelineGraph.PARTITION, key=lambda x: x[0])
+        for i in range(3):
+            graph.connect(f"worker{i}", "merge")
+        graph.start()
+
+        items = [(key, seq) for seq in range(20) for key in "abcde"]
+        for item in items:
+            graph.put(item)
+        results = [graph.get(timeout=5) for _ in range(len(items))]
+
+        # each key goes to a single worker, in order
+        workers = {}
+        for worker, (key, seq) in results:
+            self.assertTrue(workers.setdefault(key, worker) == worker)
+        for key in "abcde":
+            seqs = [seq for _, (k, seq) in results if k == key]
+            self.assertTrue(seqs == list(range(20)))
+        graph.stop_join()
+
+    def test_partition_batch(self):
+        """Tests partitioned routing of micro-batches."""
+        graph = ThreadPipelineGraph()
+        graph.add_stage("in", ThreadPipelineStage(lambda batch: batch, batch_size=8))
+        graph.add_stage("even", ThreadPipelineStage(lambda x: x))
+        graph.add_stage("odd", ThreadPipelineStage(lambda x: x))
+        graph.connect("in", ["even", "odd"],
+                      routing=ThreadPipelineGraph.PARTITION, key=lambda x: x % 2)
+        for item in range(20):
+            graph.put(item)
+        graph.start()
+
+        self.assertTrue([graph.get(timeout=5, stage="even") for _ in range(10)]
+                        == list(range(0, 20, 2)))
+        self.assertTrue([graph.get(timeout=5, stage="odd") for _ in range(10)]
+                        == list(range(1, 20, 2)))
+        self.assertTrue(set(graph.get_depths()) == {"in", "even", "odd"})
+        graph.stop_join()
+
+    def test_started_graph(self):
+        """Tests that a started graph cannot be changed nor started again."""
+        with self.assertRaises(RuntimeError):
+            ThreadPipelineGraph().start()
+
+        graph = ThreadPipelineGraph()
+        graph.add_stage("a", ThreadPipelineStage(lambda x: x))
+        graph.start()
+        with self.assertRaises(RuntimeError):
+            graph.start()
+        with self.assertRaises(RuntimeError):
+            graph.add_stage("b", ThreadPipelineStage(lambda x: x))
+        graph.put(1)
+        self.assertTrue(graph.get(timeout=5) == 1)
+        graph.stop_join()
+        with self.assertRaises(ThreadPipelineStage.StoppedException):
+            graph.put(2)
+
+
+if __name__ == '__main__':
+    unittest.main()
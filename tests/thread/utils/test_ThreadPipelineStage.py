@@ -1,3 +1,5 @@
+import threading
+import time
 import unittest
 
 from safethread.thread.utils import ThreadPipelineStage
@@ -179,5 +181,262 @@ class TestThreadPipelineStage(unittest.TestCase):
         pipe2.join()
 
 
+    def test_micro_batching(self):
+        """Tests that batches are processed by a single callback call, and results keep the input order."""
+        batches = []
+
+        def batch_callback(batch):
+            batches.append(list(batch))
+            return [x * 2 for x in batch]
+
+        with self.assertRaises(ValueError):
+            ThreadPipelineStage(batch_callback, batch_size=0)
+        with self.assertRaises(ValueError):
+            ThreadPipelineStage(batch_callback, batch_size=2, max_latency=-1)
+
+        pipeline = ThreadPipelineStage(batch_callback, batch_size=4)
+        for item in range(10):
+            pipeline.put(item)
+        pipeline.start()
+
+        results = [pipeline.get(timeout=5) for _ in range(10)]
+        self.assertTrue(results == [x * 2 for x in range(10)])
+        self.assertTrue(batches == [[0, 1, 2, 3], [4, 5, 6, 7], [8, 9]])
+
+        stats = pipeline.get_batch_stats()
+        self.assertTrue(stats["batches"] == 3)
+        self.assertTrue(stats["items"] == 10)
+        self.assertTrue(stats["max_batch_size"] == 4)
+        self.assertTrue(abs(stats["avg_batch_size"] - 10 / 3) < 1e-9)
+        self.assertTrue(pipeline.get_batch_size() == 4)
+        pipeline.stop_join()
+
+    def test_micro_batching_max_latency(self):
+        """Tests that a batch waits up to max_latency for more items."""
+        pipeline = ThreadPipelineStage(lambda batch: [len(batch)] * len(batch),
+                                       batch_size=100, max_latency=0.3)
+        pipeline.start()
+
+        begin = time.monotonic()
+        pipeline.put(1)
+        time.sleep(0.05)
+        pipeline.put(2)
+        self.assertTrue(pipeline.get(timeout=5) == 2)
+        self.assertTrue(pipeline.get(timeout=5) == 2)
+        self.assertTrue(time.monotonic() - begin >= 0.3)
+        pipeline.stop_join()
+
+    def test_micro_batching_invalid_result(self):
+        """Tests that a batch callback must return one result per item."""
+        pipeline = ThreadPipelineStage(lambda batch: [], batch_size=2)
+        pipeline.put(1)
+        pipeline.start()
+        pipeline.join(timeout=5)
+        self.assertFalse(pipeline.is_alive())
+        self.assertTrue(pipeline.get_batch_stats()["batches"] == 0)
+
+    def test_bounded_block(self):
+        """Tests that a full input queue blocks the producer (BLOCK policy)."""
+        with self.assertRaises(ValueError):
+            ThreadPipelineStage(lambda x: x, maxsize=-1)
+        with self.assertRaises(ValueError):
+            ThreadPipelineStage(lambda x: x, policy="invalid")
+
+        pipeline = ThreadPipelineStage(lambda x: x, maxsize=2)
+        pipeline.put(1)
+        pipeline.put(2)
+        self.assertTrue(pipeline.get_depth() == 2)
+        self.assertTrue(pipeline.get_maxsize() == 2)
+        with self.assertRaises(ThreadPipelineStage.FullException):
+            pipeline.put(3, timeout=0.05)
+
+        pipeline.start()
+        pipeline.put(3, timeout=5)
+        self.assertTrue([pipeline.get(timeout=5) for _ in range(3)] == [1, 2, 3])
+        self.assertTrue(pipeline.get_high_watermark() == 2)
+        self.assertTrue(pipeline.get_dropped_count() == 0)
+        pipeline.stop_join()
+
+    def test_bounded_drop(self):
+        """Tests the DROP_OLDEST and DROP_NEWEST policies."""
+        pipeline = ThreadPipelineStage(lambda x: x, maxsize=2,
+                                       policy=ThreadPipelineStage.DROP_OLDEST)
+        for item in range(5):
+            pipeline.put(item)
+        pipeline.start()
+        self.assertTrue([pipeline.get(timeout=5) for _ in range(2)] == [3, 4])
+        self.assertTrue(pipeline.get_dropped_count() == 3)
+        pipeline.stop_join()
+
+        pipeline = ThreadPipelineStage(lambda x: x, maxsize=2)
+        pipeline.set_policy(ThreadPipelineStage.DROP_NEWEST)
+        self.assertTrue(pipeline.get_policy() == ThreadPipelineStage.DROP_NEWEST)
+        for item in range(5):
+            pipeline.put(item)
+        pipeline.start()
+        self.assertTrue([pipeline.get(timeout=5) for _ in range(2)] == [0, 1])
+        self.assertTrue(pipeline.get_dropped_count() == 3)
+        self.assertTrue(pipeline.get_high_watermark() == 2)
+        pipeline.stop_join()
+
+    def test_bounded_raise(self):
+        """Tests that the RAISE policy does not block the producer."""
+        pipeline = ThreadPipelineStage(lambda x: x, maxsize=1,
+                                       policy=ThreadPipelineStage.RAISE)
+        pipeline.put(1)
+        with self.assertRaises(ThreadPipelineStage.FullException):
+            pipeline.put(2)
+        pipeline.start()
+        self.assertTrue(pipeline.get(timeout=5) == 1)
+        pipeline.stop_join()
+
+    def test_ordered(self):
+        """Tests that the ordered mode keeps the input order with several threads."""
+        with self.assertRaises(ValueError):
+            ThreadPipelineStage(lambda x: x, ordered=True, reorder_window=0)
+
+        def slow_callback(x):
+            # later data finishes first
+            time.sleep(0.002 * (x % 5))
+            return x * 2
+
+        pipeline = ThreadPipelineStage(slow_callback, n_threads=4, ordered=True)
+        self.assertTrue(pipeline.is_ordered())
+        pipeline.start()
+        for item in range(50):
+            pipeline.put(item)
+        results = [pipeline.get(timeout=5) for _ in range(50)]
+        self.assertTrue(results == [x * 2 for x in range(50)])
+        self.assertTrue(pipeline.get_reorder_buffer_size() == 0)
+        pipeline.stop_join()
+
+    def test_ordered_micro_batching(self):
+        """Tests the ordered mode with micro-batching."""
+        def batch_callback(batch):
+            time.sleep(0.01 * (batch[0] % 3))
+            return [x + 1 for x in batch]
+
+        pipeline = ThreadPipelineStage(batch_callback, n_threads=3, batch_size=4,
+                                       ordered=True)
+        for item in range(40):
+            pipeline.put(item)
+        pipeline.start()
+        results = [pipeline.get(timeout=5) for _ in range(40)]
+        self.assertTrue(results == [x + 1 for x in range(40)])
+        pipeline.stop_join()
+
+    def test_ordered_window(self):
+        """Tests that the reorder window bounds the results waiting for a slow data."""
+        def callback(x):
+            if x == 0:
+                time.sleep(0.3)
+            return x
+
+        pipeline = ThreadPipelineStage(callback, n_threads=4, ordered=True,
+                                       reorder_window=3)
+        for item in range(20):
+            pipeline.put(item)
+        pipeline.start()
+        time.sleep(0.15)
+        # data 1 and 2 are done, the other threads wait for data 0
+        self.assertTrue(pipeline.get_reorder_buffer_size() <= 2)
+        with self.assertRaises(ThreadPipelineStage.EmptyException):
+            pipeline.get(block=False)
+        self.assertTrue([pipeline.get(timeout=5) for _ in range(20)] == list(range(20)))
+        pipeline.stop_join()
+
+    def test_ordered_callback_error(self):
+        """Tests that a failed data does not block the next results in ordered mode."""
+        def callback(x):
+            if x == 1:
+                raise RuntimeError("failed")
+            return x
+
+        pipeline = ThreadPipelineStage(callback, n_threads=2, ordered=True)
+        for item in range(4):
+            pipeline.put(item)
+        pipeline.start()
+        self.assertTrue(pipeline.get(timeout=5) == 0)
+        # the thread that failed stops, the other one goes on
+        self.assertTrue([pipeline.get(timeout=5) for _ in range(2)] == [2, 3])
+        pipeline.stop_join()
+
+    def test_ordered_stop_full_output(self):
+        """Tests that stop() does not deadlock while an ordered stage waits for its full output queue."""
+        pipeline = ThreadPipelineStage(lambda x: x, n_threads=2, maxsize=1, ordered=True)
+        pipeline.start()
+        for item in range(3):
+            pipeline.put(item)
+        time.sleep(0.2)
+        stopper = threading.Thread(target=pipeline.stop, daemon=True)
+        stopper.start()
+        stopper.join(timeout=5)
+        self.assertTrue(not stopper.is_alive())
+        pipeline.join(timeout=5)
+        self.assertTrue(pipeline.is_terminated())
+
+    def test_stats(self):
+        """Tests the throughput and latency statistics of a stage."""
+        def callback(x):
+            if x == 3:
+                raise RuntimeError("failed")
+            time.sleep(0.01)
+            return x
+
+        pipeline = ThreadPipelineStage(callback, n_threads=2, collect_stats=True)
+        for item in range(6):
+            pipeline.put(item)
+        pipeline.start()
+        results = sorted(pipeline.get(timeout=5) for _ in range(5))
+        self.assertTrue(results == [0, 1, 2, 4, 5])
+
+        stats = pipeline.stats()
+        self.assertTrue(stats["enabled"])
+        self.assertTrue(stats["items_in"] == 6)
+        self.assertTrue(stats["items_out"] == 5)
+        self.assertTrue(stats["errors"] == 1)
+        self.assertTrue(stats["depth"] == 0)
+        self.assertTrue(len(stats["threads"]) == 2)
+        self.assertTrue(stats["busy_time"] >= 0.05)
+        self.assertTrue(0 < stats["utilization"] <= 1)
+
+        latency = stats["callback_latency"]
+        self.assertTrue(latency["count"] == 6)
+        self.assertTrue(sum(count for _, count in latency["buckets"]) == 6)
+        self.assertTrue(latency["min"] <= latency["p50"] <= latency["p99"] <= latency["max"])
+        self.assertTrue(latency["p90"] >= 0.01)
+        self.assertTrue(stats["queue_wait"]["count"] == 6)
+        pipeline.stop_join()
+
+    def test_stats_batch_export(self):
+        """Tests the statistics in micro-batching mode, and the exporter hook."""
+        with self.assertRaises(TypeError):
+            ThreadPipelineStage(lambda x: x).set_exporter(1)  # type: ignore
+
+        pipeline = ThreadPipelineStage(lambda batch: batch, batch_size=4,
+                                       collect_stats=True)
+        for item in range(10):
+            pipeline.put(item)
+        pipeline.start()
+        self.assertTrue([pipeline.get(timeout=5) for _ in range(10)] == list(range(10)))
+
+        exported = []
+        pipeline.set_exporter(exported.append)
+        stats = pipeline.export()
+        self.assertTrue(exported == [stats])
+        self.assertTrue(stats["items_in"] == 10 and stats["items_out"] == 10)
+        self.assertTrue(stats["callback_latency"]["count"] == 3)
+        self.assertTrue(stats["queue_wait"]["count"] == 10)
+        pipeline.stop_join()
+
+        # disabled: only the queue statistics
+        pipeline = ThreadPipelineStage(lambda x: x)
+        pipeline.put(1)
+        stats = pipeline.stats()
+        self.assertFalse(stats["enabled"])
+        self.assertTrue(stats["items_in"] == 0 and stats["depth"] == 1)
+        self.assertTrue(stats["callback_latency"]["count"] == 0)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,64 @@
+import unittest
+
+from datetime import datetime
+
+from safethread.utils import CronExpression
+
+
+class TestCronExpression(unittest.TestCase):
+
+    def test_every_minute(self):
+        cron = CronExpression("* * * * *")
+        self.assertTrue(cron.next_fire(datetime(2025, 1, 1, 10, 0, 30))
+                        == datetime(2025, 1, 1, 10, 1))
+        # strictly after
+        self.assertTrue(cron.next_fire(datetime(2025, 1, 1, 10, 1))
+                        == datetime(2025, 1, 1, 10, 2))
+
+    def test_steps_and_ranges(self):
+        cron = CronExpression("*/15 9-17 * * mon-fri")
+        self.assertTrue(cron.get_expression() == "*/15 9-17 * * mon-fri")
+        self.assertTrue(cron.next_fire(datetime(2025, 1, 3, 10, 7))
+                        == datetime(2025, 1, 3, 10, 15))
+        # Friday evening => Monday morning
+        self.assertTrue(cron.next_fire(datetime(2025, 1, 3, 17, 50))
+                        == datetime(2025, 1, 6, 9, 0))
+
+    def test_lists_and_names(self):
+        cron = CronExpression("0,30 12 1 jan,jul *")
+        self.assertTrue(cron.next_fire(datetime(2025, 1, 1, 12, 0))
+                        == datetime(2025, 1, 1, 12, 30))
+        self.assertTrue(cron.next_fire(datetime(2025, 1, 1, 12, 30))
+                        == datetime(2025, 7, 1, 12, 0))
+
+    def test_day_of_month_or_weekday(self):
+        # 13th of the month, or Sunday (7 is also Sunday)
+        cron = CronExpression("0 0 13 * 7")
+        self.assertTrue(cron.next_fire(datetime(2025, 1, 6))
+                        == datetime(2025, 1, 12))
+        self.assertTrue(cron.next_fire(datetime(2025, 1, 12))
+                        == datetime(2025, 1, 13))
+
+    def test_leap_day(self):
+        cron = CronExpression("0 0 29 2 *")
+        self.assertTrue(cron.next_fire(datetime(2025, 1, 1))
+                        == datetime(2028, 2, 29))
+
+    def test_aliases(self):
+        self.assertTrue(CronExpression("@hourly").next_fire(datetime(2025, 1, 1, 10, 5))
+                        == datetime(2025, 1, 1, 11, 0))
+        self.assertTrue(CronExpression("@daily").next_fire(datetime(2025, 1, 1, 10, 5))
+                        == datetime(2025, 1, 2))
+        self.assertTrue(CronExpression("@monthly").next_fire(datetime(2025, 12, 5))
+                        == datetime(2026, 1, 1))
+
+    def test_invalid(self):
+        for expression in ("", "* * * *", "60 * * * *", "* 24 * * *", "* * 0 * *",
+                           "*/0 * * * *", "5-1 * * * *", "* * * foo *", "@never",
+                           "0 0 30 2 *", "0 0 31 4,6,9,11 *"):
+            with self.assertRaises(ValueError):
+                CronExpression(expression)
+
+
+if __name__ == '__main__':
+    unittest.main()